@@ -51,6 +51,9 @@ export class DatabaseTables extends Construct {
   /** The DynamoDB table for region request status. */
   public readonly regionRequestTable: Table;
 
+  /** The DynamoDB table for observed endpoint tile statistics. */
+  public readonly endpointStatisticsTable: Table;
+
   /**
    * Creates a new DatabaseTables construct.
    *
@@ -67,6 +70,7 @@ export class DatabaseTables extends Construct {
     this.imageRequestTable = this.createImageRequestTable(props);
     this.featureTable = this.createFeatureTable(props);
     this.regionRequestTable = this.createRegionRequestTable(props);
+    this.endpointStatisticsTable = this.createEndpointStatisticsTable(props);
 
     // Create backup configuration for production environments
     if (props.account.prodLike && !props.account.isAdc) {
@@ -83,7 +87,7 @@ export class DatabaseTables extends Construct {
   private createOutstandingImageRequestsTable(
     props: DatabaseTablesProps
   ): Table {
-    return new Table(this, "OutstandingImageRequestsTable", {
+    const table = new Table(this, "OutstandingImageRequestsTable", {
       tableName: props.config.DDB_OUTSTANDING_IMAGE_REQUESTS_TABLE,
       partitionKey: {
         name: "endpoint_id",
@@ -98,6 +102,21 @@ export class DatabaseTables extends Construct {
       pointInTimeRecoverySpecification: { pointInTimeRecoveryEnabled: true },
       encryption: TableEncryption.AWS_MANAGED
     });
+
+    // Index used by the schedulers to read only the requests updated since their last refresh
+    table.addGlobalSecondaryIndex({
+      indexName: "outstanding_requests_by_update",
+      partitionKey: {
+        name: "scheduler_partition",
+        type: AttributeType.STRING
+      },
+      sortKey: {
+        name: "last_updated",
+        type: AttributeType.NUMBER
+      }
+    });
+
+    return table;
   }
 
   /**
@@ -172,6 +191,30 @@ export class DatabaseTables extends Construct {
     });
   }
 
+  /**
+   * Creates the endpoint statistics table used to share observed tile latencies with the schedulers.
+   *
+   * @param props - The database tables properties
+   * @returns The created Table
+   */
+  private createEndpointStatisticsTable(props: DatabaseTablesProps): Table {
+    return new Table(this, "EndpointStatisticsTable", {
+      tableName: props.config.DDB_ENDPOINT_STATISTICS_TABLE,
+      partitionKey: {
+        name: "endpoint_key",
+        type: AttributeType.STRING
+      },
+      sortKey: {
+        name: "bucket_start",
+        type: AttributeType.NUMBER
+      },
+      billingMode: BillingMode.PAY_PER_REQUEST,
+      removalPolicy: props.removalPolicy || RemovalPolicy.DESTROY,
+      encryption: TableEncryption.AWS_MANAGED,
+      timeToLiveAttribute: props.config.DDB_TTL_ATTRIBUTE
+    });
+  }
+
   /**
    * Creates backup configuration for production environments.
    */
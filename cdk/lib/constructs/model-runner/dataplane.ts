@@ -34,6 +34,8 @@ export class DataplaneConfig extends BaseConfig {
   public readonly CONTAINER_DOCKERFILE: string;
   /** The default container image to import when not building from source. */
   public readonly CONTAINER_URI: string;
+  /** The name of the DynamoDB table for observed endpoint tile statistics. */
+  public readonly DDB_ENDPOINT_STATISTICS_TABLE: string;
   /** The name of the DynamoDB table for image processing features. */
   public readonly DDB_FEATURES_TABLE: string;
   /** The name of the DynamoDB table for image request status. */
@@ -128,6 +130,7 @@ export class DataplaneConfig extends BaseConfig {
       CONTAINER_BUILD_TARGET: "model_runner",
       CONTAINER_DOCKERFILE: "docker/Dockerfile.model-runner",
       CONTAINER_URI: "awsosml/osml-model-runner:latest",
+      DDB_ENDPOINT_STATISTICS_TABLE: "EndpointStatistics",
       DDB_FEATURES_TABLE: "ImageProcessingFeatures",
       DDB_IMAGE_REQUEST_TABLE: "ImageRequestTable",
       DDB_OUTSTANDING_IMAGE_REQUESTS_TABLE: "OutstandingImageRequests",
@@ -418,6 +421,7 @@ export class Dataplane extends Construct {
         this.databaseTables.outstandingImageRequestsTable,
       featureTable: this.databaseTables.featureTable,
       regionRequestTable: this.databaseTables.regionRequestTable,
+      endpointStatisticsTable: this.databaseTables.endpointStatisticsTable,
       imageRequestQueue: this.messaging.imageRequestQueue,
       imageRequestDlQueue: this.messaging.imageRequestDlQueue,
       regionRequestQueue: this.messaging.regionRequestQueue,
@@ -56,6 +56,8 @@ export interface ECSServiceProps {
   readonly featureTable: ITable;
   /** The DynamoDB table for region request status. */
   readonly regionRequestTable: ITable;
+  /** The DynamoDB table for observed endpoint tile statistics. */
+  readonly endpointStatisticsTable: ITable;
   /** The SQS queue for image processing requests. */
   readonly imageRequestQueue: IQueue;
   /** The dead letter queue for image requests. */
@@ -156,8 +158,10 @@ export class ECSService extends Construct {
     const dynamoTableArns: string[] = [
       props.imageRequestTable.tableArn,
       props.outstandingImageRequestsTable.tableArn,
+      `${props.outstandingImageRequestsTable.tableArn}/index/*`,
       props.featureTable.tableArn,
-      props.regionRequestTable.tableArn
+      props.regionRequestTable.tableArn,
+      props.endpointStatisticsTable.tableArn
     ];
 
     return new ECSRoles(this, "ECSRoles", {
@@ -350,6 +354,7 @@ export class ECSService extends Construct {
         props.outstandingImageRequestsTable.tableName,
       FEATURE_TABLE: props.featureTable.tableName,
       REGION_REQUEST_TABLE: props.regionRequestTable.tableName,
+      ENDPOINT_STATISTICS_TABLE: props.endpointStatisticsTable.tableName,
       IMAGE_QUEUE: props.imageRequestQueue.queueUrl,
       IMAGE_DLQ: props.imageRequestDlQueue.queueUrl,
       REGION_QUEUE: props.regionRequestQueue.queueUrl,
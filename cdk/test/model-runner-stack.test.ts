@@ -93,7 +93,7 @@ describe("ModelRunnerStack", () => {
 
     // Stack should have resources (the dataplane creates various resources)
     // Check for DynamoDB tables which are always created (4 tables total)
-    template.resourceCountIs("AWS::DynamoDB::Table", 4);
+    template.resourceCountIs("AWS::DynamoDB::Table", 5);
   });
 
   test("uses provided VPC from network stack", () => {
@@ -0,0 +1,141 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Times the deduplication of the features of an image, comparing features selected group by group from lists of
+GeoJSON features with features extracted once into a feature batch that is sliced for each overlap group.
+
+Usage: python scripts/feature_selection_benchmark.py --features 100000 --repeats 3
+"""
+
+import argparse
+import copy
+import json
+import random
+import time
+from typing import Callable, Dict, List
+
+import geojson
+
+from aws.osml.model_runner.common import FeatureBatch, FeatureDistillationNMS, FeatureDistillationSoftNMS
+from aws.osml.model_runner.inference import FeatureSelector
+from aws.osml.model_runner.tile_worker import VariableOverlapTilingStrategy
+
+IMAGE_SIZE = (20480, 20480)
+REGION_SIZE = (10240, 10240)
+TILE_SIZE = (512, 512)
+TILE_OVERLAP = (32, 32)
+
+
+def build_features(feature_count: int, seed: int = 0) -> List[geojson.Feature]:
+    """
+    Create features spread over an image like the aggregated detections of a job. Features found in the overlap
+    between tiles are reported by both tiles with slightly different boxes and scores.
+    """
+    rng = random.Random(seed)
+    stride = TILE_SIZE[0] - TILE_OVERLAP[0]
+    features = []
+    while len(features) < feature_count:
+        x, y = rng.uniform(0, IMAGE_SIZE[0] - 20), rng.uniform(0, IMAGE_SIZE[1] - 20)
+        w, h = rng.uniform(4, 12), rng.uniform(4, 12)
+        copies = 2 if (x % stride) < TILE_OVERLAP[0] or (y % stride) < TILE_OVERLAP[1] else 1
+        for _ in range(copies):
+            dx, dy = rng.uniform(-0.5, 0.5), rng.uniform(-0.5, 0.5)
+            bbox = [x + dx, y + dy, x + dx + w, y + dy + h]
+            features.append(
+                geojson.Feature(
+                    id=f"{len(features):08d}",
+                    geometry=geojson.Point((-43.68 + bbox[0] * 1e-5, -22.94 - bbox[1] * 1e-5)),
+                    properties={
+                        "imageBBox": bbox,
+                        "imageGeometry": {
+                            "type": "Polygon",
+                            "coordinates": [
+                                [
+                                    [bbox[0], bbox[1]],
+                                    [bbox[2], bbox[1]],
+                                    [bbox[2], bbox[3]],
+                                    [bbox[0], bbox[3]],
+                                    [bbox[0], bbox[1]],
+                                ]
+                            ],
+                        },
+                        "featureClasses": [{"iri": rng.choice(["car", "truck", "bus"]), "score": rng.random()}],
+                        "inferenceTime": "2026-01-01T00:00:00Z",
+                    },
+                )
+            )
+    return features[:feature_count]
+
+
+def best_time(func: Callable[[], object], setup: Callable[[], object], repeats: int) -> float:
+    """
+    Run a function several times on a fresh input and return the fastest run in milliseconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        value = setup()
+        start = time.perf_counter()
+        func(value)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return min(timings)
+
+
+def run_benchmarks(feature_count: int, repeats: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time the deduplication of the features with each selection algorithm. The results map the algorithm to the
+    approach to milliseconds.
+    """
+    features = build_features(feature_count)
+    tiling_strategy = VariableOverlapTilingStrategy()
+    processing_bounds = ((0, 0), IMAGE_SIZE)
+
+    def cleanup(feature_selector: FeatureSelector, selected_features):
+        return tiling_strategy.cleanup_duplicate_features(
+            processing_bounds, REGION_SIZE, TILE_SIZE, TILE_OVERLAP, selected_features, feature_selector
+        )
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, options in [("NMS", FeatureDistillationNMS()), ("SOFT_NMS", FeatureDistillationSoftNMS())]:
+        feature_selector = FeatureSelector(options)
+        # Compile the NMS kernels before anything is timed
+        cleanup(feature_selector, copy.deepcopy(features[:1000]))
+        results[name] = {
+            # Each overlap group is a list of features the selector extracts its arrays from
+            "per group lists": best_time(
+                lambda value: cleanup(feature_selector, value), lambda: copy.deepcopy(features), repeats
+            ),
+            # The arrays of all the features are extracted once and each overlap group is a slice of them
+            "batch extract": best_time(FeatureBatch.from_features, lambda: copy.deepcopy(features), repeats),
+            "batch select": best_time(
+                lambda value: cleanup(feature_selector, value),
+                lambda: FeatureBatch.from_features(copy.deepcopy(features)),
+                repeats,
+            ),
+        }
+        results[name]["batch total"] = results[name]["batch extract"] + results[name]["batch select"]
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    """
+    Print the timings of each approach with the speedup of the batch over the per group lists.
+    """
+    for algorithm, timings in results.items():
+        baseline = timings["per group lists"]
+        columns = [f"{name}={milliseconds:9.2f}ms" for name, milliseconds in timings.items()]
+        print(f"{algorithm:10s} " + "  ".join(columns) + f"  speedup={baseline / timings['batch total']:4.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", "--features", type=int, default=100000)
+    parser.add_argument("-r", "--repeats", type=int, default=3)
+    parser.add_argument("-o", "--output", help="optional path of a JSON file to write the results to")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmarks(args.features, args.repeats)
+    print(f"Feature selection timings for an image with {args.features} features, best of {args.repeats} runs")
+    print_results(benchmark_results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"features": args.features, "repeats": args.repeats, "results": benchmark_results}, f, indent=2)
@@ -0,0 +1,173 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Times the JSON stages of processing a tile with each JSON codec that is installed.
+
+Usage: python scripts/json_codec_benchmark.py --features 5000 --repeats 5
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+import geojson
+
+from aws.osml.model_runner.common import JSONCodecType, get_json_codec
+
+
+def build_feature_collection(feature_count: int, seed: int = 0) -> geojson.FeatureCollection:
+    """
+    Create a feature collection shaped like the response of a detection model for a 512x512 tile after it has been
+    refined and geolocated.
+    """
+    rng = random.Random(seed)
+    features = []
+    for index in range(feature_count):
+        x, y = rng.uniform(0, 500), rng.uniform(0, 500)
+        w, h = rng.uniform(4, 12), rng.uniform(4, 12)
+        lon, lat = -43.68 + x * 1e-5, -22.94 - y * 1e-5
+        features.append(
+            geojson.Feature(
+                id=f"{index:08d}-1cc5e6d6-e12f-430d-adf0-8d2276ce8c5a",
+                geometry=geojson.Polygon(
+                    [
+                        [
+                            (lon, lat),
+                            (lon + w * 1e-5, lat),
+                            (lon + w * 1e-5, lat - h * 1e-5),
+                            (lon, lat - h * 1e-5),
+                            (lon, lat),
+                        ]
+                    ]
+                ),
+                properties={
+                    "imageBBox": [x, y, x + w, y + h],
+                    "imageGeometry": {
+                        "type": "Polygon",
+                        "coordinates": [[[x, y], [x + w, y], [x + w, y + h], [x, y + h], [x, y]]],
+                    },
+                    "featureClasses": [{"iri": "ground_motor_passenger_vehicle", "score": rng.random()}],
+                    "image_id": "2pp5e6d6-e12f-430d-adf0-8d2276ceadf0",
+                    "inferenceTime": "2026-01-01T00:00:00Z",
+                },
+            )
+        )
+    return geojson.FeatureCollection(features)
+
+
+def best_time(func: Callable[[], object], repeats: int) -> float:
+    """
+    Run a function several times and return the fastest run in milliseconds.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return min(timings)
+
+
+def run_benchmarks(feature_count: int, repeats: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time each stage with each installed codec. The results map stage name to codec name to milliseconds.
+    """
+    feature_collection = build_feature_collection(feature_count)
+    response = geojson.dumps(feature_collection).encode("utf-8")
+    features = list(feature_collection["features"])
+    region_request = {
+        "tile_size": [512, 512],
+        "tile_overlap": [32, 32],
+        "region_bounds": [[0, 0], [10240, 10240]],
+        "image_url": "s3://bucket/image.ntf",
+        "model_name": "centerpoint",
+        "image_id": "2pp5e6d6-e12f-430d-adf0-8d2276ceadf0",
+        "job_id": "1cc5e6d6-e12f-430d-adf0-8d2276ce8c5a",
+    }
+
+    codecs = {}
+    for codec_type in [JSONCodecType.STDLIB, JSONCodecType.ORJSON, JSONCodecType.MSGSPEC]:
+        codec = get_json_codec(codec_type)
+        if codec.codec_type == codec_type:
+            codecs[codec_type.value] = codec
+
+    # The geojson module calls every stage used before the codecs were introduced
+    encoded_features = [geojson.dumps(feature) for feature in features]
+    encoded_request = json.dumps(region_request)
+    results: Dict[str, Dict[str, float]] = {
+        "model response parse": {"legacy": best_time(lambda: geojson.loads(response), repeats)},
+        "feature table encode": {"legacy": best_time(lambda: [geojson.dumps(feature) for feature in features], repeats)},
+        "feature table decode": {
+            "legacy": best_time(lambda: [geojson.loads(feature) for feature in encoded_features], repeats)
+        },
+        "vector sink intermediate encode": {
+            "legacy": best_time(lambda: geojson.dumps(feature_collection).encode("utf-8"), repeats)
+        },
+        "queue message encode x1000": {
+            "legacy": best_time(lambda: [json.dumps(region_request) for _ in range(1000)], repeats)
+        },
+        "queue message decode x1000": {
+            "legacy": best_time(lambda: [json.loads(encoded_request) for _ in range(1000)], repeats)
+        },
+    }
+    for name, codec in codecs.items():
+        encoded_features = [codec.dumps(feature) for feature in features]
+        encoded_request = codec.dumps(region_request)
+        stages = {
+            "model response parse": lambda: codec.loads_geojson(response),
+            "feature table encode": lambda: [codec.dumps(feature) for feature in features],
+            "feature table decode": lambda: [codec.loads_geojson(feature) for feature in encoded_features],
+            "vector sink intermediate encode": lambda: codec.dumpb(feature_collection),
+            "queue message encode x1000": lambda: [codec.dumps(region_request) for _ in range(1000)],
+            "queue message decode x1000": lambda: [codec.loads(encoded_request) for _ in range(1000)],
+        }
+        for stage, func in stages.items():
+            results.setdefault(stage, {})[name] = best_time(func, repeats)
+
+    # Kinesis records keep the geojson.dumps format, the gain comes from encoding each record once
+    stdlib_codec = get_json_codec(JSONCodecType.STDLIB)
+    results["kinesis record encode"] = {
+        "legacy": best_time(
+            lambda: [
+                sys.getsizeof(
+                    geojson.dumps({"Data": geojson.dumps(geojson.FeatureCollection([feature])), "PartitionKey": "job"})
+                )
+                for feature in features
+            ],
+            repeats,
+        ),
+        "stdlib": best_time(
+            lambda: [len(stdlib_codec.dumps(geojson.FeatureCollection([feature])).encode("utf-8")) for feature in features],
+            repeats,
+        ),
+    }
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, float]]) -> None:
+    """
+    Print the timings of each stage with the speedup of each codec over the geojson and json module calls.
+    """
+    for stage, timings in results.items():
+        baseline = timings["legacy"]
+        columns: List[str] = []
+        for name, milliseconds in timings.items():
+            columns.append(f"{name}={milliseconds:9.2f}ms ({baseline / milliseconds:4.1f}x)")
+        print(f"{stage:34s} " + "  ".join(columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-f", "--features", type=int, default=5000)
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    parser.add_argument("-o", "--output", help="optional path of a JSON file to write the results to")
+    args = parser.parse_args()
+
+    benchmark_results = run_benchmarks(args.features, args.repeats)
+    print(f"JSON codec timings for a tile with {args.features} features, best of {args.repeats} runs")
+    print_results(benchmark_results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"features": args.features, "repeats": args.repeats, "results": benchmark_results}, f, indent=2)
@@ -1,4 +1,4 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 # Telling flake8 to not flag errors in this file. It is normal that these classes are imported but not used in an
 # __init__.py file.
@@ -9,4 +9,4 @@ from .image_request import ImageRequest
 from .inference import VALID_MODEL_HOSTING_OPTIONS, ModelInvokeMode
 from .region_request import RegionRequest
 from .request_utils import get_image_path, shared_properties_are_valid
-from .sink import SinkMode, SinkType
+from .sink import VALID_SINK_FORMATS, SinkFormat, SinkMode, SinkType
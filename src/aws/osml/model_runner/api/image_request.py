@@ -2,6 +2,7 @@
 
 import logging
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from json import dumps, loads
 from typing import Any, Dict, List, Optional
 
@@ -17,12 +18,13 @@ from aws.osml.model_runner.common import (
     ImageFormats,
     MRPostProcessing,
     MRPostprocessingStep,
+    RegionPlan,
     deserialize_post_processing_list,
 )
 
 from .inference import ModelInvokeMode
 from .request_utils import shared_properties_are_valid
-from .sink import VALID_SYNC_TYPES, SinkType
+from .sink import VALID_SINK_FORMATS, VALID_SYNC_TYPES, SinkType
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,14 @@ class ImageRequest:
         feature_properties: Additional properties to include in the feature processing.
         roi: Region of interest within the image, defined as a geometric shape.
         post_processing: List of post-processing steps to apply to the features detected.
+        priority: Relative urgency of the request, higher values are scheduled sooner by the deadline aware
+                  scheduling policies.
+        deadline: Optional time in epoch seconds by which the request should be started.
+        region_plan: The regions and tiles computed for the image when the request was buffered, if available.
+        overview_level: Optional overview level to process the image at, 0 is full resolution and N is the Nth
+                        overview of the image.
+        target_gsd: Optional ground sample distance in meters to process the image at. Ignored when an overview
+                    level is requested.
     """
 
     job_id: str = ""
@@ -73,6 +83,11 @@ class ImageRequest:
             MRPostProcessing(step=MRPostprocessingStep.FEATURE_DISTILLATION, algorithm=FeatureDistillationNMS())
         ]
     )
+    priority: int = 0
+    deadline: Optional[int] = None
+    region_plan: Optional[RegionPlan] = None
+    overview_level: Optional[int] = None
+    target_gsd: Optional[float] = None
 
     @staticmethod
     def from_external_message(image_request: Dict[str, Any]) -> "ImageRequest":
@@ -101,6 +116,10 @@ class ImageRequest:
             "outputs": ImageRequest._parse_outputs(image_request),
             "feature_properties": image_request.get("featureProperties", []),
             "post_processing": ImageRequest._parse_post_processing(image_request.get("postProcessing")),
+            "priority": ImageRequest._parse_priority(image_request.get("priority")),
+            "deadline": ImageRequest._parse_deadline(image_request.get("deadline")),
+            "overview_level": ImageRequest._parse_overview_level(image_request.get("imageProcessorOverviewLevel")),
+            "target_gsd": ImageRequest._parse_target_gsd(image_request.get("imageProcessorTargetGsd")),
         }
         return from_dict(ImageRequest, properties)
 
@@ -118,6 +137,76 @@ class ImageRequest:
         except Exception:
             return None
 
+    @staticmethod
+    def _parse_priority(priority: Optional[Any]) -> int:
+        """
+        Parses the scheduling priority of the request.
+
+        :param priority: Integer or numeric string priority, higher values are more urgent.
+        :return: The priority or 0 if it was not provided or could not be parsed.
+        """
+        if priority is None:
+            return 0
+        try:
+            return int(priority)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid priority: {priority}. Proceeding with default priority 0.")
+            return 0
+
+    @staticmethod
+    def _parse_deadline(deadline: Optional[Any]) -> Optional[int]:
+        """
+        Parses the scheduling deadline of the request.
+
+        :param deadline: Deadline as epoch seconds or an ISO 8601 timestamp. Timestamps without a time zone are
+                         treated as UTC.
+        :return: The deadline in epoch seconds or None if it was not provided or could not be parsed.
+        """
+        if deadline is None or deadline == "":
+            return None
+        try:
+            if isinstance(deadline, str) and not deadline.strip().lstrip("-").replace(".", "", 1).isdigit():
+                parsed = datetime.fromisoformat(deadline.strip().replace("Z", "+00:00"))
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                return int(parsed.timestamp())
+            return int(float(deadline))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid deadline: {deadline}. Proceeding without a deadline.")
+            return None
+
+    @staticmethod
+    def _parse_overview_level(overview_level: Optional[Any]) -> Optional[int]:
+        """
+        Parses the overview level the image should be processed at.
+
+        :param overview_level: Integer or numeric string overview level, 0 is full resolution.
+        :return: The overview level or None if it was not provided or could not be parsed.
+        """
+        if overview_level is None or overview_level == "":
+            return None
+        try:
+            return int(overview_level)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid overview level: {overview_level}. Proceeding at full resolution.")
+            return None
+
+    @staticmethod
+    def _parse_target_gsd(target_gsd: Optional[Any]) -> Optional[float]:
+        """
+        Parses the ground sample distance the image should be processed at.
+
+        :param target_gsd: Numeric or numeric string GSD in meters.
+        :return: The target GSD or None if it was not provided or could not be parsed.
+        """
+        if target_gsd is None or target_gsd == "":
+            return None
+        try:
+            return float(target_gsd)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid target GSD: {target_gsd}. Proceeding at full resolution.")
+            return None
+
     @staticmethod
     def _parse_roi(roi: Optional[str]) -> Optional[BaseGeometry]:
         """
@@ -229,6 +318,18 @@ class ImageRequest:
         if not self.job_id:
             logger.error("Missing job id in ImageRequest")
             return False
+        if self.priority < 0:
+            logger.error(f"Invalid priority '{self.priority}' in ImageRequest")
+            return False
+        if self.deadline is not None and self.deadline <= 0:
+            logger.error(f"Invalid deadline '{self.deadline}' in ImageRequest")
+            return False
+        if self.overview_level is not None and self.overview_level < 0:
+            logger.error(f"Invalid overview level '{self.overview_level}' in ImageRequest")
+            return False
+        if self.target_gsd is not None and self.target_gsd <= 0:
+            logger.error(f"Invalid target GSD '{self.target_gsd}' in ImageRequest")
+            return False
         if len(self.get_feature_distillation_option()) > 1:
             logger.error("Multiple feature distillation options in ImageRequest")
             return False
@@ -238,6 +339,10 @@ class ImageRequest:
                 if sink_type not in VALID_SYNC_TYPES:
                     logger.error(f"Invalid sink type '{sink_type}' in ImageRequest")
                     return False
+                sink_format = output.get("format")
+                if sink_format is not None and sink_format not in VALID_SINK_FORMATS:
+                    logger.error(f"Invalid sink format '{sink_format}' in ImageRequest")
+                    return False
         return True
 
     def get_shared_values(self) -> Dict[str, Any]:
@@ -259,6 +364,7 @@ class ImageRequest:
             "tile_overlap": self.tile_overlap,
             "tile_format": self.tile_format,
             "tile_compression": self.tile_compression,
+            "roi_wkt": self.roi.wkt if self.roi else None,
         }
 
     def get_feature_distillation_option(self) -> List[FeatureDistillationAlgorithm]:
@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
 from dataclasses import dataclass
@@ -35,6 +35,8 @@ class RegionRequest:
         tile_format: The format of the tiles (e.g., NITF, GeoTIFF).
         tile_compression: Compression type to use for the tiles (e.g., None, JPEG).
         region_bounds: Bounds of the region within the image, defined as upper-left corner coordinates and dimensions.
+        roi_wkt: Optional WKT of the region of interest for the image in longitude, latitude coordinates.
+        processing_scale: Decimation factor the tiles are read at, 1 processes the region at full resolution.
     """
 
     region_id: str = ""
@@ -52,6 +54,8 @@ class RegionRequest:
     tile_format: ImageFormats = ImageFormats.NITF
     tile_compression: ImageCompression = ImageCompression.NONE
     region_bounds: ImageRegion = ((0, 0), (0, 0))
+    roi_wkt: Optional[str] = None
+    processing_scale: int = 1
 
     def __init__(self, *initial_data: Dict[str, Any], **kwargs: Any):
         """
@@ -1,10 +1,16 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 import logging
 
 import boto3
 
 from aws.osml.model_runner.app_config import BotoConfig
-from aws.osml.model_runner.common import VALID_IMAGE_COMPRESSION, VALID_IMAGE_FORMATS, get_credentials_for_assumed_role
+from aws.osml.model_runner.common import (
+    VALID_IMAGE_COMPRESSION,
+    VALID_IMAGE_FORMATS,
+    ImageCompression,
+    ImageFormats,
+    get_credentials_for_assumed_role,
+)
 
 from .exceptions import InvalidS3ObjectException
 from .inference import VALID_MODEL_HOSTING_OPTIONS
@@ -72,6 +78,19 @@ def shared_properties_are_valid(request) -> bool:
         )
         return False
 
+    # Raw tiles are the only format compressed outside of GDAL and they only support those codecs
+    raw_compressions = [ImageCompression.NONE, ImageCompression.LZ4, ImageCompression.ZSTD]
+    is_raw_compression = not request.tile_compression or request.tile_compression in raw_compressions
+    is_gdal_compression = request.tile_compression not in [ImageCompression.LZ4, ImageCompression.ZSTD]
+    if (request.tile_format == ImageFormats.RAW and not is_raw_compression) or (
+        request.tile_format != ImageFormats.RAW and not is_gdal_compression
+    ):
+        logger.error(
+            f"Validation failed: `tile_compression` '{request.tile_compression}' is not supported for "
+            f"`tile_format` '{request.tile_format}'."
+        )
+        return False
+
     if request.image_read_role and not request.image_read_role.startswith("arn:"):
         logger.error("Validation failed: `image_read_role` does not start with 'arn:'.")
         return False
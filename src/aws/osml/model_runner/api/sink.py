@@ -1,4 +1,4 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 from enum import auto
 
@@ -25,3 +25,16 @@ class SinkType(str, AutoStringEnum):
 
 
 VALID_SYNC_TYPES = {sink_type.value for sink_type in SinkType}
+
+
+class SinkFormat(str, AutoStringEnum):
+    """
+    Enumeration defining the file formats an aggregate sink can write features in.
+    """
+
+    GEOJSON = auto()
+    GEOPARQUET = auto()
+    FLATGEOBUF = auto()
+
+
+VALID_SINK_FORMATS = {sink_format.value for sink_format in SinkFormat}
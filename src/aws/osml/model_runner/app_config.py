@@ -45,6 +45,7 @@ class ServiceConfig:
     image_status_topic: Optional[str] = os.getenv("IMAGE_STATUS_TOPIC")
     region_status_topic: Optional[str] = os.getenv("REGION_STATUS_TOPIC")
     cp_api_endpoint: Optional[str] = os.getenv("API_ENDPOINT")
+    endpoint_statistics_table: Optional[str] = os.getenv("ENDPOINT_STATISTICS_TABLE")
 
     # Optional + defaulted configuration
     ddb_ttl_in_days: int = int(os.getenv("DDB_TTL_IN_DAYS", "1"))
@@ -57,6 +58,53 @@ class ServiceConfig:
     tile_workers_per_instance: int = int(os.getenv("TILE_WORKERS_PER_INSTANCE", "4"))
     capacity_target_percentage: float = float(os.getenv("CAPACITY_TARGET_PERCENTAGE", "1.0"))
 
+    # Maximum age in seconds of the scheduler's local view of outstanding requests before a full table scan
+    scheduler_full_refresh_seconds: int = int(os.getenv("SCHEDULER_FULL_REFRESH_SECONDS", "60"))
+
+    # Window of observed tile latencies used to adjust endpoint capacity when ENDPOINT_STATISTICS_TABLE is set
+    scheduler_throughput_window_seconds: int = int(os.getenv("SCHEDULER_THROUGHPUT_WINDOW_SECONDS", "300"))
+
+    # Number of image headers read concurrently while buffering requests (0 reads them one at a time)
+    image_probe_workers: int = int(os.getenv("IMAGE_PROBE_WORKERS", "4"))
+    image_probe_timeout_seconds: int = int(os.getenv("IMAGE_PROBE_TIMEOUT_SECONDS", "60"))
+
+    # Opened datasets and sensor models kept per host so repeat regions of an image skip reading the header
+    dataset_cache_size: int = int(os.getenv("DATASET_CACHE_SIZE", "8"))
+    dataset_cache_memory_mb: int = int(os.getenv("DATASET_CACHE_MEMORY_MB", "256"))
+    dataset_cache_ttl_seconds: int = int(os.getenv("DATASET_CACHE_TTL_SECONDS", "300"))
+
+    # Optional on-disk cache of S3 byte ranges shared by every process on the host, disabled when no directory is set
+    s3_block_cache_dir: Optional[str] = os.getenv("S3_BLOCK_CACHE_DIR")
+    s3_block_cache_size_mb: int = int(os.getenv("S3_BLOCK_CACHE_SIZE_MB", "10240"))
+    s3_block_cache_etag_ttl_seconds: int = int(os.getenv("S3_BLOCK_CACHE_ETAG_TTL_SECONDS", "60"))
+
+    # Memory ceiling for decoding a region, or strips of it, once and cutting its tiles from memory (0 disables)
+    tile_buffer_memory_mb: int = int(os.getenv("TILE_BUFFER_MEMORY_MB", "0"))
+
+    # Number of upcoming tiles GDAL is advised to fetch together when reading tiles from the source image (0 disables)
+    tile_read_ahead: int = int(os.getenv("TILE_READ_AHEAD", "4"))
+
+    # Skip tiles whose fraction of nodata pixels (from the image mask) is at least the threshold before inference
+    tile_skip_nodata_enabled: bool = os.getenv("TILE_SKIP_NODATA_ENABLED", "True") in ["True", "true"]
+    tile_nodata_threshold: float = float(os.getenv("TILE_NODATA_THRESHOLD", "1.0"))
+
+    # Opt in to processing images with a single region, or at most SINGLE_NODE_MAX_PIXELS pixels, entirely on the host
+    # that starts them with their features kept in memory instead of the region and feature tables
+    single_node_enabled: bool = os.getenv("SINGLE_NODE_ENABLED", "False") in ["True", "true"]
+    single_node_max_pixels: int = int(os.getenv("SINGLE_NODE_MAX_PIXELS", "0"))
+
+    # Policy used to pick the next image to start: LOAD_BALANCED, DEADLINE or WEIGHTED_FAIR
+    scheduler_policy: str = os.getenv("SCHEDULER_POLICY", "LOAD_BALANCED")
+    scheduler_default_deadline_seconds: int = int(os.getenv("SCHEDULER_DEFAULT_DEADLINE_SECONDS", "3600"))
+    scheduler_aging_seconds: int = int(os.getenv("SCHEDULER_AGING_SECONDS", "60"))
+
+    # JSON library used for model responses, stored features and queue messages: AUTO, ORJSON, MSGSPEC or STDLIB
+    json_codec: str = os.getenv("JSON_CODEC", "AUTO")
+
+    # Store the tables keep their items in: DYNAMODB, or MEMORY to keep them in this process when it is the only one
+    # processing requests, e.g. a single-node deployment
+    persistence_backend: str = os.getenv("PERSISTENCE_BACKEND", "DYNAMODB")
+
     # Constant configuration
     kinesis_max_record_per_batch: str = "500"
     kinesis_max_record_size_batch: str = "5242880"  # 5 MB in bytes
@@ -104,6 +152,111 @@ class ServiceConfig:
             )
             self.tile_workers_per_instance = 4
 
+        # Validate scheduler_full_refresh_seconds >= 0
+        if self.scheduler_full_refresh_seconds < 0:
+            logger.warning(
+                f"Invalid scheduler_full_refresh_seconds: {self.scheduler_full_refresh_seconds}. "
+                "Must be at least 0. Defaulting to 60."
+            )
+            self.scheduler_full_refresh_seconds = 60
+
+        # Validate scheduler_throughput_window_seconds >= 60 so each window spans at least one statistics bucket
+        if self.scheduler_throughput_window_seconds < 60:
+            logger.warning(
+                f"Invalid scheduler_throughput_window_seconds: {self.scheduler_throughput_window_seconds}. "
+                "Must be at least 60. Defaulting to 300."
+            )
+            self.scheduler_throughput_window_seconds = 300
+
+        # Validate image_probe_workers >= 0
+        if self.image_probe_workers < 0:
+            logger.warning(f"Invalid image_probe_workers: {self.image_probe_workers}. Must be at least 0. Defaulting to 4.")
+            self.image_probe_workers = 4
+
+        # Validate image_probe_timeout_seconds >= 1
+        if self.image_probe_timeout_seconds < 1:
+            logger.warning(
+                f"Invalid image_probe_timeout_seconds: {self.image_probe_timeout_seconds}. "
+                "Must be at least 1. Defaulting to 60."
+            )
+            self.image_probe_timeout_seconds = 60
+
+        # Validate dataset_cache_size >= 0
+        if self.dataset_cache_size < 0:
+            logger.warning(f"Invalid dataset_cache_size: {self.dataset_cache_size}. Must be at least 0. Defaulting to 8.")
+            self.dataset_cache_size = 8
+
+        # Validate dataset_cache_memory_mb >= 1
+        if self.dataset_cache_memory_mb < 1:
+            logger.warning(
+                f"Invalid dataset_cache_memory_mb: {self.dataset_cache_memory_mb}. Must be at least 1. Defaulting to 256."
+            )
+            self.dataset_cache_memory_mb = 256
+
+        # Validate dataset_cache_ttl_seconds >= 1
+        if self.dataset_cache_ttl_seconds < 1:
+            logger.warning(
+                f"Invalid dataset_cache_ttl_seconds: {self.dataset_cache_ttl_seconds}. "
+                "Must be at least 1. Defaulting to 300."
+            )
+            self.dataset_cache_ttl_seconds = 300
+
+        # Validate s3_block_cache_size_mb >= 1
+        if self.s3_block_cache_size_mb < 1:
+            logger.warning(
+                f"Invalid s3_block_cache_size_mb: {self.s3_block_cache_size_mb}. Must be at least 1. Defaulting to 10240."
+            )
+            self.s3_block_cache_size_mb = 10240
+
+        # Validate s3_block_cache_etag_ttl_seconds >= 0
+        if self.s3_block_cache_etag_ttl_seconds < 0:
+            logger.warning(
+                f"Invalid s3_block_cache_etag_ttl_seconds: {self.s3_block_cache_etag_ttl_seconds}. "
+                "Must be at least 0. Defaulting to 60."
+            )
+            self.s3_block_cache_etag_ttl_seconds = 60
+
+        # Validate tile_buffer_memory_mb >= 0
+        if self.tile_buffer_memory_mb < 0:
+            logger.warning(
+                f"Invalid tile_buffer_memory_mb: {self.tile_buffer_memory_mb}. Must be at least 0. Defaulting to 0."
+            )
+            self.tile_buffer_memory_mb = 0
+
+        # Validate tile_read_ahead >= 0
+        if self.tile_read_ahead < 0:
+            logger.warning(f"Invalid tile_read_ahead: {self.tile_read_ahead}. Must be at least 0. Defaulting to 4.")
+            self.tile_read_ahead = 4
+
+        # Validate 0 < tile_nodata_threshold <= 1
+        if not 0.0 < self.tile_nodata_threshold <= 1.0:
+            logger.warning(
+                f"Invalid tile_nodata_threshold: {self.tile_nodata_threshold}. Must be in (0, 1]. Defaulting to 1.0."
+            )
+            self.tile_nodata_threshold = 1.0
+
+        # Validate single_node_max_pixels >= 0
+        if self.single_node_max_pixels < 0:
+            logger.warning(
+                f"Invalid single_node_max_pixels: {self.single_node_max_pixels}. Must be at least 0. Defaulting to 0."
+            )
+            self.single_node_max_pixels = 0
+
+        # Validate scheduler_default_deadline_seconds >= 1
+        if self.scheduler_default_deadline_seconds < 1:
+            logger.warning(
+                f"Invalid scheduler_default_deadline_seconds: {self.scheduler_default_deadline_seconds}. "
+                "Must be at least 1. Defaulting to 3600."
+            )
+            self.scheduler_default_deadline_seconds = 3600
+
+        # Validate scheduler_aging_seconds >= 1
+        if self.scheduler_aging_seconds < 1:
+            logger.warning(
+                f"Invalid scheduler_aging_seconds: {self.scheduler_aging_seconds}. Must be at least 1. Defaulting to 60."
+            )
+            self.scheduler_aging_seconds = 60
+
     def create_elevation_model(self) -> Optional[ElevationModel]:
         """
         Create an elevation model if the relevant options are set in the service configuration.
@@ -164,6 +317,9 @@ class MetricLabels(str, Enum):
     RETRIES = "Retries"
     UTILIZATION = "Utilization"
 
+    # Number of tiles skipped without invoking the model because they contained only nodata pixels
+    SKIPPED_TILES = "SkippedTiles"
+
     # These dimensions allow us to limit the scope of a metric value to a particular portion of the
     # ModelRunner application, a data type, or input format.
     OPERATION_DIMENSION = "Operation"
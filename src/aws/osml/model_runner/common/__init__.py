@@ -8,13 +8,16 @@ from .auto_string_enum import AutoStringEnum
 from .credentials_utils import get_credentials_for_assumed_role
 from .ensemble_boxes_nms import nms, nms_method, prepare_boxes, soft_nms
 from .exceptions import InvalidAssumedRoleException
+from .feature_batch import FeatureBatch
 from .feature_utils import get_feature_image_bounds
+from .json_codec import JSONCodec, JSONCodecType, get_json_codec, new_geojson_instance
 from .log_context import ThreadingLocalContextFilter
 from .mr_post_processing import (
     FeatureDistillationAlgorithm,
     FeatureDistillationAlgorithmType,
     FeatureDistillationDeserializer,
     FeatureDistillationNMS,
+    FeatureDistillationPointNMS,
     FeatureDistillationSoftNMS,
     MRPostProcessing,
     MRPostProcessingAlgorithm,
@@ -25,6 +28,8 @@ from .mr_post_processing import (
     mr_post_processing_options_factory,
 )
 from .observable_event import ObservableEvent
+from .point_nms import point_nms
+from .region_plan import RegionPlan
 from .timer import Timer
 from .typing import (
     VALID_IMAGE_COMPRESSION,
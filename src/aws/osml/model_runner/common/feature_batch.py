@@ -0,0 +1,272 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import geojson
+import numpy as np
+from geojson.base import GeoJSON
+
+from .feature_utils import get_feature_image_bounds
+from .json_codec import new_geojson_instance
+
+IMAGE_GEOMETRY_PROPERTY = "imageGeometry"
+IMAGE_BBOX_PROPERTY = "imageBBox"
+FEATURE_CLASSES_PROPERTY = "featureClasses"
+
+logger = logging.getLogger(__name__)
+
+
+def _get_image_bounds(feature: geojson.Feature) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Get the [minx, miny, maxx, maxy] bounds of the image geometry of a feature. Points, polygons and bounding boxes,
+    which are what models return, are read directly from the properties. Other shapes are converted to a shapely
+    geometry by get_feature_image_bounds.
+
+    :param feature: the feature to calculate bounds for
+    :return: the bounds or None
+    """
+    properties = feature.get("properties") or {}
+    image_geometry = properties.get(IMAGE_GEOMETRY_PROPERTY)
+    if image_geometry is not None:
+        geometry_type = image_geometry.get("type")
+        coordinates = image_geometry.get("coordinates")
+        if geometry_type == "Polygon" and coordinates and coordinates[0]:
+            xs = [coordinate[0] for coordinate in coordinates[0]]
+            ys = [coordinate[1] for coordinate in coordinates[0]]
+            return min(xs), min(ys), max(xs), max(ys)
+        if geometry_type == "Point" and coordinates:
+            return coordinates[0], coordinates[1], coordinates[0], coordinates[1]
+    elif IMAGE_BBOX_PROPERTY in properties:
+        return tuple(properties[IMAGE_BBOX_PROPERTY][:4])
+    if not isinstance(feature, geojson.Feature):
+        feature = geojson.Feature(properties=properties)
+    return get_feature_image_bounds(feature)
+
+
+def _is_valid_bounds(bounds: Optional[Sequence[Any]]) -> bool:
+    """
+    Check the image bounds of a feature are four finite numbers.
+
+    :param bounds: the [minx, miny, maxx, maxy] bounds or None
+    :return: True if the bounds can be used
+    """
+    try:
+        return bounds is not None and len(bounds) == 4 and all(math.isfinite(value) for value in bounds)
+    except TypeError:
+        return False
+
+
+def _get_top_feature_class(properties: Dict[str, Any]) -> Tuple[str, float]:
+    """
+    Get the feature class with the highest score from the featureClasses property.
+
+    :param properties: the properties of a feature
+    :return: tuple of feature class and highest score
+    """
+    max_score = -1.0
+    max_class = ""
+    for feature_class in properties.get(FEATURE_CLASSES_PROPERTY, []):
+        if feature_class.get("score") > max_score:
+            max_score = feature_class.get("score")
+            max_class = feature_class.get("iri")
+    return max_class, max_score
+
+
+@dataclass
+class FeatureBatch:
+    """
+    A set of features stored as columns. The image bounds, top score and top class of every feature, which are
+    what the aggregation stages work on, are held in arrays so grouping, selection and filtering do not walk the
+    GeoJSON of each feature. The world geometry, ids and the remaining properties are kept in side tables that are
+    only turned back into GeoJSON features by to_features when the features are written to a sink.
+
+    Properties every feature shares are held once in shared_properties. Properties named in excluded_properties
+    are removed from the features when they are converted.
+
+    :param image_bboxes: the (N, 4) [min_x, min_y, max_x, max_y] bounds of the image geometry of each feature
+    :param scores: the (N,) score of the top class of each feature
+    :param class_ids: the (N,) index of the top class of each feature in class_names
+    :param class_names: the class IRIs referenced by class_ids
+    :param ids: the id of each feature
+    :param world_geometries: the geometry of each feature in world coordinates
+    :param properties: the properties of each feature
+    :param shared_properties: properties added to every feature
+    :param excluded_properties: properties removed from every feature
+    :param source_indices: the (N,) position of each feature in the list the batch was created from by
+                           from_features, or None if the batch was not created from a list
+    """
+
+    image_bboxes: np.ndarray
+    scores: np.ndarray
+    class_ids: np.ndarray
+    class_names: List[str] = field(default_factory=list)
+    ids: List[Any] = field(default_factory=list)
+    world_geometries: List[Optional[geojson.geometry.Geometry]] = field(default_factory=list)
+    properties: List[Dict[str, Any]] = field(default_factory=list)
+    shared_properties: Dict[str, Any] = field(default_factory=dict)
+    excluded_properties: Set[str] = field(default_factory=set)
+    source_indices: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self.image_bboxes.shape[0])
+
+    @classmethod
+    def empty(cls) -> "FeatureBatch":
+        """
+        Create a batch without features.
+
+        :return: the empty batch
+        """
+        return cls(
+            image_bboxes=np.zeros((0, 4), dtype=np.float64),
+            scores=np.zeros(0, dtype=np.float64),
+            class_ids=np.zeros(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_features(cls, features: Sequence[geojson.Feature]) -> "FeatureBatch":
+        """
+        Create a batch from GeoJSON features. The properties of the features are referenced, not copied. Features
+        without finite image bounds cannot be placed in the image or compared by the selection algorithms, so they
+        are dropped with a warning. The position of each kept feature in the list is held in source_indices.
+
+        :param features: the features
+        :return: the batch
+        """
+        image_bboxes = np.empty((len(features), 4), dtype=np.float64)
+        scores = np.empty(len(features), dtype=np.float64)
+        class_ids = np.empty(len(features), dtype=np.int32)
+        class_indexes: Dict[str, int] = {}
+        ids = []
+        world_geometries = []
+        property_table = []
+        source_indices = []
+        for source_index, feature in enumerate(features):
+            properties = feature.get("properties") or {}
+            bounds = _get_image_bounds(feature)
+            if not _is_valid_bounds(bounds):
+                continue
+            index = len(property_table)
+            image_bboxes[index] = bounds
+            class_name, scores[index] = _get_top_feature_class(properties)
+            class_ids[index] = class_indexes.setdefault(class_name, len(class_indexes))
+            ids.append(feature.get("id"))
+            world_geometries.append(feature.get("geometry"))
+            property_table.append(properties)
+            source_indices.append(source_index)
+        if len(property_table) < len(features):
+            logger.warning(f"Dropped {len(features) - len(property_table)} features without valid image bounds")
+        return cls(
+            image_bboxes=image_bboxes[: len(property_table)],
+            scores=scores[: len(property_table)],
+            class_ids=class_ids[: len(property_table)],
+            class_names=list(class_indexes),
+            ids=ids,
+            world_geometries=world_geometries,
+            properties=property_table,
+            source_indices=np.array(source_indices, dtype=np.int64),
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["FeatureBatch"]) -> "FeatureBatch":
+        """
+        Combine batches into one. The shared and excluded properties of the first batch are kept. The source
+        indices are kept when every batch has them, which is the case for subsets of the same list.
+
+        :param batches: the batches to combine
+        :return: the combined batch
+        """
+        if not batches:
+            return cls.empty()
+        class_indexes: Dict[str, int] = {}
+        class_ids = []
+        for batch in batches:
+            mapping = np.array(
+                [class_indexes.setdefault(name, len(class_indexes)) for name in batch.class_names], dtype=np.int32
+            )
+            class_ids.append(mapping[batch.class_ids] if len(batch) else batch.class_ids.astype(np.int32))
+        return cls(
+            image_bboxes=np.concatenate([batch.image_bboxes for batch in batches]),
+            scores=np.concatenate([batch.scores for batch in batches]),
+            class_ids=np.concatenate(class_ids),
+            class_names=list(class_indexes),
+            ids=[value for batch in batches for value in batch.ids],
+            world_geometries=[value for batch in batches for value in batch.world_geometries],
+            properties=[value for batch in batches for value in batch.properties],
+            shared_properties=dict(batches[0].shared_properties),
+            excluded_properties=set(batches[0].excluded_properties),
+            source_indices=(
+                np.concatenate([batch.source_indices for batch in batches])
+                if all(batch.source_indices is not None for batch in batches)
+                else None
+            ),
+        )
+
+    def select(self, indices: Union[np.ndarray, Sequence[int]]) -> "FeatureBatch":
+        """
+        Select a subset of the features.
+
+        :param indices: the indices of the features to keep or a (N,) boolean mask
+        :return: a batch with the selected features
+        """
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        indices = indices.astype(np.int64, copy=False)
+        positions = indices.tolist()
+        return FeatureBatch(
+            image_bboxes=self.image_bboxes[indices],
+            scores=self.scores[indices],
+            class_ids=self.class_ids[indices],
+            class_names=self.class_names,
+            ids=[self.ids[i] for i in positions],
+            world_geometries=[self.world_geometries[i] for i in positions],
+            properties=[self.properties[i] for i in positions],
+            shared_properties=dict(self.shared_properties),
+            excluded_properties=set(self.excluded_properties),
+            source_indices=self.source_indices[indices] if self.source_indices is not None else None,
+        )
+
+    def update_scores(self, scores: np.ndarray) -> None:
+        """
+        Replace the scores of the top class of each feature, keeping the previous score of the class in its
+        rawScore property.
+
+        :param scores: the (N,) new scores
+        """
+        self.scores = np.asarray(scores, dtype=np.float64)
+        for properties, class_id, score in zip(self.properties, self.class_ids.tolist(), self.scores.tolist()):
+            class_name = self.class_names[class_id]
+            for feature_class in properties.get(FEATURE_CLASSES_PROPERTY, []):
+                if feature_class.get("iri") == class_name:
+                    feature_class["rawScore"] = feature_class.get("score")
+                    feature_class["score"] = score
+
+    def to_features(self) -> List[geojson.Feature]:
+        """
+        Create the GeoJSON features of the batch. The shared properties are added to and the excluded properties
+        removed from the properties of each feature.
+
+        :return: the features
+        """
+        features = []
+        for feature_id, world_geometry, properties in zip(self.ids, self.world_geometries, self.properties):
+            if self.shared_properties:
+                properties.update(self.shared_properties)
+            for name in self.excluded_properties:
+                if properties.get(name):
+                    del properties[name]
+            if world_geometry is None or isinstance(world_geometry, GeoJSON):
+                # Same result as the Feature constructor for geometries that are already geojson objects
+                items = {"type": "Feature"}
+                if feature_id is not None:
+                    items["id"] = feature_id
+                items["geometry"] = world_geometry or None
+                items["properties"] = properties
+                features.append(new_geojson_instance(geojson.Feature, items))
+            else:
+                features.append(geojson.Feature(id=feature_id, geometry=world_geometry, properties=properties))
+        return features
@@ -0,0 +1,340 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import abc
+import json
+import logging
+from enum import auto
+from typing import Any, Dict, List, Optional, Union
+
+import geojson
+from geojson.base import GeoJSON
+from geojson.geometry import DEFAULT_PRECISION
+from geojson.mapping import to_mapping
+
+from .auto_string_enum import AutoStringEnum
+
+logger = logging.getLogger(__name__)
+
+
+class JSONCodecType(str, AutoStringEnum):
+    """
+    The JSON libraries a codec can be backed by. AUTO selects the fastest library that is installed.
+    """
+
+    AUTO = auto()
+    ORJSON = auto()
+    MSGSPEC = auto()
+    STDLIB = auto()
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Convert objects the fast JSON libraries do not serialize natively, objects exposing a __geo_interface__ such as
+    shapely geometries and NumPy values, into JSON compatible values.
+
+    :param obj: the object to convert
+    :return: a JSON compatible value
+    :raises TypeError: if the object cannot be converted
+    """
+    if hasattr(obj, "__geo_interface__"):
+        return to_mapping(obj)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_GEOMETRY_CLASSES = {
+    cls.__name__: cls
+    for cls in [
+        geojson.Point,
+        geojson.MultiPoint,
+        geojson.LineString,
+        geojson.MultiLineString,
+        geojson.Polygon,
+        geojson.MultiPolygon,
+    ]
+}
+_GEOMETRY_KEYS = {"type", "coordinates"}
+_FEATURE_KEYS = {"type", "id", "geometry", "properties"}
+_FEATURE_COLLECTION_KEYS = {"type", "features"}
+
+
+def _clean_coordinates(coordinates: List) -> Optional[List]:
+    """
+    Round coordinates the way the geojson geometry constructors do.
+
+    :param coordinates: the decoded coordinates
+    :return: the rounded coordinates or None if they hold values the constructors need to handle
+    """
+    cleaned = []
+    for value in coordinates:
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            cleaned.append(round(value, DEFAULT_PRECISION))
+        elif value_type is list:
+            value = _clean_coordinates(value)
+            if value is None:
+                return None
+            cleaned.append(value)
+        else:
+            return None
+    return cleaned
+
+
+def new_geojson_instance(cls: type, items: Dict[str, Any]) -> GeoJSON:
+    """
+    Create a geojson object holding already validated items without running its constructor.
+
+    :param cls: the geojson class
+    :param items: the items of the object in the order the constructor would add them
+    :return: the geojson object
+    """
+    instance = cls.__new__(cls)
+    dict.update(instance, items)
+    return instance
+
+
+def _dict_to_geojson(obj: Dict[str, Any]) -> Any:
+    """
+    Convert a decoded JSON object into a geojson object. Geometries, features and feature collections holding only
+    the standard members are created directly, which gives the same result as their constructors without the
+    overhead. Anything else is converted by GeoJSON.to_instance.
+
+    :param obj: the decoded JSON object
+    :return: the geojson object, or the dictionary if it is not a GeoJSON type
+    """
+    geojson_type = obj.get("type")
+    if type(geojson_type) is str:
+        keys = obj.keys()
+        geometry_class = _GEOMETRY_CLASSES.get(geojson_type)
+        if geometry_class is not None and keys <= _GEOMETRY_KEYS:
+            coordinates = obj.get("coordinates") or []
+            if type(coordinates) is list:
+                coordinates = _clean_coordinates(coordinates)
+                if coordinates is not None:
+                    return new_geojson_instance(geometry_class, {"type": geojson_type, "coordinates": coordinates})
+        elif geojson_type == "Feature" and keys <= _FEATURE_KEYS:
+            geometry = obj.get("geometry")
+            if geometry is not None and type(geometry) is dict:
+                geometry = _dict_to_geojson(geometry)
+            if not geometry or isinstance(geometry, GeoJSON):
+                properties = obj.get("properties")
+                if type(properties) in (dict, list):
+                    properties = to_geojson(properties)
+                items = {"type": geojson_type}
+                if obj.get("id") is not None:
+                    items["id"] = obj["id"]
+                items["geometry"] = geometry or None
+                items["properties"] = properties or {}
+                return new_geojson_instance(geojson.Feature, items)
+        elif geojson_type == "FeatureCollection" and keys == _FEATURE_COLLECTION_KEYS and type(obj["features"]) is list:
+            features = to_geojson(obj["features"])
+            for index, feature in enumerate(features):
+                if not isinstance(feature, GeoJSON):
+                    features[index] = GeoJSON.to_instance(feature)
+            return new_geojson_instance(geojson.FeatureCollection, {"type": geojson_type, "features": features})
+
+    for key, value in obj.items():
+        if type(value) in (dict, list):
+            obj[key] = to_geojson(value)
+    return GeoJSON.to_instance(obj)
+
+
+def to_geojson(obj: Any) -> Any:
+    """
+    Convert decoded JSON into geojson objects, giving the same result as geojson.loads which converts every object
+    that has a GeoJSON type from the innermost object outwards. Objects and arrays are reused, so the decoded JSON is
+    consumed by the conversion.
+
+    :param obj: the decoded JSON
+    :return: the geojson objects
+    """
+    if type(obj) is dict:
+        return _dict_to_geojson(obj)
+    if type(obj) is list:
+        for index, value in enumerate(obj):
+            if type(value) in (dict, list):
+                obj[index] = to_geojson(value)
+    return obj
+
+
+class JSONCodec(abc.ABC):
+    """
+    Encodes and decodes the JSON documents on the hot paths of the model runner: model responses, features stored in
+    the feature table and queue messages.
+    """
+
+    codec_type: JSONCodecType
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> str:
+        """
+        Encode an object, including geojson objects, as a JSON string.
+
+        :param obj: the object to encode
+        :return: the JSON document
+        """
+
+    def dumpb(self, obj: Any) -> bytes:
+        """
+        Encode an object as UTF-8 JSON bytes.
+
+        :param obj: the object to encode
+        :return: the JSON document
+        """
+        return self.dumps(obj).encode("utf-8")
+
+    @abc.abstractmethod
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """
+        Decode a JSON document into plain dictionaries and lists.
+
+        :param data: the JSON document
+        :return: the decoded object
+        :raises JSONDecodeError: if the document is not valid JSON
+        """
+
+    def loads_geojson(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """
+        Decode a JSON document into geojson objects, matching geojson.loads.
+
+        :param data: the JSON document
+        :return: the decoded geojson objects
+        :raises JSONDecodeError: if the document is not valid JSON
+        """
+        return to_geojson(self.loads(data))
+
+
+def _reject_constant(constant: str) -> None:
+    """
+    Reject the NaN and Infinity constants the json module accepts by default but orjson, msgspec and geojson.loads
+    do not.
+
+    :param constant: the constant found in the document
+    :raises JSONDecodeError: always
+    """
+    raise json.JSONDecodeError(f"{constant} is not JSON compliant number", constant, 0)
+
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    A codec backed by the standard library json module. The output is the output of geojson.dumps.
+    """
+
+    codec_type = JSONCodecType.STDLIB
+
+    def dumps(self, obj: Any) -> str:
+        return geojson.dumps(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data, parse_constant=_reject_constant)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """
+    A codec backed by orjson. Documents are encoded without whitespace between separators.
+    """
+
+    codec_type = JSONCodecType.ORJSON
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumpb(obj).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=_encode_default, option=self._options)
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecJSONCodec(JSONCodec):
+    """
+    A codec backed by msgspec. Documents are encoded without whitespace between separators.
+    """
+
+    codec_type = JSONCodecType.MSGSPEC
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=_encode_default)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumpb(obj).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as err:
+            # Match the other codecs, which raise a JSONDecodeError for invalid documents
+            raise json.JSONDecodeError(str(err), str(data), 0) from err
+
+
+_CODEC_CLASSES = {
+    JSONCodecType.ORJSON: OrjsonJSONCodec,
+    JSONCodecType.MSGSPEC: MsgspecJSONCodec,
+    JSONCodecType.STDLIB: StdlibJSONCodec,
+}
+_codecs: Dict[JSONCodecType, JSONCodec] = {}
+
+
+def _create_codec(codec_type: JSONCodecType) -> Optional[JSONCodec]:
+    """
+    Create a codec if the library backing it is installed.
+
+    :param codec_type: the library backing the codec
+    :return: the codec or None if the library is not installed
+    """
+    try:
+        return _CODEC_CLASSES[codec_type]()
+    except ImportError:
+        return None
+
+
+def get_json_codec(codec_type: Optional[Union[JSONCodecType, str]] = None) -> JSONCodec:
+    """
+    Get the JSON codec backed by a library. The codec configured for the service is returned when no library is
+    given. Libraries that are not installed fall back to the fastest one available and then to the standard
+    library.
+
+    :param codec_type: the library backing the codec, AUTO, ORJSON, MSGSPEC or STDLIB
+    :return: the codec
+    """
+    if codec_type is None:
+        from aws.osml.model_runner.app_config import ServiceConfig
+
+        codec_type = ServiceConfig.json_codec
+    try:
+        codec_type = JSONCodecType(codec_type.upper())
+    except ValueError:
+        logger.warning(f"Invalid JSON codec: {codec_type}. Defaulting to AUTO.")
+        codec_type = JSONCodecType.AUTO
+
+    codec = _codecs.get(codec_type)
+    if codec is None:
+        candidates = [JSONCodecType.ORJSON, JSONCodecType.MSGSPEC]
+        if codec_type != JSONCodecType.AUTO:
+            candidates.insert(0, codec_type)
+        for candidate in candidates:
+            codec = _create_codec(candidate)
+            if codec is not None:
+                break
+        if codec is None:
+            codec = StdlibJSONCodec()
+        if codec_type not in [JSONCodecType.AUTO, codec.codec_type]:
+            logger.warning(f"JSON codec {codec_type.value} is not installed, using {codec.codec_type.value}")
+        _codecs[codec_type] = codec
+    return codec
@@ -1,5 +1,6 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
+import math
 from abc import ABC, ABCMeta, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, EnumMeta, auto
@@ -41,12 +42,16 @@ class FeatureDistillationAlgorithmType(str, MRPostProcessingAlgorithmType):
     - NMS: Non-maximum Suppression
     - SOFT_NMS: Variant of NMS (https://arxiv.org/abs/1704.04503). This implementation is gaussian Soft-NMS,
       as opposed to linear.
+    - POINT_NMS: NMS for point detections, such as those of center-point models. Points of the same class within a
+      radius of each other are duplicates and the highest scoring point is kept. Features with an area are selected
+      with NMS.
     - NMW: Non-maximum weighted
     - WBF: Weighted boxes fusion
     """
 
     NMS = auto()
     SOFT_NMS = auto()
+    POINT_NMS = auto()
 
 
 class MRPostprocessingStep(str, AutoStringEnum):
@@ -109,6 +114,27 @@ class FeatureDistillationSoftNMS(FeatureDistillationAlgorithm):
     sigma: float = field(default=0.1)
 
 
+@dataclass(frozen=True)
+class FeatureDistillationPointNMS(FeatureDistillationAlgorithm):
+    """
+    :param algorithm_type: FeatureSelectionAlgorithmType = algorithm to use to combine object detections
+    :param iou_threshold: float = intersection over union threshold for the features that are not points
+                         - if greater than this value boxes are considered the same
+    :param radius: float = distance in pixels between the centers of points
+                         - if less than or equal to this value points are considered the same
+    :raises ValueError: if the radius is not a positive number
+    """
+
+    algorithm_type: FeatureDistillationAlgorithmType = field(default=FeatureDistillationAlgorithmType.POINT_NMS)
+    iou_threshold: float = field(default=0.75)
+    radius: float = field(default=5.0)
+
+    def __post_init__(self) -> None:
+        # Reject an invalid radius when the request is parsed rather than when its features are selected
+        if isinstance(self.radius, bool) or not isinstance(self.radius, (int, float)) or not 0 < self.radius < math.inf:
+            raise ValueError(f"Point NMS radius must be a positive number: {self.radius}")
+
+
 @dataclass(frozen=True)
 class MRPostProcessing:
     """
@@ -147,6 +173,8 @@ class FeatureDistillationDeserializer(PostProcessingDeserializer):
                 return FeatureDistillationNMS(**post_processing_algorithm)
             elif post_processing_algorithm["algorithm_type"] == FeatureDistillationAlgorithmType.SOFT_NMS:
                 return FeatureDistillationSoftNMS(**post_processing_algorithm)
+            elif post_processing_algorithm["algorithm_type"] == FeatureDistillationAlgorithmType.POINT_NMS:
+                return FeatureDistillationPointNMS(**post_processing_algorithm)
 
         raise ValueError(
             f"Failed to deserialize. {post_processing_algorithm} is not a valid feature distillation algorithm object."
@@ -0,0 +1,118 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Non-Maximum Suppression (NMS) for point detections.
+
+Points have no area so the overlap of two detections cannot be measured with IoU. Instead two points of the same
+label are the same detection when they are within a radius of each other. Points are visited from the highest score
+to the lowest; each point that has not been suppressed is kept and suppresses the points around it. The points are
+bucketed into a grid with cells the size of the radius, so only the points in the 3x3 cells around a kept point are
+compared with it and the work grows with the number of points rather than the number of pairs of points.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import jit
+
+# Largest number of grid cells along each axis, which keeps the cell keys of every label within an int64
+MAX_GRID_CELLS = 2**20
+
+
+def _get_grid_cells(points: np.ndarray, labels: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign each point to a grid cell. A cell is at least as wide as the radius so every point within the radius of a
+    point is in its cell or one of the 8 cells around it.
+
+    :param points: array of shape (N, 2) with the [x, y] coordinates of each point
+    :param labels: array of shape (N, ) with the label of each point
+    :param radius: the distance within which points are the same detection
+
+    :return: Tuple of the [columns, rows] in the grid, which has a border of empty cells, and the (N, ) key of the
+             cell of each point. The key combines the label of the point with its column and row.
+    """
+    origin = points.min(axis=0)
+    extent = points.max(axis=0) - origin
+    cell_size = max(radius, float(extent.max()) / MAX_GRID_CELLS)
+    # Offset the cells by one so the neighbors of the cells on the edges have positive coordinates
+    cells = np.floor((points - origin) / cell_size).astype(np.int64) + 1
+    grid_size = cells.max(axis=0) + 2
+    _, label_indexes = np.unique(labels, return_inverse=True)
+    keys = (label_indexes.astype(np.int64).reshape(-1) * grid_size[0] + cells[:, 0]) * grid_size[1] + cells[:, 1]
+    return grid_size, keys
+
+
+@jit(nopython=True)
+def _suppress_points(xs: np.ndarray, ys: np.ndarray, order: np.ndarray, keys: np.ndarray, grid_rows: int, radius: float):
+    """
+    Visit the points from the highest score to the lowest and keep the points that are not within the radius of a
+    point of the same label that was already kept. The points are sorted by the key of their cell so the points of
+    the 3 cells in a column of the grid around a point are contiguous and are found with two binary searches.
+
+    :param xs: array of shape (N, ) with the x coordinate of each point, sorted by cell key
+    :param ys: array of shape (N, ) with the y coordinate of each point, sorted by cell key
+    :param order: array of shape (N, ) with the positions of the points ordered by descending score
+    :param keys: array of shape (N, ) with the sorted key of the cell of each point
+    :param grid_rows: the number of rows in the grid
+    :param radius: the distance within which points are the same detection
+
+    :return: positions of points to keep, ordered by descending score
+    """
+    radius_squared = radius * radius
+    visited = np.zeros(len(keys), dtype=np.bool_)
+    keep = np.empty(len(keys), dtype=np.int64)
+    keep_count = 0
+    for i in order:
+        if visited[i]:
+            continue
+        visited[i] = True
+        keep[keep_count] = i
+        keep_count += 1
+        for column_offset in range(-1, 2):
+            # Neighboring cells of the same label differ only in their column and row
+            center_key = keys[i] + column_offset * grid_rows
+            start = np.searchsorted(keys, center_key - 1)
+            end = np.searchsorted(keys, center_key + 2)
+            for j in range(start, end):
+                if visited[j]:
+                    continue
+                dx = xs[j] - xs[i]
+                dy = ys[j] - ys[i]
+                if dx * dx + dy * dy <= radius_squared:
+                    visited[j] = True
+    return keep[:keep_count]
+
+
+def point_nms(points: np.ndarray, scores: np.ndarray, labels: np.ndarray, radius: float) -> np.ndarray:
+    """
+    Perform NMS on point detections, keeping the highest scoring point of each cluster of points of the same label
+    that are within the radius of each other.
+
+    :param points: array of shape (N, 2) with the [x, y] coordinates of each point
+    :param scores: array of shape (N, ) with the confidence score of each point
+    :param labels: array of shape (N, ) with the label of each point
+    :param radius: the distance within which points are the same detection, in the units of the coordinates
+
+    :return: index of points to keep, ordered by descending score
+    """
+    if radius <= 0:
+        raise ValueError(f"Point NMS radius must be positive: {radius}")
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return np.zeros(0, dtype=np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    labels = np.asarray(labels)
+    grid_size, keys = _get_grid_cells(points, labels, radius)
+
+    # Sort the points by cell, stable so points with the same score are visited in their original order
+    by_cell = np.argsort(keys, kind="mergesort")
+    order = np.argsort(-scores[by_cell], kind="mergesort")
+    keep = _suppress_points(
+        np.ascontiguousarray(points[by_cell, 0]),
+        np.ascontiguousarray(points[by_cell, 1]),
+        order,
+        keys[by_cell],
+        int(grid_size[1]),
+        float(radius),
+    )
+    return by_cell[keep]
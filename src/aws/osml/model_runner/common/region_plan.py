@@ -0,0 +1,100 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .typing import ImageDimensions, ImageRegion
+
+
+def _as_region(value) -> ImageRegion:
+    """
+    Normalize a region that may have been read back from JSON or DynamoDB as nested lists.
+
+    :param value: The region as nested tuples or lists
+    :return: The region as nested tuples
+    """
+    return (int(value[0][0]), int(value[0][1])), (int(value[1][0]), int(value[1][1]))
+
+
+def _as_dimensions(value) -> ImageDimensions:
+    """
+    Normalize dimensions that may have been read back from JSON or DynamoDB as a list.
+
+    :param value: The dimensions as a tuple or list
+    :return: The dimensions as a tuple
+    """
+    return int(value[0]), int(value[1])
+
+
+@dataclass
+class RegionPlan:
+    """
+    The regions and tiles an image will be divided into, computed once when the request is buffered so that later
+    stages do not need to re-derive them from the image header.
+
+    A plan only applies to the tiling parameters it was computed with; use `matches` before reusing it.
+
+    :param processing_bounds: The area of the image to process as ((row, col), (width, height))
+    :param regions: The regions the processing bounds are divided into
+    :param tile_counts: The number of tiles in each region
+    :param region_size: The region size used to compute the plan
+    :param tile_size: The tile size used to compute the plan
+    :param tile_overlap: The tile overlap used to compute the plan
+    :param image_width: Width of the full image in pixels
+    :param image_height: Height of the full image in pixels
+    :param image_format: The GDAL driver short name of the image (e.g. NITF, GTIFF)
+    :param image_extension: The file extension of the image
+    """
+
+    processing_bounds: ImageRegion
+    regions: List[ImageRegion] = field(default_factory=list)
+    tile_counts: List[int] = field(default_factory=list)
+    region_size: ImageDimensions = (10240, 10240)
+    tile_size: ImageDimensions = (1024, 1024)
+    tile_overlap: ImageDimensions = (50, 50)
+    image_width: Optional[int] = None
+    image_height: Optional[int] = None
+    image_format: Optional[str] = None
+    image_extension: Optional[str] = None
+
+    def __post_init__(self):
+        self.processing_bounds = _as_region(self.processing_bounds)
+        self.regions = [_as_region(region) for region in self.regions]
+        self.tile_counts = [int(tile_count) for tile_count in self.tile_counts]
+        self.region_size = _as_dimensions(self.region_size)
+        self.tile_size = _as_dimensions(self.tile_size)
+        self.tile_overlap = _as_dimensions(self.tile_overlap)
+
+    @property
+    def region_count(self) -> int:
+        """
+        Number of regions in the plan.
+
+        :return: The region count
+        """
+        return len(self.regions)
+
+    @property
+    def tile_count(self) -> int:
+        """
+        Total number of tiles in the plan.
+
+        :return: The tile count
+        """
+        return sum(self.tile_counts)
+
+    def matches(self, region_size: ImageDimensions, tile_size: ImageDimensions, tile_overlap: ImageDimensions) -> bool:
+        """
+        Check whether the plan was computed with the given tiling parameters.
+
+        :param region_size: The region size in use
+        :param tile_size: The tile size in use
+        :param tile_overlap: The tile overlap in use
+        :return: True if the plan can be reused
+        """
+        return (
+            self.region_size == _as_dimensions(region_size)
+            and self.tile_size == _as_dimensions(tile_size)
+            and self.tile_overlap == _as_dimensions(tile_overlap)
+            and len(self.tile_counts) == len(self.regions)
+        )
@@ -1,4 +1,4 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 from enum import Enum, auto
 from typing import Tuple
@@ -22,6 +22,8 @@ class ImageCompression(str, AutoStringEnum):
     JPEG = auto()
     J2K = auto()
     LZW = auto()
+    LZ4 = auto()
+    ZSTD = auto()
 
 
 class ImageFormats(str, AutoStringEnum):
@@ -33,6 +35,7 @@ class ImageFormats(str, AutoStringEnum):
     JPEG = auto()
     PNG = auto()
     GTIFF = auto()
+    RAW = auto()
 
 
 class RequestStatus(str, AutoStringEnum):
@@ -59,6 +62,7 @@ class GeojsonDetectionField(str, Enum):
 class TileState(str, Enum):
     SUCCEEDED = "succeeded"
     FAILED = "failed"
+    SKIPPED = "skipped"
 
 
 VALID_IMAGE_COMPRESSION = [item.value for item in ImageCompression]
@@ -5,6 +5,7 @@
 # flake8: noqa
 
 from .ddb_helper import DDBHelper, DDBItem, DDBKey
+from .endpoint_statistics_table import EndpointStatisticsItem, EndpointStatisticsTable
 from .exceptions import (
     AddFeaturesException,
     CompleteRegionException,
@@ -19,5 +20,13 @@ from .exceptions import (
 )
 from .feature_table import FeatureTable
 from .image_request_table import ImageRequestItem, ImageRequestTable
+from .persistence_backend import (
+    InMemoryPersistence,
+    InMemoryTable,
+    PersistenceBackend,
+    PersistenceBackendType,
+    TableBackend,
+    open_table,
+)
 from .region_request_table import RegionRequestItem, RegionRequestTable
 from .requested_jobs_table import ImageRequestStatusRecord, RequestedJobsTable
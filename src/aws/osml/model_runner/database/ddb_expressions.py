@@ -0,0 +1,434 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Evaluation of DynamoDB condition and update expressions against items held in memory.
+
+The in-memory persistence backend uses these to give the tables the same conditional semantics they have on
+DynamoDB. The supported subset of the expression language covers what the tables use:
+
+- Conditions: comparisons (=, <>, <, <=, >, >=), BETWEEN, IN, AND, OR, NOT, parentheses and the attribute_exists,
+  attribute_not_exists, contains, begins_with and size functions.
+- Updates: SET with +, -, if_not_exists and list_append, ADD for numbers and sets, REMOVE and DELETE.
+
+Attributes are referenced by name or by an ExpressionAttributeNames placeholder; nested paths are not supported.
+Expressions are compiled once and cached, the values and names are looked up each time they are evaluated.
+"""
+
+import re
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+# Marks an attribute that is not present in an item
+MISSING = object()
+
+# An expression function evaluated against an item, the attribute names and the attribute values
+Operand = Callable[[Dict[str, Any], Dict[str, str], Dict[str, Any]], Any]
+
+_TOKEN_PATTERN = re.compile(
+    r"\s*(?:(?P<value>:[A-Za-z0-9_]+)|(?P<name>#[A-Za-z0-9_]+)|(?P<op><>|<=|>=|[=<>(),+\-\[\].])"
+    r"|(?P<word>[A-Za-z_][A-Za-z0-9_]*))"
+)
+_COMPARATORS = ("=", "<>", "<", "<=", ">", ">=")
+
+
+def validation_error(message: str, operation: str = "UpdateItem") -> ClientError:
+    """
+    Create the error DynamoDB returns for an invalid request.
+
+    :param message: Description of the problem
+    :param operation: The operation that failed
+    :return: The error
+    """
+    return ClientError({"Error": {"Code": "ValidationException", "Message": message}}, operation)
+
+
+def normalize_value(value: Any) -> Any:
+    """
+    Copy a value the way DynamoDB stores it: numbers become Decimals and containers are copied so the stored item
+    does not share state with the caller.
+
+    :param value: The value to copy
+    :return: The stored value
+    """
+    if isinstance(value, dict):
+        return {key: normalize_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return {normalize_value(item) for item in value}
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return value
+
+
+def evaluate_condition(
+    expression: Optional[str],
+    item: Dict[str, Any],
+    names: Optional[Dict[str, str]] = None,
+    values: Optional[Dict[str, Any]] = None,
+) -> bool:
+    """
+    Evaluate a condition expression against an item.
+
+    :param expression: The condition, an empty condition is always satisfied
+    :param item: The item, empty if it does not exist
+    :param names: The ExpressionAttributeNames of the request
+    :param values: The ExpressionAttributeValues of the request
+    :return: True if the item satisfies the condition
+    """
+    if not expression:
+        return True
+    return bool(_compile_condition(expression)(item, names or {}, values or {}))
+
+
+def apply_update(
+    expression: str,
+    item: Dict[str, Any],
+    names: Optional[Dict[str, str]] = None,
+    values: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Apply an update expression to an item. Every operand is evaluated against the item as it was before the update,
+    as DynamoDB does.
+
+    :param expression: The update expression
+    :param item: The item, with only its key if it does not exist yet
+    :param names: The ExpressionAttributeNames of the request
+    :param values: The ExpressionAttributeValues of the request
+    :return: The updated item, the item passed in is not modified
+    :raises ClientError: A ValidationException if the update cannot be applied to the item
+    """
+    names, values = names or {}, values or {}
+    changes = [(action, path(names), operand(item, names, values)) for action, path, operand in _compile_update(expression)]
+    updated = dict(item)
+    for action, attribute, value in changes:
+        if action == "SET":
+            updated[attribute] = value
+        elif action == "REMOVE":
+            updated.pop(attribute, None)
+        elif action == "ADD":
+            current = updated.get(attribute, MISSING)
+            if isinstance(value, Decimal):
+                if current is MISSING:
+                    current = Decimal(0)
+                if not isinstance(current, Decimal):
+                    raise validation_error(f"An operand in the update expression has an incorrect data type: {attribute}")
+                updated[attribute] = current + value
+            elif isinstance(value, set):
+                updated[attribute] = (set() if current is MISSING else set(current)) | value
+            else:
+                raise validation_error(f"ADD only supports numbers and sets: {attribute}")
+        elif action == "DELETE":
+            current = updated.get(attribute, MISSING)
+            if current is not MISSING:
+                remaining = set(current) - set(value)
+                if remaining:
+                    updated[attribute] = remaining
+                else:
+                    updated.pop(attribute)
+    return updated
+
+
+class _Parser:
+    """
+    Recursive descent parser turning an expression into functions of (item, names, values).
+    """
+
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(expression):
+            match = _TOKEN_PATTERN.match(expression, position)
+            if match is None or match.end() == position:
+                if expression[position:].strip():
+                    raise validation_error(f"Invalid expression: {expression}")
+                break
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.index = 0
+
+    def peek(self, offset: int = 0) -> Tuple[Optional[str], Optional[str]]:
+        if self.index + offset < len(self.tokens):
+            return self.tokens[self.index + offset]
+        return None, None
+
+    def peek_word(self) -> Optional[str]:
+        kind, text = self.peek()
+        return text.upper() if kind == "word" else None
+
+    def next(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token[0] is None:
+            raise validation_error(f"Unexpected end of expression: {self.expression}")
+        self.index += 1
+        return token
+
+    def expect(self, text: str) -> None:
+        kind, token = self.next()
+        if token.upper() != text:
+            raise validation_error(f"Expected {text} but found {token} in expression: {self.expression}")
+
+    def at_end(self) -> bool:
+        return self.index >= len(self.tokens)
+
+    # Operands
+
+    def path(self) -> Callable[[Dict[str, str]], str]:
+        kind, text = self.next()
+        if kind == "name":
+            attribute_name = text
+
+            def resolve(names: Dict[str, str]) -> str:
+                if attribute_name not in names:
+                    raise validation_error(f"An expression attribute name is not defined: {attribute_name}")
+                return names[attribute_name]
+
+        elif kind == "word":
+
+            def resolve(names: Dict[str, str]) -> str:
+                return text
+
+        else:
+            raise validation_error(f"Expected an attribute but found {text} in expression: {self.expression}")
+        if self.peek()[1] in (".", "["):
+            raise validation_error(f"Nested attribute paths are not supported: {self.expression}")
+        return resolve
+
+    def operand(self) -> Operand:
+        left = self.term()
+        operator = self.peek()[1]
+        if operator not in ("+", "-"):
+            return left
+        self.next()
+        right = self.term()
+
+        def arithmetic(item, names, values):
+            left_value, right_value = left(item, names, values), right(item, names, values)
+            if not isinstance(left_value, Decimal) or not isinstance(right_value, Decimal):
+                raise validation_error(f"An operand in the update expression has an incorrect data type: {self.expression}")
+            return left_value + right_value if operator == "+" else left_value - right_value
+
+        return arithmetic
+
+    def term(self) -> Operand:
+        kind, text = self.peek()
+        if kind == "value":
+            self.next()
+
+            def value(item, names, values):
+                if text not in values:
+                    raise validation_error(f"An expression attribute value is not defined: {text}")
+                return normalize_value(values[text])
+
+            return value
+
+        function = text.lower() if kind == "word" and self.peek(1)[1] == "(" else None
+        if function == "if_not_exists":
+            self.next()
+            self.expect("(")
+            path = self.path()
+            self.expect(",")
+            default = self.operand()
+            self.expect(")")
+
+            def if_not_exists(item, names, values):
+                current = item.get(path(names), MISSING)
+                return default(item, names, values) if current is MISSING else current
+
+            return if_not_exists
+
+        if function == "list_append":
+            self.next()
+            self.expect("(")
+            first = self.operand()
+            self.expect(",")
+            second = self.operand()
+            self.expect(")")
+
+            def list_append(item, names, values):
+                first_value, second_value = first(item, names, values), second(item, names, values)
+                if not isinstance(first_value, list) or not isinstance(second_value, list):
+                    raise validation_error(f"list_append operands must be lists: {self.expression}")
+                return first_value + second_value
+
+            return list_append
+
+        if function == "size":
+            self.next()
+            self.expect("(")
+            path = self.path()
+            self.expect(")")
+
+            def size(item, names, values):
+                current = item.get(path(names), MISSING)
+                return MISSING if current is MISSING else Decimal(len(current))
+
+            return size
+
+        path = self.path()
+
+        def attribute(item, names, values):
+            return item.get(path(names), MISSING)
+
+        return attribute
+
+    # Conditions
+
+    def condition(self) -> Operand:
+        left = self.conjunction()
+        while self.peek_word() == "OR":
+            self.next()
+            left = self._combine(left, self.conjunction(), any)
+        return left
+
+    def conjunction(self) -> Operand:
+        left = self.negation()
+        while self.peek_word() == "AND":
+            self.next()
+            left = self._combine(left, self.negation(), all)
+        return left
+
+    @staticmethod
+    def _combine(left: Operand, right: Operand, combine: Callable) -> Operand:
+        return lambda item, names, values: combine(
+            (condition(item, names, values) for condition in (left, right))  # short circuits
+        )
+
+    def negation(self) -> Operand:
+        if self.peek_word() == "NOT":
+            self.next()
+            negated = self.negation()
+            return lambda item, names, values: not negated(item, names, values)
+        return self.primary()
+
+    def primary(self) -> Operand:
+        kind, text = self.peek()
+        if text == "(":
+            self.next()
+            condition = self.condition()
+            self.expect(")")
+            return condition
+
+        function = text.lower() if kind == "word" and self.peek(1)[1] == "(" else None
+        if function in ("attribute_exists", "attribute_not_exists"):
+            self.next()
+            self.expect("(")
+            path = self.path()
+            self.expect(")")
+            exists = function == "attribute_exists"
+            return lambda item, names, values: (path(names) in item) == exists
+
+        if function in ("contains", "begins_with"):
+            self.next()
+            self.expect("(")
+            container = self.operand()
+            self.expect(",")
+            operand = self.operand()
+            self.expect(")")
+
+            def contains(item, names, values):
+                container_value, value = container(item, names, values), operand(item, names, values)
+                if container_value is MISSING or value is MISSING:
+                    return False
+                if function == "begins_with":
+                    return isinstance(container_value, str) and isinstance(value, str) and container_value.startswith(value)
+                if isinstance(container_value, str):
+                    return isinstance(value, str) and value in container_value
+                return isinstance(container_value, (list, set)) and value in container_value
+
+            return contains
+
+        left = self.operand()
+        operator = self.next()[1]
+        if operator.upper() == "BETWEEN":
+            low = self.operand()
+            self.expect("AND")
+            high = self.operand()
+            return lambda item, names, values: _compare(
+                left(item, names, values), low(item, names, values), ">="
+            ) and _compare(left(item, names, values), high(item, names, values), "<=")
+        if operator.upper() == "IN":
+            self.expect("(")
+            candidates = [self.operand()]
+            while self.peek()[1] == ",":
+                self.next()
+                candidates.append(self.operand())
+            self.expect(")")
+            return lambda item, names, values: any(
+                _compare(left(item, names, values), candidate(item, names, values), "=") for candidate in candidates
+            )
+        if operator not in _COMPARATORS:
+            raise validation_error(f"Invalid operator {operator} in expression: {self.expression}")
+        right = self.operand()
+        return lambda item, names, values: _compare(left(item, names, values), right(item, names, values), operator)
+
+    # Updates
+
+    def update(self) -> List[Tuple[str, Callable[[Dict[str, str]], str], Operand]]:
+        actions = []
+        while not self.at_end():
+            clause = self.peek_word()
+            if clause not in ("SET", "ADD", "REMOVE", "DELETE"):
+                raise validation_error(f"Invalid update clause {self.peek()[1]} in expression: {self.expression}")
+            self.next()
+            while True:
+                path = self.path()
+                if clause == "SET":
+                    self.expect("=")
+                    actions.append((clause, path, self.operand()))
+                elif clause == "REMOVE":
+                    actions.append((clause, path, lambda item, names, values: None))
+                else:
+                    actions.append((clause, path, self.term()))
+                if self.peek()[1] != ",":
+                    break
+                self.next()
+        return actions
+
+
+def _compare(left: Any, right: Any, operator: str) -> bool:
+    """
+    Compare two operands. Comparisons with a missing attribute or between values of different types are false,
+    except for <> which is then true.
+    """
+    if left is MISSING or right is MISSING:
+        return operator == "<>"
+    try:
+        if operator == "=":
+            return left == right
+        if operator == "<>":
+            return left != right
+        if operator == "<":
+            return left < right
+        if operator == "<=":
+            return left <= right
+        if operator == ">":
+            return left > right
+        return left >= right
+    except TypeError:
+        return operator == "<>"
+
+
+@lru_cache(maxsize=256)
+def _compile_condition(expression: str) -> Operand:
+    parser = _Parser(expression)
+    condition = parser.condition()
+    if not parser.at_end():
+        raise validation_error(f"Unexpected {parser.peek()[1]} in condition expression: {expression}")
+    return condition
+
+
+@lru_cache(maxsize=256)
+def _compile_update(expression: str) -> List[Tuple[str, Callable[[Dict[str, str]], str], Operand]]:
+    actions = _Parser(expression).update()
+    if not actions:
+        raise validation_error(f"Empty update expression: {expression}")
+    return actions
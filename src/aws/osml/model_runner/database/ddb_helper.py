@@ -1,18 +1,16 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
 import random
 import time
 from dataclasses import asdict, dataclass, field, fields
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import boto3
 from boto3.dynamodb.conditions import Key
 
-from aws.osml.model_runner.app_config import BotoConfig
-
 from .exceptions import DDBBatchWriteException, DDBUpdateException
+from .persistence_backend import open_table
 
 logger = logging.getLogger(__name__)
 
@@ -63,19 +61,24 @@ class DDBItem:
 
 class DDBHelper:
     """
-    DDBHelper is a class meant to help OSML with accessing and interacting with DynamoDB tables.
+    DDBHelper is a class meant to help OSML with accessing and interacting with DynamoDB tables. The table is opened
+    in the persistence backend configured for the service, DynamoDB or an in-memory store with the same semantics.
 
     Attributes:
         table_name (str): The name of the DynamoDB table to interact with.
-        client (boto3.resources.factory.dynamodb.ServiceResource): A DynamoDB service resource instance used.
-        table (boto3.resources.factory.dynamodb.Table): A reference to the DynamoDB table for performing operations.
+        client (PersistenceBackend): The DynamoDB service resource, or the in-memory store, holding the table.
+        table (TableBackend): A reference to the DynamoDB table for performing operations.
     """
 
-    def __init__(self, table_name: str) -> None:
+    def __init__(self, table_name: str, key_attributes: Optional[Sequence[str]] = None) -> None:
+        """
+        :param table_name: The name of the table
+        :param key_attributes: The names of the hash key and, if the table has one, the range key. Required by the
+                               in-memory backend, which has no table definitions to read them from.
+        """
         # build a table resource to use for accessing data
         self.table_name = table_name
-        self.client = boto3.resource("dynamodb", config=BotoConfig.ddb)
-        self.table = self.client.Table(table_name)
+        self.client, self.table = open_table(table_name, key_attributes or ())
 
     def get_ddb_item(self, ddb_item: DDBItem) -> Dict[str, Any]:
         """
@@ -0,0 +1,145 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from boto3.dynamodb.conditions import Key
+from dacite import from_dict
+
+from aws.osml.model_runner.app_config import ServiceConfig
+
+from .ddb_helper import DDBHelper, DDBItem, DDBKey
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointStatisticsItem(DDBItem):
+    """
+    EndpointStatisticsItem is a dataclass meant to represent the tile inference statistics observed for a model
+    endpoint variant during a fixed length time bucket.
+
+    The data schema is defined as follows:
+    endpoint_key: str = primary key - formatted as endpoint name + "#" + variant name (empty if no variant)
+    bucket_start: int = secondary key - start of the time bucket in epoch seconds
+    tile_count: Optional[int] = number of tiles successfully processed by the endpoint during the bucket
+    failed_tile_count: Optional[int] = number of tiles that failed during the bucket
+    latency_sum_ms: Optional[int] = sum of the inference latencies of the successful tiles in milliseconds
+    expire_time: Optional[int] = time in epoch seconds when the item will expire from the table
+    """
+
+    endpoint_key: str
+    bucket_start: int
+    tile_count: Optional[int] = None
+    failed_tile_count: Optional[int] = None
+    latency_sum_ms: Optional[int] = None
+    expire_time: Optional[int] = None
+
+    def __post_init__(self):
+        self.ddb_key = DDBKey(
+            hash_key="endpoint_key",
+            hash_value=self.endpoint_key,
+            range_key="bucket_start",
+            range_value=self.bucket_start,
+        )
+
+
+class EndpointStatisticsTable(DDBHelper):
+    """
+    EndpointStatisticsTable shares the tile inference latencies observed by every tile worker in the cluster. Each
+    item holds running totals for one endpoint variant and one time bucket. Workers add to the totals atomically so
+    no coordination is needed between them, and readers combine the buckets in a recent window to get rolling
+    statistics.
+
+    :param table_name: str = the name of the table to interact with
+    :param bucket_seconds: int = the length of the time buckets in seconds
+
+    :return: None
+    """
+
+    def __init__(self, table_name: str, bucket_seconds: int = 60) -> None:
+        super().__init__(table_name, key_attributes=("endpoint_key", "bucket_start"))
+        self.bucket_seconds = max(1, bucket_seconds)
+
+    @staticmethod
+    def endpoint_key(endpoint_name: str, variant_name: Optional[str] = None) -> str:
+        """
+        Build the partition key used for an endpoint variant.
+
+        :param endpoint_name: str = the SageMaker endpoint name or HTTP URL
+        :param variant_name: Optional[str] = the production variant, None if the requests were not routed to one
+
+        :return: str = the partition key
+        """
+        return f"{endpoint_name}#{variant_name or ''}"
+
+    def bucket_for(self, timestamp: float) -> int:
+        """
+        Find the start of the time bucket containing a timestamp.
+
+        :param timestamp: float = time in epoch seconds
+
+        :return: int = start of the bucket in epoch seconds
+        """
+        return int(timestamp) - int(timestamp) % self.bucket_seconds
+
+    def add_tile_statistics(
+        self,
+        endpoint_name: str,
+        variant_name: Optional[str],
+        bucket_start: int,
+        tile_count: int,
+        failed_tile_count: int,
+        latency_sum_ms: int,
+    ) -> None:
+        """
+        Atomically add tile results to the totals for an endpoint variant and time bucket.
+
+        :param endpoint_name: str = the SageMaker endpoint name or HTTP URL
+        :param variant_name: Optional[str] = the production variant the tiles were sent to
+        :param bucket_start: int = start of the time bucket in epoch seconds
+        :param tile_count: int = number of tiles successfully processed
+        :param failed_tile_count: int = number of tiles that failed
+        :param latency_sum_ms: int = sum of the inference latencies of the successful tiles in milliseconds
+
+        :return: None
+        """
+        # Statistics are only useful for a short time so they expire on the same schedule as the other tables
+        expire_time = int(time.time()) + (ServiceConfig.ddb_ttl_in_days * 24 * 60 * 60)
+        self.update_ddb_item(
+            EndpointStatisticsItem(endpoint_key=self.endpoint_key(endpoint_name, variant_name), bucket_start=bucket_start),
+            update_exp=(
+                "ADD tile_count :tile_count, failed_tile_count :failed_tile_count, latency_sum_ms :latency_sum_ms "
+                "SET expire_time = :expire_time"
+            ),
+            update_attr={
+                ":tile_count": tile_count,
+                ":failed_tile_count": failed_tile_count,
+                ":latency_sum_ms": latency_sum_ms,
+                ":expire_time": expire_time,
+            },
+        )
+
+    def get_tile_statistics(
+        self, endpoint_name: str, variant_name: Optional[str], since: int
+    ) -> List[EndpointStatisticsItem]:
+        """
+        Get the statistics buckets for an endpoint variant starting at or after a given time.
+
+        :param endpoint_name: str = the SageMaker endpoint name or HTTP URL
+        :param variant_name: Optional[str] = the production variant
+        :param since: int = earliest bucket start to return in epoch seconds
+
+        :return: List[EndpointStatisticsItem] = the buckets in ascending time order
+        """
+        key_condition = Key("endpoint_key").eq(self.endpoint_key(endpoint_name, variant_name)) & Key("bucket_start").gte(
+            since
+        )
+        response = self.table.query(KeyConditionExpression=key_condition)
+        items = response.get("Items", [])
+        while "LastEvaluatedKey" in response:
+            response = self.table.query(KeyConditionExpression=key_condition, ExclusiveStartKey=response["LastEvaluatedKey"])
+            items.extend(response.get("Items", []))
+        return [from_dict(EndpointStatisticsItem, self.convert_decimal(item)) for item in items]
@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
 import random
@@ -6,9 +6,8 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from secrets import token_hex
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-import geojson
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
 from aws_embedded_metrics.unit import Unit
@@ -17,7 +16,7 @@ from dacite import from_dict
 from geojson import Feature
 
 from aws.osml.model_runner.app_config import MetricLabels, ServiceConfig
-from aws.osml.model_runner.common import ImageDimensions, Timer, get_feature_image_bounds
+from aws.osml.model_runner.common import FeatureBatch, ImageDimensions, Timer, get_feature_image_bounds, get_json_codec
 
 from .ddb_helper import DDBHelper, DDBItem, DDBKey
 from .exceptions import AddFeaturesException
@@ -75,7 +74,7 @@ class FeatureItem(DDBItem):
 
 class FeatureTable(DDBHelper):
     def __init__(self, table_name: str, tile_size: ImageDimensions, overlap: ImageDimensions) -> None:
-        super().__init__(table_name)
+        super().__init__(table_name, key_attributes=("hash_key", "range_key"))
         self.tile_size = tile_size
         self.overlap = overlap
         self.hash_salt = 50
@@ -110,6 +109,7 @@ class FeatureTable(DDBHelper):
             metrics_logger=metrics,
         ):
             try:
+                json_codec = get_json_codec()
                 items = []
                 for key, grouped_features in self.group_features_by_key(features).items():
                     image_id, tile_id = key.split("-region-", 1)
@@ -123,7 +123,7 @@ class FeatureTable(DDBHelper):
                     encoded_features = []
                     for feature in grouped_features:
                         feature_count += 1
-                        encoded_feature = geojson.dumps(feature)
+                        encoded_feature = json_codec.dumps(feature)
                         total_encoded_length += len(encoded_feature)
                         encoded_features.append(encoded_feature)
                         # Once we exceed the 200K byte limit on our features, write them to DDB. We are
@@ -160,15 +160,12 @@ class FeatureTable(DDBHelper):
                     metrics.put_metric(MetricLabels.ERRORS, 1, str(Unit.COUNT.value))
                 raise AddFeaturesException("Failed to add features for tile!") from err
 
-    @metric_scope
-    def get_features(self, image_id: str, metrics: MetricsLogger = None) -> List[Feature]:
+    def _iter_feature_items(self, image_id: str) -> Iterator[FeatureItem]:
         """
-        Parallelized version to query the database for all items with a given image_id,
-        then convert them into feature items.
+        Query the salted partitions of an image in parallel and yield the feature items as each query completes.
 
-        :param image_id: The image_id to aggregate features from DDB for.
-        :param metrics: MetricsLogger = the metrics logger to use to report metrics.
-        :return: List of features aggregated from the DDB table.
+        :param image_id: The image_id to query the items of.
+        :return: The feature items of the image.
         """
 
         def process_query(index: int):
@@ -178,12 +175,35 @@ class FeatureTable(DDBHelper):
                 items.append(from_dict(FeatureItem, row))
             return items
 
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            # Create a range of tasks to query the database for the salted image hash
+            futures = [executor.submit(process_query, i) for i in range(1, self.hash_salt + 1)]
+
+            # For each of the salted index processes, yield the items
+            for future in as_completed(futures):
+                for item in future.result():
+                    if item.features:
+                        yield item
+                    else:
+                        logger.warning(f"Found FeatureTable item: {item.range_key} with no features!")
+
+    @metric_scope
+    def get_features(self, image_id: str, metrics: MetricsLogger = None) -> List[Feature]:
+        """
+        Parallelized version to query the database for all items with a given image_id,
+        then convert them into feature items.
+
+        :param image_id: The image_id to aggregate features from DDB for.
+        :param metrics: MetricsLogger = the metrics logger to use to report metrics.
+        :return: List of features aggregated from the DDB table.
+        """
         if isinstance(metrics, MetricsLogger):
             metrics.set_dimensions()
             metrics.put_dimensions({MetricLabels.OPERATION_DIMENSION: MetricLabels.FEATURE_AGG_OPERATION})
             metrics.put_metric(MetricLabels.INVOCATIONS, 1, str(Unit.COUNT.value))
 
         features: List[Feature] = []
+        json_codec = get_json_codec()
 
         with Timer(
             task_str="Aggregate image features",
@@ -191,22 +211,42 @@ class FeatureTable(DDBHelper):
             logger=logger,
             metrics_logger=metrics,
         ):
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Create a range of tasks to query the database for the salted image hash
-                futures = [executor.submit(process_query, i) for i in range(1, self.hash_salt + 1)]
-
-                # For each of the salted index processes, add the features to the list
-                for future in as_completed(futures):
-                    feature_items = future.result()
-                    for item in feature_items:
-                        if item.features:
-                            for feature in item.features:
-                                features.append(geojson.loads(feature))
-                        else:
-                            logger.warning(f"Found FeatureTable item: {item.range_key} with no features!")
+            for item in self._iter_feature_items(image_id):
+                for feature in item.features:
+                    features.append(json_codec.loads_geojson(feature))
 
         return features
 
+    @metric_scope
+    def get_feature_batch(self, image_id: str, metrics: MetricsLogger = None) -> FeatureBatch:
+        """
+        Query the database for all items with a given image_id and collect their features into a columnar batch.
+        The features of each item are converted to columns as soon as they are decoded, so the features of the
+        whole image are never held as GeoJSON features at the same time.
+
+        :param image_id: The image_id to aggregate features from DDB for.
+        :param metrics: MetricsLogger = the metrics logger to use to report metrics.
+        :return: The batch of features aggregated from the DDB table.
+        """
+        if isinstance(metrics, MetricsLogger):
+            metrics.set_dimensions()
+            metrics.put_dimensions({MetricLabels.OPERATION_DIMENSION: MetricLabels.FEATURE_AGG_OPERATION})
+            metrics.put_metric(MetricLabels.INVOCATIONS, 1, str(Unit.COUNT.value))
+
+        batches: List[FeatureBatch] = []
+        json_codec = get_json_codec()
+
+        with Timer(
+            task_str="Aggregate image features",
+            metric_name=MetricLabels.DURATION,
+            logger=logger,
+            metrics_logger=metrics,
+        ):
+            for item in self._iter_feature_items(image_id):
+                batches.append(FeatureBatch.from_features([json_codec.loads_geojson(feature) for feature in item.features]))
+
+        return FeatureBatch.concatenate(batches)
+
     def group_features_by_key(self, features: List[Feature]) -> Dict[str, List[Feature]]:
         """
         Group all the feature items by key
@@ -280,3 +320,30 @@ class FeatureTable(DDBHelper):
             logger.debug(f"Total features aggregated: {len(features)}")
 
         return features
+
+    @metric_scope
+    def aggregate_feature_batch(self, image_request_item: ImageRequestItem, metrics: MetricsLogger = None) -> FeatureBatch:
+        """
+        For a given image processing job - aggregate all the features that were collected for it into a columnar
+        batch that can be deduplicated and sunk without converting every feature back to GeoJSON first.
+
+        :param image_request_item: ImageRequestItem = the image request
+        :param metrics: the current metrics scope
+
+        :return: FeatureBatch = the batch of features
+        """
+        if isinstance(metrics, MetricsLogger):
+            metrics.set_dimensions()
+            metrics.put_dimensions(
+                {
+                    MetricLabels.OPERATION_DIMENSION: MetricLabels.FEATURE_AGG_OPERATION,
+                }
+            )
+
+        with Timer(
+            task_str="Aggregating Features", metric_name=MetricLabels.DURATION, logger=logger, metrics_logger=metrics
+        ):
+            feature_batch = self.get_feature_batch(image_request_item.image_id)
+            logger.debug(f"Total features aggregated: {len(feature_batch)}")
+
+        return feature_batch
@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import time
 from dataclasses import dataclass
@@ -47,6 +47,7 @@ class ImageRequestItem(DDBItem):
     feature_properties: Optional[str] = additional feature properties or metadata from the image processing
     feature_distillation_option: Optional[str] = the options used in selecting features (e.g., NMS/SOFT_NMS, thresholds)
     roi_wkt: Optional[str] = a Well-Known Text (WKT) representation of the requested processing bounds
+    processing_scale: Optional[int] = decimation factor the image is processed at, 1 or None is full resolution
     """
 
     image_id: str
@@ -70,6 +71,7 @@ class ImageRequestItem(DDBItem):
     feature_properties: Optional[str] = None
     feature_distillation_option: Optional[str] = None
     roi_wkt: Optional[str] = None
+    processing_scale: Optional[int] = None
 
     def __post_init__(self):
         self.ddb_key = DDBKey(hash_key="image_id", hash_value=self.image_id)
@@ -110,7 +112,7 @@ class ImageRequestTable(DDBHelper):
     """
 
     def __init__(self, table_name: str) -> None:
-        super().__init__(table_name)
+        super().__init__(table_name, key_attributes=("image_id",))
 
     def start_image_request(self, image_request_item: ImageRequestItem) -> ImageRequestItem:
         """
@@ -201,18 +203,21 @@ class ImageRequestTable(DDBHelper):
         else:
             raise IsImageCompleteException("Failed to check if image is complete!")
 
-    def end_image_request(self, image_id: str) -> ImageRequestItem:
+    def end_image_request(self, image_id: str, image_request_item: Optional[ImageRequestItem] = None) -> ImageRequestItem:
         """
         Stop an image processing job for given image_id and record the time the job ended, this should be the last
         record for this image in the table.
 
         :param image_id: str = the unique identifier for the image we want to stop processing
+        :param image_request_item: Optional[ImageRequestItem] = the item to write, when the caller holds the only
+                                   up-to-date copy of it; the latest item is read from the table when not given
 
         :return: None
         """
         try:
             # Get the latest item
-            image_request_item = self.get_image_request(image_id)
+            if image_request_item is None:
+                image_request_item = self.get_image_request(image_id)
 
             # Give it an end time
             image_request_item.end_time = int(time.time() * 1000)
@@ -0,0 +1,402 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from enum import auto
+from threading import Lock, RLock
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import boto3
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from botocore.exceptions import ClientError
+
+from aws.osml.model_runner.app_config import BotoConfig
+from aws.osml.model_runner.common import AutoStringEnum
+
+from .ddb_expressions import apply_update, evaluate_condition, normalize_value, validation_error
+
+logger = logging.getLogger(__name__)
+
+# Attribute holding the epoch second after which an item expires, as configured for TTL on the DynamoDB tables
+TTL_ATTRIBUTE = "expire_time"
+
+
+class PersistenceBackendType(str, AutoStringEnum):
+    """
+    The stores the tables can keep their items in. MEMORY keeps them in the ModelRunner process, so it can only be
+    used when a single process handles every request, e.g. a single-node deployment or a benchmark.
+    """
+
+    DYNAMODB = auto()
+    MEMORY = auto()
+
+
+class TableBackend(ABC):
+    """
+    The operations the tables perform on the items of a table: get, put, conditional update, delete, query and scan.
+    The interface follows the boto3 DynamoDB Table resource, so the DynamoDB backend is the boto3 Table itself and
+    other backends accept the same requests and return the same responses. Conditions fail with a ClientError with
+    the ConditionalCheckFailedException code.
+    """
+
+    @abstractmethod
+    def get_item(self, Key: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """
+        :param Key: The key attributes of the item
+        :return: The response, with the item under "Item" if it exists
+        """
+
+    @abstractmethod
+    def put_item(
+        self, Item: Dict[str, Any], ConditionExpression: Optional[Union[str, ConditionBase]] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        :param Item: The item to create or replace
+        :param ConditionExpression: A condition the existing item must satisfy
+        :return: The response
+        """
+
+    @abstractmethod
+    def update_item(
+        self,
+        Key: Dict[str, Any],
+        UpdateExpression: str,
+        ConditionExpression: Optional[Union[str, ConditionBase]] = None,
+        ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+        ReturnValues: str = "NONE",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        :param Key: The key attributes of the item, the item is created if it does not exist
+        :param UpdateExpression: The SET, ADD, REMOVE and DELETE actions to apply
+        :param ConditionExpression: A condition the existing item must satisfy
+        :param ExpressionAttributeValues: The values referenced by the expressions
+        :param ExpressionAttributeNames: The names referenced by the expressions
+        :param ReturnValues: NONE, ALL_NEW or ALL_OLD
+        :return: The response, with the item under "Attributes" when requested
+        """
+
+    @abstractmethod
+    def delete_item(
+        self, Key: Dict[str, Any], ConditionExpression: Optional[Union[str, ConditionBase]] = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        :param Key: The key attributes of the item
+        :param ConditionExpression: A condition the existing item must satisfy
+        :return: The response
+        """
+
+    @abstractmethod
+    def query(self, KeyConditionExpression: Union[str, ConditionBase], **kwargs) -> Dict[str, Any]:
+        """
+        :param KeyConditionExpression: The condition on the key, or index key, attributes of the items to read
+        :return: The response, with the items under "Items" and "LastEvaluatedKey" when there are more pages
+        """
+
+    @abstractmethod
+    def scan(self, **kwargs) -> Dict[str, Any]:
+        """
+        :return: The response, with the items under "Items" and "LastEvaluatedKey" when there are more pages
+        """
+
+
+class PersistenceBackend(ABC):
+    """
+    The store holding the tables, following the boto3 DynamoDB service resource.
+    """
+
+    @abstractmethod
+    def Table(self, name: str) -> TableBackend:  # noqa: N802
+        """
+        :param name: The name of the table
+        :return: The table
+        """
+
+    @abstractmethod
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]], **kwargs) -> Dict[str, Any]:
+        """
+        :param RequestItems: The PutRequest and DeleteRequest operations for each table
+        :return: The response, with the operations that were not processed under "UnprocessedItems"
+        """
+
+
+def _conditional_check_failed(operation: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": "The conditional request failed"}}, operation
+    )
+
+
+def _copy_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a stored item so callers can modify it. Strings and Decimals are immutable and are shared.
+    """
+    return {name: _copy_value(value) for name, value in item.items()}
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return _copy_item(value)
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class InMemoryTable(TableBackend):
+    """
+    A table held in the memory of the process. Requests take a lock on the table, so a conditional update is atomic
+    with respect to the other threads of the process, as it is on DynamoDB. Numbers are stored and returned as
+    Decimals and items are copied on the way in and out, as they are by DynamoDB.
+
+    Items with an expire_time in the past are treated as deleted and removed when they are next read, like the TTL
+    of the DynamoDB tables. Queries return the items sorted by the range key of the table or of the index queried,
+    in descending order if ScanIndexForward is False. Queries on a secondary index are answered by filtering the
+    items on the key condition, and only items with every key attribute of the index are in the index.
+
+    :param name: The name of the table
+    :param key_attributes: The names of the hash key and, if the table has one, the range key
+    :param index_key_attributes: The hash and range key attribute names of each secondary index by index name
+    """
+
+    def __init__(
+        self, name: str, key_attributes: Sequence[str], index_key_attributes: Optional[Dict[str, Sequence[str]]] = None
+    ) -> None:
+        self.name = name
+        self.key_attributes = tuple(key_attributes)
+        self.index_key_attributes = {index: tuple(keys) for index, keys in (index_key_attributes or {}).items()}
+        self.items: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        self._lock = RLock()
+
+    def _item_key(self, key: Dict[str, Any], operation: str) -> Tuple[Any, ...]:
+        try:
+            return tuple(normalize_value(key[attribute]) for attribute in self.key_attributes)
+        except KeyError as err:
+            raise validation_error(f"The provided key element does not match the schema of {self.name}", operation) from err
+
+    def _get_live_item(self, item_key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        item = self.items.get(item_key)
+        if item is not None and self._is_expired(item):
+            del self.items[item_key]
+            return None
+        return item
+
+    @staticmethod
+    def _is_expired(item: Dict[str, Any]) -> bool:
+        expire_time = item.get(TTL_ATTRIBUTE)
+        return isinstance(expire_time, Decimal) and expire_time < time.time()
+
+    @staticmethod
+    def _expressions(request: Dict[str, Any], *expressions: Optional[Union[str, ConditionBase]]) -> Tuple[List, Dict, Dict]:
+        """
+        Get the expressions, names and values of a request. Conditions built with boto3.dynamodb.conditions are
+        converted to expressions the way boto3 does before sending them to DynamoDB.
+        """
+        names = dict(request.get("ExpressionAttributeNames") or {})
+        values = dict(request.get("ExpressionAttributeValues") or {})
+        builder = ConditionExpressionBuilder()
+        converted = []
+        for expression in expressions:
+            if isinstance(expression, ConditionBase):
+                built = builder.build_expression(expression)
+                names.update(built.attribute_name_placeholders)
+                values.update(built.attribute_value_placeholders)
+                expression = built.condition_expression
+            converted.append(expression)
+        return converted, names, values
+
+    def get_item(self, Key: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        with self._lock:
+            item = self._get_live_item(self._item_key(Key, "GetItem"))
+            return {"Item": _copy_item(item)} if item is not None else {}
+
+    def put_item(
+        self, Item: Dict[str, Any], ConditionExpression: Optional[Union[str, ConditionBase]] = None, **kwargs
+    ) -> Dict[str, Any]:
+        item = normalize_value(Item)
+        (expression,), names, values = self._expressions(kwargs, ConditionExpression)
+        with self._lock:
+            item_key = self._item_key(item, "PutItem")
+            existing = self._get_live_item(item_key)
+            if not evaluate_condition(expression, existing or {}, names, values):
+                raise _conditional_check_failed("PutItem")
+            self.items[item_key] = item
+        return {}
+
+    def update_item(
+        self,
+        Key: Dict[str, Any],
+        UpdateExpression: str,
+        ConditionExpression: Optional[Union[str, ConditionBase]] = None,
+        ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+        ExpressionAttributeNames: Optional[Dict[str, str]] = None,
+        ReturnValues: str = "NONE",
+        **kwargs,
+    ) -> Dict[str, Any]:
+        request = {
+            "ExpressionAttributeValues": ExpressionAttributeValues,
+            "ExpressionAttributeNames": ExpressionAttributeNames,
+        }
+        (expression,), names, values = self._expressions(request, ConditionExpression)
+        with self._lock:
+            item_key = self._item_key(Key, "UpdateItem")
+            existing = self._get_live_item(item_key)
+            if not evaluate_condition(expression, existing or {}, names, values):
+                raise _conditional_check_failed("UpdateItem")
+            original = existing if existing is not None else normalize_value(dict(Key))
+            updated = apply_update(UpdateExpression, original, names, values)
+            if self._item_key(updated, "UpdateItem") != item_key:
+                raise validation_error("Cannot update attribute of the key", "UpdateItem")
+            self.items[item_key] = updated
+            if ReturnValues == "ALL_NEW":
+                return {"Attributes": _copy_item(updated)}
+            if ReturnValues == "ALL_OLD" and existing is not None:
+                return {"Attributes": _copy_item(existing)}
+            return {}
+
+    def delete_item(
+        self, Key: Dict[str, Any], ConditionExpression: Optional[Union[str, ConditionBase]] = None, **kwargs
+    ) -> Dict[str, Any]:
+        (expression,), names, values = self._expressions(kwargs, ConditionExpression)
+        with self._lock:
+            item_key = self._item_key(Key, "DeleteItem")
+            existing = self._get_live_item(item_key)
+            if not evaluate_condition(expression, existing or {}, names, values):
+                raise _conditional_check_failed("DeleteItem")
+            self.items.pop(item_key, None)
+            if kwargs.get("ReturnValues") == "ALL_OLD" and existing is not None:
+                return {"Attributes": _copy_item(existing)}
+            return {}
+
+    def query(self, KeyConditionExpression: Union[str, ConditionBase], **kwargs) -> Dict[str, Any]:
+        (key_expression, filter_expression), names, values = self._expressions(
+            kwargs, KeyConditionExpression, kwargs.get("FilterExpression")
+        )
+        key_attributes = self.key_attributes
+        index_name = kwargs.get("IndexName")
+        if index_name is not None:
+            if index_name not in self.index_key_attributes:
+                raise validation_error(f"The table does not have the specified index: {index_name}", "Query")
+            key_attributes = self.index_key_attributes[index_name]
+        items = [
+            item
+            for item in self._live_items()
+            if all(attribute in item for attribute in key_attributes)
+            and evaluate_condition(key_expression, item, names, values)
+            and evaluate_condition(filter_expression, item, names, values)
+        ]
+        if len(key_attributes) > 1:
+            items.sort(key=lambda item: item[key_attributes[1]], reverse=not kwargs.get("ScanIndexForward", True))
+        return self._response(items, kwargs)
+
+    def scan(self, **kwargs) -> Dict[str, Any]:
+        (filter_expression,), names, values = self._expressions(kwargs, kwargs.get("FilterExpression"))
+        items = [item for item in self._live_items() if evaluate_condition(filter_expression, item, names, values)]
+        return self._response(items, kwargs)
+
+    def _live_items(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            expired = [item_key for item_key, item in self.items.items() if self._is_expired(item)]
+            for item_key in expired:
+                del self.items[item_key]
+            return [_copy_item(item) for item in self.items.values()]
+
+    @staticmethod
+    def _response(items: List[Dict[str, Any]], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # Every item is returned in one page
+        if kwargs.get("Select") == "COUNT":
+            return {"Count": len(items), "ScannedCount": len(items)}
+        return {"Items": items, "Count": len(items), "ScannedCount": len(items)}
+
+
+class InMemoryPersistence(PersistenceBackend):
+    """
+    Holds the in-memory tables of the process. Every table object created for the same table name shares its items,
+    as the table objects for a DynamoDB table do.
+    """
+
+    def __init__(self) -> None:
+        self.tables: Dict[str, InMemoryTable] = {}
+        self._lock = Lock()
+
+    def create_table(
+        self, name: str, key_attributes: Sequence[str], index_key_attributes: Optional[Dict[str, Sequence[str]]] = None
+    ) -> InMemoryTable:
+        """
+        Create a table, or get it if it already exists. Indexes not yet on an existing table are added to it.
+
+        :param name: The name of the table
+        :param key_attributes: The names of the hash key and, if the table has one, the range key
+        :param index_key_attributes: The hash and range key attribute names of each secondary index by index name
+        :return: The table
+        """
+        with self._lock:
+            table = self.tables.get(name)
+            if table is None:
+                table = self.tables[name] = InMemoryTable(name, key_attributes, index_key_attributes)
+            elif set(table.key_attributes) != set(key_attributes):
+                raise ValueError(f"Table {name} has the key {table.key_attributes}, not {tuple(key_attributes)}")
+            else:
+                for index_name, index_keys in (index_key_attributes or {}).items():
+                    table.index_key_attributes.setdefault(index_name, tuple(index_keys))
+            return table
+
+    def Table(self, name: str) -> InMemoryTable:  # noqa: N802
+        with self._lock:
+            if name not in self.tables:
+                raise ClientError(
+                    {"Error": {"Code": "ResourceNotFoundException", "Message": f"Table not found: {name}"}}, "DescribeTable"
+                )
+            return self.tables[name]
+
+    def batch_write_item(self, RequestItems: Dict[str, List[Dict[str, Any]]], **kwargs) -> Dict[str, Any]:
+        for table_name, requests in RequestItems.items():
+            table = self.Table(table_name)
+            for request in requests:
+                if "PutRequest" in request:
+                    table.put_item(Item=request["PutRequest"]["Item"])
+                elif "DeleteRequest" in request:
+                    table.delete_item(Key=request["DeleteRequest"]["Key"])
+        return {"UnprocessedItems": {}}
+
+
+# The in-memory tables are shared by everything in the process that uses them
+_in_memory_persistence = InMemoryPersistence()
+
+
+def open_table(
+    table_name: str,
+    key_attributes: Sequence[str],
+    backend_type: Optional[Union[PersistenceBackendType, str]] = None,
+    index_key_attributes: Optional[Dict[str, Sequence[str]]] = None,
+) -> Tuple[Any, Any]:
+    """
+    Open a table in a persistence backend. The backend configured for the service is used when none is given.
+
+    :param table_name: The name of the table
+    :param key_attributes: The names of the hash key and, if the table has one, the range key. In-memory tables are
+                           created with this key the first time they are opened.
+    :param backend_type: The backend holding the table, DYNAMODB or MEMORY
+    :param index_key_attributes: The hash and range key attribute names of each secondary index queried by index
+                                 name. In-memory tables use them to answer and sort index queries.
+    :return: The backend, used for batch writes, and the table
+    """
+    if backend_type is None:
+        from aws.osml.model_runner.app_config import ServiceConfig
+
+        backend_type = ServiceConfig.persistence_backend
+    try:
+        backend_type = PersistenceBackendType(str(backend_type).upper())
+    except ValueError:
+        logger.warning(f"Invalid persistence backend: {backend_type}. Defaulting to DYNAMODB.")
+        backend_type = PersistenceBackendType.DYNAMODB
+
+    if backend_type == PersistenceBackendType.MEMORY:
+        if not key_attributes:
+            raise ValueError(f"The key attributes of table {table_name} are required to open it in memory")
+        return _in_memory_persistence, _in_memory_persistence.create_table(table_name, key_attributes, index_key_attributes)
+    resource = boto3.resource("dynamodb", config=BotoConfig.ddb)
+    return resource, resource.Table(table_name)
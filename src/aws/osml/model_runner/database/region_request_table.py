@@ -39,6 +39,8 @@ class RegionRequestItem(DDBItem):
     failed_tile_count: Optional[int] = count of failed tiles that failed to process
     succeeded_tiles: Optional[List] = list of tiles that succeeded processing
     succeeded_tile_count: Optional[int] = count of successfully processed tiles
+    skipped_tiles: Optional[List] = list of nodata tiles that were skipped without invoking the model
+    skipped_tile_count: Optional[int] = count of skipped tiles
     region_bounds: Optional[List[List[int]]] = list of pixel bounds that define the region
     region_retry_count: Optional[int] = number of times the region processing has been retried
     tile_compression: Optional[str] = compression type of tiles for the region (e.g., 'LZW', 'JPEG')
@@ -63,6 +65,8 @@ class RegionRequestItem(DDBItem):
     failed_tile_count: Optional[int] = None
     succeeded_tiles: Optional[List] = None
     succeeded_tile_count: Optional[int] = None
+    skipped_tiles: Optional[List] = None
+    skipped_tile_count: Optional[int] = None
     region_bounds: Optional[List[List[int]]] = None
     region_retry_count: Optional[int] = None
     tile_compression: Optional[str] = None
@@ -114,7 +118,7 @@ class RegionRequestTable(DDBHelper):
     """
 
     def __init__(self, table_name: str) -> None:
-        super().__init__(table_name)
+        super().__init__(table_name, key_attributes=("region_id", "image_id"))
 
     def start_region_request(self, region_request_item: RegionRequestItem) -> RegionRequestItem:
         """
@@ -138,6 +142,7 @@ class RegionRequestTable(DDBHelper):
             region_request_item.region_retry_count = 0
             region_request_item.succeeded_tile_count = 0
             region_request_item.failed_tile_count = 0
+            region_request_item.skipped_tile_count = 0
             region_request_item.processing_duration = 0
             region_request_item.expire_time = int((start_time_millisec / 1000) + (ddb_ttl_in_days * 24 * 60 * 60))
 
@@ -214,7 +219,7 @@ class RegionRequestTable(DDBHelper):
         :param image_id: str = the id of the image request we want to update
         :param region_id: str = the id of the region request we want to update
         :param tiles: List[ImageRegion] = list of tiles to append
-        :param state: str = state of the tiles to add, i.e. succeeded or failed
+        :param state: str = state of the tiles to add, i.e. succeeded, failed or skipped
         :return: The new updated DDB item.
         """
         if len(tiles) == 0:
@@ -3,14 +3,14 @@
 import logging
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import boto3
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 from aws.osml.model_runner.api import ImageRequest
-from aws.osml.model_runner.app_config import BotoConfig
 from aws.osml.model_runner.database.dataclass_ddb_mixin import DataclassDDBMixin
+from aws.osml.model_runner.database.persistence_backend import open_table
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +33,8 @@ class ImageRequestStatusRecord(DataclassDDBMixin):
     :param num_attempts: Number of times this job has been attempted
     :param regions_complete: List of regions that have completed processing
     :param region_count: Total number of regions to process (optional)
+    :param last_updated: Unix timestamp of the last write to this record
+    :param record_version: Counter incremented on every write, used to discard stale copies of the record
     """
 
     endpoint_id: str
@@ -43,6 +45,8 @@ class ImageRequestStatusRecord(DataclassDDBMixin):
     num_attempts: int
     regions_complete: List[str]
     region_count: Optional[int] = None
+    last_updated: int = 0
+    record_version: int = 0
 
     @classmethod
     def new_from_request(cls, image_request: ImageRequest, region_count: Optional[int] = None) -> "ImageRequestStatusRecord":
@@ -53,15 +57,18 @@ class ImageRequestStatusRecord(DataclassDDBMixin):
         :param region_count: Optional total number of regions to process for capacity planning
         :return: A new ImageRequestStatusRecord instance
         """
+        current_time = int(time.time())
         return cls(
             endpoint_id=image_request.model_name,
             job_id=image_request.job_id,
-            request_time=int(time.time()),
+            request_time=current_time,
             request_payload=image_request,
             last_attempt=0,
             num_attempts=0,
             regions_complete=[],
             region_count=region_count,
+            last_updated=current_time,
+            record_version=0,
         )
 
 
@@ -73,23 +80,50 @@ class RequestedJobsTable:
     updates, and completion. It is intended to only keep requests that are either pending execution or in progress.
     It does not keep a history of past requests as they are removed once completed (either successfully or with errors).
 
-    Note that some operations on this class, e.g. get_outstanding_requests, perform a full table scan. It is
-    essential that users of this table ensure there is some reasonable limit to the number of requests stored.
-    The expectation is that the system is only working on some relatively small number of images at any one time
-    (likely 10s, at most 1000 requests). If that assumption doesn't hold true in the future we will need to expand
-    this class to have a secondary index based on request time and offer protections to only scan through a limited
-    number of requests.
+    The scheduler reads the outstanding requests on every cycle, so this class keeps a local view of the table
+    instead of scanning it each time. The view is rebuilt with a full consistent scan every `full_refresh_interval`
+    seconds, which is also how deletions made by other workers are picked up. In between, only the records
+    written since the last refresh are read through the UPDATED_INDEX secondary index, and every write made through
+    this class is applied to the view directly. Each record carries a `record_version` that is incremented on every
+    write so an older copy of a record never replaces a newer one. If the index does not exist on the table the class
+    falls back to scanning on every call.
+
+    A slightly stale view is safe because start_next_attempt is a conditional update; a worker acting on an outdated
+    record simply loses the race and the record is reloaded.
     """
 
-    def __init__(self, table_name: str):
+    # Sparse secondary index over all outstanding records ordered by the time of their last write
+    UPDATED_INDEX = "outstanding_requests_by_update"
+    INDEX_PARTITION_ATTRIBUTE = "scheduler_partition"
+    INDEX_PARTITION_VALUE = "outstanding"
+
+    # Records written by other workers are timestamped with their clocks so the incremental query looks back a
+    # little further than the newest update seen to tolerate some clock skew between instances
+    UPDATE_WINDOW_SKEW_SECONDS = 5
+
+    # Update expression fragment that stamps every write with its time and a new version number
+    _VERSION_UPDATE = "last_updated = :updated, record_version = if_not_exists(record_version, :zero) + :one"
+
+    def __init__(self, table_name: str, full_refresh_interval: int = 60):
         """
         Initialize the RequestedJobsTable.
 
         :param table_name: Name of the DynamoDB table to used to track outstanding requests
+        :param full_refresh_interval: Maximum age in seconds of the local view before it is rebuilt with a full
+                                      table scan. A value of 0 scans the table on every call.
         """
         self.table_name = table_name
-        self.client = boto3.resource("dynamodb", config=BotoConfig.ddb)
-        self.table = self.client.Table(table_name)
+        self.client, self.table = open_table(
+            table_name,
+            ("endpoint_id", "job_id"),
+            index_key_attributes={self.UPDATED_INDEX: (self.INDEX_PARTITION_ATTRIBUTE, "last_updated")},
+        )
+        self.full_refresh_interval = full_refresh_interval
+
+        self._cached_records: Dict[Tuple[str, str], ImageRequestStatusRecord] = {}
+        self._last_full_refresh: Optional[float] = None
+        self._updated_since = 0
+        self._index_available = True
 
     def add_new_request(self, image_request: ImageRequest, region_count: Optional[int] = None) -> ImageRequestStatusRecord:
         """
@@ -105,7 +139,10 @@ class RequestedJobsTable:
         logger.debug(f"Adding ImageRequest for {image_request.job_id} to image request table.")
         try:
             request_status_record = ImageRequestStatusRecord.new_from_request(image_request, region_count)
-            self.table.put_item(Item=request_status_record.to_ddb_item())
+            item = request_status_record.to_ddb_item()
+            item[self.INDEX_PARTITION_ATTRIBUTE] = self.INDEX_PARTITION_VALUE
+            self.table.put_item(Item=item)
+            self._cache_record(request_status_record)
             return request_status_record
         except ClientError as ce:
             logger.error(f"Unable to add ImageRequest {image_request.job_id} to image request table.")
@@ -122,13 +159,14 @@ class RequestedJobsTable:
         """
         logger.debug(f"Updating region count to {region_count} for job {image_request.job_id}")
         try:
-            self.table.update_item(
+            response = self.table.update_item(
                 Key={"endpoint_id": image_request.model_name, "job_id": image_request.job_id},
-                UpdateExpression="SET region_count = :count",
+                UpdateExpression=f"SET region_count = :count, {self._VERSION_UPDATE}",
                 ConditionExpression="attribute_exists(job_id)",
-                ExpressionAttributeValues={":count": region_count},
-                ReturnValues="UPDATED_NEW",
+                ExpressionAttributeValues={":count": region_count, **self._version_update_values()},
+                ReturnValues="ALL_NEW",
             )
+            self._cache_item(response.get("Attributes"))
             logger.debug(f"Successfully updated region count for job {image_request.job_id}")
         except ClientError as ce:
             logger.error(
@@ -142,9 +180,32 @@ class RequestedJobsTable:
         """
         Retrieve all outstanding image processing requests.
 
+        The local view of the table is rebuilt with a full scan when it is older than the refresh interval,
+        otherwise only the records updated since the last call are read from the table.
+
         :return: List of all incomplete image processing requests
         :raises ClientError: If there is an error querying DynamoDB
         """
+        current_time = time.time()
+        if (
+            not self._index_available
+            or self._last_full_refresh is None
+            or current_time - self._last_full_refresh >= self.full_refresh_interval
+        ):
+            self._refresh_all_records()
+            self._last_full_refresh = current_time
+        else:
+            self._refresh_updated_records()
+
+        logger.debug(f"Found {len(self._cached_records)} outstanding requests.")
+        return list(self._cached_records.values())
+
+    def _refresh_all_records(self) -> None:
+        """
+        Replace the local view of the table with the results of a full consistent scan.
+
+        :raises ClientError: If there is an error scanning DynamoDB
+        """
         logger.debug("Scanning image request table for outstanding ImageRequests.")
         try:
             response = self.table.scan(ConsistentRead=True)
@@ -154,15 +215,98 @@ class RequestedJobsTable:
             while "LastEvaluatedKey" in response:
                 response = self.table.scan(ConsistentRead=True, ExclusiveStartKey=response["LastEvaluatedKey"])
                 items.extend(response.get("Items", []))
-            logger.debug(f"Found {len(items)} outstanding requests.")
-
-            # Convert DynamoDB items back to ImageRequestStatusRecord objects
-            return [ImageRequestStatusRecord.from_ddb_item(item) for item in items]
         except ClientError as ce:
             logger.error("Unable to scan image request table for outstanding image requests.")
             logger.exception(ce)
             raise
 
+        # Convert DynamoDB items back to ImageRequestStatusRecord objects
+        self._cached_records = {}
+        for item in items:
+            self._cache_item(item)
+
+    def _refresh_updated_records(self) -> None:
+        """
+        Merge the records written since the last refresh into the local view using the update time index.
+        Falls back to full scans if the table does not have the index.
+
+        :raises ClientError: If there is an error querying DynamoDB
+        """
+        since = self._updated_since - self.UPDATE_WINDOW_SKEW_SECONDS
+        query_args: Dict[str, Any] = {
+            "IndexName": self.UPDATED_INDEX,
+            "KeyConditionExpression": Key(self.INDEX_PARTITION_ATTRIBUTE).eq(self.INDEX_PARTITION_VALUE)
+            & Key("last_updated").gte(since),
+        }
+        try:
+            response = self.table.query(**query_args)
+            items = response.get("Items", [])
+            while "LastEvaluatedKey" in response:
+                response = self.table.query(**query_args, ExclusiveStartKey=response["LastEvaluatedKey"])
+                items.extend(response.get("Items", []))
+        except ClientError as ce:
+            # DynamoDB reports a missing index as a validation error, some emulators as a missing resource
+            if ce.response["Error"]["Code"] in ["ValidationException", "ResourceNotFoundException"]:
+                logger.warning(
+                    f"Index {self.UPDATED_INDEX} is not available on {self.table_name}. "
+                    "Falling back to full table scans for outstanding requests."
+                )
+                self._index_available = False
+                self._refresh_all_records()
+                return
+            logger.error("Unable to query image request table for updated image requests.")
+            logger.exception(ce)
+            raise
+
+        for item in items:
+            self._cache_item(item)
+
+    def _cache_item(self, item: Optional[Dict[str, Any]]) -> None:
+        """
+        Convert a DynamoDB item to a status record and merge it into the local view.
+
+        :param item: The DynamoDB item, ignored if None
+        """
+        if item:
+            self._cache_record(ImageRequestStatusRecord.from_ddb_item(item))
+
+    def _cache_record(self, record: ImageRequestStatusRecord) -> None:
+        """
+        Merge a status record into the local view unless a newer version of it is already present.
+
+        Cached records are replaced rather than modified so references handed out by get_outstanding_requests
+        keep the values they were read with.
+
+        :param record: The status record to merge
+        """
+        key = (record.endpoint_id, record.job_id)
+        cached_record = self._cached_records.get(key)
+        if cached_record is None or record.record_version >= cached_record.record_version:
+            self._cached_records[key] = record
+        self._updated_since = max(self._updated_since, record.last_updated)
+
+    def _reload_record(self, endpoint_id: str, job_id: str) -> None:
+        """
+        Replace a record in the local view with a consistent read from the table, removing it if the
+        record no longer exists.
+
+        :param endpoint_id: The endpoint of the record to reload
+        :param job_id: The job of the record to reload
+        :raises ClientError: If there is an error reading from DynamoDB
+        """
+        response = self.table.get_item(Key={"endpoint_id": endpoint_id, "job_id": job_id}, ConsistentRead=True)
+        self._cached_records.pop((endpoint_id, job_id), None)
+        self._cache_item(response.get("Item"))
+
+    @staticmethod
+    def _version_update_values() -> Dict[str, Any]:
+        """
+        Build the expression attribute values used by _VERSION_UPDATE.
+
+        :return: The expression attribute values
+        """
+        return {":updated": int(time.time()), ":zero": 0, ":one": 1}
+
     def start_next_attempt(self, request_status_record: ImageRequestStatusRecord) -> bool:
         """
         Start the next processing attempt for a request.
@@ -177,17 +321,19 @@ class RequestedJobsTable:
         logger.debug(f"Updating image request table for new attempt of {request_status_record.job_id}")
         try:
             current_time = int(time.time())
-            self.table.update_item(
+            response = self.table.update_item(
                 Key={"endpoint_id": request_status_record.endpoint_id, "job_id": request_status_record.job_id},
-                UpdateExpression="SET last_attempt = :time, num_attempts = num_attempts + :inc",
+                UpdateExpression=f"SET last_attempt = :time, num_attempts = num_attempts + :inc, {self._VERSION_UPDATE}",
                 ConditionExpression="num_attempts = :current_attempts",
                 ExpressionAttributeValues={
                     ":time": current_time,
                     ":inc": 1,
                     ":current_attempts": request_status_record.num_attempts,
+                    **self._version_update_values(),
                 },
-                ReturnValues="UPDATED_NEW",
+                ReturnValues="ALL_NEW",
             )
+            self._cache_item(response.get("Attributes"))
             logger.debug(f"Successfully recorded new attempt for {request_status_record.job_id}")
             return True
         except ClientError as ce:
@@ -196,6 +342,8 @@ class RequestedJobsTable:
                     f"Unable to update image request table for {request_status_record.job_id}. "
                     "Another worker got to it first."
                 )
+                # Our view of this record is out of date, pick up the other worker's changes
+                self._reload_record(request_status_record.endpoint_id, request_status_record.job_id)
                 return False
             else:
                 logger.error(
@@ -214,6 +362,7 @@ class RequestedJobsTable:
         logger.debug(f"Removing {image_request.job_id} from image request table")
         try:
             self.table.delete_item(Key={"endpoint_id": image_request.model_name, "job_id": image_request.job_id})
+            self._cached_records.pop((image_request.model_name, image_request.job_id), None)
         except ClientError as ce:
             logger.error(f"Unable to remove {image_request.job_id} from image request table.")
             logger.exception(ce)
@@ -231,16 +380,25 @@ class RequestedJobsTable:
         """
         logger.debug(f"Adding completed region {region_id} for job {image_request.job_id}")
         try:
-            self.table.update_item(
+            response = self.table.update_item(
                 Key={"endpoint_id": image_request.model_name, "job_id": image_request.job_id},
-                UpdateExpression="SET regions_complete = list_append(if_not_exists(regions_complete, :empty), :region)",
+                UpdateExpression=(
+                    "SET regions_complete = list_append(if_not_exists(regions_complete, :empty), :region), "
+                    f"{self._VERSION_UPDATE}"
+                ),
                 ConditionExpression=(
                     "attribute_exists(job_id) AND "
                     "(attribute_not_exists(regions_complete) OR NOT contains(regions_complete, :region_value))"
                 ),
-                ExpressionAttributeValues={":region": [region_id], ":region_value": region_id, ":empty": []},
-                ReturnValues="UPDATED_NEW",
+                ExpressionAttributeValues={
+                    ":region": [region_id],
+                    ":region_value": region_id,
+                    ":empty": [],
+                    **self._version_update_values(),
+                },
+                ReturnValues="ALL_NEW",
             )
+            self._cache_item(response.get("Attributes"))
             logger.debug(f"Successfully recorded completed region {region_id} for job {image_request.job_id}")
             return True
         except ClientError as ce:
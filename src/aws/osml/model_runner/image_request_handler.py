@@ -6,7 +6,7 @@ import logging
 import random
 from dataclasses import asdict
 from json import dumps
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import boto3
 import shapely.geometry.base
@@ -24,9 +24,11 @@ from aws.osml.photogrammetry import SensorModel
 from .api import VALID_MODEL_HOSTING_OPTIONS, ImageRequest, RegionRequest
 from .app_config import MetricLabels, ServiceConfig
 from .common import (
+    FeatureBatch,
     ImageDimensions,
     ImageRegion,
     ObservableEvent,
+    RegionPlan,
     RequestStatus,
     Timer,
     get_credentials_for_assumed_role,
@@ -46,13 +48,20 @@ from .exceptions import (
     ProcessImageException,
     UnsupportedModelException,
 )
-from .inference import calculate_processing_bounds, get_source_property
+from .inference import calculate_processing_area, calculate_processing_bounds, get_source_property
 from .inference.feature_utils import add_properties_to_features
 from .region_request_handler import RegionRequestHandler
 from .scheduler import RequestQueue
 from .sink import SinkFactory
 from .status import ImageStatusMonitor
-from .tile_worker import TilingStrategy, select_features
+from .tile_worker import (
+    FeatureCollector,
+    GDALDatasetCache,
+    TilingStrategy,
+    resolve_processing_scale,
+    scale_dimensions,
+    select_features,
+)
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
@@ -76,6 +85,8 @@ class ImageRequestHandler:
         region_request_table: RegionRequestTable,
         config: ServiceConfig,
         region_request_handler: RegionRequestHandler,
+        dataset_cache: Optional[GDALDatasetCache] = None,
+        single_node_max_pixels: Optional[int] = None,
     ) -> None:
         """
         Initialize the ImageRequestHandler with the necessary dependencies.
@@ -87,6 +98,11 @@ class ImageRequestHandler:
         :param region_request_table: Table to track region request progress and results.
         :param config: Configuration settings for the service.
         :param region_request_handler: Handler for processing individual region requests.
+        :param dataset_cache: Optional cache that the opened dataset is added to so later regions of the image
+                              processed on this host do not reopen it.
+        :param single_node_max_pixels: Images with a single region, or with at most this many pixels in their regions,
+                                       are processed entirely on this host with their features kept in memory. None
+                                       processes every image through the region queue and tables.
         """
 
         self.image_request_table = image_request_table
@@ -96,6 +112,8 @@ class ImageRequestHandler:
         self.region_request_table = region_request_table
         self.config = config
         self.region_request_handler = region_request_handler
+        self.dataset_cache = dataset_cache
+        self.single_node_max_pixels = single_node_max_pixels
         self.on_image_update = ObservableEvent()
 
     def process_image_request(self, image_request: ImageRequest) -> None:
@@ -131,7 +149,16 @@ class ImageRequestHandler:
             self.validate_model_hosting(image_request_item)
 
             # Load the relevant image meta data into memory
-            extension, ds, sensor_model, regions = self.load_image_request(image_request_item, image_request.roi)
+            extension, ds, sensor_model, regions = self.load_image_request(
+                image_request_item,
+                image_request.roi,
+                image_request.region_plan,
+                overview_level=image_request.overview_level,
+                target_gsd=image_request.target_gsd,
+            )
+
+            if ds and self.dataset_cache is not None:
+                self.dataset_cache.put(image_request.image_url, image_request.image_read_role, ds, sensor_model)
 
             if sensor_model is None:
                 logger.warning(
@@ -155,14 +182,30 @@ class ImageRequestHandler:
                 # Update the feature properties
                 image_request_item.feature_properties = json.dumps(feature_properties)
 
-                # Update the image request job to have new derived image data
-                self.image_request_table.update_image_request(image_request_item)
+                # Update the image request job to have new derived image data. Images processed on this host keep
+                # it in memory until they are finished, so only the start and end of the request are written.
+                processing_scale = image_request_item.processing_scale or 1
+                single_node = self.is_single_node_image(regions, processing_scale)
+                if not single_node:
+                    self.image_request_table.update_image_request(image_request_item)
                 self.on_image_update(image_request_item)
 
                 self.image_status_monitor.process_event(image_request_item, RequestStatus.IN_PROGRESS, "Processing regions")
 
-                # Place the resulting region requests on the appropriate work queue
-                self.queue_region_request(regions, image_request, ds, sensor_model, extension)
+                if single_node:
+                    self.process_image_in_memory(
+                        regions, image_request, image_request_item, ds, sensor_model, extension, processing_scale
+                    )
+                else:
+                    # Place the resulting region requests on the appropriate work queue
+                    self.queue_region_request(
+                        regions,
+                        image_request,
+                        ds,
+                        sensor_model,
+                        extension,
+                        processing_scale=processing_scale,
+                    )
 
         except Exception as err:
             # We failed try and gracefully update our image request
@@ -186,6 +229,7 @@ class ImageRequestHandler:
         raster_dataset: Dataset,
         sensor_model: Optional[SensorModel],
         image_extension: Optional[str],
+        processing_scale: int = 1,
     ) -> None:
         """
         Queue all image regions for processing. Each region is added to the queue, with traceability maintained
@@ -196,6 +240,7 @@ class ImageRequestHandler:
         :param raster_dataset: The GDAL dataset containing the image regions.
         :param sensor_model: The sensor model for this raster dataset, if available.
         :param image_extension: The file extension of the image.
+        :param processing_scale: The decimation factor the regions are processed at.
 
         :return: None
         """
@@ -209,6 +254,7 @@ class ImageRequestHandler:
                 region_bounds=region,
                 region_id=f"{region[0]}{region[1]}-{image_request.job_id}",
                 image_extension=image_extension,
+                processing_scale=processing_scale,
             )
 
             # Create a new entry to the region request being started
@@ -232,6 +278,7 @@ class ImageRequestHandler:
             region_bounds=first_region,
             region_id=f"{first_region[0]}{first_region[1]}-{image_request.job_id}",
             image_extension=image_extension,
+            processing_scale=processing_scale,
         )
 
         # Add item to RegionRequestTable
@@ -249,17 +296,107 @@ class ImageRequestHandler:
             image_format = str(raster_dataset.GetDriver().ShortName).upper()
             self.complete_image_request(first_region_request, image_format, raster_dataset, sensor_model)
 
+    def is_single_node_image(self, regions: List[ImageRegion], processing_scale: int = 1) -> bool:
+        """
+        Decide whether an image is small enough to process entirely on this host instead of distributing its regions.
+
+        :param regions: The regions of the image.
+        :param processing_scale: The decimation factor the regions are processed at.
+
+        :return: True if the regions should be processed in memory on this host.
+        """
+        if self.single_node_max_pixels is None:
+            return False
+        if len(regions) == 1:
+            return True
+        pixel_count = sum(region[1][0] * region[1][1] for region in regions) // (processing_scale * processing_scale)
+        return pixel_count <= self.single_node_max_pixels
+
+    def process_image_in_memory(
+        self,
+        all_regions: List[ImageRegion],
+        image_request: ImageRequest,
+        image_request_item: ImageRequestItem,
+        raster_dataset: Dataset,
+        sensor_model: Optional[SensorModel],
+        image_extension: Optional[str],
+        processing_scale: int = 1,
+    ) -> None:
+        """
+        Process every region of an image on this host and complete the image request. The regions are not written to
+        the region request table or the queue and the features are kept in memory instead of the feature table, so
+        the only writes for the image are the start and end of the image request.
+
+        :param all_regions: List of image regions to process.
+        :param image_request: The image request associated with these regions.
+        :param image_request_item: The image request item, the region counts are recorded on it.
+        :param raster_dataset: The GDAL dataset containing the image regions.
+        :param sensor_model: The sensor model for this raster dataset, if available.
+        :param image_extension: The file extension of the image.
+        :param processing_scale: The decimation factor the regions are processed at.
+
+        :return: None
+        """
+        logger.debug(f"Processing {len(all_regions)} regions of {image_request_item.image_id} in memory")
+        feature_collector = FeatureCollector()
+        for region in all_regions:
+            region_request = RegionRequest(
+                image_request.get_shared_values(),
+                region_bounds=region,
+                region_id=f"{region[0]}{region[1]}-{image_request.job_id}",
+                image_extension=image_extension,
+                processing_scale=processing_scale,
+            )
+            region_status = self.region_request_handler.process_region_in_memory(
+                region_request,
+                RegionRequestItem.from_region_request(region_request),
+                raster_dataset,
+                sensor_model,
+                feature_collector,
+                image_request_item,
+            )
+            if region_status == RequestStatus.SUCCESS:
+                image_request_item.region_success += 1
+            else:
+                image_request_item.region_error += 1
+
+        image_format = str(raster_dataset.GetDriver().ShortName).upper()
+        try:
+            logger.debug(f"Collected {len(feature_collector)} features for job {image_request_item.job_id}")
+            self.finish_image_request(
+                image_request_item,
+                feature_collector.to_feature_batch(),
+                image_format,
+                raster_dataset,
+                sensor_model,
+                in_memory=True,
+            )
+        except Exception as err:
+            raise AggregateFeaturesException("Failed to aggregate features for region!") from err
+
     def load_image_request(
         self,
         image_request_item: ImageRequestItem,
         roi: shapely.geometry.base.BaseGeometry,
+        region_plan: Optional[RegionPlan] = None,
+        overview_level: Optional[int] = None,
+        target_gsd: Optional[float] = None,
     ) -> Tuple[str, Dataset, Optional[SensorModel], List[ImageRegion]]:
         """
         Loads image metadata and prepares it for processing. The image is divided into regions
-        for distribution across workers.
+        for distribution across workers. If a region plan was computed when the request was buffered
+        and it matches the current tiling parameters and image, its regions are reused instead of
+        being recalculated.
+
+        When an overview level or target GSD is requested the image is processed at a reduced resolution.
+        The resolved decimation factor is stored on the image request item and the regions are laid out
+        so that each tile covers tile_size pixels of the reduced resolution image, in full image coordinates.
 
         :param image_request_item: The image request object containing job information.
         :param roi: Region of interest to restrict image processing, provided as a geometry.
+        :param region_plan: Optional region plan computed when the request was buffered.
+        :param overview_level: Optional overview level to process the image at.
+        :param target_gsd: Optional ground sample distance in meters to process the image at.
 
         :raises InvalidImageURLException: If the image URL is not valid.
         :raises LoadImageException: If loading image or processing bounds fails.
@@ -271,6 +408,13 @@ class ImageRequestHandler:
         if image_request_item.image_read_role:
             assumed_credentials = get_credentials_for_assumed_role(image_request_item.image_read_role)
 
+        region_size: ImageDimensions = ast.literal_eval(self.config.region_size)
+        tile_size: ImageDimensions = ast.literal_eval(image_request_item.tile_size)
+        if not image_request_item.tile_overlap:
+            minimum_overlap = (0, 0)
+        else:
+            minimum_overlap = ast.literal_eval(image_request_item.tile_overlap)
+
         # This will update the GDAL configuration options to use the security credentials for this
         # request. Any GDAL managed AWS calls (i.e. incrementally fetching pixels from a dataset
         # stored in S3) within this "with" statement will be made using customer credentials. At
@@ -281,6 +425,21 @@ class ImageRequestHandler:
 
             # Use gdal to load the image url we were given
             raster_dataset, sensor_model = load_gdal_dataset(image_path)
+
+            if overview_level is not None or target_gsd is not None:
+                processing_scale = resolve_processing_scale(raster_dataset, sensor_model, overview_level, target_gsd)
+                image_request_item.processing_scale = processing_scale
+                if processing_scale > 1:
+                    logger.debug(f"Processing {image_request_item.image_id} at 1/{processing_scale} resolution")
+                    region_size = scale_dimensions(region_size, processing_scale)
+                    tile_size = scale_dimensions(tile_size, processing_scale)
+                    minimum_overlap = scale_dimensions(minimum_overlap, processing_scale)
+
+            if self._can_reuse_region_plan(region_plan, raster_dataset, region_size, tile_size, minimum_overlap):
+                logger.debug(f"Reusing the region plan computed for {image_request_item.image_id} during buffering")
+                image_extension = region_plan.image_extension or get_image_extension(image_path)
+                return image_extension, raster_dataset, sensor_model, list(region_plan.regions)
+
             image_extension = get_image_extension(image_path)
 
             # Determine how much of this image should be processed.
@@ -292,20 +451,42 @@ class ImageRequestHandler:
             else:
                 # Calculate a set of ML engine-sized regions that we need to process for this image
                 # Region size chosen to break large images into pieces that can be handled by a
-                # single tile worker
-                region_size: ImageDimensions = ast.literal_eval(self.config.region_size)
-                tile_size: ImageDimensions = ast.literal_eval(image_request_item.tile_size)
-                if not image_request_item.tile_overlap:
-                    minimum_overlap = (0, 0)
-                else:
-                    minimum_overlap = ast.literal_eval(image_request_item.tile_overlap)
-
+                # single tile worker. Regions outside a polygon ROI are never created.
+                processing_area = calculate_processing_area(raster_dataset, roi, sensor_model)
+                area_kwargs = {"processing_area": processing_area} if processing_area is not None else {}
                 all_regions = self.tiling_strategy.compute_regions(
-                    processing_bounds, region_size, tile_size, minimum_overlap
+                    processing_bounds, region_size, tile_size, minimum_overlap, **area_kwargs
                 )
 
         return image_extension, raster_dataset, sensor_model, all_regions
 
+    @staticmethod
+    def _can_reuse_region_plan(
+        region_plan: Optional[RegionPlan],
+        raster_dataset: Dataset,
+        region_size: ImageDimensions,
+        tile_size: ImageDimensions,
+        tile_overlap: ImageDimensions,
+    ) -> bool:
+        """
+        Check whether a region plan computed during buffering still applies to this request. The plan must have
+        been computed with the same tiling parameters and against an image with the same dimensions.
+
+        :param region_plan: The region plan, if any
+        :param raster_dataset: The opened GDAL dataset of the image
+        :param region_size: The region size in use
+        :param tile_size: The tile size in use
+        :param tile_overlap: The tile overlap in use
+        :return: True if the regions in the plan can be used as-is
+        """
+        if not isinstance(region_plan, RegionPlan) or not region_plan.regions:
+            return False
+        if not region_plan.matches(region_size, tile_size, tile_overlap):
+            return False
+        return region_plan.image_width == int(raster_dataset.RasterXSize) and region_plan.image_height == int(
+            raster_dataset.RasterYSize
+        )
+
     def fail_image_request(self, image_request_item: ImageRequestItem, err: Exception) -> None:
         """
         Handles image request failure. Updates the status to 'failed' and ends the request in the job table.
@@ -344,55 +525,76 @@ class ImageRequestHandler:
             # Set up the feature table
             feature_table = FeatureTable(self.config.feature_table, region_request.tile_size, region_request.tile_overlap)
 
-            # Aggregate features
-            features = feature_table.aggregate_features(image_request_item)
+            # Aggregate features into a columnar batch, they are only converted back to GeoJSON by the sinks
+            features = feature_table.aggregate_feature_batch(image_request_item)
             logger.debug(f"Aggregated {len(features)} features for job {image_request_item.job_id}")
 
-            # Deduplicate features
-            logger.info(
-                "Consolidating duplicate features caused by tiling...",
-                extra={"tag": "TIMELINE EVENT", "job_id": image_request_item.job_id},
-            )
-            deduped_features = self.deduplicate(image_request_item, features, raster_dataset, sensor_model)
+            self.finish_image_request(image_request_item, features, image_format, raster_dataset, sensor_model)
 
-            # Add the relevant properties to our final features
-            final_features = add_properties_to_features(
-                image_request_item.job_id, image_request_item.feature_properties, deduped_features
-            )
+        except Exception as err:
+            raise AggregateFeaturesException("Failed to aggregate features for region!") from err
 
-            # Sink features to target outputs
-            logger.info(
-                "Writing features to outputs...", extra={"tag": "TIMELINE EVENT", "job_id": image_request_item.job_id}
-            )
-            self.sink_features(image_request_item, final_features)
+    def finish_image_request(
+        self,
+        image_request_item: ImageRequestItem,
+        features: Union[List[Feature], FeatureBatch],
+        image_format: str,
+        raster_dataset: gdal.Dataset,
+        sensor_model: SensorModel,
+        in_memory: bool = False,
+    ) -> None:
+        """
+        Deduplicates the aggregated features of an image, sinks them and finalizes the request.
 
-            # Finalize and update the job table with the completed request
-            self.end_image_request(image_request_item, image_format)
-            logger.info("Completed image processing.", extra={"tag": "TIMELINE EVENT", "job_id": image_request_item.job_id})
+        :param image_request_item: The image processing job item.
+        :param features: The features of the image.
+        :param image_format: The format of the image file.
+        :param raster_dataset: The GDAL dataset of the processed image.
+        :param sensor_model: The sensor model for the image, if available.
+        :param in_memory: True if the regions of the image were processed in memory on this host.
 
-        except Exception as err:
-            raise AggregateFeaturesException("Failed to aggregate features for region!") from err
+        :return: None
+        """
+        # Deduplicate features
+        logger.info(
+            "Consolidating duplicate features caused by tiling...",
+            extra={"tag": "TIMELINE EVENT", "job_id": image_request_item.job_id},
+        )
+        deduped_features = self.deduplicate(image_request_item, features, raster_dataset, sensor_model)
+
+        # Add the relevant properties to our final features
+        final_features = add_properties_to_features(
+            image_request_item.job_id, image_request_item.feature_properties, deduped_features
+        )
+
+        # Sink features to target outputs
+        logger.info("Writing features to outputs...", extra={"tag": "TIMELINE EVENT", "job_id": image_request_item.job_id})
+        self.sink_features(image_request_item, final_features)
+
+        # Finalize and update the job table with the completed request
+        self.end_image_request(image_request_item, image_format, in_memory=in_memory)
+        logger.info("Completed image processing.", extra={"tag": "TIMELINE EVENT", "job_id": image_request_item.job_id})
 
     @metric_scope
     def deduplicate(
         self,
         image_request_item: ImageRequestItem,
-        features: List[Feature],
+        features: Union[List[Feature], FeatureBatch],
         raster_dataset: gdal.Dataset,
         sensor_model: SensorModel,
         metrics: MetricsLogger = None,
-    ) -> List[Feature]:
+    ) -> Union[List[Feature], FeatureBatch]:
         """
         Deduplicate the features and add additional properties to them, if applicable.
 
         :param metrics:
         :param image_request_item: The image processing job item containing job-specific information.
-        :param features: A list of GeoJSON features to deduplicate.
+        :param features: A list of GeoJSON features or a feature batch to deduplicate.
         :param raster_dataset: The GDAL dataset representing the image being processed.
         :param sensor_model: The sensor model associated with the dataset, used for georeferencing.
         :param metrics: Optional metrics logger for tracking performance metrics.
 
-        :return: A list of deduplicated features with additional properties added.
+        :return: The deduplicated features, of the same type as the input.
         """
         if isinstance(metrics, MetricsLogger):
             metrics.set_dimensions()
@@ -410,14 +612,25 @@ class ImageRequestHandler:
             # Calculate processing bounds based on the region of interest (ROI) and sensor model
             processing_bounds = self.calculate_processing_bounds(raster_dataset, sensor_model, image_request_item.roi_wkt)
 
+            # Features are grouped using the regions and tiles in full image pixels
+            region_size = self.config.region_size
+            tile_size = image_request_item.tile_size
+            tile_overlap = image_request_item.tile_overlap
+            processing_scale = image_request_item.processing_scale or 1
+            if processing_scale > 1:
+                region_size, tile_size, tile_overlap = [
+                    str(scale_dimensions(ast.literal_eval(dimensions), processing_scale))
+                    for dimensions in (region_size, tile_size, tile_overlap)
+                ]
+
             # Select and deduplicate features based on configuration options and processing bounds
             deduplicated_features = select_features(
                 image_request_item.feature_distillation_option,
                 features,
                 processing_bounds,
-                self.config.region_size,
-                image_request_item.tile_size,
-                image_request_item.tile_overlap,
+                region_size,
+                tile_size,
+                tile_overlap,
                 self.tiling_strategy,
             )
 
@@ -443,18 +656,29 @@ class ImageRequestHandler:
 
     @metric_scope
     def end_image_request(
-        self, image_request_item: ImageRequestItem, image_format: str, metrics: MetricsLogger = None
+        self,
+        image_request_item: ImageRequestItem,
+        image_format: str,
+        in_memory: bool = False,
+        metrics: MetricsLogger = None,
     ) -> None:
         """
         Finalizes the image request, updates the job status, and logs the necessary metrics.
 
         :param image_request_item: The image processing job item to finalize.
         :param image_format: The format of the image being processed (e.g., TIFF, NITF).
+        :param in_memory: True if the regions of the image were processed in memory on this host, the item then
+                          holds the only copy of the region counts and is written as it is.
         :param metrics: Optional metrics logger for tracking performance metrics.
 
         :return: None
         """
-        completed_image_request_item = self.image_request_table.end_image_request(image_request_item.image_id)
+        if in_memory:
+            completed_image_request_item = self.image_request_table.end_image_request(
+                image_request_item.image_id, image_request_item
+            )
+        else:
+            completed_image_request_item = self.image_request_table.end_image_request(image_request_item.image_id)
 
         # Retrieve the image request status and send status updates
         image_request_status = self.image_status_monitor.get_status(completed_image_request_item)
@@ -496,7 +720,7 @@ class ImageRequestHandler:
         roi = None
         if roi_wkt:
             logger.debug(f"Using ROI from request to set processing boundary: {roi_wkt}")
-            roi = shapely.to_wkt(roi_wkt)
+            roi = shapely.from_wkt(roi_wkt)
 
         processing_bounds = calculate_processing_bounds(raster_dataset, roi, sensor_model)
         logger.debug(f"Processing boundary from {roi} is {processing_bounds}")
@@ -508,12 +732,14 @@ class ImageRequestHandler:
 
     @staticmethod
     @metric_scope
-    def sink_features(image_request_item: ImageRequestItem, features: List[Feature], metrics: MetricsLogger = None) -> None:
+    def sink_features(
+        image_request_item: ImageRequestItem, features: Union[List[Feature], FeatureBatch], metrics: MetricsLogger = None
+    ) -> None:
         """
         Sink the deduplicated features to the specified output (e.g., S3, Kinesis, etc.).
 
         :param image_request_item: The job item representing the image processing request.
-        :param features: The list of deduplicated GeoJSON features to sink.
+        :param features: The list of deduplicated GeoJSON features or the feature batch to sink.
         :param metrics: Optional metrics logger to track feature sinking performance.
 
         :raises AggregateOutputFeaturesException: If sinking the features to the output fails.
@@ -1,12 +1,20 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 # Telling flake8 to not flag errors in this file. It is normal that these classes are imported but not used in an
 # __init__.py file.
 # flake8: noqa
 
+from .detection_batch import DETECTION_BATCH_MEDIA_TYPE, DetectionBatch, decode_detection_batch, encode_detection_batch
 from .detector import Detector
 from .endpoint_factory import FeatureDetectorFactory
 from .feature_selection import FeatureSelector
-from .feature_utils import calculate_processing_bounds, get_source_property
+from .feature_utils import calculate_processing_area, calculate_processing_bounds, get_source_property
 from .http_detector import HTTPDetector
+from .segmentation_mask import (
+    SEGMENTATION_MASK_MEDIA_TYPE,
+    SegmentationMask,
+    accepts_segmentation_masks,
+    decode_segmentation_mask,
+    encode_segmentation_mask,
+)
 from .sm_detector import SMDetector
@@ -0,0 +1,273 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import geojson
+import numpy as np
+import shapely
+
+from .exceptions import InvalidDetectionBatchException
+
+# Media type a model endpoint responds with, and a request can Accept, for a columnar detection batch.
+DETECTION_BATCH_MEDIA_TYPE = "application/vnd.osml.detections"
+
+# An encoded batch is DETECTION_BATCH_MAGIC, the length of the header as a little-endian uint32, a UTF-8 JSON header
+# and then the columns back to back in the order they are listed in the header. The header is
+# {"count": N, "classes": ["iri", ...], "columns": [{"name": "bbox", "dtype": "<f4", "shape": [N, 4]}, ...]}.
+# The bbox (N, 4) [min_x, min_y, max_x, max_y], score (N,) and class_id (N,) columns are required. Polygons are
+# described by the optional vertices (M, 2) [x, y] column and the vertex_offsets (N + 1,) column giving the range
+# of vertices of each detection. Coordinates are pixels of the tile sent to the model.
+DETECTION_BATCH_MAGIC = b"OSMLDET1"
+REQUIRED_DETECTION_COLUMNS = ["bbox", "score", "class_id"]
+
+
+def is_detection_batch_media_type(content_type: Any) -> bool:
+    """
+    Check whether the content type of a model response identifies a detection batch.
+
+    :param content_type: the content type of the response, may include parameters
+    :return: True if the response is a detection batch
+    """
+    if not isinstance(content_type, str):
+        return False
+    return content_type.split(";")[0].strip().lower() == DETECTION_BATCH_MEDIA_TYPE
+
+
+@dataclass
+class DetectionBatch:
+    """
+    The detections returned by a model for a tile stored as columns of arrays instead of one GeoJSON feature per
+    detection.
+
+    :param bboxes: the (N, 4) [min_x, min_y, max_x, max_y] bounds of each detection
+    :param scores: the (N,) confidence of each detection
+    :param class_ids: the (N,) index of the class of each detection in class_names
+    :param class_names: the class IRIs referenced by class_ids
+    :param vertices: optional (M, 2) [x, y] vertices of the polygon outlining each detection
+    :param vertex_offsets: optional (N + 1,) offsets of the vertices of each detection
+    """
+
+    bboxes: np.ndarray
+    scores: np.ndarray
+    class_ids: np.ndarray
+    class_names: List[str] = field(default_factory=list)
+    vertices: Optional[np.ndarray] = None
+    vertex_offsets: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self.bboxes.shape[0])
+
+    @property
+    def has_polygons(self) -> bool:
+        return self.vertices is not None and self.vertex_offsets is not None
+
+    def to_full_image(self, ulx: float, uly: float, processing_scale: int = 1) -> "DetectionBatch":
+        """
+        Convert the coordinates of the detections from tile pixels to full image pixels.
+
+        :param ulx: the column of the upper left corner of the tile
+        :param uly: the row of the upper left corner of the tile
+        :param processing_scale: the decimation factor of the tile
+        :return: a batch with full image coordinates
+        """
+        offset = np.array([ulx, uly], dtype=np.float64)
+        bboxes = self.bboxes.astype(np.float64).reshape(-1, 2, 2) * processing_scale + offset
+        vertices = None
+        if self.has_polygons:
+            vertices = self.vertices.astype(np.float64) * processing_scale + offset
+        return DetectionBatch(
+            bboxes=bboxes.reshape(-1, 4),
+            scores=self.scores,
+            class_ids=self.class_ids,
+            class_names=self.class_names,
+            vertices=vertices,
+            vertex_offsets=self.vertex_offsets,
+        )
+
+    def select(self, mask: np.ndarray) -> "DetectionBatch":
+        """
+        Select a subset of the detections.
+
+        :param mask: a (N,) boolean array selecting the detections to keep
+        :return: a batch with the selected detections
+        """
+        vertices = None
+        vertex_offsets = None
+        if self.has_polygons:
+            counts = np.diff(self.vertex_offsets)[mask]
+            vertex_mask = np.repeat(mask, np.diff(self.vertex_offsets))
+            vertices = self.vertices[vertex_mask]
+            vertex_offsets = np.concatenate([[0], np.cumsum(counts)]).astype(self.vertex_offsets.dtype)
+        return DetectionBatch(
+            bboxes=self.bboxes[mask],
+            scores=self.scores[mask],
+            class_ids=self.class_ids[mask],
+            class_names=self.class_names,
+            vertices=vertices,
+            vertex_offsets=vertex_offsets,
+        )
+
+    def geometries(self) -> np.ndarray:
+        """
+        Create the shapes of the detections, the polygons when the batch has them and the bounding boxes otherwise.
+
+        :return: an array of shapely geometries
+        """
+        if self.has_polygons:
+            return shapely.from_ragged_array(
+                shapely.GeometryType.POLYGON,
+                self.vertices.astype(np.float64),
+                (self.vertex_offsets.astype(np.int64), np.arange(len(self) + 1, dtype=np.int64)),
+            )
+        return shapely.box(self.bboxes[:, 0], self.bboxes[:, 1], self.bboxes[:, 2], self.bboxes[:, 3])
+
+    def to_features(self, properties: Optional[Dict[str, Any]] = None) -> List[geojson.Feature]:
+        """
+        Create a GeoJSON feature for each detection with the imageBBox, imageGeometry and featureClasses properties
+        used by the rest of the system.
+
+        :param properties: additional properties shared by every feature
+        :return: the features
+        """
+        properties = properties or {}
+        bboxes = self.bboxes.tolist()
+        scores = self.scores.tolist()
+        class_ids = self.class_ids.tolist()
+        if self.has_polygons:
+            vertices = self.vertices.tolist()
+            offsets = self.vertex_offsets.tolist()
+            rings = [vertices[offsets[i] : offsets[i + 1]] for i in range(len(self))]
+            # GeoJSON rings end with their first vertex, models are not required to repeat it
+            rings = [ring + [ring[0]] if ring and ring[0] != ring[-1] else ring for ring in rings]
+            image_geometries = [{"type": "Polygon", "coordinates": [ring]} for ring in rings]
+        else:
+            image_geometries = [
+                {
+                    "type": "Polygon",
+                    "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]],
+                }
+                for x0, y0, x1, y1 in bboxes
+            ]
+
+        features = []
+        for bbox, image_geometry, score, class_id in zip(bboxes, image_geometries, scores, class_ids):
+            class_name = self.class_names[class_id] if 0 <= class_id < len(self.class_names) else str(class_id)
+            features.append(
+                geojson.Feature(
+                    geometry=None,
+                    properties={
+                        "imageBBox": bbox,
+                        "imageGeometry": image_geometry,
+                        "featureClasses": [{"iri": class_name, "score": score}],
+                        **properties,
+                    },
+                )
+            )
+        return features
+
+
+def encode_detection_batch(batch: DetectionBatch) -> bytes:
+    """
+    Encode a detection batch. Model containers can use this to produce the response a detector decodes.
+
+    :param batch: the detections
+    :return: the encoded batch
+    """
+    columns = {"bbox": batch.bboxes, "score": batch.scores, "class_id": batch.class_ids}
+    if batch.has_polygons:
+        columns["vertices"] = batch.vertices
+        columns["vertex_offsets"] = batch.vertex_offsets
+    arrays = [np.ascontiguousarray(array) for array in columns.values()]
+    header = json.dumps(
+        {
+            "count": len(batch),
+            "classes": list(batch.class_names),
+            "columns": [
+                {"name": name, "dtype": array.dtype.str, "shape": list(array.shape)}
+                for name, array in zip(columns.keys(), arrays)
+            ],
+        }
+    ).encode("utf-8")
+    return b"".join([DETECTION_BATCH_MAGIC, struct.pack("<I", len(header)), header] + [array.tobytes() for array in arrays])
+
+
+def decode_detection_batch(payload: bytes) -> DetectionBatch:
+    """
+    Decode a detection batch. The columns are views of the payload and are not copied.
+
+    :param payload: the encoded batch
+    :return: the detections
+    :raises InvalidDetectionBatchException: if the payload is not a valid detection batch
+    """
+    prefix_length = len(DETECTION_BATCH_MAGIC) + 4
+    if len(payload) < prefix_length or bytes(payload[: len(DETECTION_BATCH_MAGIC)]) != DETECTION_BATCH_MAGIC:
+        raise InvalidDetectionBatchException("Payload is not a detection batch")
+    (header_length,) = struct.unpack("<I", payload[len(DETECTION_BATCH_MAGIC) : prefix_length])
+    if prefix_length + header_length > len(payload):
+        raise InvalidDetectionBatchException("Detection batch header is truncated")
+    try:
+        header = json.loads(bytes(payload[prefix_length : prefix_length + header_length]).decode("utf-8"))
+        count = int(header["count"])
+        column_specs = [
+            (str(column["name"]), np.dtype(column["dtype"]), tuple(column["shape"])) for column in header["columns"]
+        ]
+    except (ValueError, TypeError, KeyError) as err:
+        raise InvalidDetectionBatchException(f"Detection batch header is invalid: {err}") from err
+
+    columns = {}
+    offset = prefix_length + header_length
+    for name, dtype, shape in column_specs:
+        try:
+            length = int(np.prod(shape, dtype=np.int64))
+            if length < 0 or offset + length * dtype.itemsize > len(payload):
+                raise InvalidDetectionBatchException(f"Detection batch column {name} is truncated")
+            columns[name] = np.frombuffer(payload, dtype=dtype, count=length, offset=offset).reshape(shape)
+        except (ValueError, TypeError) as err:
+            raise InvalidDetectionBatchException(f"Detection batch column {name} is invalid: {err}") from err
+        offset += length * dtype.itemsize
+
+    missing_columns = [name for name in REQUIRED_DETECTION_COLUMNS if name not in columns]
+    if missing_columns:
+        raise InvalidDetectionBatchException(f"Detection batch is missing columns: {missing_columns}")
+    if columns["bbox"].shape != (count, 4):
+        raise InvalidDetectionBatchException(f"Detection batch bbox column must have shape ({count}, 4)")
+    if columns["score"].shape != (count,) or columns["class_id"].shape != (count,):
+        raise InvalidDetectionBatchException("Detection batch columns do not match the detection count")
+    if ("vertices" in columns) != ("vertex_offsets" in columns):
+        raise InvalidDetectionBatchException("Detection batch polygons need both the vertices and vertex_offsets columns")
+    if "vertices" in columns:
+        _validate_polygons(columns["vertices"], columns["vertex_offsets"], count)
+
+    return DetectionBatch(
+        bboxes=columns["bbox"],
+        scores=columns["score"],
+        class_ids=columns["class_id"],
+        class_names=header.get("classes", []),
+        vertices=columns.get("vertices"),
+        vertex_offsets=columns.get("vertex_offsets"),
+    )
+
+
+def _validate_polygons(vertices: np.ndarray, vertex_offsets: np.ndarray, count: int) -> None:
+    """
+    Check the polygon columns of a decoded batch describe a vertex range of at least 3 vertices for every detection,
+    so every polygon can be closed into a valid ring.
+
+    :param vertices: the (M, 2) vertices column
+    :param vertex_offsets: the (N + 1,) vertex offsets column
+    :param count: the number of detections N
+    :raises InvalidDetectionBatchException: if the columns are inconsistent
+    """
+    if vertices.ndim != 2 or vertices.shape[1] != 2:
+        raise InvalidDetectionBatchException("Detection batch vertices column must have shape (M, 2)")
+    if vertex_offsets.shape != (count + 1,) or not np.issubdtype(vertex_offsets.dtype, np.integer):
+        raise InvalidDetectionBatchException(f"Detection batch vertex_offsets column must be {count + 1} integers")
+    if vertex_offsets[0] != 0 or vertex_offsets[-1] != vertices.shape[0] or np.any(np.diff(vertex_offsets) < 0):
+        raise InvalidDetectionBatchException(
+            "Detection batch vertex_offsets must start at 0, never decrease and end at the number of vertices"
+        )
+    if np.any(np.diff(vertex_offsets) < 3):
+        raise InvalidDetectionBatchException("Detection batch polygons must have at least 3 vertices")
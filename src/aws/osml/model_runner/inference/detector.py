@@ -1,8 +1,8 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import abc
 from io import BufferedReader
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
@@ -10,6 +10,9 @@ from geojson import FeatureCollection
 
 from aws.osml.model_runner.api import ModelInvokeMode
 
+from .detection_batch import DetectionBatch
+from .segmentation_mask import SegmentationMask
+
 
 class Detector(abc.ABC):
     """
@@ -35,7 +38,9 @@ class Detector(abc.ABC):
 
     @abc.abstractmethod
     @metric_scope
-    def find_features(self, payload: BufferedReader, metrics: MetricsLogger) -> FeatureCollection:
+    def find_features(
+        self, payload: BufferedReader, metrics: MetricsLogger
+    ) -> Union[FeatureCollection, DetectionBatch, SegmentationMask]:
         """
         Query the established endpoint mode to find features based on a payload
 
@@ -43,5 +48,6 @@ class Detector(abc.ABC):
                                     data that will be  sent to the feature generator
         :param metrics: MetricsLogger = the metrics logger object to capture the log data on the system
 
-        :return: FeatureCollection = a feature collection containing the center point of a tile
+        :return: Union[FeatureCollection, DetectionBatch, SegmentationMask] = the features detected in the tile, or
+                 the segmentation mask of the tile
         """
@@ -1,4 +1,4 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 # Telling flake8 to not flag errors in this file. It is normal that these classes are imported but not used in an
 # __init__.py file.
@@ -11,3 +11,11 @@ class FeatureDistillationException(Exception):
 
 class InvalidFeaturePropertiesException(Exception):
     pass
+
+
+class InvalidDetectionBatchException(Exception):
+    pass
+
+
+class InvalidSegmentationMaskException(Exception):
+    pass
@@ -1,23 +1,20 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 from geojson import Feature
 
-from aws.osml.model_runner.common import (
-    FeatureDistillationAlgorithm,
-    FeatureDistillationAlgorithmType,
-    get_feature_image_bounds,
-)
+from aws.osml.model_runner.common import FeatureBatch, FeatureDistillationAlgorithm, FeatureDistillationAlgorithmType
 from aws.osml.model_runner.common.ensemble_boxes_nms import nms, soft_nms
+from aws.osml.model_runner.common.point_nms import point_nms
 from aws.osml.model_runner.inference.exceptions import FeatureDistillationException
 
 
 class FeatureSelector:
     """
     The FeatureSelector class is used to select a subset of geojson features from a larger set
-    using an algorith such as NMS or Soft NMS.  Parameters such as thresholds and the algorithm
+    using an algorith such as NMS, Soft NMS or Point NMS.  Parameters such as thresholds and the algorithm
     to use can be set by passing a FeatureSelectionOptions object in when the FeatureSelector
     is instantiated.
     """
@@ -31,18 +28,114 @@ class FeatureSelector:
         """
         self.options = options
 
-    def select_features(self, feature_list: List[Feature]) -> List[Feature]:
+    def select_features(self, feature_list: Union[List[Feature], FeatureBatch]) -> Union[List[Feature], FeatureBatch]:
         """
         Selects a subset of features from a larger set of features using an algorithm such as NMS or Soft NMS.
 
-        :param feature_list: a list of geojson features with a property of bounds_imcoords
-        :return: the filtered list of features
+        :param feature_list: a list of geojson features with a property of bounds_imcoords, or a feature batch
+        :return: the filtered list of features, or the filtered batch when a batch was given. Features in a list
+                 without image bounds are dropped.
         """
+        if isinstance(feature_list, FeatureBatch):
+            if not self.options or len(feature_list) == 0:
+                return feature_list
+            indices, scores = self._select_indices(feature_list)
+            selected_batch = feature_list.select(indices)
+            if self.options.algorithm_type == FeatureDistillationAlgorithmType.SOFT_NMS:
+                selected_batch.update_scores(scores)
+            return selected_batch
+
         if feature_list is None or not feature_list:
             return []
         if not self.options:
             return feature_list
-        boxes_array, scores_array, labels_array = self._get_lists_from_features(feature_list)
+
+        # The batch references the properties of the features so rescoring it updates the features themselves. Features
+        # without image bounds are not in the batch, so the selected rows are mapped back to their place in the list.
+        feature_batch = FeatureBatch.from_features(feature_list)
+        if len(feature_batch) == 0:
+            return []
+        indices, scores = self._select_indices(feature_batch)
+        selected_batch = feature_batch.select(indices)
+        if self.options.algorithm_type == FeatureDistillationAlgorithmType.SOFT_NMS:
+            selected_batch.update_scores(scores)
+        return [feature_list[i] for i in selected_batch.source_indices.tolist()]
+
+    def _select_indices(self, feature_batch: FeatureBatch) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the selection algorithm on the bounds, scores and classes held in the columns of a feature batch.
+
+        :param feature_batch: the features to select from
+        :return: tuple of the indices of the features to keep and their updated scores
+        """
+        if self.options.algorithm_type == FeatureDistillationAlgorithmType.POINT_NMS:
+            return self._select_point_indices(feature_batch)
+        return self._select_box_indices(feature_batch.image_bboxes, feature_batch.scores, feature_batch.class_ids)
+
+    def _select_box_indices(
+        self, image_bboxes: np.ndarray, scores_array: np.ndarray, labels_array: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Run the selection algorithm on the bounding boxes of a set of features.
+
+        :param image_bboxes: the (N, 4) [min_x, min_y, max_x, max_y] image bounds of the features
+        :param scores_array: the confidence score of each feature
+        :param labels_array: the category label of each feature
+        :return: tuple of the indices of the features to keep and their updated scores
+        """
+        scores, labels, indices = self._run_algorithm(self._get_normalized_boxes(image_bboxes), scores_array, labels_array)
+
+        # Verify selected features, scores, and labels have the same length
+        if not len(indices) == len(scores) == len(labels):
+            raise FeatureDistillationException(
+                f"Mismatched lengths: features={len(indices)}, scores={len(scores)}, labels={len(labels)}"
+            )
+        return np.asarray(indices, dtype=np.int64), np.asarray(scores, dtype=np.float64)
+
+    def _select_point_indices(self, feature_batch: FeatureBatch) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Select point features by clustering the points within the configured radius of each other. Features that
+        have an area are selected from the rest with NMS.
+
+        :param feature_batch: the features to select from
+        :return: tuple of the indices of the features to keep, ordered by descending score, and their scores
+        """
+        image_bboxes = feature_batch.image_bboxes
+        is_point = np.all(image_bboxes[:, :2] == image_bboxes[:, 2:], axis=1)
+        point_indices = np.flatnonzero(is_point)
+        box_indices = np.flatnonzero(~is_point)
+
+        selected = [
+            point_indices[
+                point_nms(
+                    image_bboxes[point_indices, :2],
+                    feature_batch.scores[point_indices],
+                    feature_batch.class_ids[point_indices],
+                    self.options.radius,
+                )
+            ]
+        ]
+        if len(box_indices) > 0:
+            indices, _ = self._select_box_indices(
+                image_bboxes[box_indices], feature_batch.scores[box_indices], feature_batch.class_ids[box_indices]
+            )
+            selected.append(box_indices[indices])
+
+        indices = np.concatenate(selected)
+        indices = indices[np.argsort(-feature_batch.scores[indices], kind="mergesort")]
+        return indices, feature_batch.scores[indices]
+
+    def _run_algorithm(
+        self, boxes_array: np.ndarray, scores_array: np.ndarray, labels_array: np.ndarray
+    ) -> Tuple[np.array, np.array, np.array]:
+        """
+        Run the configured selection algorithm on normalized bounding boxes.
+
+        :param boxes_array: the normalized bounding boxes
+        :param scores_array: the confidence score of each box
+        :param labels_array: the category label of each box
+        :return: tuple of the scores, labels and indices of the boxes to keep
+        """
         if self.options.algorithm_type == FeatureDistillationAlgorithmType.SOFT_NMS:
             boxes, scores, labels, indices = soft_nms(
                 boxes=[np.array(boxes_array)],
@@ -53,7 +146,10 @@ class FeatureSelector:
                 sigma=self.options.sigma,
                 thresh=self.options.skip_box_threshold,
             )
-        elif self.options.algorithm_type == FeatureDistillationAlgorithmType.NMS:
+        elif self.options.algorithm_type in [
+            FeatureDistillationAlgorithmType.NMS,
+            FeatureDistillationAlgorithmType.POINT_NMS,
+        ]:
             boxes, scores, labels, indices = nms(
                 boxes=[np.array(boxes_array)],
                 scores=[np.array(scores_array)],
@@ -63,68 +159,32 @@ class FeatureSelector:
             )
         else:
             raise FeatureDistillationException(f"Invalid feature distillation algorithm: {self.options.algorithm_type}")
-        return self._get_features_from_lists(feature_list, scores, labels, indices)
+        return scores, labels, indices
 
-    def _get_lists_from_features(self, feature_list: List[Feature]) -> Tuple[np.array, np.array, np.array]:
+    def _get_normalized_boxes(self, image_bboxes: np.ndarray) -> np.ndarray:
         """
-        This function converts the GeoJSON features into lists of normalized bounding boxes, scores, and label IDs
-        needed by the selection algorithm implementations. As a side effect of this function various class attributes
-        are set to support the inverse mapping of algorithm primitives to the full features. See
-        _get_features_from_lists for the inverse function.
+        Prepare the image bounds of a set of features for the selection algorithm implementations. As a side
+        effect the extents of the features are stored on this selector.
 
-        :param feature_list: the input set of GeoJSON features to preprocess
-        :return: tuple of lists - bounding boxes, confidence scores, category labels
+        :param image_bboxes: the (N, 4) [min_x, min_y, max_x, max_y] image bounds of the features
+        :return: the normalized bounding boxes
         """
-
-        n_features = len(feature_list)
-        boxes = np.zeros((n_features, 4))
-        scores = np.zeros(n_features)
-        categories = []
-        self.extents = [None, None, None, None]  # [min_x, min_y, max_x, max_y]
-        self.labels_map = dict()
-
-        for i, feature in enumerate(feature_list):
-            # [min_x, min_y, max_x, max_y]
-            bounds_imcoords = get_feature_image_bounds(feature)
-
-            # This is a workaround for assumptions made by the NMS library and normalization code in this class.
-            # All of that code assumes that features have bounding boxes with a non-zero area. That assumption
-            # does not hold for features reported as a single point geometry or others that might simply be
-            # erroneously reported with a zero width or height bbox. No matter the cause, we would like those
-            # features to pass through our feature selection processing without triggering errors. Here we
-            # add 0.1 of a pixel to the width or height of any bbox if it is currently zero. This does not change
-            # the actual reported geometry of the feature in any way it just ensures the assumption of a non-zero
-            # area is true.
-            boxes[i] = (
-                bounds_imcoords[0],
-                bounds_imcoords[1],
-                bounds_imcoords[2] + 0.1 if bounds_imcoords[0] == bounds_imcoords[2] else bounds_imcoords[2],
-                bounds_imcoords[3] + 0.1 if bounds_imcoords[1] == bounds_imcoords[3] else bounds_imcoords[3],
-            )
-
-            category, score = self._get_category_and_score_from_feature(feature)
-            categories.append(category)
-            scores[i] = score
+        # This is a workaround for assumptions made by the NMS library and normalization code in this class.
+        # All of that code assumes that features have bounding boxes with a non-zero area. That assumption
+        # does not hold for features reported as a single point geometry or others that might simply be
+        # erroneously reported with a zero width or height bbox. No matter the cause, we would like those
+        # features to pass through our feature selection processing without triggering errors. Here we
+        # add 0.1 of a pixel to the width or height of any bbox if it is currently zero. This does not change
+        # the actual reported geometry of the feature in any way it just ensures the assumption of a non-zero
+        # area is true.
+        boxes = np.array(image_bboxes, dtype=np.float64)
+        boxes[:, 2:] += np.where(boxes[:, :2] == boxes[:, 2:], 0.1, 0.0)
 
         # calculate data extents
-        if n_features > 0:
-            self.extents = [
-                float(np.min(boxes[:, 0])),  # min_x
-                float(np.min(boxes[:, 1])),  # min_y
-                float(np.max(boxes[:, 2])),  # max_x
-                float(np.max(boxes[:, 3])),  # max_y
-            ]
-        # Determine categories
-        unique_categories = list(set(categories))
-        for idx, unique_category in enumerate(unique_categories):
-            self.labels_map[str(idx)] = unique_category
-            self.labels_map[unique_category] = str(idx)
-        labels_indexes = [int(self.labels_map.get(category, None)) for category in categories]
-
-        # Normalize the boxes
-        normalized_boxes = self._normalize_boxes(boxes)
-
-        return normalized_boxes, scores, np.array(labels_indexes)
+        self.extents = [None, None, None, None]  # [min_x, min_y, max_x, max_y]
+        if len(boxes) > 0:
+            self.extents = [*np.min(boxes[:, :2], axis=0).tolist(), *np.max(boxes[:, 2:], axis=0).tolist()]
+        return self._normalize_boxes(boxes)
 
     def _normalize_boxes(self, boxes: np.ndarray) -> np.ndarray:
         """
@@ -138,58 +198,6 @@ class FeatureSelector:
         # boxes: [[x1, y1, x2, y2], ...]
         if boxes.size == 0:
             return np.array([])
-        x_range = self.extents[2] - self.extents[0]
-        y_range = self.extents[3] - self.extents[1]
-        normalized_boxes = np.zeros_like(boxes)
-        normalized_boxes[:, 0] = (boxes[:, 0] - self.extents[0]) / x_range  # x1
-        normalized_boxes[:, 1] = (boxes[:, 1] - self.extents[1]) / y_range  # y1
-        normalized_boxes[:, 2] = (boxes[:, 2] - self.extents[0]) / x_range  # x2
-        normalized_boxes[:, 3] = (boxes[:, 3] - self.extents[1]) / y_range  # y2
-        return normalized_boxes
-
-    @staticmethod
-    def _get_category_and_score_from_feature(feature: Feature) -> Tuple[str, float]:
-        """
-        Get the feature class with the highest score from the featureClasses property.
-
-        :return: tuple of feature class and highest score
-        """
-        max_score = -1.0
-        max_class = ""
-        for feature_class in feature.get("properties", {}).get("featureClasses", []):
-            if feature_class.get("score") > max_score:
-                max_score = feature_class.get("score")
-                max_class = feature_class.get("iri")
-        return max_class, max_score
-
-    def _get_features_from_lists(
-        self, feature_list: List[Feature], scores: np.array, labels: np.array, indices: np.array
-    ) -> List[Feature]:
-        """
-        This function selects features from the feature_list based on the indices provided by the NMS algorithm.
-        In the case when SOFT_NMS is selected, it also updates the scores as required.
-
-        :param feature_list: the original list of GeoJSON features
-        :param scores: the updated scores for each feature
-        :param labels: the labels for each feature
-        :param indices: the indices of the features to keep
-        :return: the refined list of GeoJSON features
-        """
-        selected_features = [feature_list[i] for i in indices]
-
-        # Verify selected_features, scores, and labels have the same length
-        try:
-            assert len(selected_features) == len(scores) == len(labels)
-        except AssertionError:
-            raise FeatureDistillationException(
-                f"Mismatched lengths: features={len(selected_features)}, scores={len(scores)}, labels={len(labels)}"
-            )
-
-        if self.options.algorithm_type == FeatureDistillationAlgorithmType.SOFT_NMS:
-            for feature, score, label in zip(selected_features, scores, labels):
-                category = self.labels_map.get(str(label))
-                for feature_class in feature.get("properties", {}).get("featureClasses", []):
-                    if feature_class.get("iri") == category:
-                        feature_class["rawScore"] = feature_class.get("score")
-                        feature_class["score"] = score
-        return selected_features
+        origin = np.array([self.extents[0], self.extents[1], self.extents[0], self.extents[1]])
+        extent_range = np.array([self.extents[2], self.extents[3], self.extents[2], self.extents[3]]) - origin
+        return (boxes - origin) / extent_range
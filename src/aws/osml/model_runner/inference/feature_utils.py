@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import json
 import logging
@@ -11,13 +11,24 @@ from geojson import Feature, LineString, MultiLineString, MultiPoint, MultiPolyg
 from osgeo import gdal
 from shapely.geometry.base import BaseGeometry
 
-from aws.osml.model_runner.common import GeojsonDetectionField, ImageDimensions
+from aws.osml.model_runner.common import FeatureBatch, GeojsonDetectionField, ImageDimensions
 from aws.osml.photogrammetry import GeodeticWorldCoordinate, SensorModel
 
 from .exceptions import InvalidFeaturePropertiesException
 
 logger = logging.getLogger(__name__)
 
+# Properties used while processing the image that are removed from the features before they are written out
+PROCESSING_ONLY_PROPERTIES = [
+    "inferenceTime",
+    GeojsonDetectionField.BOUNDS,
+    GeojsonDetectionField.GEOM,
+    "detection_score",
+    "feature_types",
+    "image_id",
+    "adjusted_feature_types",
+]
+
 
 def features_to_image_shapes(
     sensor_model: SensorModel, features: List[Feature], skip: Optional[bool] = True
@@ -113,6 +124,44 @@ def convert_nested_coordinate_lists(coordinates_or_lists: List, conversion_funct
         return output_list
 
 
+def calculate_processing_area(
+    ds: gdal.Dataset, roi: Optional[BaseGeometry], sensor_model: Optional[SensorModel]
+) -> Optional[BaseGeometry]:
+    """
+    Project a region of interest into image coordinates and clip it to the image.
+
+    :param ds: gdal.Dataset = GDAL dataset
+    :param roi: Optional[BaseGeometry] = ROI shape
+    :param sensor_model: Optional[SensorModel] = Sensor model to use for transformations
+
+    :return: Optional[BaseGeometry] = the (x, y) image coordinate area to process, None if processing is not
+             restricted to an ROI. The area is empty if the ROI does not intersect the image.
+    """
+    if roi is None or sensor_model is None:
+        return None
+
+    full_image_area = shapely.geometry.Polygon(
+        [(0, 0), (0, ds.RasterYSize), (ds.RasterXSize, ds.RasterYSize), (ds.RasterXSize, 0)]
+    )
+
+    # This is making the assumption that the ROI is a shapely Polygon, and it only considers
+    # the exterior boundary (i.e. we don't handle cases where the WKT for the ROI has holes).
+    # It also assumes that the coordinates of the WKT string are in longitude latitude order
+    # to match GeoJSON
+    world_coordinates_3d = []
+    list_coordinates = shapely.geometry.mapping(roi)["coordinates"][0]
+    for coord in list_coordinates:
+        if len(coord) == 3:
+            world_coordinates_3d.append(coord)
+        else:
+            world_coordinates_3d.append(coord + (0.0,))
+    roi_area = features_to_image_shapes(sensor_model, [Feature(geometry=Polygon([tuple(world_coordinates_3d)]))], False)[0]
+
+    if not roi_area.intersects(full_image_area):
+        return shapely.geometry.Polygon()
+    return roi_area.intersection(full_image_area)
+
+
 def calculate_processing_bounds(
     ds: gdal.Dataset, roi: Optional[BaseGeometry], sensor_model: Optional[SensorModel]
 ) -> Optional[Tuple[ImageDimensions, ImageDimensions]]:
@@ -125,46 +174,21 @@ def calculate_processing_bounds(
 
     :return: Optional[Tuple[ImageDimensions, ImageDimensions]] = Image dimensions associated with the ROI request
     """
-    processing_bounds: Optional[Tuple[ImageDimensions, ImageDimensions]] = (
-        (0, 0),
-        (ds.RasterXSize, ds.RasterYSize),
-    )
-    if roi is not None and sensor_model is not None:
-        full_image_area = shapely.geometry.Polygon(
-            [(0, 0), (0, ds.RasterYSize), (ds.RasterXSize, ds.RasterYSize), (ds.RasterXSize, 0)]
-        )
-
-        # This is making the assumption that the ROI is a shapely Polygon, and it only considers
-        # the exterior boundary (i.e. we don't handle cases where the WKT for the ROI has holes).
-        # It also assumes that the coordinates of the WKT string are in longitude latitude order
-        # to match GeoJSON
-        world_coordinates_3d = []
-        list_coordinates = shapely.geometry.mapping(roi)["coordinates"][0]
-        for coord in list_coordinates:
-            if len(coord) == 3:
-                world_coordinates_3d.append(coord)
-            else:
-                world_coordinates_3d.append(coord + (0.0,))
-        roi_area = features_to_image_shapes(sensor_model, [Feature(geometry=Polygon([tuple(world_coordinates_3d)]))], False)[
-            0
-        ]
-
-        if roi_area.intersects(full_image_area):
-            area_to_process = roi_area.intersection(full_image_area)
-
-            # Shapely bounds are (minx, miny, maxx, maxy); convert this to the ((r, c), (w, h))
-            # expected by the tiler
-            processing_bounds = (
-                (round(area_to_process.bounds[1]), round(area_to_process.bounds[0])),
-                (
-                    round(area_to_process.bounds[2] - area_to_process.bounds[0]),
-                    round(area_to_process.bounds[3] - area_to_process.bounds[1]),
-                ),
-            )
-        else:
-            processing_bounds = None
+    area_to_process = calculate_processing_area(ds, roi, sensor_model)
+    if area_to_process is None:
+        return (0, 0), (ds.RasterXSize, ds.RasterYSize)
+    if area_to_process.is_empty:
+        return None
 
-    return processing_bounds
+    # Shapely bounds are (minx, miny, maxx, maxy); convert this to the ((r, c), (w, h))
+    # expected by the tiler
+    return (
+        (round(area_to_process.bounds[1]), round(area_to_process.bounds[0])),
+        (
+            round(area_to_process.bounds[2] - area_to_process.bounds[0]),
+            round(area_to_process.bounds[3] - area_to_process.bounds[1]),
+        ),
+    )
 
 
 def get_source_property(image_location: str, image_extension: str, dataset: gdal.Dataset) -> Optional[Dict]:
@@ -213,17 +237,21 @@ def get_source_property(image_location: str, image_extension: str, dataset: gdal
         return None
 
 
-def add_properties_to_features(job_id: str, feature_properties: str, features: List[Feature]) -> List[Feature]:
+def add_properties_to_features(
+    job_id: str, feature_properties: str, features: Union[List[Feature], FeatureBatch]
+) -> Union[List[Feature], FeatureBatch]:
     """
     Add arbitrary and controlled property dictionaries to geojson feature properties
     :param job_id: str = unique identifier for the job
     :param feature_properties: str = additional feature properties or metadata from the image processing
-    :param features: List[geojson.Feature] = the list of features to update
+    :param features: Union[List[geojson.Feature], FeatureBatch] = the list of features or the feature batch to update
 
-    :return: List[geojson.Feature] = updated list of features
+    :return: Union[List[geojson.Feature], FeatureBatch] = updated list of features or feature batch
     """
     try:
         feature_properties: List[dict] = json.loads(feature_properties)
+        if isinstance(features, FeatureBatch):
+            return _add_properties_to_feature_batch(job_id, feature_properties, features)
         for feature in features:
             # Update the features with their inference metadata
             feature["properties"].update(get_inference_metadata_property(job_id, feature["properties"]["inferenceTime"]))
@@ -233,20 +261,9 @@ def add_properties_to_features(job_id: str, feature_properties: str, features: L
                 feature["properties"].update(feature_property)
 
             # Remove unneeded feature properties if they are present
-            if feature.get("properties", {}).get("inferenceTime"):
-                del feature["properties"]["inferenceTime"]
-            if feature.get("properties", {}).get(GeojsonDetectionField.BOUNDS):
-                del feature["properties"][GeojsonDetectionField.BOUNDS]
-            if feature.get("properties", {}).get(GeojsonDetectionField.GEOM):
-                del feature["properties"][GeojsonDetectionField.GEOM]
-            if feature.get("properties", {}).get("detection_score"):
-                del feature["properties"]["detection_score"]
-            if feature.get("properties", {}).get("feature_types"):
-                del feature["properties"]["feature_types"]
-            if feature.get("properties", {}).get("image_id"):
-                del feature["properties"]["image_id"]
-            if feature.get("properties", {}).get("adjusted_feature_types"):
-                del feature["properties"]["adjusted_feature_types"]
+            for property_name in PROCESSING_ONLY_PROPERTIES:
+                if feature.get("properties", {}).get(property_name):
+                    del feature["properties"][property_name]
 
     except Exception as err:
         logger.exception(err)
@@ -254,6 +271,35 @@ def add_properties_to_features(job_id: str, feature_properties: str, features: L
     return features
 
 
+def _add_properties_to_feature_batch(
+    job_id: str, feature_properties: List[dict], feature_batch: FeatureBatch
+) -> FeatureBatch:
+    """
+    Add the inference metadata and custom properties to a feature batch. The custom properties are shared by every
+    feature and are only added when the features are converted for the sinks. Features inferred at the same time
+    share a single inference metadata property.
+
+    :param job_id: str = unique identifier for the job
+    :param feature_properties: List[dict] = the custom feature properties
+    :param feature_batch: FeatureBatch = the feature batch to update
+
+    :return: FeatureBatch = the updated feature batch
+    """
+    inference_metadata_by_time: Dict[str, Dict[str, Any]] = {}
+    for properties in feature_batch.properties:
+        inference_time = properties["inferenceTime"]
+        inference_metadata = inference_metadata_by_time.get(inference_time)
+        if inference_metadata is None:
+            inference_metadata = get_inference_metadata_property(job_id, inference_time)
+            inference_metadata_by_time[inference_time] = inference_metadata
+        properties.update(inference_metadata)
+
+    for feature_property in feature_properties:
+        feature_batch.shared_properties.update(feature_property)
+    feature_batch.excluded_properties.update(PROCESSING_ONLY_PROPERTIES)
+    return feature_batch
+
+
 def get_inference_metadata_property(job_id: str, inference_time: str) -> Dict[str, Any]:
     """
     Create an inference dictionary property to append to geojson features
@@ -3,9 +3,8 @@
 import logging
 from io import BufferedReader
 from json import JSONDecodeError
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
-import geojson
 import urllib3
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
@@ -17,10 +16,13 @@ from urllib3.util.retry import Retry
 
 from aws.osml.model_runner.api import ModelInvokeMode
 from aws.osml.model_runner.app_config import MetricLabels
-from aws.osml.model_runner.common import Timer
+from aws.osml.model_runner.common import Timer, get_json_codec
 
+from .detection_batch import DetectionBatch, decode_detection_batch, is_detection_batch_media_type
 from .detector import Detector
 from .endpoint_builder import FeatureEndpointBuilder
+from .exceptions import InvalidDetectionBatchException, InvalidSegmentationMaskException
+from .segmentation_mask import SegmentationMask, decode_segmentation_mask, is_segmentation_mask_media_type
 
 logger = logging.getLogger(__name__)
 
@@ -123,21 +125,28 @@ class HTTPDetector(Detector):
         return ModelInvokeMode.HTTP_ENDPOINT
 
     @metric_scope
-    def find_features(self, payload: BufferedReader, metrics: MetricsLogger) -> FeatureCollection:
+    def find_features(
+        self, payload: BufferedReader, metrics: MetricsLogger
+    ) -> Union[FeatureCollection, DetectionBatch, SegmentationMask]:
         """
         Invokes the HTTP model endpoint to detect features from the given payload.
 
         This method sends a payload to the HTTP model endpoint and retrieves feature detection results
-        in the form of a geojson FeatureCollection. If configured, it logs metrics about the invocation process.
+        in the form of a geojson FeatureCollection. Endpoints that respond with the detection batch media type,
+        usually because it was requested through the Accept endpoint parameter, are decoded into a DetectionBatch
+        instead. Segmentation models responding with the segmentation mask media type are decoded into a
+        SegmentationMask. If configured, it logs metrics about the invocation process.
 
         :param payload: BufferedReader = The data to be sent to the HTTP model for feature detection.
         :param metrics: MetricsLogger = The metrics logger to capture system performance and log metrics.
 
-        :return: FeatureCollection = A geojson FeatureCollection containing the detected features.
+        :return: Union[FeatureCollection, DetectionBatch, SegmentationMask] = The features detected by the model.
 
         :raises RetryError: Raised if the request fails after retries.
         :raises MaxRetryError: Raised if the maximum retry attempts are reached.
         :raises JSONDecodeError: Raised if there is an error decoding the model's response.
+        :raises InvalidDetectionBatchException: Raised if a detection batch response is malformed.
+        :raises InvalidSegmentationMaskException: Raised if a segmentation mask response is malformed.
         """
         logger.debug(f"Invoking Model: {self.name}")
         if isinstance(metrics, MetricsLogger):
@@ -183,7 +192,12 @@ class HTTPDetector(Detector):
                 if isinstance(metrics, MetricsLogger):
                     metrics.put_metric(MetricLabels.RETRIES, retry_count, str(Unit.COUNT.value))
 
-                return geojson.loads(response.data.decode("utf-8"))
+                if is_detection_batch_media_type(response.headers.get("Content-Type")):
+                    return decode_detection_batch(response.data)
+                if is_segmentation_mask_media_type(response.headers.get("Content-Type")):
+                    return decode_segmentation_mask(response.data)
+
+                return get_json_codec().loads_geojson(response.data)
 
         except RetryError as err:
             if isinstance(metrics, MetricsLogger):
@@ -197,7 +211,7 @@ class HTTPDetector(Detector):
             logger.error(f"Max retries reached - failed due to {err.reason}")
             logger.exception(err)
             raise err
-        except JSONDecodeError as err:
+        except (JSONDecodeError, InvalidDetectionBatchException, InvalidSegmentationMaskException) as err:
             if isinstance(metrics, MetricsLogger):
                 metrics.put_metric(MetricLabels.ERRORS, 1, str(Unit.COUNT.value))
             logger.error(
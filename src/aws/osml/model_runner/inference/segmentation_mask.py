@@ -0,0 +1,113 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .exceptions import InvalidSegmentationMaskException
+
+# Media type a model endpoint responds with, and a request can Accept, for the segmentation mask of a tile.
+# The mask is encoded like a RAW tile: the magic bytes OSMLRAW1, the length of the header as a little-endian uint32,
+# a UTF-8 JSON header describing the (bands, height, width) array and then the pixels, optionally compressed with
+# LZ4 or ZSTD. Each band is the confidence of one class scaled to 0-255, so a binary mask is 0 or 255.
+SEGMENTATION_MASK_MEDIA_TYPE = "application/vnd.osml.mask"
+
+
+def is_segmentation_mask_media_type(content_type: Any) -> bool:
+    """
+    Check whether the content type of a model response identifies a segmentation mask.
+
+    :param content_type: the content type of the response, may include parameters
+    :return: True if the response is a segmentation mask
+    """
+    if not isinstance(content_type, str):
+        return False
+    return content_type.split(";")[0].strip().lower() == SEGMENTATION_MASK_MEDIA_TYPE
+
+
+def accepts_segmentation_masks(endpoint_parameters: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a request asks the model for segmentation masks through its Accept endpoint parameter.
+
+    :param endpoint_parameters: the model endpoint parameters of the request
+    :return: True if the segmentation mask media type is one of the accepted media types
+    """
+    if not endpoint_parameters or not isinstance(endpoint_parameters.get("Accept"), str):
+        return False
+    return any(is_segmentation_mask_media_type(media_type) for media_type in endpoint_parameters["Accept"].split(","))
+
+
+@dataclass
+class SegmentationMask:
+    """
+    The segmentation mask returned by a model for a tile. Masks are mosaicked into a raster for each region instead
+    of being converted into features.
+
+    :param pixels: the (bands, height, width) 8-bit confidence of each class for each pixel of the tile
+    """
+
+    pixels: np.ndarray
+
+    @property
+    def band_count(self) -> int:
+        return int(self.pixels.shape[0])
+
+    @staticmethod
+    def to_confidence(pixels: np.ndarray) -> np.ndarray:
+        """
+        Convert the pixels of a mask to 8-bit confidences. Boolean masks become 0 or 255, floating point
+        confidences in [0, 1] are scaled to [0, 255] and integer values are clipped to [0, 255].
+
+        :param pixels: the (height, width) or (bands, height, width) mask
+        :return: the (bands, height, width) 8-bit mask
+        """
+        pixels = np.asarray(pixels)
+        if pixels.ndim == 2:
+            pixels = pixels[np.newaxis]
+        if pixels.ndim != 3:
+            raise InvalidSegmentationMaskException(f"Segmentation mask must have 2 or 3 dimensions: {pixels.shape}")
+        if pixels.dtype == np.uint8:
+            return pixels
+        if pixels.dtype == np.bool_:
+            return pixels.astype(np.uint8) * 255
+        if np.issubdtype(pixels.dtype, np.floating):
+            return np.rint(np.clip(pixels, 0.0, 1.0) * 255).astype(np.uint8)
+        if np.issubdtype(pixels.dtype, np.integer):
+            return np.clip(pixels, 0, 255).astype(np.uint8)
+        raise InvalidSegmentationMaskException(f"Unsupported segmentation mask type: {pixels.dtype}")
+
+
+def encode_segmentation_mask(pixels: np.ndarray, compression: str = "NONE") -> bytes:
+    """
+    Encode a segmentation mask. Model containers can use this to produce the response a detector decodes.
+
+    :param pixels: the (height, width) or (bands, height, width) mask
+    :param compression: the compression applied to the pixels, NONE, LZ4 or ZSTD
+    :return: the encoded mask
+    """
+    # The tile worker package imports this package so the raw tile codec is imported when it is used
+    from aws.osml.model_runner.tile_worker.raw_tile_factory import _get_codec, encode_raw_tile_header
+
+    pixels = np.ascontiguousarray(SegmentationMask.to_confidence(pixels))
+    data = pixels.tobytes()
+    if compression != "NONE":
+        data = _get_codec(compression).compress(data)
+    return encode_raw_tile_header(pixels.shape, pixels.dtype, compression) + data
+
+
+def decode_segmentation_mask(payload: bytes) -> SegmentationMask:
+    """
+    Decode a segmentation mask. Uncompressed 8-bit masks are views of the payload and are not copied.
+
+    :param payload: the encoded mask
+    :return: the mask
+    :raises InvalidSegmentationMaskException: if the payload is not a valid segmentation mask
+    """
+    from aws.osml.model_runner.tile_worker.raw_tile_factory import decode_raw_tile
+
+    try:
+        pixels = decode_raw_tile(payload)
+    except (ValueError, KeyError, TypeError) as err:
+        raise InvalidSegmentationMaskException(f"Payload is not a segmentation mask: {err}") from err
+    return SegmentationMask(pixels=SegmentationMask.to_confidence(pixels))
@@ -1,12 +1,11 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
 from io import BufferedReader
 from json import JSONDecodeError
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 import boto3
-import geojson
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
 from aws_embedded_metrics.unit import Unit
@@ -15,10 +14,13 @@ from geojson import FeatureCollection
 
 from aws.osml.model_runner.api import ModelInvokeMode
 from aws.osml.model_runner.app_config import BotoConfig, MetricLabels
-from aws.osml.model_runner.common import Timer
+from aws.osml.model_runner.common import Timer, get_json_codec
 
+from .detection_batch import DetectionBatch, decode_detection_batch, is_detection_batch_media_type
 from .detector import Detector
 from .endpoint_builder import FeatureEndpointBuilder
+from .exceptions import InvalidDetectionBatchException, InvalidSegmentationMaskException
+from .segmentation_mask import SegmentationMask, decode_segmentation_mask, is_segmentation_mask_media_type
 
 logger = logging.getLogger(__name__)
 
@@ -68,20 +70,27 @@ class SMDetector(Detector):
         return ModelInvokeMode.SM_ENDPOINT
 
     @metric_scope
-    def find_features(self, payload: BufferedReader, metrics: MetricsLogger) -> FeatureCollection:
+    def find_features(
+        self, payload: BufferedReader, metrics: MetricsLogger
+    ) -> Union[FeatureCollection, DetectionBatch, SegmentationMask]:
         """
         Invokes the SageMaker model endpoint to detect features from the given payload.
 
         This method sends a payload to the SageMaker model endpoint and retrieves feature detection results
-        in the form of a geojson FeatureCollection. If configured, it logs metrics about the invocation process.
+        in the form of a geojson FeatureCollection. Endpoints that respond with the detection batch media type,
+        usually because it was requested through the Accept endpoint parameter, are decoded into a DetectionBatch
+        instead. Segmentation models responding with the segmentation mask media type are decoded into a
+        SegmentationMask. If configured, it logs metrics about the invocation process.
 
         :param payload: BufferedReader = The data to be sent to the SageMaker model for feature detection.
         :param metrics: MetricsLogger = The metrics logger to capture system performance and log metrics.
 
-        :return: FeatureCollection = A geojson FeatureCollection containing the detected features.
+        :return: Union[FeatureCollection, DetectionBatch, SegmentationMask] = The features detected by the model.
 
         :raises ClientError: Raised if there is an error while invoking the SageMaker endpoint.
         :raises JSONDecodeError: Raised if there is an error decoding the model's response.
+        :raises InvalidDetectionBatchException: Raised if a detection batch response is malformed.
+        :raises InvalidSegmentationMaskException: Raised if a segmentation mask response is malformed.
         """
         logger.debug(f"Invoking Model: {self.endpoint}")
         if isinstance(metrics, MetricsLogger):
@@ -112,8 +121,14 @@ class SMDetector(Detector):
                 if isinstance(metrics, MetricsLogger):
                     metrics.put_metric(MetricLabels.RETRIES, retry_count, str(Unit.COUNT.value))
 
+                response_body = model_response.get("Body").read()
+                if is_detection_batch_media_type(model_response.get("ContentType")):
+                    return decode_detection_batch(response_body)
+                if is_segmentation_mask_media_type(model_response.get("ContentType")):
+                    return decode_segmentation_mask(response_body)
+
                 # Parse the model's response as a geojson FeatureCollection
-                return geojson.loads(model_response.get("Body").read())
+                return get_json_codec().loads_geojson(response_body)
 
         except ClientError as ce:
             error_code = ce.response.get("Error", {}).get("Code")
@@ -125,7 +140,7 @@ class SMDetector(Detector):
             )
             logger.exception(ce)
             raise ce
-        except JSONDecodeError as de:
+        except (JSONDecodeError, InvalidDetectionBatchException, InvalidSegmentationMaskException) as de:
             if isinstance(metrics, MetricsLogger):
                 metrics.put_metric(MetricLabels.ERRORS, 1, str(Unit.COUNT.value))
             logger.error("Unable to decode response from model.")
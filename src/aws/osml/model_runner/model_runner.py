@@ -2,17 +2,20 @@
 
 import ast
 import logging
+from typing import Optional, Tuple
 
 import boto3
 from osgeo import gdal
 
 from aws.osml.gdal import load_gdal_dataset, set_gdal_default_configuration
 from aws.osml.model_runner.api import get_image_path
+from aws.osml.photogrammetry import SensorModel
 
 from .api import ImageRequest, RegionRequest
 from .app_config import BotoConfig, ServiceConfig
 from .common import ImageDimensions, RequestStatus, ThreadingLocalContextFilter
 from .database import (
+    EndpointStatisticsTable,
     ImageRequestItem,
     ImageRequestTable,
     RegionRequestItem,
@@ -26,11 +29,20 @@ from .scheduler import (
     BufferedImageRequestQueue,
     EndpointCapacityEstimator,
     EndpointLoadImageScheduler,
+    EndpointThroughputEstimator,
     EndpointVariantSelector,
     RequestQueue,
 )
 from .status import ImageStatusMonitor, RegionStatusMonitor
-from .tile_worker import RegionCalculator, TilingStrategy, ToolkitRegionCalculator, VariableOverlapTilingStrategy
+from .tile_worker import (
+    GDALDatasetCache,
+    RegionCalculator,
+    S3BlockCache,
+    S3BlockCacheProxy,
+    TilingStrategy,
+    ToolkitRegionCalculator,
+    VariableOverlapTilingStrategy,
+)
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
@@ -71,6 +83,13 @@ class ModelRunner:
             tiling_strategy=self.tiling_strategy, region_size=region_size
         )
 
+        # Datasets opened on this host are reused by later regions of the same image
+        self.dataset_cache = GDALDatasetCache(
+            max_entries=self.config.dataset_cache_size,
+            max_memory_bytes=self.config.dataset_cache_memory_mb * 1024 * 1024,
+            ttl_seconds=self.config.dataset_cache_ttl_seconds,
+        )
+
         # Handlers for image and region processing
         self.region_request_handler = RegionRequestHandler(
             region_request_table=self.region_request_table,
@@ -87,10 +106,14 @@ class ModelRunner:
             region_request_table=self.region_request_table,
             config=self.config,
             region_request_handler=self.region_request_handler,
+            dataset_cache=self.dataset_cache,
+            single_node_max_pixels=self.config.single_node_max_pixels if self.config.single_node_enabled else None,
         )
 
         # Set up the job scheduler with RegionCalculator and EndpointCapacityEstimator
-        self.requested_jobs_table = RequestedJobsTable(self.config.outstanding_jobs_table)
+        self.requested_jobs_table = RequestedJobsTable(
+            self.config.outstanding_jobs_table, full_refresh_interval=self.config.scheduler_full_refresh_seconds
+        )
 
         # Create SageMaker client for capacity estimation and variant selection
         sm_client = boto3.client("sagemaker", config=BotoConfig.default)
@@ -103,29 +126,46 @@ class ModelRunner:
             cache_ttl_seconds=300,
         )
 
+        # Learn from the tile latencies recorded by the tile workers when endpoint statistics are enabled
+        self.throughput_estimator = None
+        if self.config.endpoint_statistics_table:
+            self.throughput_estimator = EndpointThroughputEstimator(
+                EndpointStatisticsTable(self.config.endpoint_statistics_table),
+                window_seconds=self.config.scheduler_throughput_window_seconds,
+            )
+
         # Create EndpointVariantSelector for early variant selection
         self.variant_selector = EndpointVariantSelector(
             sm_client=sm_client,
             cache_ttl_seconds=300,
         )
 
+        self.buffered_image_request_queue = BufferedImageRequestQueue(
+            self.config.image_queue,
+            self.config.image_dlq,
+            self.requested_jobs_table,
+            region_calculator=self.region_calculator,
+            variant_selector=self.variant_selector,
+            probe_workers=self.config.image_probe_workers,
+            probe_timeout=self.config.image_probe_timeout_seconds,
+        )
         self.image_job_scheduler = EndpointLoadImageScheduler(
-            BufferedImageRequestQueue(
-                self.config.image_queue,
-                self.config.image_dlq,
-                self.requested_jobs_table,
-                region_calculator=self.region_calculator,
-                variant_selector=self.variant_selector,
-            ),
+            self.buffered_image_request_queue,
             capacity_estimator=self.capacity_estimator,
             throttling_enabled=self.config.scheduler_throttling_enabled,
             capacity_target_percentage=self.config.capacity_target_percentage,
+            tile_workers_per_instance=self.config.tile_workers_per_instance,
+            throughput_estimator=self.throughput_estimator,
+            scheduling_policy=self.config.scheduler_policy,
+            default_deadline_seconds=self.config.scheduler_default_deadline_seconds,
+            aging_seconds=self.config.scheduler_aging_seconds,
         )
         self.region_request_handler.on_region_complete.subscribe(self._update_requested_jobs_for_region_completion)
         self.image_request_handler.on_image_update.subscribe(
             lambda image_request: self.requested_jobs_table.update_request_details(image_request, image_request.region_count)
         )
 
+        self.s3_block_cache_proxy: Optional[S3BlockCacheProxy] = None
         self.running = False
 
     def run(self) -> None:
@@ -153,6 +193,7 @@ class ModelRunner:
         :return: None
         """
         set_gdal_default_configuration()
+        self._start_s3_block_cache()
         logger.info("Beginning monitoring request queues")
         while self.running:
             try:
@@ -163,8 +204,30 @@ class ModelRunner:
             except Exception as err:
                 logger.error(f"Unexpected error in monitor_work_queues: {err}")
                 self.running = False
+        self.buffered_image_request_queue.close()
         logger.info("Stopped monitoring request queues")
 
+    def _start_s3_block_cache(self) -> None:
+        """
+        Route GDAL's S3 reads through a local block cache when S3_BLOCK_CACHE_DIR is set. The cache directory is
+        shared with the other ModelRunner processes on this host.
+
+        :return: None
+        """
+        if not self.config.s3_block_cache_dir or self.s3_block_cache_proxy is not None:
+            return
+        try:
+            block_cache = S3BlockCache(
+                self.config.s3_block_cache_dir, max_size_bytes=self.config.s3_block_cache_size_mb * 1024 * 1024
+            )
+            self.s3_block_cache_proxy = S3BlockCacheProxy(
+                block_cache, etag_ttl_seconds=self.config.s3_block_cache_etag_ttl_seconds
+            ).start()
+            self.s3_block_cache_proxy.configure_gdal()
+        except Exception as err:
+            logger.warning(f"Unable to start the S3 block cache, reading from S3 directly: {err}")
+            self.s3_block_cache_proxy = None
+
     def _process_region_requests(self) -> bool:
         """
         Process messages from the region request queue.
@@ -181,10 +244,10 @@ class ModelRunner:
 
         if region_request_attributes:
             ThreadingLocalContextFilter.set_context(region_request_attributes)
+            region_request = None
             try:
                 region_request = RegionRequest(region_request_attributes)
-                image_path = get_image_path(region_request.image_url, region_request.image_read_role)
-                raster_dataset, sensor_model = load_gdal_dataset(image_path)
+                raster_dataset, sensor_model = self._load_region_dataset(region_request)
                 region_request_item = self._get_or_create_region_request_item(region_request)
                 image_request_item = self.region_request_handler.process_region_request(
                     region_request, region_request_item, raster_dataset, sensor_model
@@ -199,6 +262,8 @@ class ModelRunner:
                 self.region_request_queue.reset_request(receipt_handle, visibility_timeout=0)
             except Exception as err:
                 logger.exception(f"Error processing region request: {err}")
+                if region_request is not None:
+                    self.dataset_cache.invalidate(region_request.image_url, region_request.image_read_role)
                 self.region_request_queue.finish_request(receipt_handle)
             finally:
                 ThreadingLocalContextFilter.set_context(None)
@@ -206,6 +271,21 @@ class ModelRunner:
         else:
             return False
 
+    def _load_region_dataset(self, region_request: RegionRequest) -> Tuple[gdal.Dataset, Optional[SensorModel]]:
+        """
+        Get the dataset and sensor model for a region request, reusing the ones already opened on this host for
+        the same image when possible.
+
+        :param region_request: The region request being processed
+        :return: The GDAL dataset and its sensor model
+        """
+
+        def load_dataset() -> Tuple[gdal.Dataset, Optional[SensorModel]]:
+            image_path = get_image_path(region_request.image_url, region_request.image_read_role)
+            return load_gdal_dataset(image_path)
+
+        return self.dataset_cache.get(region_request.image_url, region_request.image_read_role, load_dataset)
+
     def _process_image_requests(self) -> bool:
         """
         Processes messages from the image job scheduler.
@@ -1,8 +1,12 @@
 #  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
+import os
+import tempfile
+import time
 from typing import Optional
 
+import shapely
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
 from aws_embedded_metrics.unit import Unit
@@ -15,8 +19,10 @@ from .app_config import MetricLabels, ServiceConfig
 from .common import ObservableEvent, RequestStatus, Timer
 from .database import ImageRequestItem, ImageRequestTable, RegionRequestItem, RegionRequestTable
 from .exceptions import ProcessRegionException
+from .inference import accepts_segmentation_masks, calculate_processing_area
+from .sink import SinkFactory
 from .status import RegionStatusMonitor
-from .tile_worker import TilingStrategy, process_tiles, setup_tile_workers
+from .tile_worker import FeatureCollector, RegionMaskMosaic, TilingStrategy, process_tiles, setup_tile_workers
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
@@ -94,6 +100,7 @@ class RegionRequestHandler:
                 }
             )
 
+        skipped_tile_count = 0
         try:
             with Timer(
                 task_str=f"Processing region {region_request.image_url} {region_request.region_bounds}",
@@ -104,23 +111,13 @@ class RegionRequestHandler:
                 self.region_request_table.start_region_request(region_request_item)
                 logger.debug(f"Starting region request: region id: {region_request_item.region_id}")
 
-                # Set up our threaded tile worker pool
-                tile_queue, tile_workers = setup_tile_workers(region_request, sensor_model, self.config.elevation_model)
-
                 # Process all our tiles
-                total_tile_count, failed_tile_count = process_tiles(
-                    self.tiling_strategy,
-                    region_request_item,
-                    tile_queue,
-                    tile_workers,
-                    raster_dataset,
-                    sensor_model,
+                failed_tile_count = self.process_region_tiles(
+                    region_request, region_request_item, raster_dataset, sensor_model
                 )
+                skipped_tile_count = region_request_item.skipped_tile_count or 0
 
                 # Update table w/ total tile counts
-                region_request_item.total_tiles = total_tile_count
-                region_request_item.succeeded_tile_count = total_tile_count - failed_tile_count
-                region_request_item.failed_tile_count = failed_tile_count
                 region_request_item = self.region_request_table.update_region_request(region_request_item)
 
             # Update the image request to complete this region
@@ -142,6 +139,7 @@ class RegionRequestHandler:
             # Write CloudWatch Metrics to the Logs
             if isinstance(metrics, MetricsLogger):
                 metrics.put_metric(MetricLabels.INVOCATIONS, 1, str(Unit.COUNT.value))
+                metrics.put_metric(MetricLabels.SKIPPED_TILES, skipped_tile_count, str(Unit.COUNT.value))
 
             # Return the updated item
             return image_request_item
@@ -155,6 +153,178 @@ class RegionRequestHandler:
             self.on_region_complete(image_request_item, region_request_item, RequestStatus.FAILED)
             return image_request_item
 
+    @metric_scope
+    def process_region_in_memory(
+        self,
+        region_request: RegionRequest,
+        region_request_item: RegionRequestItem,
+        raster_dataset: gdal.Dataset,
+        sensor_model: Optional[SensorModel],
+        feature_collector: FeatureCollector,
+        image_request_item: ImageRequestItem,
+        metrics: MetricsLogger = None,
+    ) -> RequestStatus:
+        """
+        Processes a region of an image that is processed entirely on this host. The features of the tiles are added
+        to the feature collector and the region and image request tables are not updated, the caller records the
+        outcome of the region on the image request item it holds. Region completion is still announced through
+        on_region_complete, as for regions processed from the queue.
+
+        :param region_request: RegionRequest = the region request
+        :param region_request_item: RegionRequestItem = the region request, only kept in memory
+        :param raster_dataset: gdal.Dataset = the raster dataset containing the region
+        :param sensor_model: Optional[SensorModel] = the sensor model for this raster dataset
+        :param feature_collector: FeatureCollector = collects the features of the image
+        :param image_request_item: ImageRequestItem = the image request the region belongs to, only kept in memory
+        :param metrics: MetricsLogger = the metrics logger to use to report metrics.
+
+        :return: RequestStatus = the status of the region
+        """
+        logger.info(
+            "Starting region processing in memory.",
+            extra={"tag": "TIMELINE EVENT", "job_id": region_request.job_id, "region_id": region_request.region_id},
+        )
+        if isinstance(metrics, MetricsLogger):
+            metrics.set_dimensions()
+            metrics.put_dimensions(
+                {
+                    MetricLabels.OPERATION_DIMENSION: MetricLabels.REGION_PROCESSING_OPERATION,
+                    MetricLabels.MODEL_NAME_DIMENSION: region_request.model_name,
+                    MetricLabels.INPUT_FORMAT_DIMENSION: str(raster_dataset.GetDriver().ShortName).upper(),
+                }
+            )
+
+        region_request_item.start_time = int(time.time() * 1000)
+        try:
+            if not region_request.is_valid():
+                logger.error(f"Invalid Region Request! {region_request.__dict__}")
+                raise ValueError("Invalid Region Request")
+
+            with Timer(
+                task_str=f"Processing region {region_request.image_url} {region_request.region_bounds}",
+                metric_name=MetricLabels.DURATION,
+                logger=logger,
+                metrics_logger=metrics,
+            ):
+                self.process_region_tiles(
+                    region_request, region_request_item, raster_dataset, sensor_model, feature_collector=feature_collector
+                )
+            region_status = self.region_status_monitor.get_status(region_request_item)
+            if isinstance(metrics, MetricsLogger):
+                metrics.put_metric(MetricLabels.INVOCATIONS, 1, str(Unit.COUNT.value))
+                metrics.put_metric(
+                    MetricLabels.SKIPPED_TILES, region_request_item.skipped_tile_count or 0, str(Unit.COUNT.value)
+                )
+        except Exception as err:
+            failed_msg = f"Failed to process image region: {err}"
+            logger.error(failed_msg)
+            region_request_item.message = failed_msg
+            region_status = RequestStatus.FAILED
+            if isinstance(metrics, MetricsLogger):
+                metrics.put_metric(MetricLabels.ERRORS, 1, str(Unit.COUNT.value))
+
+        region_request_item.region_status = region_status
+        region_request_item.end_time = int(time.time() * 1000)
+        region_request_item.processing_duration = region_request_item.end_time - region_request_item.start_time
+        self.region_status_monitor.process_event(region_request_item, region_status, "Completed region processing")
+        self.on_region_complete(image_request_item, region_request_item, region_status)
+        logger.info(
+            "Completed region processing.",
+            extra={"tag": "TIMELINE EVENT", "job_id": region_request.job_id, "region_id": region_request.region_id},
+        )
+        return region_status
+
+    def process_region_tiles(
+        self,
+        region_request: RegionRequest,
+        region_request_item: RegionRequestItem,
+        raster_dataset: gdal.Dataset,
+        sensor_model: Optional[SensorModel] = None,
+        feature_collector: Optional[FeatureCollector] = None,
+    ) -> int:
+        """
+        Runs the tiles of a region through the model with a pool of tile workers and records the tile counts on the
+        region request item. Segmentation masks returned for the tiles are written to the outputs of the image.
+
+        :param region_request: RegionRequest = the region request
+        :param region_request_item: RegionRequestItem = the region request to record the tile counts on
+        :param raster_dataset: gdal.Dataset = the raster dataset containing the region
+        :param sensor_model: Optional[SensorModel] = the sensor model for this raster dataset
+        :param feature_collector: Optional[FeatureCollector] = collects the features in memory instead of the
+                                  feature table
+
+        :return: int = the number of tiles that failed
+        """
+        # Set up our threaded tile worker pool. Segmentation masks returned for the tiles are blended into
+        # a mosaic of the region, which only allocates storage once a mask arrives.
+        mask_mosaic = RegionMaskMosaic(
+            region_request.region_bounds, region_request.tile_overlap, region_request.processing_scale
+        )
+        try:
+            tile_queue, tile_workers = setup_tile_workers(
+                region_request,
+                sensor_model,
+                self.config.elevation_model,
+                mask_mosaic=mask_mosaic,
+                feature_collector=feature_collector,
+            )
+
+            # Tiles outside a polygon ROI are not created and detections outside it are dropped
+            processing_area = None
+            if region_request.roi_wkt:
+                processing_area = calculate_processing_area(
+                    raster_dataset, shapely.from_wkt(region_request.roi_wkt), sensor_model
+                )
+
+            # Process all our tiles. The mask of a region replaces the one written by an earlier attempt, so
+            # when masks are requested the tiles that already succeeded are processed again to complete it.
+            total_tile_count, failed_tile_count = process_tiles(
+                self.tiling_strategy,
+                region_request_item,
+                tile_queue,
+                tile_workers,
+                raster_dataset,
+                sensor_model,
+                tile_buffer_bytes=self.config.tile_buffer_memory_mb * 1024 * 1024,
+                read_ahead_tiles=self.config.tile_read_ahead,
+                nodata_threshold=(self.config.tile_nodata_threshold if self.config.tile_skip_nodata_enabled else None),
+                processing_area=processing_area,
+                processing_scale=region_request.processing_scale,
+                reprocess_succeeded_tiles=accepts_segmentation_masks(region_request.model_endpoint_parameters),
+            )
+
+            if mask_mosaic.has_masks:
+                self.sink_region_mask(region_request, mask_mosaic, raster_dataset)
+        finally:
+            mask_mosaic.close()
+
+        skipped_tile_count = region_request_item.skipped_tile_count or 0
+        region_request_item.total_tiles = total_tile_count
+        region_request_item.succeeded_tile_count = total_tile_count - failed_tile_count - skipped_tile_count
+        region_request_item.failed_tile_count = failed_tile_count
+        return failed_tile_count
+
+    def sink_region_mask(
+        self, region_request: RegionRequest, mask_mosaic: RegionMaskMosaic, raster_dataset: gdal.Dataset
+    ) -> None:
+        """
+        Write the segmentation masks of a region to the outputs of the image request as a Cloud Optimized GeoTIFF
+        named after the origin of the region.
+
+        :param region_request: RegionRequest = the region request
+        :param mask_mosaic: RegionMaskMosaic = the blended masks of the tiles of the region
+        :param raster_dataset: gdal.Dataset = the raster dataset containing the region, used to georeference the COG
+
+        :return: None
+        """
+        image_request_item = self.image_request_table.get_image_request(region_request.image_id)
+        raster_name = f"mask-{region_request.region_bounds[0][0]}-{region_request.region_bounds[0][1]}.tif"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, raster_name)
+            mask_mosaic.write_cog(file_path, raster_dataset)
+            if not SinkFactory.sink_raster(region_request.job_id, image_request_item.outputs, raster_name, file_path):
+                raise ProcessRegionException(f"Failed to write the segmentation mask of region {region_request.region_id}")
+
     @metric_scope
     def fail_region_request(
         self,
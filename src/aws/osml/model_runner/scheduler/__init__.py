@@ -6,7 +6,8 @@
 
 from .buffered_image_request_queue import BufferedImageRequestQueue
 from .endpoint_capacity_estimator import EndpointCapacityEstimator
-from .endpoint_load_image_scheduler import EndpointLoadImageScheduler
+from .endpoint_load_image_scheduler import EndpointLoadImageScheduler, SchedulingPolicy
+from .endpoint_throughput_estimator import EndpointThroughputEstimator, EndpointThroughputStatistics
 from .endpoint_variant_selector import EndpointVariantSelector
 from .fifo_image_scheduler import FIFOImageScheduler
 from .image_scheduler import ImageScheduler
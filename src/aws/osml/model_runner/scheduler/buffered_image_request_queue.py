@@ -4,7 +4,9 @@ import dataclasses
 import json
 import logging
 import time
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 
 import boto3
 from aws_embedded_metrics import metric_scope
@@ -14,6 +16,7 @@ from botocore.exceptions import ClientError
 
 from aws.osml.model_runner.api import ImageRequest
 from aws.osml.model_runner.app_config import BotoConfig, MetricLabels
+from aws.osml.model_runner.common import RegionPlan
 from aws.osml.model_runner.database.requested_jobs_table import ImageRequestStatusRecord, RequestedJobsTable
 from aws.osml.model_runner.exceptions import LoadImageException
 from aws.osml.model_runner.scheduler.endpoint_variant_selector import EndpointVariantSelector
@@ -22,6 +25,24 @@ from aws.osml.model_runner.tile_worker import RegionCalculator
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PendingProbe:
+    """
+    A request whose image header is being read in the background.
+
+    :param message: The SQS message containing the request, left in flight until the probe finishes. It is replaced
+                    when the message is received again so the latest receipt handle is used to delete it.
+    :param image_request: The parsed image request
+    :param future: The background region calculation
+    :param deadline: Time in epoch seconds after which the probe is abandoned
+    """
+
+    message: dict
+    image_request: ImageRequest
+    future: Future
+    deadline: float
+
+
 class BufferedImageRequestQueue:
     """
     A queue that buffers image requests from SQS and manages them in DynamoDB.
@@ -48,6 +69,8 @@ class BufferedImageRequestQueue:
         max_retry_attempts: int = 1,
         region_calculator: Optional[RegionCalculator] = None,
         variant_selector: Optional[EndpointVariantSelector] = None,
+        probe_workers: int = 0,
+        probe_timeout: int = 60,
     ):
         """
         Initialize the buffered image request queue.
@@ -63,6 +86,11 @@ class BufferedImageRequestQueue:
                                  and storing region_count for capacity planning.
         :param variant_selector: Optional selector for endpoint variants. When provided, enables early
                                 variant selection during buffering using weighted random selection.
+        :param probe_workers: Number of image headers to read concurrently when calculating regions. When 0 the
+                              headers are read one message at a time before the next message is considered.
+        :param probe_timeout: Time in seconds a background header read may take before the request is buffered
+                              without a region count. This should be shorter than the visibility timeout of the
+                              image queue so messages do not become visible again while they are probed.
         """
         self.requested_jobs_table = requested_jobs_table
         self.max_jobs_lookahead = max_jobs_lookahead
@@ -70,6 +98,17 @@ class BufferedImageRequestQueue:
         self.max_retry_attempts = max_retry_attempts
         self.region_calculator = region_calculator
         self.variant_selector = variant_selector
+        self.probe_timeout = probe_timeout
+        self._probe_executor = (
+            ThreadPoolExecutor(max_workers=probe_workers, thread_name_prefix="ImageHeaderProbe")
+            if probe_workers > 0 and region_calculator
+            else None
+        )
+        self.probe_workers = probe_workers
+        self._pending_probes: Dict[str, _PendingProbe] = {}
+        # Probes that timed out while running. Their threads cannot be interrupted so they hold a worker until the
+        # header read returns.
+        self._abandoned_probes: List[Future] = []
 
         self.sqs_client = boto3.client("sqs", config=BotoConfig.default)
         self.image_queue_url = image_queue_url
@@ -93,8 +132,8 @@ class BufferedImageRequestQueue:
             outstanding_requests = self._purge_finished_requests(outstanding_requests)
 
             # If our buffer isn't at full capacity pull new messages from the queue
-            # and store them in the buffer.
-            if len(outstanding_requests) < self.max_jobs_lookahead:
+            # and store them in the buffer. Requests with finished background probes are always collected.
+            if len(outstanding_requests) < self.max_jobs_lookahead or self._pending_probes:
                 outstanding_requests.extend(
                     self._fetch_new_requests(max_messages_to_fetch=self.max_jobs_lookahead - len(outstanding_requests))
                 )
@@ -129,10 +168,17 @@ class BufferedImageRequestQueue:
         This approach provides fail-fast behavior: images that cannot be accessed
         are rejected immediately rather than consuming scheduler capacity.
 
+        When a probe pool is configured the image headers are read concurrently in the background. Messages stay
+        in flight on the SQS queue while their headers are probed and are added to DynamoDB by a later call once
+        the probe finishes, so a burst of large images does not stall the scheduling loop. A probe that runs past
+        probe_timeout is abandoned and its request is buffered without a region count. An abandoned probe holds its
+        worker until the header read returns, and while every worker is held this way new requests are buffered
+        without a region count instead of waiting behind them.
+
         :return: List of new image request status records
         """
-        outstanding_requests = []
-        messages_to_fetch = max_messages_to_fetch
+        outstanding_requests = self._collect_finished_probes()
+        messages_to_fetch = max_messages_to_fetch - len(outstanding_requests) - len(self._pending_probes)
         while messages_to_fetch > 0:
             try:
                 # Use the SQS batch read function to retrieve multiple image requests from the queue if possible.
@@ -150,6 +196,12 @@ class BufferedImageRequestQueue:
                     break
 
                 for message in messages:
+                    # A message that became visible again while its header is still being probed is left for the
+                    # probe to finish. Receiving it again invalidates the old receipt handle, so the probe keeps the
+                    # new one to delete the message with.
+                    if message.get("MessageId") in self._pending_probes:
+                        self._pending_probes[message.get("MessageId")].message = message
+                        continue
                     try:
                         # Attempt to create a valid ImageRequest from the queue body
                         message_body = message["Body"]
@@ -163,34 +215,29 @@ class BufferedImageRequestQueue:
                         if self.variant_selector:
                             image_request = self.variant_selector.select_variant(image_request)
 
+                        # Read the image header in the background if a probe pool is available
+                        if self._probe_executor and self.region_calculator and self._has_free_probe_worker():
+                            self._pending_probes[message.get("MessageId")] = _PendingProbe(
+                                message=message,
+                                image_request=image_request,
+                                future=self._probe_executor.submit(self._calculate_region_count, image_request),
+                                deadline=time.time() + self.probe_timeout,
+                            )
+                            messages_to_fetch -= 1
+                            continue
+
                         # Calculate region count if region_calculator is provided
                         region_count = None
-                        if self.region_calculator:
+                        if self._probe_executor:
+                            logger.warning(
+                                f"Every image header probe worker is held by a timed out probe. Buffering image "
+                                f"{image_request.image_id} without a region count."
+                            )
+                        elif self.region_calculator:
                             try:
-                                regions = self.region_calculator.calculate_regions(
-                                    image_url=image_request.image_url,
-                                    tile_size=image_request.tile_size,
-                                    tile_overlap=image_request.tile_overlap,
-                                    roi=image_request.roi,
-                                    image_read_role=image_request.image_read_role,
-                                )
-                                region_count = len(regions)
-                                logger.info(
-                                    f"Calculated {region_count} regions for image {image_request.image_id} "
-                                    f"during buffering"
-                                )
+                                region_count = self._calculate_region_count(image_request)
                             except LoadImageException as e:
-                                # Image is inaccessible - fail fast by moving to DLQ immediately
-                                logger.error(
-                                    f"Image {image_request.image_url} is inaccessible during buffering. "
-                                    f"Moving to DLQ. Error: {e}"
-                                )
-                                logger.info(f"Moving inaccessible image {image_request.image_id} to DLQ")
-
-                                # Emit Errors metric for image access failure
-                                self._emit_image_access_error_metric(image_request.model_name)
-
-                                self._handle_invalid_message(message)
+                                self._handle_inaccessible_image(message, image_request, e)
                                 continue
                         else:
                             logger.warning(
@@ -198,23 +245,14 @@ class BufferedImageRequestQueue:
                                 f"Region count will not be calculated during buffering."
                             )
 
-                        # If we have a valid request move it from the SQS queue into our DDB table. The order of these
-                        # operations is important to ensure we don't lose any requests. (i.e. ensure they are added
-                        # to the table before we delete them from the queue).
-                        request_status_record = self.requested_jobs_table.add_new_request(image_request, region_count)
-                        self.sqs_client.delete_message(QueueUrl=self.image_queue_url, ReceiptHandle=message["ReceiptHandle"])
-                        outstanding_requests.append(request_status_record)
-                        messages_to_fetch -= 1
+                        request_status_record = self._buffer_request(message, image_request, region_count)
+                        if request_status_record:
+                            outstanding_requests.append(request_status_record)
+                            messages_to_fetch -= 1
 
                     except (json.JSONDecodeError, ValueError) as e:
                         logger.info(f"Invalid message received. Moving to DLQ. {e}")
                         self._handle_invalid_message(message)
-                    except ClientError:
-                        # In this case we were unable to either add the request to the DDB table or remove it from the
-                        # image queue. The table add happens before the delete so if the request is not recorded it
-                        # will be left on the SQS queue for a retry attempt. If the delete attempt failed it will appear
-                        # just like a duplicate SQS message.
-                        logger.error("Unable to move valid image request from input queue to DDB.", exc_info=True)
 
             except ClientError as e:
                 logger.error(f"Error receiving messages from SQS: {e}")
@@ -222,6 +260,140 @@ class BufferedImageRequestQueue:
 
         return outstanding_requests
 
+    def _calculate_region_count(self, image_request: ImageRequest) -> int:
+        """
+        Read the image header and calculate the number of regions the image will be divided into. When the
+        region calculator can produce a full region plan it is attached to the image request so it is persisted
+        with the buffered request and reused by the workers.
+
+        :param image_request: The image request to calculate regions for
+        :return: The number of regions
+        :raises LoadImageException: If the image cannot be accessed
+        """
+        region_plan = self.region_calculator.calculate_region_plan(
+            image_url=image_request.image_url,
+            tile_size=image_request.tile_size,
+            tile_overlap=image_request.tile_overlap,
+            roi=image_request.roi,
+            image_read_role=image_request.image_read_role,
+        )
+        if isinstance(region_plan, RegionPlan):
+            image_request.region_plan = region_plan
+            region_count = region_plan.region_count
+        else:
+            regions = self.region_calculator.calculate_regions(
+                image_url=image_request.image_url,
+                tile_size=image_request.tile_size,
+                tile_overlap=image_request.tile_overlap,
+                roi=image_request.roi,
+                image_read_role=image_request.image_read_role,
+            )
+            region_count = len(regions)
+        logger.info(f"Calculated {region_count} regions for image {image_request.image_id} during buffering")
+        return region_count
+
+    def _collect_finished_probes(self) -> List[ImageRequestStatusRecord]:
+        """
+        Buffer the requests whose background header probes have finished or run past their deadline. Probes that
+        are still running are left in place without waiting for them.
+
+        :return: List of new image request status records
+        """
+        outstanding_requests = []
+        current_time = time.time()
+        for message_id, probe in list(self._pending_probes.items()):
+            if probe.future.done():
+                del self._pending_probes[message_id]
+                try:
+                    region_count = probe.future.result()
+                except LoadImageException as e:
+                    self._handle_inaccessible_image(probe.message, probe.image_request, e)
+                    continue
+                except Exception as e:
+                    # Leave the message on the queue so it is retried once its visibility timeout expires
+                    logger.error(f"Unexpected error probing image {probe.image_request.image_url}: {e}", exc_info=True)
+                    continue
+            elif current_time > probe.deadline:
+                del self._pending_probes[message_id]
+                if not probe.future.cancel():
+                    self._abandoned_probes.append(probe.future)
+                logger.warning(
+                    f"Timed out reading the header of image {probe.image_request.image_url} after "
+                    f"{self.probe_timeout}s. Buffering the request without a region count."
+                )
+                region_count = None
+            else:
+                continue
+
+            request_status_record = self._buffer_request(probe.message, probe.image_request, region_count)
+            if request_status_record:
+                outstanding_requests.append(request_status_record)
+
+        return outstanding_requests
+
+    def _has_free_probe_worker(self) -> bool:
+        """
+        Check whether a probe worker is not held by a timed out probe, forgetting the timed out probes that have
+        since finished.
+
+        :return: True if a new probe can be run in the background
+        """
+        self._abandoned_probes = [future for future in self._abandoned_probes if not future.done()]
+        return len(self._abandoned_probes) < self.probe_workers
+
+    def close(self) -> None:
+        """
+        Stop reading image headers in the background. Probes that have not started are cancelled and running probes
+        are not waited for. Their messages stay on the SQS queue and become visible again after their visibility
+        timeout, so the requests are buffered by this or another worker later.
+        """
+        if self._probe_executor:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
+            self._probe_executor = None
+        self._pending_probes.clear()
+        self._abandoned_probes.clear()
+
+    def _buffer_request(
+        self, message: dict, image_request: ImageRequest, region_count: Optional[int]
+    ) -> Optional[ImageRequestStatusRecord]:
+        """
+        Move a valid request from the SQS queue into the DynamoDB table.
+
+        :param message: The SQS message containing the request
+        :param image_request: The parsed image request
+        :param region_count: The number of regions in the image, None if it is not known
+        :return: The new status record or None if the request could not be moved
+        """
+        try:
+            # The order of these operations is important to ensure we don't lose any requests. (i.e. ensure they
+            # are added to the table before we delete them from the queue).
+            request_status_record = self.requested_jobs_table.add_new_request(image_request, region_count)
+            self.sqs_client.delete_message(QueueUrl=self.image_queue_url, ReceiptHandle=message["ReceiptHandle"])
+            return request_status_record
+        except ClientError:
+            # In this case we were unable to either add the request to the DDB table or remove it from the
+            # image queue. The table add happens before the delete so if the request is not recorded it
+            # will be left on the SQS queue for a retry attempt. If the delete attempt failed it will appear
+            # just like a duplicate SQS message.
+            logger.error("Unable to move valid image request from input queue to DDB.", exc_info=True)
+            return None
+
+    def _handle_inaccessible_image(self, message: dict, image_request: ImageRequest, error: Exception) -> None:
+        """
+        Fail fast on an image that could not be read during buffering by moving its request to the DLQ.
+
+        :param message: The SQS message containing the request
+        :param image_request: The parsed image request
+        :param error: The error raised while reading the image
+        """
+        logger.error(f"Image {image_request.image_url} is inaccessible during buffering. Moving to DLQ. Error: {error}")
+        logger.info(f"Moving inaccessible image {image_request.image_id} to DLQ")
+
+        # Emit Errors metric for image access failure
+        self._emit_image_access_error_metric(image_request.model_name)
+
+        self._handle_invalid_message(message)
+
     def _handle_invalid_message(self, message: dict) -> None:
         """
         This is the error handling for an invalid or improperly formatted image request.
@@ -3,9 +3,10 @@
 import logging
 import time
 from dataclasses import dataclass
+from enum import auto
 from itertools import groupby
 from operator import attrgetter
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import boto3
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
@@ -15,14 +16,26 @@ from botocore.exceptions import ClientError
 
 from aws.osml.model_runner.api import ImageRequest
 from aws.osml.model_runner.app_config import BotoConfig, MetricLabels
+from aws.osml.model_runner.common import AutoStringEnum
 from aws.osml.model_runner.database import ImageRequestStatusRecord
 from aws.osml.model_runner.scheduler.buffered_image_request_queue import BufferedImageRequestQueue
 from aws.osml.model_runner.scheduler.endpoint_capacity_estimator import EndpointCapacityEstimator
+from aws.osml.model_runner.scheduler.endpoint_throughput_estimator import EndpointThroughputEstimator
 from aws.osml.model_runner.scheduler.image_scheduler import ImageScheduler
 
 logger = logging.getLogger(__name__)
 
 
+class SchedulingPolicy(str, AutoStringEnum):
+    """
+    Enumeration defining the policies the scheduler can use to pick the next image request to start.
+    """
+
+    LOAD_BALANCED = auto()
+    DEADLINE = auto()
+    WEIGHTED_FAIR = auto()
+
+
 @dataclass
 class EndpointUtilizationSummary:
     """
@@ -56,16 +69,32 @@ class EndpointLoadImageScheduler(ImageScheduler):
     It does this by using a buffered request queue that will allow us to look ahead some number of requests
     and then pick the oldest request for the endpoint currently processing the fewest number of regions.
 
+    Two other selection policies can be configured:
+
+    - DEADLINE starts the request with the earliest deadline first. Requests without a deadline are given an
+      implied one of request_time + default_deadline_seconds / (1 + priority) so they age into the schedule.
+    - WEIGHTED_FAIR starts the request that would finish first if each endpoint shared its instances between
+      its own requests in proportion to their priority. Small images are started ahead of large ones on a busy
+      endpoint while waiting time is credited to every request so large backfill images still make progress.
+
     The scheduler supports optional capacity-based throttling to prevent endpoint overload by checking
     available capacity before starting new image jobs.
     """
 
+    # Default estimate of the number of regions in an image when the count is not available (typical for large images)
+    DEFAULT_REGION_COUNT = 20
+
     def __init__(
         self,
         image_request_queue: BufferedImageRequestQueue,
         capacity_estimator: Optional[EndpointCapacityEstimator] = None,
         throttling_enabled: bool = True,
         capacity_target_percentage: float = 1.0,
+        tile_workers_per_instance: Optional[int] = None,
+        throughput_estimator: Optional[EndpointThroughputEstimator] = None,
+        scheduling_policy: Union[SchedulingPolicy, str] = SchedulingPolicy.LOAD_BALANCED,
+        default_deadline_seconds: int = 3600,
+        aging_seconds: int = 60,
     ):
         """
         Initialize the load based image scheduler.
@@ -84,6 +113,17 @@ class EndpointLoadImageScheduler(ImageScheduler):
                                           Values = 1.0 use full endpoint capacity (default).
                                           Values > 1.0 allow overprovisioning for aggressive scaling.
                                           For example, 0.8 maintains 20% headroom, 1.2 allows 120% utilization.
+        :param tile_workers_per_instance: Number of tile workers each ModelRunner instance uses to process a region.
+                                          Used to estimate the load of an image. If None, the value is read from the
+                                          ServiceConfig.
+        :param throughput_estimator: Optional estimator that adjusts the capacity reported by the capacity_estimator
+                                     using the tile latencies observed by the tile workers. When None the static
+                                     capacity is used.
+        :param scheduling_policy: Policy used to select the next request. Unknown values fall back to LOAD_BALANCED.
+        :param default_deadline_seconds: Implied deadline, relative to the request time, of requests that do not
+                                         specify one. Only used by the DEADLINE policy.
+        :param aging_seconds: Waiting time that offsets one region of load per endpoint instance. Only used by the
+                              WEIGHTED_FAIR policy.
 
         Note: Variant selection is NOT needed in the scheduler - it already happened in BufferedImageRequestQueue
         during request buffering. By the time the scheduler sees a request, TargetVariant is already
@@ -94,6 +134,15 @@ class EndpointLoadImageScheduler(ImageScheduler):
         self.capacity_estimator = capacity_estimator
         self.throttling_enabled = throttling_enabled
         self.capacity_target_percentage = capacity_target_percentage
+        self.tile_workers_per_instance = tile_workers_per_instance
+        self.throughput_estimator = throughput_estimator
+        try:
+            self.scheduling_policy = SchedulingPolicy(scheduling_policy.upper())
+        except (AttributeError, ValueError):
+            logger.warning(f"Invalid scheduling policy: {scheduling_policy}. Defaulting to LOAD_BALANCED.")
+            self.scheduling_policy = SchedulingPolicy.LOAD_BALANCED
+        self.default_deadline_seconds = max(1, default_deadline_seconds)
+        self.aging_seconds = max(1, aging_seconds)
 
     def get_next_scheduled_request(self) -> Optional[ImageRequest]:
         """
@@ -107,7 +156,7 @@ class EndpointLoadImageScheduler(ImageScheduler):
 
         1. Retrieve all outstanding requests from the buffered queue
         2. Group requests by endpoint and calculate current utilization
-        3. Select the next eligible request based on load balancing
+        3. Select the next eligible request based on the scheduling policy
         4. If throttling is enabled, extract the TargetVariant from the request
            (already set by BufferedImageRequestQueue), calculate available capacity
            for the specific endpoint variant, check if sufficient capacity exists
@@ -199,11 +248,18 @@ class EndpointLoadImageScheduler(ImageScheduler):
 
                 # Capacity is available - log scheduling decision with details
                 image_load = self._estimate_image_load(next_request)
+                expected_throughput = ""
+                if self.throughput_estimator is not None:
+                    tiles_per_second = self.throughput_estimator.expected_tiles_per_second(
+                        endpoint_name, variant_name, image_load
+                    )
+                    if tiles_per_second is not None:
+                        expected_throughput = f", Expected throughput: {tiles_per_second:.2f} tiles/s"
                 logger.info(
                     f"Scheduling job {next_request.job_id} with sufficient capacity. "
                     f"Endpoint: {endpoint_name}, Variant: {variant_name}, "
                     f"Required load: {image_load} tiles, Available capacity: {available_capacity} tiles, "
-                    f"Target percentage: {self.capacity_target_percentage:.1%}"
+                    f"Target percentage: {self.capacity_target_percentage:.1%}{expected_throughput}"
                 )
 
             # Try to start the next attempt. If the attempt can't be started that usually means the conditional
@@ -214,6 +270,9 @@ class EndpointLoadImageScheduler(ImageScheduler):
                 schedule_cycle_log_message = (
                     f"Started selected job {next_request.job_id}. Attempt # {next_request.num_attempts + 1}"
                 )
+                deadline = next_request.request_payload.deadline
+                if deadline is not None and time.time() > deadline:
+                    logger.warning(f"Job {next_request.job_id} started {time.time() - deadline:.0f}s after its deadline.")
                 return next_request.request_payload
 
             schedule_cycle_log_message = (
@@ -268,6 +327,9 @@ class EndpointLoadImageScheduler(ImageScheduler):
         by the number of tile workers per instance. This represents the maximum number of
         concurrent inference requests the image can generate at a time.
 
+        When the request carries a region plan the per-region tile counts are used instead, since a
+        region with fewer tiles than there are tile workers cannot use all of them.
+
         When region_count is not available (None), a default estimate is used based on typical
         image sizes. This can occur for requests that were added before region calculation was
         implemented or when region calculation is disabled.
@@ -275,22 +337,37 @@ class EndpointLoadImageScheduler(ImageScheduler):
         :param request: The image request status record containing region count information
         :return: Estimated load in concurrent tile requests (regions × workers per instance)
         """
-        # Import here to avoid circular dependency
-        from aws.osml.model_runner.app_config import ServiceConfig
+        tile_workers_per_instance = self.tile_workers_per_instance
+        if tile_workers_per_instance is None:
+            # Import here to avoid circular dependency
+            from aws.osml.model_runner.app_config import ServiceConfig
 
-        config = ServiceConfig()
+            tile_workers_per_instance = ServiceConfig().tile_workers_per_instance
 
-        if request.region_count is not None:
+        region_plan = request.request_payload.region_plan if request.request_payload else None
+        if region_plan is not None and region_plan.tile_counts and len(region_plan.tile_counts) == region_plan.region_count:
+            # A region can never keep more tile workers busy than it has tiles, so small regions count for less
+            estimated_load = sum(min(tile_count, tile_workers_per_instance) for tile_count in region_plan.tile_counts)
+        elif request.region_count is not None:
             # Use actual region count minus the number of complete regions when available
-            estimated_load = request.region_count * config.tile_workers_per_instance
+            estimated_load = request.region_count * tile_workers_per_instance
         else:
             # Use default estimate when region count is not available
-            # Default assumes 20 regions per image (typical for large images)
-            default_region_count = 20
-            estimated_load = default_region_count * config.tile_workers_per_instance
+            estimated_load = self.DEFAULT_REGION_COUNT * tile_workers_per_instance
 
         return estimated_load
 
+    def _estimate_remaining_regions(self, request: ImageRequestStatusRecord) -> int:
+        """
+        Calculate the number of regions an image request still has to process.
+
+        :param request: The image request status record containing region count information
+        :return: Number of incomplete regions, at least 1
+        """
+        if request.region_count is None:
+            return self.DEFAULT_REGION_COUNT
+        return max(1, request.region_count - len(request.regions_complete))
+
     def _get_running_jobs_for_endpoint_variant(
         self,
         endpoint_name: str,
@@ -381,6 +458,10 @@ class EndpointLoadImageScheduler(ImageScheduler):
             # Get maximum capacity for the specific variant
             max_capacity = self.capacity_estimator.estimate_capacity(endpoint_name, variant_name)
 
+            # Correct the configured capacity with the throughput the endpoint has actually been observed to sustain
+            if self.throughput_estimator is not None:
+                max_capacity = self.throughput_estimator.adjust_capacity(endpoint_name, variant_name, max_capacity)
+
             # Apply target percentage to get the target capacity for scheduling
             target_capacity = int(max_capacity * self.capacity_target_percentage)
 
@@ -576,7 +657,34 @@ class EndpointLoadImageScheduler(ImageScheduler):
         self, endpoint_loads: List[EndpointUtilizationSummary]
     ) -> Optional[ImageRequestStatusRecord]:
         """
-        Find the next eligible request to process.
+        Find the next eligible request to process using the configured scheduling policy.
+
+        :param endpoint_loads: List of endpoint load information
+        :return: The next request to process, if any
+        """
+        if self.scheduling_policy == SchedulingPolicy.DEADLINE:
+            return self._select_earliest_deadline_request(endpoint_loads)
+        if self.scheduling_policy == SchedulingPolicy.WEIGHTED_FAIR:
+            return self._select_weighted_fair_request(endpoint_loads)
+        return self._select_load_balanced_request(endpoint_loads)
+
+    def _get_visible_requests(
+        self, requests: List[ImageRequestStatusRecord], current_time: float
+    ) -> List[ImageRequestStatusRecord]:
+        """
+        Filter out the requests that are running or waiting for their retry timeout to expire.
+
+        :param requests: The requests to filter
+        :param current_time: The current time in epoch seconds
+        :return: The requests that are eligible to start
+        """
+        return [request for request in requests if request.last_attempt + self.image_request_queue.retry_time < current_time]
+
+    def _select_load_balanced_request(
+        self, endpoint_loads: List[EndpointUtilizationSummary]
+    ) -> Optional[ImageRequestStatusRecord]:
+        """
+        Find the oldest eligible request for the least loaded endpoint.
 
         :param endpoint_loads: List of endpoint load information
         :return: The next request to process, if any
@@ -587,12 +695,7 @@ class EndpointLoadImageScheduler(ImageScheduler):
             if last_load is not None and endpoint_load.load_factor > last_load:
                 break
             if endpoint_load.requests:
-                current_time = time.time()
-                visible_requests = [
-                    request
-                    for request in endpoint_load.requests
-                    if request.last_attempt + self.image_request_queue.retry_time < current_time
-                ]
+                visible_requests = self._get_visible_requests(endpoint_load.requests, time.time())
                 if visible_requests:
                     current_oldest_request = min(visible_requests, key=attrgetter("request_time"))
                     if oldest_request is None or oldest_request.request_time > current_oldest_request.request_time:
@@ -601,6 +704,72 @@ class EndpointLoadImageScheduler(ImageScheduler):
 
         return oldest_request
 
+    def _get_effective_deadline(self, request: ImageRequestStatusRecord) -> float:
+        """
+        Get the deadline a request is scheduled by. Requests without an explicit deadline are given one relative
+        to their request time that shrinks as their priority increases.
+
+        :param request: The image request status record
+        :return: The deadline in epoch seconds
+        """
+        if request.request_payload.deadline is not None:
+            return request.request_payload.deadline
+        return request.request_time + self.default_deadline_seconds / (1 + max(0, request.request_payload.priority))
+
+    def _select_earliest_deadline_request(
+        self, endpoint_loads: List[EndpointUtilizationSummary]
+    ) -> Optional[ImageRequestStatusRecord]:
+        """
+        Find the eligible request with the earliest deadline across all endpoints. Ties are broken by the higher
+        priority and then by the older request.
+
+        :param endpoint_loads: List of endpoint load information
+        :return: The next request to process, if any
+        """
+        current_time = time.time()
+        visible_requests = [
+            request
+            for endpoint_load in endpoint_loads
+            for request in self._get_visible_requests(endpoint_load.requests, current_time)
+        ]
+        if not visible_requests:
+            return None
+        return min(
+            visible_requests,
+            key=lambda r: (self._get_effective_deadline(r), -r.request_payload.priority, r.request_time),
+        )
+
+    def _select_weighted_fair_request(
+        self, endpoint_loads: List[EndpointUtilizationSummary]
+    ) -> Optional[ImageRequestStatusRecord]:
+        """
+        Find the eligible request with the earliest virtual finish time.
+
+        Each endpoint is treated as a fair queue served by its instances. The virtual finish time of a request is
+        the load already running on its endpoint plus the remaining regions of the request scaled down by its
+        weight (1 + priority), all per endpoint instance. Every aging_seconds a request has waited is credited as
+        one region per instance so large requests are not starved by a steady stream of small ones.
+
+        :param endpoint_loads: List of endpoint load information
+        :return: The next request to process, if any
+        """
+        current_time = time.time()
+        selected_request = None
+        selected_key = None
+        for endpoint_load in endpoint_loads:
+            instance_count = max(1, endpoint_load.instance_count)
+            for request in self._get_visible_requests(endpoint_load.requests, current_time):
+                weight = 1 + max(0, request.request_payload.priority)
+                finish_time = (endpoint_load.current_load + self._estimate_remaining_regions(request) / weight) / (
+                    instance_count
+                ) - max(0.0, current_time - request.request_time) / self.aging_seconds
+                key = (finish_time, request.request_time)
+                if selected_key is None or key < selected_key:
+                    selected_request = request
+                    selected_key = key
+
+        return selected_request
+
     @metric_scope
     def _emit_utilization_metric(
         self,
@@ -0,0 +1,213 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+EndpointThroughputEstimator adjusts endpoint capacity using the tile inference latencies observed by the
+tile workers.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from cachetools import TTLCache
+
+from aws.osml.model_runner.database import EndpointStatisticsTable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EndpointThroughputStatistics:
+    """
+    Rolling tile inference statistics for an endpoint variant.
+
+    :param tile_count: Number of tiles successfully processed in the recent window
+    :param failed_tile_count: Number of tiles that failed in the recent window
+    :param latency_sum_seconds: Sum of the inference latencies of the successful tiles in the recent window
+    :param window_seconds: Length of the recent window in seconds
+    :param baseline_latency: Lowest mean latency of any sufficiently sampled bucket in the baseline window. This
+                             approximates the latency of the endpoint when it is not saturated.
+    """
+
+    tile_count: int
+    failed_tile_count: int
+    latency_sum_seconds: float
+    window_seconds: float
+    baseline_latency: Optional[float] = None
+
+    @property
+    def mean_latency(self) -> Optional[float]:
+        """
+        Mean inference latency of a tile in seconds.
+
+        :return: The mean latency or None if no tiles have been observed
+        """
+        return self.latency_sum_seconds / self.tile_count if self.tile_count else None
+
+    @property
+    def tiles_per_second(self) -> float:
+        """
+        Observed tile throughput of the endpoint variant across the cluster.
+
+        :return: Tiles processed per second over the recent window
+        """
+        return self.tile_count / self.window_seconds if self.window_seconds > 0 else 0.0
+
+    @property
+    def observed_concurrency(self) -> float:
+        """
+        Average number of inference requests in flight over the recent window (Little's law).
+
+        :return: The observed concurrency
+        """
+        return self.latency_sum_seconds / self.window_seconds if self.window_seconds > 0 else 0.0
+
+
+class EndpointThroughputEstimator:
+    """
+    Learns how much concurrent work an endpoint variant actually sustains from the tile latencies recorded in the
+    endpoint statistics table.
+
+    The static capacity estimate (instance count × per-instance concurrency) is treated as a starting point:
+
+    - When the recent mean latency rises above the baseline latency the endpoint is saturated, so the capacity is
+      scaled down by baseline / recent latency (never below min_capacity_fraction of the static capacity).
+    - When the latency is healthy and the endpoint has been observed serving more concurrent requests than the
+      static estimate, the observed concurrency is used instead.
+
+    The adjusted capacity is converted to an expected throughput using the recent mean latency so scheduling
+    decisions can be reported in tiles per second. Statistics are cached to limit table reads.
+    """
+
+    def __init__(
+        self,
+        statistics_table: EndpointStatisticsTable,
+        window_seconds: int = 300,
+        baseline_window_seconds: int = 3600,
+        min_samples: int = 50,
+        min_bucket_samples: int = 10,
+        healthy_latency_ratio: float = 0.9,
+        min_capacity_fraction: float = 0.25,
+        cache_ttl_seconds: int = 30,
+        cache_max_size: int = 100,
+    ):
+        """
+        Initialize the throughput estimator.
+
+        :param statistics_table: Table containing the tile statistics recorded by the tile workers
+        :param window_seconds: Length of the window used for the recent latency and throughput
+        :param baseline_window_seconds: Length of the window searched for the unsaturated baseline latency
+        :param min_samples: Minimum number of tiles in the recent window before the capacity is adjusted
+        :param min_bucket_samples: Minimum number of tiles in a bucket for it to set the baseline latency
+        :param healthy_latency_ratio: Baseline / recent latency ratio at or above which the endpoint is
+                                      considered unsaturated
+        :param min_capacity_fraction: Lower bound on the adjusted capacity as a fraction of the static capacity
+        :param cache_ttl_seconds: Time-to-live for cached statistics in seconds
+        :param cache_max_size: Maximum number of endpoint variants to cache statistics for
+        """
+        self.statistics_table = statistics_table
+        self.window_seconds = window_seconds
+        self.baseline_window_seconds = max(baseline_window_seconds, window_seconds)
+        self.min_samples = min_samples
+        self.min_bucket_samples = min_bucket_samples
+        self.healthy_latency_ratio = healthy_latency_ratio
+        self.min_capacity_fraction = min_capacity_fraction
+        self._statistics_cache: TTLCache = TTLCache(maxsize=cache_max_size, ttl=cache_ttl_seconds)
+
+    def get_statistics(self, endpoint_name: str, variant_name: Optional[str]) -> Optional[EndpointThroughputStatistics]:
+        """
+        Get the rolling statistics for an endpoint variant.
+
+        :param endpoint_name: Name of SageMaker endpoint or HTTP URL
+        :param variant_name: The production variant, None if requests are not routed to a specific variant
+        :return: The statistics or None if they could not be read
+        """
+        cache_key = (endpoint_name, variant_name)
+        if cache_key in self._statistics_cache:
+            return self._statistics_cache[cache_key]
+
+        # The tile workers write a bucket once it has ended so only completed buckets are used
+        now = time.time()
+        current_bucket = self.statistics_table.bucket_for(now)
+        recent_start = self.statistics_table.bucket_for(now - self.window_seconds)
+        try:
+            buckets = self.statistics_table.get_tile_statistics(
+                endpoint_name, variant_name, self.statistics_table.bucket_for(now - self.baseline_window_seconds)
+            )
+        except Exception as e:
+            logger.warning(f"Unable to read tile statistics for endpoint {endpoint_name} (variant={variant_name}): {e}")
+            return None
+
+        tile_count = 0
+        failed_tile_count = 0
+        latency_sum_ms = 0
+        baseline_latency = None
+        for bucket in buckets:
+            if bucket.bucket_start >= current_bucket:
+                continue
+            bucket_tiles = bucket.tile_count or 0
+            bucket_latency_ms = bucket.latency_sum_ms or 0
+            if bucket_tiles >= self.min_bucket_samples:
+                bucket_latency = bucket_latency_ms / bucket_tiles / 1000.0
+                baseline_latency = bucket_latency if baseline_latency is None else min(baseline_latency, bucket_latency)
+            if bucket.bucket_start >= recent_start:
+                tile_count += bucket_tiles
+                failed_tile_count += bucket.failed_tile_count or 0
+                latency_sum_ms += bucket_latency_ms
+
+        statistics = EndpointThroughputStatistics(
+            tile_count=tile_count,
+            failed_tile_count=failed_tile_count,
+            latency_sum_seconds=latency_sum_ms / 1000.0,
+            window_seconds=max(current_bucket - recent_start, self.statistics_table.bucket_seconds),
+            baseline_latency=baseline_latency,
+        )
+        self._statistics_cache[cache_key] = statistics
+        return statistics
+
+    def adjust_capacity(self, endpoint_name: str, variant_name: Optional[str], static_capacity: int) -> int:
+        """
+        Adjust the static capacity of an endpoint variant using the observed tile latencies.
+
+        :param endpoint_name: Name of SageMaker endpoint or HTTP URL
+        :param variant_name: The production variant, None if requests are not routed to a specific variant
+        :param static_capacity: Capacity from the endpoint configuration in concurrent inference requests
+        :return: The adjusted capacity in concurrent inference requests
+        """
+        statistics = self.get_statistics(endpoint_name, variant_name)
+        if statistics is None or statistics.tile_count < self.min_samples or not statistics.baseline_latency:
+            return static_capacity
+
+        latency_ratio = min(1.0, statistics.baseline_latency / statistics.mean_latency)
+        if latency_ratio >= self.healthy_latency_ratio:
+            adjusted_capacity = max(static_capacity, math.floor(statistics.observed_concurrency))
+        else:
+            floor_capacity = max(1, math.ceil(static_capacity * self.min_capacity_fraction))
+            adjusted_capacity = max(floor_capacity, math.floor(static_capacity * latency_ratio))
+
+        logger.debug(
+            f"Throughput adjusted capacity for {endpoint_name} (variant={variant_name}): "
+            f"static={static_capacity}, adjusted={adjusted_capacity}, "
+            f"mean_latency={statistics.mean_latency:.3f}s, baseline_latency={statistics.baseline_latency:.3f}s, "
+            f"observed_concurrency={statistics.observed_concurrency:.1f}, "
+            f"tiles_per_second={statistics.tiles_per_second:.2f}"
+        )
+        return adjusted_capacity
+
+    def expected_tiles_per_second(
+        self, endpoint_name: str, variant_name: Optional[str], concurrency: int
+    ) -> Optional[float]:
+        """
+        Predict the tile throughput of a number of concurrent inference requests against an endpoint variant.
+
+        :param endpoint_name: Name of SageMaker endpoint or HTTP URL
+        :param variant_name: The production variant, None if requests are not routed to a specific variant
+        :param concurrency: Number of concurrent inference requests
+        :return: The expected tiles per second or None if not enough tiles have been observed
+        """
+        statistics = self.get_statistics(endpoint_name, variant_name)
+        if statistics is None or statistics.tile_count < self.min_samples or not statistics.mean_latency:
+            return None
+        return concurrency / statistics.mean_latency
@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import json
 import logging
@@ -8,6 +8,7 @@ import boto3
 from botocore.exceptions import ClientError
 
 from aws.osml.model_runner.app_config import BotoConfig
+from aws.osml.model_runner.common import get_json_codec
 
 # Set up logging configuration
 logger = logging.getLogger(__name__)
@@ -44,7 +45,7 @@ class RequestQueue:
                         logger.debug(f"Message Body {message_body}")
 
                         try:
-                            work_request = json.loads(message_body)
+                            work_request = get_json_codec().loads(message_body)
 
                             yield message["ReceiptHandle"], work_request
 
@@ -100,6 +101,6 @@ class RequestQueue:
         :return: None
         """
         try:
-            self.sqs_client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(request))
+            self.sqs_client.send_message(QueueUrl=self.queue_url, MessageBody=get_json_codec().dumps(request))
         except ClientError as err:
             logger.error(f"Unable to send message visibility: {err}")
@@ -1,16 +1,14 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
-import sys
 from typing import List, Optional
 
 import boto3
-import geojson
 from geojson import Feature, FeatureCollection
 
 from aws.osml.model_runner.api import SinkMode, SinkType
 from aws.osml.model_runner.app_config import BotoConfig, ServiceConfig
-from aws.osml.model_runner.common import get_credentials_for_assumed_role
+from aws.osml.model_runner.common import JSONCodecType, get_credentials_for_assumed_role, get_json_codec
 
 from .exceptions import InvalidKinesisStreamException
 from .sink import Sink
@@ -73,15 +71,18 @@ class KinesisSink(Sink):
         pending_features_size: int = 0
 
         if self.validate_kinesis_stream():
+            # Records are delivered to consumers as GeoJSON so they keep the formatting of geojson.dumps
+            json_codec = get_json_codec(JSONCodecType.STDLIB)
+            partition_key_size = len(job_id.encode("utf-8"))
             for feature in features:
                 # Serialize feature data to JSON
-                record_data = geojson.dumps(FeatureCollection([feature]))
+                record_data = json_codec.dumps(FeatureCollection([feature]))
 
                 # Create the record dict
                 record = {"Data": record_data, "PartitionKey": job_id}
 
-                # Calculate size of the entire record (Data + PartitionKey)
-                record_size = sys.getsizeof(geojson.dumps(record))
+                # Calculate size of the entire record (Data + PartitionKey) as counted against the Kinesis limits
+                record_size = len(record_data.encode("utf-8")) + partition_key_size
 
                 # If adding the next record would exceed the 5 MB batch limit, flush the current batch
                 if pending_features_size + record_size > int(ServiceConfig.kinesis_max_record_size_batch) or len(
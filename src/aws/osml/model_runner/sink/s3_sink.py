@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
 import os
@@ -6,31 +6,32 @@ import tempfile
 from typing import List, Optional
 
 import boto3
-import geojson
 from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
-from geojson import Feature, FeatureCollection
+from geojson import Feature
 
-from aws.osml.model_runner.api import SinkMode, SinkType
+from aws.osml.model_runner.api import SinkFormat, SinkMode, SinkType
 from aws.osml.model_runner.app_config import BotoConfig
 from aws.osml.model_runner.common import get_credentials_for_assumed_role
 
 from .sink import Sink
+from .vector_file_writer import SINK_FORMAT_EXTENSIONS, write_features_to_file
 
 logger = logging.getLogger(__name__)
 
 
 class S3Sink(Sink):
     """
-    A sink for writing aggregated GeoJSON feature collections to an S3 bucket.
+    A sink for writing aggregated feature collections to an S3 bucket.
 
-    This class handles uploading GeoJSON data to a specified S3 bucket, optionally using an
+    This class handles uploading feature data to a specified S3 bucket, optionally using an
     assumed IAM role for accessing the bucket. It validates the bucket's accessibility and writes
-    the aggregated features to S3.
+    the aggregated features to S3 as GeoJSON, GeoParquet, or FlatGeobuf.
 
     :param bucket: The name of the S3 bucket.
     :param prefix: The prefix within the bucket where the files will be stored.
     :param assumed_role: Optional IAM role ARN to assume for accessing the bucket.
+    :param output_format: The file format of the aggregated output, defaults to GeoJSON.
     """
 
     def __init__(
@@ -38,9 +39,11 @@ class S3Sink(Sink):
         bucket: str,
         prefix: str,
         assumed_role: Optional[str] = None,
+        output_format: SinkFormat = SinkFormat.GEOJSON,
     ) -> None:
         self.bucket = bucket
         self.prefix = prefix
+        self.output_format = output_format
         if assumed_role:
             assumed_credentials = get_credentials_for_assumed_role(assumed_role)
             # Here we will be writing to S3 using an IAM role other than the one for this process.
@@ -67,10 +70,11 @@ class S3Sink(Sink):
 
     def write(self, image_id: str, features: List[Feature]) -> bool:
         """
-        Write aggregated GeoJSON feature collection to the S3 bucket.
+        Write aggregated feature collection to the S3 bucket.
 
         Validates if the S3 bucket is accessible and uploads a temporary file containing
-        the aggregated features. The object key is derived from the `image_id`.
+        the aggregated features in the configured output format. The object key is derived
+        from the `image_id` and the extension of the output format.
 
         :param image_id: The identifier for the image, used to generate the S3 object key.
         :param features: A list of GeoJSON features to be aggregated and written to S3.
@@ -78,23 +82,22 @@ class S3Sink(Sink):
 
         :raises ClientError: If there are errors while uploading the file to S3.
         """
-        features_collection = FeatureCollection(features)
-
         # validate if S3 bucket exists and accessible
         if self.validate_s3_bucket():
             # image_id is the concatenation of the job id and source image url in s3. We just
             # want to base our key off of the original image file name so split by '/' and use
             # the last element
-            object_key = os.path.join(self.prefix, image_id.split("/")[-1] + ".geojson")
+            extension = SINK_FORMAT_EXTENSIONS[self.output_format]
+            object_key = os.path.join(self.prefix, image_id.split("/")[-1] + extension)
 
-            # Create a temporary file to store aggregated features as a GeoJSON data
-            with tempfile.NamedTemporaryFile(delete=True) as temp_file:
-                with open(temp_file.name, "w") as f:
-                    f.write(geojson.dumps(features_collection))
+            # Create a temporary file to store the aggregated features in the output format
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_file_path = os.path.join(temp_dir, "features" + extension)
+                write_features_to_file(features, temp_file_path, self.output_format)
 
                 # Use upload_file to upload the file to S3
                 self.s3_client.upload_file(
-                    Filename=temp_file.name,
+                    Filename=temp_file_path,
                     Bucket=self.bucket,
                     Key=object_key,
                     Config=TransferConfig(
@@ -111,6 +114,37 @@ class S3Sink(Sink):
         else:
             return False
 
+    def write_raster(self, image_id: str, raster_name: str, file_path: str) -> bool:
+        """
+        Upload a raster file to the S3 bucket. Rasters are stored next to the aggregated features under a prefix
+        named after the image, so the segmentation masks of every region of an image are found together.
+
+        :param image_id: The identifier for the image, used to generate the S3 object key.
+        :param raster_name: The file name of the raster under the prefix of the image.
+        :param file_path: The path of the raster file to upload.
+        :return: `True` if the upload was successful, `False` otherwise.
+
+        :raises ClientError: If there are errors while uploading the file to S3.
+        """
+        if not self.validate_s3_bucket():
+            return False
+
+        object_key = os.path.join(self.prefix, image_id.split("/")[-1], raster_name)
+        self.s3_client.upload_file(
+            Filename=file_path,
+            Bucket=self.bucket,
+            Key=object_key,
+            Config=TransferConfig(
+                multipart_threshold=64 * 1024**2,  # 64 MB
+                max_concurrency=10,
+                multipart_chunksize=128 * 1024**2,  # 128 MB
+                use_threads=True,
+            ),
+            ExtraArgs={"ACL": "bucket-owner-full-control", "ContentType": "image/tiff"},
+        )
+        logger.debug(f"Wrote raster {raster_name} for '{image_id}' to s3://{self.bucket}/{object_key}")
+        return True
+
     def validate_s3_bucket(self) -> bool:
         """
         Check if the output S3 bucket exists and can be read/written to.
@@ -1,4 +1,4 @@
-#  Copyright 2023-2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import abc
 from typing import List
@@ -45,3 +45,16 @@ class Sink(abc.ABC):
 
         :return: bool = if it has been written/output successfully
         """
+
+    def write_raster(self, image_id: str, raster_name: str, file_path: str) -> bool:
+        """
+        Write a raster produced for the given image id, such as the segmentation mask of a region, to the sink.
+        Sinks that only store features do not write rasters.
+
+        :param image_id: str = the unique identifier for the image
+        :param raster_name: str = the file name of the raster in the output for the image
+        :param file_path: str = the path of the raster file to write
+
+        :return: bool = if it has been written/output successfully
+        """
+        return False
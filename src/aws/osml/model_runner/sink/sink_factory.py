@@ -1,12 +1,13 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import json
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from geojson import Feature
 
-from aws.osml.model_runner.api import InvalidImageRequestException, SinkMode
+from aws.osml.model_runner.api import VALID_SINK_FORMATS, InvalidImageRequestException, SinkFormat, SinkMode
+from aws.osml.model_runner.common import FeatureBatch
 from aws.osml.model_runner.sink import KinesisSink, S3Sink, Sink
 
 logger = logging.getLogger(__name__)
@@ -32,11 +33,17 @@ class SinkFactory:
         for destination in destinations:
             sink_type = destination["type"]
             if sink_type == S3Sink.name():
+                sink_format = destination.get("format", SinkFormat.GEOJSON.value)
+                if sink_format not in VALID_SINK_FORMATS:
+                    error = f"Invalid Image Request! Unrecognized output format specified, '{sink_format}'"
+                    logger.error(error)
+                    raise InvalidImageRequestException(error)
                 outputs.append(
                     S3Sink(
                         destination["bucket"],
                         destination["prefix"],
                         destination.get("role"),
+                        SinkFormat(sink_format),
                     )
                 )
             elif sink_type == KinesisSink.name():
@@ -54,13 +61,14 @@ class SinkFactory:
         return outputs
 
     @staticmethod
-    def sink_features(job_id: str, outputs: str, features: List[Feature]) -> bool:
+    def sink_features(job_id: str, outputs: str, features: Union[List[Feature], FeatureBatch]) -> bool:
         """
-        Writing the features output to S3 and/or Kinesis Stream
+        Writing the features output to S3 and/or Kinesis Stream. A feature batch is converted to GeoJSON features
+        once here and the features are shared by all the sinks.
 
         :param job_id: str = unique identifier for the job
         :param outputs: str = details about the job output syncs
-        :param features: List[Features] = the list of features to update
+        :param features: Union[List[Features], FeatureBatch] = the list of features or the feature batch to write
 
         :return: bool = if it has successfully written to an output sink
         """
@@ -72,6 +80,8 @@ class SinkFactory:
         # Ensure we have outputs defined for where to dump our features
         if outputs:
             logger.debug(f"Writing aggregate feature for job '{job_id}'")
+            if isinstance(features, FeatureBatch):
+                features = features.to_features()
             for sink in SinkFactory.outputs_to_sinks(json.loads(outputs)):
                 if sink.mode == SinkMode.AGGREGATE and job_id:
                     is_write_output_succeeded = sink.write(job_id, features)
@@ -93,3 +103,27 @@ class SinkFactory:
                 return False
         else:
             raise InvalidImageRequestException("No output destinations were defined for this image request!")
+
+    @staticmethod
+    def sink_raster(job_id: str, outputs: str, raster_name: str, file_path: str) -> bool:
+        """
+        Write a raster produced for the job, such as the segmentation mask of a region, to the aggregate outputs
+        that store rasters. Outputs that only store features, like Kinesis streams, are skipped.
+
+        :param job_id: str = unique identifier for the job
+        :param outputs: str = details about the job output syncs
+        :param raster_name: str = the file name of the raster in the outputs of the job
+        :param file_path: str = the path of the raster file to write
+
+        :return: bool = if it has successfully written to at least one output sink
+        """
+        if not outputs:
+            raise InvalidImageRequestException("No output destinations were defined for this image request!")
+
+        is_write_succeeded = False
+        for sink in SinkFactory.outputs_to_sinks(json.loads(outputs)):
+            if sink.mode == SinkMode.AGGREGATE and job_id and sink.write_raster(job_id, raster_name, file_path):
+                is_write_succeeded = True
+        if not is_write_succeeded:
+            logger.error(f"ModelRunner was not able to write raster {raster_name} to an output that stores rasters.")
+        return is_write_succeeded
@@ -0,0 +1,76 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import uuid
+from typing import Dict, List
+
+from geojson import Feature, FeatureCollection
+from osgeo import gdal
+
+from aws.osml.model_runner.api import SinkFormat
+from aws.osml.model_runner.common import JSONCodecType, get_json_codec
+
+logger = logging.getLogger(__name__)
+
+# Output file extension used for each of the supported sink formats
+SINK_FORMAT_EXTENSIONS: Dict[SinkFormat, str] = {
+    SinkFormat.GEOJSON: ".geojson",
+    SinkFormat.GEOPARQUET: ".parquet",
+    SinkFormat.FLATGEOBUF: ".fgb",
+}
+
+# Layer creation options for the columnar formats. GeoParquet output is sorted by bounding box and carries a bbox
+# covering column so readers can skip row groups, FlatGeobuf output gets a packed Hilbert R-tree.
+GEOPARQUET_LAYER_OPTIONS = ["COMPRESSION=ZSTD", "GEOMETRY_ENCODING=WKB", "SORT_BY_BBOX=YES", "WRITE_COVERING_BBOX=YES"]
+FLATGEOBUF_LAYER_OPTIONS = ["SPATIAL_INDEX=YES"]
+
+
+def write_features_to_file(features: List[Feature], output_path: str, sink_format: SinkFormat) -> None:
+    """
+    Write a list of GeoJSON features to a local file in the requested format.
+
+    GeoJSON is written directly. The columnar formats are produced by handing the feature collection to
+    OGR through an in-memory GeoJSON dataset so every property and geometry type the GeoJSON driver can
+    read is carried into the output.
+
+    :param features: The GeoJSON features to write.
+    :param output_path: The local file path to write to.
+    :param sink_format: The format of the output file.
+
+    :raises RuntimeError: If GDAL is unable to translate the features into the requested format.
+    """
+    feature_collection = FeatureCollection(features)
+    if sink_format == SinkFormat.GEOJSON:
+        # GeoJSON results are delivered as written so they keep the formatting of geojson.dumps
+        with open(output_path, "wb") as f:
+            f.write(get_json_codec(JSONCodecType.STDLIB).dumpb(feature_collection))
+        return
+
+    if sink_format == SinkFormat.GEOPARQUET:
+        driver = "Parquet"
+        layer_options = GEOPARQUET_LAYER_OPTIONS
+    else:
+        driver = "FlatGeobuf"
+        layer_options = FLATGEOBUF_LAYER_OPTIONS
+        # The packed R-tree cannot index features without a geometry
+        if any(feature.get("geometry") is None for feature in features):
+            logger.warning("Features without geometry found, writing FlatGeobuf output without a spatial index")
+            layer_options = ["SPATIAL_INDEX=NO"]
+
+    source_path = f"/vsimem/{uuid.uuid4()}.geojson"
+    # The GeoJSON is only read by OGR so it is encoded with the fastest codec available
+    gdal.FileFromMemBuffer(source_path, get_json_codec().dumpb(feature_collection))
+    try:
+        result = gdal.VectorTranslate(
+            output_path,
+            source_path,
+            format=driver,
+            layerName="features",
+            layerCreationOptions=layer_options,
+        )
+        if result is None:
+            raise RuntimeError(f"GDAL was unable to write features using the {driver} driver")
+        # Dereferencing the dataset flushes and closes the output file
+        result = None
+    finally:
+        gdal.Unlink(source_path)
@@ -85,7 +85,7 @@ class RegionStatusMonitor(BaseStatusMonitor):
         """
         Determines the current status of a region request.
 
-        This method evaluates the total tiles and failed tile counts for regions in the request and returns the
+        This method evaluates the total, skipped and failed tile counts for regions in the request and returns the
         appropriate status: SUCCESS, PARTIAL, or FAILED.
 
         :param request_item: RegionRequestItem = The region request item containing tile processing information.
@@ -93,8 +93,11 @@ class RegionStatusMonitor(BaseStatusMonitor):
         :return: RequestStatus = The status of the region request based on the tile counts.
         """
         region_status = RequestStatus.SUCCESS
-        if request_item.total_tiles == request_item.failed_tile_count:
+        # Skipped nodata tiles never reach the model so they count neither as successes nor as failures
+        skipped_tile_count = request_item.skipped_tile_count or 0
+        processed_tile_count = request_item.total_tiles - skipped_tile_count
+        if processed_tile_count == request_item.failed_tile_count and (processed_tile_count > 0 or skipped_tile_count == 0):
             region_status = RequestStatus.FAILED
-        if 0 < request_item.failed_tile_count < request_item.total_tiles:
+        if 0 < request_item.failed_tile_count < processed_tile_count:
             region_status = RequestStatus.PARTIAL
         return region_status
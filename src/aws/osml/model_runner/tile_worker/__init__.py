@@ -1,10 +1,19 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 # Telling flake8 to not flag errors in this file. It is normal that these classes are imported but not used in an
 # __init__.py file.
 # flake8: noqa
 
+from .buffered_tile_factory import BufferedGDALTileFactory, plan_tile_windows
+from .feature_collector import FeatureCollector
+from .gdal_dataset_cache import GDALDatasetCache
+from .nodata_tile_filter import NoDataTileFilter
+from .processing_resolution import estimate_gsd, resolve_processing_scale, scale_dimensions
+from .raw_tile_factory import RawTileFactory, decode_raw_tile, encode_raw_tile_header
 from .region_calculator import RegionCalculator
+from .region_mask_mosaic import RegionMaskMosaic
+from .s3_block_cache import S3BlockCache, S3BlockCacheProxy
+from .tile_read_planner import TileReadAhead, order_tiles_by_block, plan_tile_reads
 from .tile_worker import TileWorker
 from .tile_worker_utils import process_tiles, select_features, setup_tile_workers
 from .tiling_strategy import TilingStrategy
@@ -0,0 +1,234 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+from typing import Any, List, Optional, Tuple
+
+from osgeo import gdal
+
+from aws.osml.gdal import GDALCompressionOptions, GDALImageFormats, RangeAdjustmentType
+from aws.osml.image_processing.gdal_tile_factory import GDALTileFactory
+from aws.osml.model_runner.common import ImageRegion
+from aws.osml.photogrammetry import SensorModel
+
+logger = logging.getLogger(__name__)
+
+# Metadata domains GDAL already updates for the window when it copies a dataset
+TRANSLATED_METADATA_DOMAINS = {"", "RPC", "IMAGE_STRUCTURE", "DERIVED_SUBDATASETS"}
+
+
+class _SourceWindowChipUpdater:
+    """
+    Wraps a SICD/SIDD metadata updater so chips cut from the decoded window are described by their location in
+    the full image.
+    """
+
+    def __init__(self, updater: Any, tile_factory: "BufferedGDALTileFactory") -> None:
+        self.updater = updater
+        self.tile_factory = tile_factory
+
+    def update_image_data_for_chip(self, chip_bounds: List[int], output_size: Optional[Tuple[int, int]]) -> None:
+        self.updater.update_image_data_for_chip(self.tile_factory.to_source_window(chip_bounds), output_size)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.updater, name)
+
+
+class BufferedGDALTileFactory(GDALTileFactory):
+    """
+    A GDALTileFactory that can decode a window of the source image into memory once and cut the tiles inside that
+    window from the decoded pixels.
+
+    Overlapping tiles read the same source pixels several times and for compressed inputs (e.g. JPEG2000 in
+    NITF) decoding those pixels is the dominant cost of tile creation. Loading a window decodes it into a GDAL
+    MEM dataset; tiles that fall inside the window are translated from that dataset and tiles outside it are read
+    from the source as usual. Tile metadata (IGEOLO, SICD/SIDD chip information) is still computed in full image
+    coordinates.
+    """
+
+    def __init__(
+        self,
+        raster_dataset: gdal.Dataset,
+        sensor_model: Optional[SensorModel] = None,
+        tile_format: GDALImageFormats = GDALImageFormats.NITF,
+        tile_compression: GDALCompressionOptions = GDALCompressionOptions.NONE,
+        output_type: Optional[int] = None,
+        range_adjustment: RangeAdjustmentType = RangeAdjustmentType.NONE,
+    ) -> None:
+        """
+        Constructs a new factory capable of producing tiles from a given GDAL raster dataset.
+
+        :param raster_dataset: the original raster dataset to create tiles from
+        :param sensor_model: the sensor model providing mensuration support for this image
+        :param tile_format: the output tile format
+        :param tile_compression: the output tile compression
+        :param output_type: the GDAL pixel type in the output tile
+        :param range_adjustment: the type of scaling used to convert raw pixel values to the output range
+        """
+        super().__init__(
+            raster_dataset,
+            sensor_model=sensor_model,
+            tile_format=tile_format,
+            tile_compression=tile_compression,
+            output_type=output_type,
+            range_adjustment=range_adjustment,
+        )
+        self.source_dataset = raster_dataset
+        self.window: Optional[List[int]] = None
+        self._window_dataset: Optional[gdal.Dataset] = None
+        self._read_offset = (0, 0)
+        if self.sar_updater is not None:
+            self.sar_updater = _SourceWindowChipUpdater(self.sar_updater, self)
+
+    @staticmethod
+    def bytes_per_pixel(raster_dataset: gdal.Dataset) -> int:
+        """
+        Number of bytes a decoded pixel occupies across all bands of a dataset.
+
+        :param raster_dataset: the raster dataset
+        :return: the size of a pixel in bytes
+        """
+        size_bits = 0
+        for band_index in range(1, raster_dataset.RasterCount + 1):
+            size_bits += gdal.GetDataTypeSize(raster_dataset.GetRasterBand(band_index).DataType)
+        return max(1, size_bits // 8)
+
+    def load_window(self, src_window: List[int]) -> bool:
+        """
+        Decode a window of the source image into memory. Tiles inside the window are then cut from memory until
+        the window is released or another window is loaded.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of the window
+        :return: True if the window was decoded, False if tiles will be read from the source
+        """
+        self.release_window()
+        try:
+            window_dataset = gdal.Translate("", self.source_dataset, format="MEM", srcWin=src_window)
+        except Exception as err:
+            logger.warning(f"Unable to decode window {src_window}, reading tiles from the source image: {err}")
+            return False
+        if window_dataset is None:
+            logger.warning(f"Unable to decode window {src_window}, reading tiles from the source image")
+            return False
+
+        # Carry over the metadata GDAL does not copy (e.g. NITF TREs and DES) so tiles keep the same headers
+        for domain in self.source_dataset.GetMetadataDomainList() or []:
+            if domain in TRANSLATED_METADATA_DOMAINS:
+                continue
+            metadata = self.source_dataset.GetMetadata(domain)
+            if metadata:
+                window_dataset.SetMetadata(metadata, domain)
+
+        self._window_dataset = window_dataset
+        self.window = list(src_window)
+        return True
+
+    def release_window(self) -> None:
+        """
+        Release the decoded window.
+        """
+        self._window_dataset = None
+        self.window = None
+
+    def contains(self, src_window: List[int]) -> bool:
+        """
+        Check whether a tile lies entirely inside the decoded window.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of the tile
+        :return: True if the tile can be cut from memory
+        """
+        if self.window is None:
+            return False
+        window_x, window_y, window_width, window_height = self.window
+        return (
+            src_window[0] >= window_x
+            and src_window[1] >= window_y
+            and src_window[0] + src_window[2] <= window_x + window_width
+            and src_window[1] + src_window[3] <= window_y + window_height
+        )
+
+    def to_source_window(self, src_window: List[int]) -> List[int]:
+        """
+        Convert a window relative to the dataset currently being read into full image coordinates.
+
+        :param src_window: the [left_x, top_y, width, height] bounds relative to the dataset being read
+        :return: the bounds in full image coordinates
+        """
+        return [src_window[0] + self._read_offset[0], src_window[1] + self._read_offset[1], src_window[2], src_window[3]]
+
+    def create_encoded_tile(
+        self, src_window: List[int], output_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[bytearray]:
+        """
+        Cut a tile from the decoded window if it contains the tile, otherwise from the source image.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of this tile in full image coordinates
+        :param output_size: an optional size of the output tile (width, height)
+        :return: the encoded image tile or None if one could not be produced
+        """
+        if not self.contains(src_window):
+            return super().create_encoded_tile(src_window, output_size)
+
+        window_x, window_y = self.window[0], self.window[1]
+        self.raster_dataset = self._window_dataset
+        self._read_offset = (window_x, window_y)
+        try:
+            return super().create_encoded_tile(
+                [src_window[0] - window_x, src_window[1] - window_y, src_window[2], src_window[3]], output_size
+            )
+        finally:
+            self.raster_dataset = self.source_dataset
+            self._read_offset = (0, 0)
+
+    def _create_new_igeolo(self, src_window: List[int]) -> str:
+        return super()._create_new_igeolo(self.to_source_window(src_window))
+
+
+def plan_tile_windows(
+    tiles: List[ImageRegion], bytes_per_pixel: int, max_window_bytes: int
+) -> List[Tuple[Optional[List[int]], List[ImageRegion]]]:
+    """
+    Group tiles into horizontal strips that can each be decoded into memory once.
+
+    Rows of tiles are added to a strip while the decoded strip stays under the memory ceiling, so a region that
+    fits is decoded in a single window. A row of tiles that does not fit on its own is returned without a window
+    and its tiles are read from the source image one at a time.
+
+    :param tiles: the tiles as ((row, column), (width, height))
+    :param bytes_per_pixel: size of a decoded pixel across all bands
+    :param max_window_bytes: memory ceiling for a decoded window
+    :return: the [left_x, top_y, width, height] window (or None) and the tiles to cut from it
+    """
+
+    def bounding_window(window_tiles: List[ImageRegion]) -> List[int]:
+        min_x = min(tile[0][1] for tile in window_tiles)
+        min_y = min(tile[0][0] for tile in window_tiles)
+        max_x = max(tile[0][1] + tile[1][0] for tile in window_tiles)
+        max_y = max(tile[0][0] + tile[1][1] for tile in window_tiles)
+        return [min_x, min_y, max_x - min_x, max_y - min_y]
+
+    def window_bytes(window: List[int]) -> int:
+        return window[2] * window[3] * bytes_per_pixel
+
+    tile_rows: List[List[ImageRegion]] = []
+    for tile in sorted(tiles, key=lambda tile: (tile[0][0], tile[0][1])):
+        if tile_rows and tile_rows[-1][0][0][0] == tile[0][0]:
+            tile_rows[-1].append(tile)
+        else:
+            tile_rows.append([tile])
+
+    plan: List[Tuple[Optional[List[int]], List[ImageRegion]]] = []
+    strip_tiles: List[ImageRegion] = []
+    for row_tiles in tile_rows:
+        if strip_tiles and window_bytes(bounding_window(strip_tiles + row_tiles)) <= max_window_bytes:
+            strip_tiles = strip_tiles + row_tiles
+            continue
+        if strip_tiles:
+            plan.append((bounding_window(strip_tiles), strip_tiles))
+            strip_tiles = []
+        if window_bytes(bounding_window(row_tiles)) <= max_window_bytes:
+            strip_tiles = row_tiles
+        else:
+            plan.append((None, row_tiles))
+    if strip_tiles:
+        plan.append((bounding_window(strip_tiles), strip_tiles))
+    return plan
@@ -0,0 +1,42 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import threading
+from typing import List
+
+from geojson import Feature
+
+from aws.osml.model_runner.common import FeatureBatch
+
+
+class FeatureCollector:
+    """
+    Collects the features of an image in the memory of this process. The tile workers add their features to it in
+    place of the FeatureTable when every region of the image is processed on this host, so the features are handed
+    to deduplication and the sinks without being written to and read back from the table.
+    """
+
+    def __init__(self) -> None:
+        self._features: List[Feature] = []
+        self._lock = threading.Lock()
+
+    def add_features(self, features: List[Feature]) -> None:
+        """
+        Add the features of a tile. Called by the tile workers of the image concurrently.
+
+        :param features: The features of the tile
+        """
+        with self._lock:
+            self._features.extend(features)
+
+    def to_feature_batch(self) -> FeatureBatch:
+        """
+        Get the features collected so far as a columnar batch, as the FeatureTable returns them when aggregating.
+
+        :return: The batch of features
+        """
+        with self._lock:
+            return FeatureBatch.from_features(list(self._features))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._features)
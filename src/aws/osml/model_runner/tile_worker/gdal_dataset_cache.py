@@ -0,0 +1,207 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+from osgeo import gdal
+
+from aws.osml.photogrammetry import SensorModel
+
+logger = logging.getLogger(__name__)
+
+# Approximate fixed cost of an open dataset handle and its sensor model beyond the metadata that was parsed
+DATASET_BASE_SIZE_BYTES = 64 * 1024
+BAND_BASE_SIZE_BYTES = 4 * 1024
+
+CacheKey = Tuple[str, str]
+DatasetLoader = Callable[[], Tuple[gdal.Dataset, Optional[SensorModel]]]
+
+
+@dataclass
+class _CachedDataset:
+    """
+    An opened dataset and the sensor model built from its metadata.
+
+    :param raster_dataset: The opened GDAL dataset
+    :param sensor_model: The sensor model for the dataset, None if the image is not geo-referenced
+    :param size_bytes: Estimated memory held by the entry
+    :param expire_time: Time in epoch seconds after which the entry is no longer used
+    """
+
+    raster_dataset: gdal.Dataset
+    sensor_model: Optional[SensorModel]
+    size_bytes: int
+    expire_time: float
+
+
+class GDALDatasetCache:
+    """
+    A per-host LRU cache of opened GDAL datasets and their sensor models.
+
+    Region requests for the same image are often processed by the same host. Opening the dataset reads the image
+    header and, for NITF and SICD images, parses the TREs and builds an RSM or RPC sensor model, which is expensive
+    to repeat for every region. Entries are keyed by the image URL and the role used to read it, so a dataset opened
+    with one set of credentials is never handed to a request using another. The cache is bounded by the number of
+    entries and by their estimated memory, and entries expire after a fixed time so updated images are picked up.
+
+    GDAL datasets are not safe to share between threads. The cache is meant to be used by the thread that processes
+    region requests; the lock only protects the cache bookkeeping.
+    """
+
+    def __init__(self, max_entries: int = 8, max_memory_bytes: int = 256 * 1024 * 1024, ttl_seconds: int = 300):
+        """
+        Initialize the dataset cache.
+
+        :param max_entries: Maximum number of datasets to keep open, 0 disables caching
+        :param max_memory_bytes: Maximum estimated memory of the cached datasets and sensor models
+        :param ttl_seconds: Time in seconds a dataset is reused after it was opened
+        """
+        self.max_entries = max(0, max_entries)
+        self.max_memory_bytes = max(0, max_memory_bytes)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, _CachedDataset]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(image_url: str, image_read_role: Optional[str] = None) -> CacheKey:
+        """
+        Build the key identifying a dataset opened with a given set of credentials.
+
+        :param image_url: URL of the image
+        :param image_read_role: Optional IAM role ARN used to read the image
+        :return: The cache key
+        """
+        return image_url, image_read_role or ""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Estimated memory held by the cached entries.
+
+        :return: The estimated size in bytes
+        """
+        return self._memory_bytes
+
+    def get(
+        self, image_url: str, image_read_role: Optional[str], load_dataset: DatasetLoader
+    ) -> Tuple[gdal.Dataset, Optional[SensorModel]]:
+        """
+        Get the dataset and sensor model for an image, opening it if it is not already cached.
+
+        :param image_url: URL of the image
+        :param image_read_role: Optional IAM role ARN used to read the image
+        :param load_dataset: Function that opens the dataset and builds its sensor model on a cache miss
+        :return: The GDAL dataset and its sensor model
+        """
+        key = self.cache_key(image_url, image_read_role)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expire_time > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.raster_dataset, entry.sensor_model
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+
+        raster_dataset, sensor_model = load_dataset()
+        self.put(image_url, image_read_role, raster_dataset, sensor_model)
+        return raster_dataset, sensor_model
+
+    def put(
+        self,
+        image_url: str,
+        image_read_role: Optional[str],
+        raster_dataset: gdal.Dataset,
+        sensor_model: Optional[SensorModel],
+    ) -> None:
+        """
+        Add a dataset that was opened elsewhere so later regions of the same image can reuse it.
+
+        :param image_url: URL of the image
+        :param image_read_role: Optional IAM role ARN used to read the image
+        :param raster_dataset: The opened GDAL dataset
+        :param sensor_model: The sensor model for the dataset
+        """
+        if self.max_entries == 0 or raster_dataset is None:
+            return
+
+        size_bytes = self.estimate_size(raster_dataset)
+        if size_bytes > self.max_memory_bytes:
+            logger.debug(f"Not caching dataset for {image_url}; estimated size {size_bytes} bytes exceeds the limit")
+            return
+
+        key = self.cache_key(image_url, image_read_role)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _CachedDataset(
+                raster_dataset=raster_dataset,
+                sensor_model=sensor_model,
+                size_bytes=size_bytes,
+                expire_time=time.time() + self.ttl_seconds,
+            )
+            self._memory_bytes += size_bytes
+            while len(self._entries) > self.max_entries or self._memory_bytes > self.max_memory_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, image_url: str, image_read_role: Optional[str] = None) -> None:
+        """
+        Remove a dataset from the cache, e.g. after an error that may have left it in a bad state.
+
+        :param image_url: URL of the image
+        :param image_read_role: Optional IAM role ARN used to read the image
+        """
+        with self._lock:
+            self._remove(self.cache_key(image_url, image_read_role))
+
+    def clear(self) -> None:
+        """
+        Remove all datasets from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        """
+        Remove an entry and release its share of the memory budget. The caller must hold the lock.
+
+        :param key: The cache key of the entry
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry.size_bytes
+
+    @staticmethod
+    def estimate_size(raster_dataset: gdal.Dataset) -> int:
+        """
+        Estimate the memory held by an open dataset and the sensor model built from it. Pixel blocks are held in
+        GDAL's shared block cache and are not counted. The bulk of the remaining memory is the parsed metadata
+        (e.g. NITF TREs and SICD XML) and the structures built from it, so the size is approximated from the
+        length of the metadata in every domain.
+
+        :param raster_dataset: The opened GDAL dataset
+        :return: The estimated size in bytes
+        """
+        size_bytes = DATASET_BASE_SIZE_BYTES + BAND_BASE_SIZE_BYTES * int(raster_dataset.RasterCount or 0)
+        try:
+            for domain in raster_dataset.GetMetadataDomainList() or []:
+                metadata = raster_dataset.GetMetadata(domain) or {}
+                if isinstance(metadata, dict):
+                    size_bytes += sum(len(str(key)) + len(str(value)) for key, value in metadata.items())
+                else:
+                    size_bytes += sum(len(str(item)) for item in metadata)
+        except Exception as err:
+            logger.debug(f"Unable to read dataset metadata to estimate its size: {err}")
+        return size_bytes
@@ -0,0 +1,126 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+from typing import List, Optional
+
+import numpy as np
+from osgeo import gdal
+
+from aws.osml.model_runner.common import ImageRegion
+
+logger = logging.getLogger(__name__)
+
+# Largest width/height of the mask sample read for each tile. Reading the mask at a reduced resolution lets GDAL
+# answer from mask overviews when the image has them. The sample is averaged so a sample pixel covering any valid
+# pixel is usually valid, but a tile is only skipped once its full resolution mask confirms the estimate.
+MASK_SAMPLE_SIZE = 64
+
+
+class NoDataTileFilter:
+    """
+    Identifies tiles that are entirely, or mostly, nodata so they can be skipped before they are encoded and sent
+    to the model.
+
+    The check uses the GDAL mask of the dataset which reflects the nodata value, alpha band or internal mask of
+    the image. A pixel is treated as nodata when it is masked out in every band. The nodata fraction of a tile is
+    estimated from a reduced resolution read of the mask so the check stays cheap compared to encoding the tile.
+    Decimation can miss sparse valid data such as a road, a coastline or a sliver along the image edge, so a tile
+    the estimate would skip is checked again at full resolution and only skipped if that confirms it.
+    """
+
+    def __init__(self, raster_dataset: gdal.Dataset, nodata_threshold: float) -> None:
+        """
+        Initialize the filter for a dataset.
+
+        :param raster_dataset: the raster dataset the tiles are read from
+        :param nodata_threshold: tiles with at least this fraction of nodata pixels are skipped
+        """
+        self.raster_dataset = raster_dataset
+        self.nodata_threshold = nodata_threshold
+        self.mask_bands = self._get_mask_bands(raster_dataset)
+
+    @staticmethod
+    def _get_mask_bands(raster_dataset: gdal.Dataset) -> List[gdal.Band]:
+        """
+        Find the mask bands that need to be checked for a dataset.
+
+        :param raster_dataset: the raster dataset
+        :return: the mask bands, empty if every pixel of the dataset is valid
+        """
+        try:
+            mask_bands = []
+            for band_index in range(1, raster_dataset.RasterCount + 1):
+                band = raster_dataset.GetRasterBand(band_index)
+                mask_flags = band.GetMaskFlags()
+                if mask_flags & gdal.GMF_ALL_VALID:
+                    # A band without a mask makes every pixel valid in at least one band
+                    return []
+                mask_bands.append(band.GetMaskBand())
+                if mask_flags & gdal.GMF_PER_DATASET:
+                    # The same mask applies to all bands
+                    break
+            return mask_bands
+        except Exception as err:
+            logger.debug(f"Unable to read the mask of the dataset, nodata tiles will not be skipped: {err}")
+            return []
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Check whether the dataset has any nodata pixels that could make a tile empty.
+
+        :return: True if tiles need to be checked
+        """
+        return len(self.mask_bands) > 0
+
+    def nodata_fraction(self, tile: ImageRegion, full_resolution: bool = False) -> Optional[float]:
+        """
+        Estimate the fraction of nodata pixels in a tile.
+
+        :param tile: the tile as ((row, column), (width, height))
+        :param full_resolution: read every pixel of the mask instead of a reduced resolution sample
+        :return: the fraction of nodata pixels or None if it could not be determined
+        """
+        if not self.enabled:
+            return 0.0
+        (row, column), (width, height) = tile
+        if full_resolution:
+            sample_width, sample_height = max(1, width), max(1, height)
+        else:
+            sample_width = max(1, min(width, MASK_SAMPLE_SIZE))
+            sample_height = max(1, min(height, MASK_SAMPLE_SIZE))
+        try:
+            valid = np.zeros(sample_width * sample_height, dtype=bool)
+            for mask_band in self.mask_bands:
+                mask_bytes = mask_band.ReadRaster(
+                    column,
+                    row,
+                    width,
+                    height,
+                    buf_xsize=sample_width,
+                    buf_ysize=sample_height,
+                    buf_type=gdal.GDT_Byte,
+                    resample_alg=gdal.GRIORA_Average,
+                )
+                valid |= np.frombuffer(mask_bytes, dtype=np.uint8) > 0
+        except Exception as err:
+            logger.debug(f"Unable to read the mask for tile {tile}: {err}")
+            return None
+        return 1.0 - float(np.count_nonzero(valid)) / valid.size
+
+    def is_empty(self, tile: ImageRegion) -> bool:
+        """
+        Check whether a tile has enough nodata pixels to be skipped.
+
+        :param tile: the tile as ((row, column), (width, height))
+        :return: True if the tile should be skipped
+        """
+        fraction = self.nodata_fraction(tile)
+        if fraction is None or fraction < self.nodata_threshold:
+            return False
+        (_, _), (width, height) = tile
+        if width <= MASK_SAMPLE_SIZE and height <= MASK_SAMPLE_SIZE:
+            # The sample was already read at full resolution
+            return True
+        fraction = self.nodata_fraction(tile, full_resolution=True)
+        return fraction is not None and fraction >= self.nodata_threshold
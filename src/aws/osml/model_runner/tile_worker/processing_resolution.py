@@ -0,0 +1,104 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import math
+from typing import Optional
+
+import numpy as np
+from osgeo import gdal
+
+from aws.osml.model_runner.common import ImageDimensions
+from aws.osml.photogrammetry import ImageCoordinate, SensorModel, geodetic_to_geocentric
+
+logger = logging.getLogger(__name__)
+
+# Distance in pixels between the image points used to estimate the ground sample distance. Spanning several
+# pixels keeps the estimate stable for sensor models that are not linear at the pixel level.
+GSD_SAMPLE_PIXELS = 100
+
+
+def get_overview_scale(raster_dataset: gdal.Dataset, overview_level: int) -> int:
+    """
+    Get the decimation factor of an overview level. Level 0 is the full resolution image and level N is the Nth
+    overview of the dataset. Levels the dataset does not have overviews for fall back to a factor of 2^N which
+    GDAL serves with decimated reads of the closest overview available.
+
+    :param raster_dataset: the raster dataset
+    :param overview_level: the overview level, 0 for full resolution
+    :return: the decimation factor between the full image and the overview
+    """
+    if overview_level <= 0:
+        return 1
+    try:
+        band = raster_dataset.GetRasterBand(1)
+        if band.GetOverviewCount() >= overview_level:
+            overview = band.GetOverview(overview_level - 1)
+            return max(1, int(round(raster_dataset.RasterXSize / overview.XSize)))
+    except Exception as err:
+        logger.debug(f"Unable to read overview {overview_level} of the dataset: {err}")
+    logger.debug(f"Dataset has no overview level {overview_level}, tiles will be decimated from the closest level")
+    return 2**overview_level
+
+
+def estimate_gsd(raster_dataset: gdal.Dataset, sensor_model: Optional[SensorModel]) -> Optional[float]:
+    """
+    Estimate the ground sample distance at the center of an image.
+
+    :param raster_dataset: the raster dataset
+    :param sensor_model: the sensor model of the image
+    :return: the ground sample distance in meters or None if it could not be estimated
+    """
+    if sensor_model is None:
+        return None
+    center_x = raster_dataset.RasterXSize / 2.0
+    center_y = raster_dataset.RasterYSize / 2.0
+    step = max(1, min(GSD_SAMPLE_PIXELS, raster_dataset.RasterXSize // 2, raster_dataset.RasterYSize // 2))
+    try:
+        center, right, below = [
+            geodetic_to_geocentric(sensor_model.image_to_world(ImageCoordinate([x, y]))).coordinate
+            for x, y in [(center_x, center_y), (center_x + step, center_y), (center_x, center_y + step)]
+        ]
+    except Exception as err:
+        logger.debug(f"Unable to estimate the ground sample distance of the image: {err}")
+        return None
+    gsd = (float(np.linalg.norm(right - center)) + float(np.linalg.norm(below - center))) / (2.0 * step)
+    return gsd if gsd > 0 else None
+
+
+def resolve_processing_scale(
+    raster_dataset: gdal.Dataset,
+    sensor_model: Optional[SensorModel],
+    overview_level: Optional[int] = None,
+    target_gsd: Optional[float] = None,
+) -> int:
+    """
+    Resolve the requested processing resolution of an image into a decimation factor. An overview level takes
+    precedence over a target GSD. A target GSD is converted using the estimated GSD of the image and rounded down
+    so the image is never processed coarser than requested.
+
+    :param raster_dataset: the raster dataset
+    :param sensor_model: the sensor model of the image
+    :param overview_level: the requested overview level
+    :param target_gsd: the requested ground sample distance in meters
+    :return: the decimation factor, 1 processes the image at full resolution
+    """
+    if overview_level is not None:
+        return get_overview_scale(raster_dataset, overview_level)
+    if target_gsd is not None:
+        image_gsd = estimate_gsd(raster_dataset, sensor_model)
+        if image_gsd is None:
+            logger.warning(f"Unable to estimate the GSD of the image, ignoring target GSD {target_gsd}")
+            return 1
+        return max(1, int(math.floor(target_gsd / image_gsd + 1e-6)))
+    return 1
+
+
+def scale_dimensions(dimensions: ImageDimensions, processing_scale: int) -> ImageDimensions:
+    """
+    Convert dimensions at the processing resolution into full image pixels.
+
+    :param dimensions: the (width, height) at the processing resolution
+    :param processing_scale: the decimation factor
+    :return: the (width, height) in full image pixels
+    """
+    return dimensions[0] * processing_scale, dimensions[1] * processing_scale
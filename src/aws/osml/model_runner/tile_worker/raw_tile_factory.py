@@ -0,0 +1,268 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import json
+import logging
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from osgeo import gdal
+
+from aws.osml.model_runner.common import ImageCompression
+
+logger = logging.getLogger(__name__)
+
+# A raw tile is RAW_TILE_MAGIC, the length of the header as a little-endian uint32, a UTF-8 JSON header and then
+# the pixels. The header describes the pixel array as {"shape": [bands, height, width], "dtype": "<u2",
+# "interleave": "BSQ", "bands": [1, 2, ...], "compression": "NONE"}.
+RAW_TILE_MAGIC = b"OSMLRAW1"
+RAW_TILE_INTERLEAVE = "BSQ"
+RAW_TILE_COMPRESSIONS = [ImageCompression.NONE.value, ImageCompression.LZ4.value, ImageCompression.ZSTD.value]
+
+# Pixel types of GDAL bands and the type of the array sent to the model. Complex integer samples have no
+# numpy equivalent and are converted to the complex floating point type that holds them exactly.
+NUMPY_TYPES_BY_GDAL_TYPE_NAME = {
+    "Byte": np.uint8,
+    "Int8": np.int8,
+    "UInt16": np.uint16,
+    "Int16": np.int16,
+    "UInt32": np.uint32,
+    "Int32": np.int32,
+    "UInt64": np.uint64,
+    "Int64": np.int64,
+    "Float32": np.float32,
+    "Float64": np.float64,
+    "CInt16": np.complex64,
+    "CInt32": np.complex128,
+    "CFloat32": np.complex64,
+    "CFloat64": np.complex128,
+}
+
+
+def encode_raw_tile_header(shape: Tuple[int, int, int], dtype: Any, compression: str) -> bytes:
+    """
+    Create the header of a raw tile.
+
+    :param shape: the (bands, height, width) of the pixel array
+    :param dtype: the numpy type of the pixels
+    :param compression: the compression applied to the pixels
+    :return: the encoded header
+    """
+    header = json.dumps(
+        {
+            "shape": list(shape),
+            "dtype": np.dtype(dtype).str,
+            "interleave": RAW_TILE_INTERLEAVE,
+            "bands": list(range(1, shape[0] + 1)),
+            "compression": compression,
+        }
+    ).encode("utf-8")
+    return RAW_TILE_MAGIC + struct.pack("<I", len(header)) + header
+
+
+def decode_raw_tile_header(payload: bytes) -> Tuple[Dict[str, Any], int]:
+    """
+    Read the header of a raw tile.
+
+    :param payload: the raw tile
+    :return: the header and the offset of the pixels in the payload
+    :raises ValueError: if the payload is not a raw tile
+    """
+    prefix_length = len(RAW_TILE_MAGIC) + 4
+    if len(payload) < prefix_length or bytes(payload[: len(RAW_TILE_MAGIC)]) != RAW_TILE_MAGIC:
+        raise ValueError("Payload is not a raw tile")
+    (header_length,) = struct.unpack("<I", payload[len(RAW_TILE_MAGIC) : prefix_length])
+    header = json.loads(bytes(payload[prefix_length : prefix_length + header_length]).decode("utf-8"))
+    return header, prefix_length + header_length
+
+
+def decode_raw_tile(payload: bytes) -> np.ndarray:
+    """
+    Decode a raw tile into an array of shape (bands, height, width). Uncompressed tiles are not copied.
+
+    :param payload: the raw tile
+    :return: the pixels of the tile
+    :raises ValueError: if the payload is not a raw tile
+    """
+    header, offset = decode_raw_tile_header(payload)
+    pixels = memoryview(payload)[offset:]
+    if header["compression"] != ImageCompression.NONE.value:
+        pixels = _get_codec(header["compression"]).decompress(pixels)
+    return np.frombuffer(pixels, dtype=np.dtype(header["dtype"])).reshape(header["shape"])
+
+
+class _LZ4Codec:
+    @staticmethod
+    def compress(data: Any) -> bytes:
+        import lz4.frame
+
+        return lz4.frame.compress(data)
+
+    @staticmethod
+    def decompress(data: Any) -> bytes:
+        import lz4.frame
+
+        return lz4.frame.decompress(data)
+
+
+class _ZstdCodec:
+    @staticmethod
+    def compress(data: Any) -> bytes:
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+
+    @staticmethod
+    def decompress(data: Any) -> bytes:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+def _get_codec(compression: str) -> Any:
+    """
+    Get the codec used to compress the pixels of a raw tile. The codecs are optional dependencies that are only
+    imported when a compressed tile is created.
+
+    :param compression: the compression of the tile
+    :return: the codec
+    :raises ValueError: if the compression is not supported for raw tiles
+    """
+    if compression == ImageCompression.LZ4.value:
+        return _LZ4Codec
+    if compression == ImageCompression.ZSTD.value:
+        return _ZstdCodec
+    raise ValueError(f"Unsupported raw tile compression: {compression}")
+
+
+class RawTileFactory:
+    """
+    Creates raw tiles: the decoded pixels of a tile behind a small header describing the array, optionally
+    compressed with LZ4 or Zstandard.
+
+    Models that decode every tile back into an array do not need GDAL to encode it into an image format first.
+    Uncompressed tiles are read by GDAL directly into the payload buffer behind the header, without an intermediate
+    array. The payload is then written to the temporary tile file that the tile workers read, like every other
+    tile format, so the tiles waiting for a worker are held on disk rather than in memory. Like the
+    BufferedGDALTileFactory, a window of the image can be decoded once so tiles inside it are cut from memory.
+    """
+
+    def __init__(self, raster_dataset: gdal.Dataset, tile_compression: str = ImageCompression.NONE.value) -> None:
+        """
+        Constructs a new factory capable of producing raw tiles from a given GDAL raster dataset.
+
+        :param raster_dataset: the original raster dataset to create tiles from
+        :param tile_compression: the compression applied to the pixels, NONE, LZ4 or ZSTD
+        """
+        if tile_compression not in RAW_TILE_COMPRESSIONS:
+            raise ValueError(f"Unsupported raw tile compression: {tile_compression}")
+        self.raster_dataset = raster_dataset
+        self.tile_compression = tile_compression
+        self.band_count = raster_dataset.RasterCount
+        type_name = gdal.GetDataTypeName(raster_dataset.GetRasterBand(1).DataType)
+        self.dtype = np.dtype(NUMPY_TYPES_BY_GDAL_TYPE_NAME.get(type_name, np.float64))
+        self.window: Optional[List[int]] = None
+        self._window_array: Optional[np.ndarray] = None
+
+    def load_window(self, src_window: List[int]) -> bool:
+        """
+        Decode a window of the image into memory. Tiles inside the window are then cut from memory until the
+        window is released or another window is loaded.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of the window
+        :return: True if the window was decoded, False if tiles will be read from the source
+        """
+        self.release_window()
+        window_array = np.empty((self.band_count, src_window[3], src_window[2]), dtype=self.dtype)
+        try:
+            self._read_into(src_window, window_array)
+        except Exception as err:
+            logger.warning(f"Unable to decode window {src_window}, reading tiles from the source image: {err}")
+            return False
+        self._window_array = window_array
+        self.window = list(src_window)
+        return True
+
+    def release_window(self) -> None:
+        """
+        Release the decoded window.
+        """
+        self._window_array = None
+        self.window = None
+
+    def contains(self, src_window: List[int]) -> bool:
+        """
+        Check whether a tile lies entirely inside the decoded window.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of the tile
+        :return: True if the tile can be cut from memory
+        """
+        if self.window is None:
+            return False
+        window_x, window_y, window_width, window_height = self.window
+        return (
+            src_window[0] >= window_x
+            and src_window[1] >= window_y
+            and src_window[0] + src_window[2] <= window_x + window_width
+            and src_window[1] + src_window[3] <= window_y + window_height
+        )
+
+    def create_encoded_tile(
+        self, src_window: List[int], output_size: Optional[Tuple[int, int]] = None
+    ) -> Optional[bytearray]:
+        """
+        Create a raw tile for a window of the image.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of this tile in full image coordinates
+        :param output_size: an optional size of the output tile (width, height)
+        :return: the raw tile or None if one could not be produced
+        """
+        width, height = output_size if output_size is not None else (src_window[2], src_window[3])
+        shape = (self.band_count, height, width)
+        header = encode_raw_tile_header(shape, self.dtype, self.tile_compression)
+        pixel_bytes = self.band_count * height * width * self.dtype.itemsize
+
+        if self.tile_compression == ImageCompression.NONE.value:
+            # Decode the pixels straight into the payload behind the header
+            tile = bytearray(len(header) + pixel_bytes)
+            tile[: len(header)] = header
+            pixels = np.frombuffer(tile, dtype=self.dtype, offset=len(header)).reshape(shape)
+        else:
+            tile = None
+            pixels = np.empty(shape, dtype=self.dtype)
+
+        try:
+            if output_size is None and self.contains(src_window):
+                x = src_window[0] - self.window[0]
+                y = src_window[1] - self.window[1]
+                np.copyto(pixels, self._window_array[:, y : y + height, x : x + width])
+            else:
+                self._read_into(src_window, pixels)
+        except Exception as err:
+            logger.error(f"Unable to read pixels for raw tile {src_window}: {err}")
+            return None
+
+        if tile is None:
+            tile = bytearray(header)
+            tile += _get_codec(self.tile_compression).compress(memoryview(pixels).cast("B"))
+        return tile
+
+    def _read_into(self, src_window: List[int], pixels: np.ndarray) -> None:
+        """
+        Read a window of the image into an array, decimating it to the size of the array.
+
+        :param src_window: the [left_x, top_y, width, height] bounds of the window
+        :param pixels: the (bands, height, width) array to fill
+        """
+        buf_obj = pixels[0] if self.band_count == 1 else pixels
+        result = self.raster_dataset.ReadAsArray(
+            src_window[0],
+            src_window[1],
+            src_window[2],
+            src_window[3],
+            buf_obj=buf_obj,
+            buf_xsize=pixels.shape[2],
+            buf_ysize=pixels.shape[1],
+        )
+        if result is None:
+            raise RuntimeError("GDAL returned no pixels")
@@ -1,11 +1,11 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
 import shapely.geometry.base
 
-from aws.osml.model_runner.common import ImageDimensions, ImageRegion
+from aws.osml.model_runner.common import ImageDimensions, ImageRegion, RegionPlan
 
 
 class RegionCalculator(ABC):
@@ -46,3 +46,27 @@ class RegionCalculator(ABC):
         :raises LoadImageException: If image cannot be read or processed
         """
         pass
+
+    def calculate_region_plan(
+        self,
+        image_url: str,
+        tile_size: ImageDimensions,
+        tile_overlap: ImageDimensions,
+        roi: Optional[shapely.geometry.base.BaseGeometry] = None,
+        image_read_role: Optional[str] = None,
+    ) -> Optional[RegionPlan]:
+        """
+        Calculate the full region plan for an image: processing bounds, regions, tile counts and image metadata.
+
+        Implementations that can describe more than the region list override this method. The default
+        implementation returns None, in which case callers fall back to calculate_regions.
+
+        :param image_url: URL or path to the image
+        :param tile_size: Size of tiles in pixels
+        :param tile_overlap: Overlap between tiles in pixels
+        :param roi: Optional region of interest to restrict processing
+        :param image_read_role: Optional IAM role ARN for accessing the image
+        :return: The region plan or None if it is not supported
+        :raises LoadImageException: If image cannot be read or processed
+        """
+        return None
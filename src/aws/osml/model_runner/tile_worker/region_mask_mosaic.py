@@ -0,0 +1,221 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+import tempfile
+from threading import Lock
+from typing import IO, Optional, Tuple
+
+import numpy as np
+from osgeo import gdal
+
+from aws.osml.model_runner.common import ImageDimensions, ImageRegion
+from aws.osml.model_runner.inference import SegmentationMask
+
+logger = logging.getLogger(__name__)
+
+# Weight of the pixels in the middle of a tile. Pixels in the overlap with other tiles ramp down to a weight of 1 at
+# the tile edge. At most 4 tiles cover a pixel so the summed weights fit in 8 bits.
+MAX_TILE_WEIGHT = 63
+
+# Creation options of the COG written for a region, overviews are averaged so they show the mean confidence
+COG_CREATION_OPTIONS = ["COMPRESS=DEFLATE", "BLOCKSIZE=512", "OVERVIEW_RESAMPLING=AVERAGE", "BIGTIFF=IF_SAFER"]
+
+# The mosaic is staged in an uncompressed tiled GeoTIFF, written a strip of tiles at a time, before the COG is copied
+STAGING_CREATION_OPTIONS = ["TILED=YES", "BLOCKXSIZE=512", "BLOCKYSIZE=512", "BIGTIFF=IF_SAFER"]
+WRITE_STRIP_ROWS = 512
+
+
+class RegionMaskMosaic:
+    """
+    Mosaics the segmentation masks a model returns for the tiles of a region into one raster. Where tiles overlap
+    the masks are blended with weights that fall off towards the edges of each tile, so the result does not show
+    the seams of the tiles. The mosaic holds an 8-bit confidence and an 8-bit weight for each pixel of the region
+    in a memory mapped temporary file, so only the windows of the tiles being blended are resident and a large
+    region with many classes does not have to fit in memory. The file is only created when the first mask arrives,
+    so regions processed by detection models use no storage. Call close() to release it.
+
+    Tile workers share the mosaic of a region, masks are added under a lock.
+
+    :param region_bounds: the ((row, column), (width, height)) bounds of the region in full image pixels
+    :param tile_overlap: the (width, height) overlap between tiles at the processing resolution
+    :param processing_scale: the decimation factor the tiles are read at, the mosaic has the resolution of the tiles
+    """
+
+    def __init__(self, region_bounds: ImageRegion, tile_overlap: ImageDimensions, processing_scale: int = 1) -> None:
+        self.region_bounds = region_bounds
+        self.tile_overlap = tile_overlap
+        self.processing_scale = max(1, int(processing_scale))
+        self.width = -(-int(region_bounds[1][0]) // self.processing_scale)
+        self.height = -(-int(region_bounds[1][1]) // self.processing_scale)
+        self.confidence: Optional[np.ndarray] = None
+        self.weights: Optional[np.ndarray] = None
+        self._backing_file: Optional[IO[bytes]] = None
+        self.mask_count = 0
+        self._lock = Lock()
+
+    @property
+    def has_masks(self) -> bool:
+        return self.mask_count > 0
+
+    def _allocate(self, band_count: int) -> None:
+        """
+        Create the memory mapped confidence bands and weights of the mosaic. The caller must hold the lock.
+
+        :param band_count: the number of classes in the masks
+        """
+        self._backing_file = tempfile.TemporaryFile(prefix="region-mask-")
+        storage = np.memmap(self._backing_file, dtype=np.uint8, mode="w+", shape=(band_count + 1, self.height, self.width))
+        self.confidence = storage[:band_count]
+        self.weights = storage[band_count]
+
+    def close(self) -> None:
+        """
+        Release the temporary file backing the mosaic.
+        """
+        with self._lock:
+            self.confidence = None
+            self.weights = None
+            if self._backing_file is not None:
+                self._backing_file.close()
+                self._backing_file = None
+
+    @staticmethod
+    def _ramp(length: int, overlap: int) -> np.ndarray:
+        """
+        Create the blending weights along one axis of a tile.
+
+        :param length: the number of pixels along the axis
+        :param overlap: the overlap with the neighboring tiles along the axis
+        :return: the (length,) weights in (0, 1]
+        """
+        distance_to_edge = np.minimum(np.arange(length), np.arange(length)[::-1])
+        return np.minimum(1.0, (distance_to_edge + 1) / (max(0, overlap) + 1))
+
+    def _tile_window(self, tile_bounds: ImageRegion) -> Tuple[int, int, int, int]:
+        """
+        Locate a tile in the mosaic.
+
+        :param tile_bounds: the ((row, column), (width, height)) bounds of the tile in full image pixels
+        :return: the row, column, height and width of the tile in mosaic pixels
+        """
+        scale = self.processing_scale
+        row = (int(tile_bounds[0][0]) - int(self.region_bounds[0][0])) // scale
+        column = (int(tile_bounds[0][1]) - int(self.region_bounds[0][1])) // scale
+        return row, column, -(-int(tile_bounds[1][1]) // scale), -(-int(tile_bounds[1][0]) // scale)
+
+    def add_mask(self, mask: SegmentationMask, tile_bounds: ImageRegion) -> None:
+        """
+        Blend the mask of a tile into the mosaic. A mask with a different size than the tile is resampled to the
+        tile with nearest neighbor sampling, so models can return masks at a lower resolution.
+
+        :param mask: the mask returned by the model for the tile
+        :param tile_bounds: the ((row, column), (width, height)) bounds of the tile in full image pixels
+        :raises ValueError: if the mask has a different number of bands than the masks already added
+        """
+        row, column, height, width = self._tile_window(tile_bounds)
+        pixels = mask.pixels
+        if pixels.shape[1:] != (height, width):
+            rows = np.arange(height) * pixels.shape[1] // height
+            columns = np.arange(width) * pixels.shape[2] // width
+            pixels = pixels[:, rows[:, np.newaxis], columns]
+
+        # Clip the tile to the region, tiles on the edge of the image can extend past it
+        top, left = max(0, -row), max(0, -column)
+        bottom, right = min(height, self.height - row), min(width, self.width - column)
+        if bottom <= top or right <= left:
+            return
+        weights = np.rint(
+            np.outer(self._ramp(height, self.tile_overlap[1]), self._ramp(width, self.tile_overlap[0])) * MAX_TILE_WEIGHT
+        )
+        weights = np.maximum(weights, 1)[top:bottom, left:right].astype(np.float32)
+        pixels = pixels[:, top:bottom, left:right].astype(np.float32)
+        window = (slice(row + top, row + bottom), slice(column + left, column + right))
+
+        with self._lock:
+            if self.confidence is None:
+                self._allocate(mask.band_count)
+            elif mask.band_count != self.confidence.shape[0]:
+                raise ValueError(
+                    f"Segmentation mask has {mask.band_count} bands but the region mosaic has {self.confidence.shape[0]}"
+                )
+            # Running weighted average of the masks covering each pixel
+            current_weights = self.weights[window].astype(np.float32)
+            total_weights = current_weights + weights
+            confidence = self.confidence[(slice(None),) + window].astype(np.float32)
+            blended = (confidence * current_weights + pixels * weights) / total_weights
+            self.confidence[(slice(None),) + window] = np.rint(blended).astype(np.uint8)
+            self.weights[window] = np.minimum(total_weights, 255).astype(np.uint8)
+            self.mask_count += 1
+
+    def write_cog(self, file_path: str, raster_dataset: Optional[gdal.Dataset] = None) -> None:
+        """
+        Write the mosaic to a Cloud Optimized GeoTIFF with one band for each class of the masks. When a source
+        dataset is given the georeferencing of the image, a geo transform or RPCs, is adjusted to the region and
+        resolution of the mosaic so the COG lines up with the image. The mosaic is copied to a staging GeoTIFF next
+        to the COG in strips, so neither copy of the region is held in memory.
+
+        :param file_path: the path of the COG to create
+        :param raster_dataset: the dataset of the image the region belongs to
+        """
+        if self.confidence is None:
+            raise ValueError("The region mosaic has no segmentation masks")
+        band_count = self.confidence.shape[0]
+        staging_path = f"{file_path}.staging.tif"
+        staging_driver = gdal.GetDriverByName("GTiff")
+        staging_dataset = staging_driver.Create(
+            staging_path, self.width, self.height, band_count, gdal.GDT_Byte, options=STAGING_CREATION_OPTIONS
+        )
+        try:
+            for row in range(0, self.height, WRITE_STRIP_ROWS):
+                for band_index in range(band_count):
+                    strip = np.asarray(self.confidence[band_index, row : row + WRITE_STRIP_ROWS])
+                    staging_dataset.GetRasterBand(band_index + 1).WriteArray(strip, 0, row)
+            if raster_dataset is not None:
+                self._copy_georeferencing(raster_dataset, staging_dataset)
+            staging_dataset.SetMetadata(
+                {
+                    "REGION_ROW": str(self.region_bounds[0][0]),
+                    "REGION_COLUMN": str(self.region_bounds[0][1]),
+                    "PROCESSING_SCALE": str(self.processing_scale),
+                }
+            )
+            gdal.GetDriverByName("COG").CreateCopy(file_path, staging_dataset, options=COG_CREATION_OPTIONS)
+        finally:
+            staging_dataset = None
+            staging_driver.Delete(staging_path)
+        logger.debug(f"Wrote {self.mask_count} segmentation masks of region {self.region_bounds} to {file_path}")
+
+    def _copy_georeferencing(self, raster_dataset: gdal.Dataset, mosaic_dataset: gdal.Dataset) -> None:
+        """
+        Georeference the mosaic using the georeferencing of the image, moved to the region origin and scaled to the
+        processing resolution.
+
+        :param raster_dataset: the dataset of the image
+        :param mosaic_dataset: the dataset of the mosaic
+        """
+        row, column = int(self.region_bounds[0][0]), int(self.region_bounds[0][1])
+        scale = self.processing_scale
+        geo_transform = raster_dataset.GetGeoTransform(can_return_null=True)
+        if geo_transform is not None:
+            mosaic_dataset.SetGeoTransform(
+                [
+                    geo_transform[0] + column * geo_transform[1] + row * geo_transform[2],
+                    geo_transform[1] * scale,
+                    geo_transform[2] * scale,
+                    geo_transform[3] + column * geo_transform[4] + row * geo_transform[5],
+                    geo_transform[4] * scale,
+                    geo_transform[5] * scale,
+                ]
+            )
+            mosaic_dataset.SetProjection(raster_dataset.GetProjectionRef())
+            return
+
+        rpc = raster_dataset.GetMetadata("RPC")
+        if rpc:
+            # Pixels of the mosaic are (image pixel - region origin) / scale
+            rpc = dict(rpc)
+            rpc["LINE_OFF"] = str((float(rpc["LINE_OFF"]) - row) / scale)
+            rpc["SAMP_OFF"] = str((float(rpc["SAMP_OFF"]) - column) / scale)
+            rpc["LINE_SCALE"] = str(float(rpc["LINE_SCALE"]) / scale)
+            rpc["SAMP_SCALE"] = str(float(rpc["SAMP_SCALE"]) / scale)
+            mosaic_dataset.SetMetadata(rpc, "RPC")
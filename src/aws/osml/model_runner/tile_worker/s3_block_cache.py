@@ -0,0 +1,566 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import fcntl
+import hashlib
+import http.client
+import json
+import logging
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from osgeo import gdal
+
+logger = logging.getLogger(__name__)
+
+# Headers that describe the connection between two hops and must not be forwarded
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailer",
+    "transfer-encoding",
+    "upgrade",
+}
+
+# Response headers stored with a cached block and returned on a cache hit
+CACHED_RESPONSE_HEADERS = {"content-range", "content-type", "etag", "last-modified", "accept-ranges"}
+
+CREDENTIAL_PATTERN = re.compile(r"Credential=([^/,\s]+)/")
+
+# S3 endpoints in every partition, e.g. bucket.s3.us-west-2.amazonaws.com, s3-fips.us-gov-west-1.amazonaws.com or
+# s3.cn-north-1.amazonaws.com.cn
+S3_HOST_PATTERN = re.compile(r"^(.+\.)?s3([.-][a-z0-9-]+)*\.amazonaws\.com(\.cn)?$")
+
+# GDAL filesystem prefix the proxy is scoped to
+VSIS3_PREFIX = "/vsis3/"
+
+# Shared file recording the total size of the cached blocks, locked by the process updating it
+SIZE_INDEX_NAME = ".size"
+
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class S3BlockCache:
+    """
+    An on-disk, size-bounded cache of byte ranges read from S3 objects.
+
+    Blocks are keyed by the object URL, its ETag, the requested byte range and the access key that read them, so an
+    updated object is never served from stale blocks and blocks read with one set of credentials are never returned
+    to a request signed with another. Each block is written to a temporary file and atomically renamed into place,
+    which lets every process on a host share the same cache directory. The total size of the directory is kept in
+    a shared index file updated under an exclusive file lock, so the size limit holds for all the processes
+    together. When the cache grows past its size limit the least recently used blocks, by file modification time,
+    are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_size_bytes: int = 10 * 1024 * 1024 * 1024) -> None:
+        """
+        Initialize the block cache.
+
+        :param cache_dir: Directory holding the cached blocks, shared by every process on the host
+        :param max_size_bytes: Maximum total size of the cached blocks
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, SIZE_INDEX_NAME)
+
+    @staticmethod
+    def block_key(url: str, etag: str, byte_range: str, credential: str) -> str:
+        """
+        Build the key of a cached block.
+
+        :param url: URL of the object without the query string
+        :param etag: ETag of the object version the block was read from
+        :param byte_range: The HTTP Range header of the request
+        :param credential: Access key id that signed the request
+        :return: The cache key
+        """
+        return hashlib.sha256("|".join([url, etag, byte_range, credential]).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """
+        Location of a block on disk. Blocks are spread over subdirectories to keep directory listings short.
+
+        :param key: The cache key
+        :return: The path of the block
+        """
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, str], bytes]]:
+        """
+        Read a block from the cache.
+
+        :param key: The cache key
+        :return: The stored response headers and block contents or None if the block is not cached
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as block_file:
+                (header_length,) = struct.unpack(">I", block_file.read(4))
+                headers = json.loads(block_file.read(header_length).decode("utf-8"))
+                body = block_file.read()
+            # Refresh the modification time so recently read blocks are evicted last
+            os.utime(path)
+            return headers, body
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            logger.warning(f"Discarding unreadable cached block {path}: {err}")
+            self._discard(path)
+            return None
+
+    def put(self, key: str, headers: Dict[str, str], body: bytes) -> None:
+        """
+        Add a block to the cache.
+
+        :param key: The cache key
+        :param headers: The response headers to return on a cache hit
+        :param body: The block contents
+        """
+        path = self._path(key)
+        encoded_headers = json.dumps(headers).encode("utf-8")
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            with os.fdopen(file_descriptor, "wb") as block_file:
+                block_file.write(struct.pack(">I", len(encoded_headers)))
+                block_file.write(encoded_headers)
+                block_file.write(body)
+            os.replace(temp_path, path)
+        except OSError as err:
+            logger.warning(f"Unable to write block to cache {path}: {err}")
+            return
+
+        self._add_size(4 + len(encoded_headers) + len(body))
+
+    def size_bytes(self) -> int:
+        """
+        Total size of the cached blocks written by every process sharing the cache directory.
+
+        :return: The size in bytes
+        """
+        return self._add_size(0)
+
+    def _add_size(self, added_bytes: int) -> int:
+        """
+        Add to the shared size index and evict blocks if the cache directory is over its size limit. The index is
+        read and written under an exclusive lock so concurrent writers in other processes are accounted for. A
+        missing or unreadable index is rebuilt by scanning the directory.
+
+        :param added_bytes: Size of the block just written
+        :return: The size of the cache directory in bytes
+        """
+        try:
+            index_descriptor = os.open(self._index_path, os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as err:
+            logger.warning(f"Unable to open the block cache size index {self._index_path}: {err}")
+            return 0
+        with os.fdopen(index_descriptor, "r+") as index_file:
+            fcntl.flock(index_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    size_bytes = int(index_file.read()) + added_bytes
+                except ValueError:
+                    size_bytes = self._scan_size()
+                if size_bytes > self.max_size_bytes:
+                    size_bytes = self._evict()
+                index_file.seek(0)
+                index_file.truncate()
+                index_file.write(str(size_bytes))
+                index_file.flush()
+            finally:
+                fcntl.flock(index_file, fcntl.LOCK_UN)
+        return size_bytes
+
+    def _scan_size(self) -> int:
+        """
+        Total the size of the blocks currently on disk, including those written by other processes.
+
+        :return: The size in bytes
+        """
+        return sum(entry[2] for entry in self._list_blocks())
+
+    def _list_blocks(self) -> List[Tuple[float, str, int]]:
+        """
+        List the blocks on disk.
+
+        :return: The modification time, path and size of each block
+        """
+        blocks = []
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                blocks.append((stat.st_mtime, entry.path, stat.st_size))
+        return blocks
+
+    def _evict(self) -> int:
+        """
+        Remove the least recently used blocks until the cache is below 90% of its size limit. The directory is
+        rescanned so blocks replaced or discarded since the index was last rebuilt are not counted. The caller must
+        hold the size index lock.
+
+        :return: The size of the cache directory in bytes after eviction
+        """
+        blocks = sorted(self._list_blocks())
+        size_bytes = sum(block[2] for block in blocks)
+        target_bytes = int(self.max_size_bytes * 0.9)
+        for _, path, block_size in blocks:
+            if size_bytes <= target_bytes:
+                break
+            if self._discard(path):
+                size_bytes -= block_size
+        return size_bytes
+
+    @staticmethod
+    def _discard(path: str) -> bool:
+        """
+        Remove a block, ignoring blocks already removed by another process.
+
+        :param path: The path of the block
+        :return: True if the block was removed
+        """
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+class S3BlockCacheProxy:
+    """
+    A local HTTP proxy that puts an S3BlockCache underneath GDAL's /vsis3/ reads.
+
+    GDAL is pointed at the proxy with path specific GDAL_HTTP_PROXY and AWS_HTTPS options for /vsis3/, so only S3
+    reads talk plain HTTP to it over the loopback interface and every other GDAL request is left untouched. The
+    proxy forwards each request unchanged, including its SigV4 signature, to S3 over HTTPS. The signature covers
+    the Host header but not the scheme, so forwarding does not change it. Only S3 endpoints, or the endpoint
+    configured with AWS_S3_ENDPOINT, are forwarded to; the proxy refuses requests for any other host. Every other
+    request is passed through and the ETag in its response is remembered for the object.
+
+    The access key id in a request is not proof that the sender holds its secret key, so a cached block is never
+    returned on the proxy's own authority. A range read of an object whose ETag was seen recently is forwarded with
+    an If-None-Match condition on that ETag. S3 checks the signature and the caller's access to the object before
+    the condition, so a 304 Not Modified response proves the request may read the unchanged object and the block
+    is then served from the cache. Only the response headers are transferred from S3 on a hit.
+    """
+
+    def __init__(
+        self,
+        block_cache: S3BlockCache,
+        etag_ttl_seconds: int = 60,
+        upstream_https: bool = True,
+        upstream_timeout: int = 60,
+        s3_endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the proxy.
+
+        :param block_cache: The cache holding the blocks
+        :param etag_ttl_seconds: Time in seconds an observed object ETag is trusted without asking S3 again
+        :param upstream_https: Connect to S3 over HTTPS, only disabled for testing or when AWS_HTTPS=NO was already
+            configured for a custom endpoint
+        :param upstream_timeout: Timeout in seconds for requests to S3
+        :param s3_endpoint: Custom S3 endpoint as host[:port] that requests may be forwarded to, defaults to the
+            AWS_S3_ENDPOINT configuration option
+        """
+        self.block_cache = block_cache
+        self.etag_ttl_seconds = etag_ttl_seconds
+        self.upstream_https = upstream_https
+        self.upstream_timeout = upstream_timeout
+        self.s3_endpoint = s3_endpoint or gdal.GetConfigOption("AWS_S3_ENDPOINT")
+        self._etags: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._etag_lock = threading.Lock()
+        self._connections = threading.local()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def address(self) -> str:
+        """
+        Address of the running proxy as host:port.
+
+        :return: The proxy address
+        """
+        if self._server is None:
+            raise RuntimeError("S3 block cache proxy is not running")
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def gdal_options(self) -> Dict[str, str]:
+        """
+        The GDAL configuration options that route /vsis3/ reads through the proxy. They are applied to the /vsis3/
+        prefix only.
+
+        :return: The configuration options
+        """
+        return {"GDAL_HTTP_PROXY": self.address, "AWS_HTTPS": "NO"}
+
+    def start(self, port: int = 0) -> "S3BlockCacheProxy":
+        """
+        Start serving on the loopback interface in a background thread.
+
+        :param port: Port to listen on, 0 picks a free port
+        :return: self to allow chaining
+        """
+        proxy = self
+
+        class _Handler(_ProxyRequestHandler):
+            owner = proxy
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="S3BlockCacheProxy", daemon=True)
+        self._thread.start()
+        logger.info(f"Started S3 block cache proxy on {self.address} using {self.block_cache.cache_dir}")
+        return self
+
+    def configure_gdal(self) -> None:
+        """
+        Set the path specific GDAL configuration options that route /vsis3/ reads through the proxy. If AWS_HTTPS=NO
+        was already configured the S3 endpoint is plain HTTP, so the proxy keeps forwarding to it over HTTP.
+        """
+        if str(gdal.GetConfigOption("AWS_HTTPS", "YES")).upper() in ("NO", "FALSE", "OFF"):
+            self.upstream_https = False
+        for key, value in self.gdal_options().items():
+            gdal.SetPathSpecificOption(VSIS3_PREFIX, key, value)
+
+    def is_s3_host(self, host: str) -> bool:
+        """
+        Check a request is for an S3 endpoint the proxy may forward to.
+
+        :param host: The host the request was sent to as host[:port]
+        :return: True if the host is an S3 endpoint or the configured custom endpoint
+        """
+        hostname = host.split(":")[0].lower()
+        if self.s3_endpoint:
+            endpoint = urlsplit(self.s3_endpoint if "//" in self.s3_endpoint else f"//{self.s3_endpoint}")
+            endpoint_host = endpoint.netloc.lower()
+            # Virtual hosted requests prefix the endpoint with the bucket name
+            if host.lower() == endpoint_host or host.lower().endswith(f".{endpoint_host}"):
+                return True
+        return bool(S3_HOST_PATTERN.match(hostname))
+
+    def stop(self) -> None:
+        """
+        Stop the proxy.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def get_etag(self, url: str, credential: str) -> Optional[str]:
+        """
+        Get the recently observed ETag of an object.
+
+        :param url: URL of the object without the query string
+        :param credential: Access key id that signed the request
+        :return: The ETag or None if it has not been observed within the TTL
+        """
+        with self._etag_lock:
+            observed = self._etags.get((url, credential))
+            if observed is None:
+                return None
+            etag, observed_time = observed
+            if time.time() - observed_time > self.etag_ttl_seconds:
+                del self._etags[(url, credential)]
+                return None
+            return etag
+
+    def set_etag(self, url: str, credential: str, etag: Optional[str]) -> None:
+        """
+        Remember the ETag returned by S3 for an object.
+
+        :param url: URL of the object without the query string
+        :param credential: Access key id that signed the request
+        :param etag: The ETag from the response
+        """
+        if not etag:
+            return
+        with self._etag_lock:
+            self._etags[(url, credential)] = (etag, time.time())
+
+    def upstream_connection(self, host: str) -> http.client.HTTPConnection:
+        """
+        Get a connection to S3 for the current thread, reusing it across requests to the same host. Connections
+        use HTTPS unless the proxy was configured for a plain HTTP endpoint.
+
+        :param host: The host the request was sent to
+        :return: The connection
+        """
+        connections = getattr(self._connections, "by_host", None)
+        if connections is None:
+            connections = self._connections.by_host = {}
+        connection = connections.get(host)
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if self.upstream_https else http.client.HTTPConnection
+            connection = connection_class(host, timeout=self.upstream_timeout)
+            connections[host] = connection
+        return connection
+
+    def close_upstream_connection(self, host: str) -> None:
+        """
+        Close the current thread's connection to a host after a failed request.
+
+        :param host: The host the request was sent to
+        """
+        connections = getattr(self._connections, "by_host", {})
+        connection = connections.pop(host, None)
+        if connection is not None:
+            connection.close()
+
+
+class _ProxyRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests GDAL sends to the S3BlockCacheProxy.
+    """
+
+    owner: S3BlockCacheProxy
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"S3 block cache proxy: {format % args}")
+
+    def do_HEAD(self) -> None:
+        self._handle()
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def _handle(self) -> None:
+        target = urlsplit(self.path)
+        host = target.netloc or self.headers.get("Host", "")
+        if not self.owner.is_s3_host(host):
+            logger.warning(f"S3 block cache proxy refused request for non S3 host {host}")
+            self.send_error(403, "Forbidden")
+            return
+        object_url = f"{host}{target.path}"
+        upstream_path = target.path + (f"?{target.query}" if target.query else "")
+        credential = self._credential()
+        byte_range = self.headers.get("Range")
+
+        etag = None
+        cached = None
+        if self.command == "GET" and byte_range and not target.query:
+            etag = self.owner.get_etag(object_url, credential)
+            if etag:
+                cached = self.owner.block_cache.get(
+                    self.owner.block_cache.block_key(object_url, etag, byte_range, credential)
+                )
+
+        try:
+            self._forward(
+                host, upstream_path, object_url, credential, byte_range if not target.query else None, etag, cached
+            )
+        except Exception as err:
+            logger.warning(f"S3 block cache proxy failed to forward request for {object_url}: {err}")
+            self.owner.close_upstream_connection(host)
+            self.send_error(502, "Bad Gateway")
+
+    def _credential(self) -> str:
+        match = CREDENTIAL_PATTERN.search(self.headers.get("Authorization", ""))
+        return match.group(1) if match else ""
+
+    def _send_cached(self, headers: Dict[str, str], body: bytes) -> None:
+        self.send_response(206)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _forward(
+        self,
+        host: str,
+        upstream_path: str,
+        object_url: str,
+        credential: str,
+        byte_range: Optional[str],
+        cached_etag: Optional[str] = None,
+        cached: Optional[Tuple[Dict[str, str], bytes]] = None,
+    ) -> None:
+        """
+        Forward the request to S3 and relay the response. When a cached block is given the request is made
+        conditional on its ETag and the block is returned if S3 answers 304 Not Modified.
+        """
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS}
+        if cached is not None:
+            headers["If-None-Match"] = cached_etag
+        connection = self.owner.upstream_connection(host)
+        connection.request(self.command, upstream_path, headers=headers)
+        response = connection.getresponse()
+
+        if cached is not None and response.status == 304:
+            response.read()
+            self.owner.hits += 1
+            self.owner.set_etag(object_url, credential, cached_etag)
+            self._send_cached(*cached)
+            return
+        if self.command == "GET" and byte_range:
+            self.owner.misses += 1
+
+        etag = response.getheader("ETag")
+        if response.status in (200, 206):
+            self.owner.set_etag(object_url, credential, etag)
+
+        self.send_response(response.status, response.reason)
+        response_headers = [(name, value) for name, value in response.getheaders() if name.lower() not in HOP_BY_HOP_HEADERS]
+        has_length = any(name.lower() == "content-length" for name, _ in response_headers)
+        if self.command == "HEAD":
+            for name, value in response_headers:
+                self.send_header(name, value)
+            self.end_headers()
+            response.read()
+            return
+
+        if response.status == 206 and byte_range and etag:
+            # Partial reads are bounded by GDAL's chunk size so they are buffered and cached
+            body = response.read()
+            for name, value in response_headers:
+                if name.lower() != "content-length":
+                    self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            cached_headers = {name: value for name, value in response_headers if name.lower() in CACHED_RESPONSE_HEADERS}
+            self.owner.block_cache.put(
+                self.owner.block_cache.block_key(object_url, etag, byte_range, credential), cached_headers, body
+            )
+            return
+
+        if has_length:
+            for name, value in response_headers:
+                self.send_header(name, value)
+            self.end_headers()
+            while True:
+                chunk = response.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+        else:
+            body = response.read()
+            for name, value in response_headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
@@ -0,0 +1,106 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import logging
+from typing import List, Optional, Tuple
+
+from osgeo import gdal
+
+from aws.osml.model_runner.common import ImageDimensions, ImageRegion
+
+logger = logging.getLogger(__name__)
+
+
+def get_block_size(raster_dataset: gdal.Dataset) -> Optional[ImageDimensions]:
+    """
+    Get the internal block layout of a dataset as (width, height).
+
+    :param raster_dataset: the raster dataset
+    :return: the block size or None if it could not be determined
+    """
+    try:
+        block_width, block_height = raster_dataset.GetRasterBand(1).GetBlockSize()
+        block_width, block_height = int(block_width), int(block_height)
+    except Exception as err:
+        logger.debug(f"Unable to read the block size of the dataset: {err}")
+        return None
+    if block_width <= 0 or block_height <= 0:
+        return None
+    return block_width, block_height
+
+
+def order_tiles_by_block(tiles: List[ImageRegion], block_size: Optional[ImageDimensions]) -> List[ImageRegion]:
+    """
+    Order tiles so their reads walk the dataset's internal blocks in storage order.
+
+    Tiled GeoTIFF/COG and blocked NITF images store blocks row by row. Tiles are ordered by the row of blocks
+    their top edge falls in and then by the block column of their left edge, so consecutive tiles reuse the
+    blocks already fetched and new blocks are requested in the order they are laid out in the file. Striped
+    images (blocks spanning the full width) degrade to plain row-major order.
+
+    :param tiles: the tiles as ((row, column), (width, height))
+    :param block_size: the block size as (width, height), None keeps row-major order
+    :return: the tiles in read order
+    """
+    if not block_size:
+        return sorted(tiles, key=lambda tile: (tile[0][0], tile[0][1]))
+    block_width, block_height = block_size
+    return sorted(tiles, key=lambda tile: (tile[0][0] // block_height, tile[0][1] // block_width, tile[0][0], tile[0][1]))
+
+
+class TileReadAhead:
+    """
+    Hints GDAL about the tiles that will be read next so it can fetch their blocks ahead of time.
+
+    Tiles are grouped into batches. When the first tile of a batch is about to be read, AdviseRead is called
+    once for the area covered by the batch. For tiled inputs on /vsis3/ this lets GDAL fetch all the blocks
+    the batch needs with one set of merged range requests instead of one request per tile read.
+    """
+
+    def __init__(self, raster_dataset: gdal.Dataset, tiles: List[ImageRegion], batch_size: int) -> None:
+        """
+        Initialize the read-ahead for a sequence of tiles.
+
+        :param raster_dataset: the raster dataset the tiles are read from
+        :param tiles: the tiles in the order they will be read
+        :param batch_size: number of tiles covered by each hint, 0 disables read-ahead
+        """
+        self.raster_dataset = raster_dataset
+        self.tiles = tiles
+        self.batch_size = max(0, batch_size)
+
+    def before_read(self, tile_index: int) -> None:
+        """
+        Advise GDAL of the upcoming batch when the tile at the given index starts a batch.
+
+        :param tile_index: index of the tile about to be read
+        """
+        if self.batch_size == 0 or tile_index % self.batch_size != 0:
+            return
+        batch = self.tiles[tile_index : tile_index + self.batch_size]
+        if not batch:
+            return
+        min_x = min(tile[0][1] for tile in batch)
+        min_y = min(tile[0][0] for tile in batch)
+        max_x = max(tile[0][1] + tile[1][0] for tile in batch)
+        max_y = max(tile[0][0] + tile[1][1] for tile in batch)
+        try:
+            self.raster_dataset.AdviseRead(min_x, min_y, max_x - min_x, max_y - min_y)
+        except Exception as err:
+            # The hint is only an optimization, reads still work without it
+            logger.debug(f"AdviseRead failed for window {(min_x, min_y, max_x - min_x, max_y - min_y)}: {err}")
+            self.batch_size = 0
+
+
+def plan_tile_reads(
+    raster_dataset: gdal.Dataset, tiles: List[ImageRegion], read_ahead_tiles: int
+) -> Tuple[List[ImageRegion], TileReadAhead]:
+    """
+    Order tiles along the dataset's block layout and set up read-ahead for them.
+
+    :param raster_dataset: the raster dataset the tiles are read from
+    :param tiles: the tiles as ((row, column), (width, height))
+    :param read_ahead_tiles: number of tiles covered by each read-ahead hint, 0 disables read-ahead
+    :return: the tiles in read order and the read-ahead for them
+    """
+    ordered_tiles = order_tiles_by_block(tiles, get_block_size(raster_dataset))
+    return ordered_tiles, TileReadAhead(raster_dataset, ordered_tiles, read_ahead_tiles)
@@ -2,23 +2,29 @@
 
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from datetime import datetime, timezone
 from queue import Queue
 from threading import Thread
-from typing import DefaultDict, Dict, List, Optional, Tuple
+from typing import DefaultDict, Dict, List, Optional, Tuple, Union
 
 import geojson
+import shapely
 from aws_embedded_metrics.logger.metrics_logger import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
 from aws_embedded_metrics.unit import Unit
-from shapely.affinity import translate
+from shapely.affinity import scale, translate
+from shapely.geometry.base import BaseGeometry
 
 from aws.osml.features import Geolocator, ImagedFeaturePropertyAccessor
 from aws.osml.model_runner.app_config import MetricLabels
 from aws.osml.model_runner.common import ThreadingLocalContextFilter, TileState, Timer
-from aws.osml.model_runner.database import FeatureTable, RegionRequestTable
-from aws.osml.model_runner.inference import Detector
+from aws.osml.model_runner.database import EndpointStatisticsTable, FeatureTable, RegionRequestTable
+from aws.osml.model_runner.inference import DetectionBatch, Detector, SegmentationMask
+
+from .feature_collector import FeatureCollector
+from .region_mask_mosaic import RegionMaskMosaic
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +35,10 @@ class TileWorker(Thread):
         in_queue: Queue,
         feature_detector: Detector,
         geolocator: Optional[Geolocator],
-        feature_table: FeatureTable,
-        region_request_table: RegionRequestTable,
+        feature_table: Union[FeatureTable, FeatureCollector],
+        region_request_table: Optional[RegionRequestTable],
+        endpoint_statistics_table: Optional[EndpointStatisticsTable] = None,
+        mask_mosaic: Optional[RegionMaskMosaic] = None,
     ) -> None:
         super().__init__()
         self.in_queue = in_queue
@@ -41,6 +49,11 @@ class TileWorker(Thread):
         self.property_accessor = ImagedFeaturePropertyAccessor()
         self.failed_tile_count: int = 0
         self._buffered_tile_updates: DefaultDict[Tuple[str, str, TileState], List] = defaultdict(list)
+        self.endpoint_statistics_table = endpoint_statistics_table
+        # Running [tile count, failed tile count, latency sum in ms] totals for each statistics time bucket
+        self._buffered_statistics: DefaultDict[int, List[int]] = defaultdict(lambda: [0, 0, 0])
+        # Segmentation masks returned for the tiles are blended into the mosaic of the region instead of the features
+        self.mask_mosaic = mask_mosaic
 
     def run(self) -> None:
         thread_event_loop = asyncio.new_event_loop()
@@ -55,6 +68,7 @@ class TileWorker(Thread):
                 except Exception as e:
                     logger.error("Failed to flush buffered tile updates during worker shutdown.")
                     logger.exception(e)
+                self.flush_inference_statistics()
                 logger.debug("All images processed. Stopping tile worker.")
                 logger.debug(
                     (
@@ -80,7 +94,8 @@ class TileWorker(Thread):
     def process_tile(self, image_info: Dict, metrics: MetricsLogger = None) -> None:
         """
         This method handles the processing of a single tile by invoking the ML model, geolocating the detections to
-        create features and finally storing the features in the database.
+        create features and finally storing the features in the database. Segmentation masks returned by the model
+        are added to the mask mosaic of the region instead.
 
         :param image_info: description of the tile to be processed
         :param metrics: the current metric scope
@@ -103,12 +118,23 @@ class TileWorker(Thread):
                 metrics_logger=metrics,
             ):
                 with open(image_info["image_path"], mode="rb") as payload:
-                    feature_collection = self.feature_detector.find_features(payload)
-
-                features = self._refine_features(feature_collection, image_info)
-
-                if len(features) > 0:
-                    self.feature_table.add_features(features)
+                    inference_start = time.perf_counter()
+                    try:
+                        feature_collection = self.feature_detector.find_features(payload)
+                    except Exception:
+                        self.record_inference_statistics(None)
+                        raise
+                    self.record_inference_statistics(time.perf_counter() - inference_start)
+
+                if isinstance(feature_collection, SegmentationMask):
+                    if self.mask_mosaic is None:
+                        raise ValueError("Segmentation masks are not supported without a region mask mosaic")
+                    self.mask_mosaic.add_mask(feature_collection, image_info["region"])
+                else:
+                    features = self._refine_features(feature_collection, image_info)
+
+                    if len(features) > 0:
+                        self.feature_table.add_features(features)
 
                 self.buffer_tile_update(image_info, TileState.SUCCEEDED)
         except Exception as e:
@@ -129,10 +155,14 @@ class TileWorker(Thread):
 
     def flush_tile_updates(self) -> None:
         """
-        Flush buffered tile state updates to the region request table.
+        Flush buffered tile state updates to the region request table. Nothing is written when the region is
+        processed in memory without a region request table.
         """
         if len(self._buffered_tile_updates) == 0:
             return
+        if self.region_request_table is None:
+            self._buffered_tile_updates.clear()
+            return
 
         try:
             for (image_id, region_id, state), tiles in self._buffered_tile_updates.items():
@@ -150,6 +180,69 @@ class TileWorker(Thread):
         finally:
             self._buffered_tile_updates.clear()
 
+    def record_inference_statistics(self, latency: Optional[float]) -> None:
+        """
+        Add the outcome of a model invocation to the buffered endpoint statistics. Completed time buckets are
+        written to the endpoint statistics table as soon as a later bucket starts.
+
+        :param latency: the inference latency in seconds, None if the invocation failed
+        """
+        if self.endpoint_statistics_table is None:
+            return
+
+        current_bucket = self.endpoint_statistics_table.bucket_for(time.time())
+        totals = self._buffered_statistics[current_bucket]
+        if latency is None:
+            totals[1] += 1
+        else:
+            totals[0] += 1
+            totals[2] += int(latency * 1000)
+
+        if len(self._buffered_statistics) > 1:
+            self.flush_inference_statistics(before_bucket=current_bucket)
+
+    def flush_inference_statistics(self, before_bucket: Optional[int] = None) -> None:
+        """
+        Write the buffered endpoint statistics to the endpoint statistics table. The statistics only guide
+        scheduling decisions so failures are logged and the buffered values are dropped.
+
+        :param before_bucket: only flush the buckets that started before this time, None flushes everything
+        """
+        if self.endpoint_statistics_table is None:
+            return
+
+        variant_name = (self.feature_detector.endpoint_parameters or {}).get("TargetVariant")
+        for bucket_start in sorted(self._buffered_statistics.keys()):
+            if before_bucket is not None and bucket_start >= before_bucket:
+                continue
+            tile_count, failed_tile_count, latency_sum_ms = self._buffered_statistics.pop(bucket_start)
+            try:
+                self.endpoint_statistics_table.add_tile_statistics(
+                    self.feature_detector.endpoint,
+                    variant_name,
+                    bucket_start,
+                    tile_count,
+                    failed_tile_count,
+                    latency_sum_ms,
+                )
+            except Exception as e:
+                logger.warning(f"Unable to record inference statistics for {self.feature_detector.endpoint}: {e}")
+
+    @staticmethod
+    def _to_full_image(tiled_geometry: BaseGeometry, ulx: int, uly: int, processing_scale: int) -> BaseGeometry:
+        """
+        Convert a shape in the coordinates of a tile into full image coordinates.
+
+        :param tiled_geometry: the shape in tile coordinates
+        :param ulx: the column of the tile's upper left corner in the full image
+        :param uly: the row of the tile's upper left corner in the full image
+        :param processing_scale: the decimation factor the tile was read at, 1 for full resolution tiles
+        :return: the shape in full image coordinates
+        """
+        if processing_scale != 1:
+            tiled_geometry = scale(tiled_geometry, xfact=processing_scale, yfact=processing_scale, origin=(0, 0))
+        return translate(tiled_geometry, xoff=ulx, yoff=uly)
+
     @metric_scope
     def _refine_features(self, feature_collection, image_info: Dict, metrics: MetricsLogger = None) -> List[geojson.Feature]:
         """
@@ -182,14 +275,19 @@ class TileWorker(Thread):
             features = []
             ulx = image_info["region"][0][1]
             uly = image_info["region"][0][0]
-            if isinstance(feature_collection, dict) and "features" in feature_collection:
+            processing_scale = image_info.get("processing_scale", 1)
+            processing_area = image_info.get("processing_area")
+            if isinstance(feature_collection, DetectionBatch):
+                logger.debug(f"SM Model returned a batch of {len(feature_collection)} detections")
+                features = self._refine_detection_batch(feature_collection, image_info, processing_area)
+            elif isinstance(feature_collection, dict) and "features" in feature_collection:
                 logger.debug(f"SM Model returned {len(feature_collection['features'])} features")
                 for feature in feature_collection["features"]:
                     # Check to see if there is a bbox defined in image coordinates. If so, update it to
                     # use full image coordinates and store the updated value in the feature properties.
                     tiled_image_bbox = self.property_accessor.get_image_bbox(feature)
                     if tiled_image_bbox is not None:
-                        full_image_bbox = translate(tiled_image_bbox, xoff=ulx, yoff=uly)
+                        full_image_bbox = self._to_full_image(tiled_image_bbox, ulx, uly, processing_scale)
                         self.property_accessor.set_image_bbox(feature, full_image_bbox)
 
                     # Check to see if there is a geometry defined in image coordinates. If not and
@@ -206,7 +304,7 @@ class TileWorker(Thread):
                     # If we found an image geometry update it to use full image coordinates and store the
                     # value in the feature properties.
                     if tiled_image_geometry is not None:
-                        full_image_geometry = translate(tiled_image_geometry, xoff=ulx, yoff=uly)
+                        full_image_geometry = self._to_full_image(tiled_image_geometry, ulx, uly, processing_scale)
                         self.property_accessor.set_image_geometry(feature, full_image_geometry)
 
                     feature["properties"]["image_id"] = image_info["image_id"]
@@ -220,6 +318,8 @@ class TileWorker(Thread):
                     TileWorker.convert_deprecated_feature_properties(feature)
 
                     features.append(feature)
+                if processing_area is not None:
+                    features = [feature for feature in features if self._intersects_area(feature, processing_area)]
             logger.debug(f"# Features Created: {len(features)}")
             if len(features) > 0:
                 if self.geolocator is not None:
@@ -230,6 +330,47 @@ class TileWorker(Thread):
 
         return features
 
+    @staticmethod
+    def _refine_detection_batch(
+        batch: DetectionBatch, image_info: Dict, processing_area: Optional[BaseGeometry] = None
+    ) -> List[geojson.Feature]:
+        """
+        Convert a columnar batch of detections into features. The detections are moved to full image coordinates
+        and clipped to the region of interest on the arrays so features are only created for detections that are
+        kept.
+
+        :param batch: the detections from the ML model
+        :param image_info: a description of the image tile containing the detections
+        :param processing_area: the region of interest in (x, y) image coordinates
+        :return: a list of GeoJSON features
+        """
+        ulx = image_info["region"][0][1]
+        uly = image_info["region"][0][0]
+        batch = batch.to_full_image(ulx, uly, image_info.get("processing_scale", 1))
+        if processing_area is not None and len(batch) > 0:
+            batch = batch.select(shapely.intersects(processing_area, batch.geometries()))
+        return batch.to_features(
+            {
+                "image_id": image_info["image_id"],
+                "inferenceTime": datetime.now(tz=timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+            }
+        )
+
+    def _intersects_area(self, feature: geojson.Feature, processing_area: BaseGeometry) -> bool:
+        """
+        Check whether a detection falls inside the region of interest. Detections without an image shape are kept.
+
+        :param feature: the feature with full image coordinates
+        :param processing_area: the region of interest in (x, y) image coordinates
+        :return: True if the detection intersects the region of interest
+        """
+        image_shape = self.property_accessor.get_image_geometry(feature)
+        if image_shape is None:
+            image_shape = self.property_accessor.get_image_bbox(feature)
+        if image_shape is None:
+            return True
+        return processing_area.intersects(image_shape)
+
     @staticmethod
     def convert_deprecated_feature_properties(feature: geojson.Feature) -> None:
         """
@@ -1,4 +1,4 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import ast
 import json
@@ -7,13 +7,14 @@ import tempfile
 from pathlib import Path
 from queue import Queue
 from secrets import token_hex
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from aws_embedded_metrics import MetricsLogger
 from aws_embedded_metrics.metric_scope import metric_scope
 from aws_embedded_metrics.unit import Unit
 from geojson import Feature
 from osgeo import gdal
+from shapely.geometry.base import BaseGeometry
 
 from aws.osml.features import Geolocator, ImagedFeaturePropertyAccessor
 from aws.osml.gdal import GDALConfigEnv
@@ -21,19 +22,33 @@ from aws.osml.image_processing.gdal_tile_factory import GDALTileFactory
 from aws.osml.model_runner.api import RegionRequest
 from aws.osml.model_runner.app_config import MetricLabels, ServiceConfig
 from aws.osml.model_runner.common import (
+    FeatureBatch,
     FeatureDistillationDeserializer,
+    ImageFormats,
     ImageRegion,
     Timer,
     get_credentials_for_assumed_role,
 )
-from aws.osml.model_runner.database import FeatureTable, RegionRequestItem, RegionRequestTable
+from aws.osml.model_runner.database import (
+    EndpointStatisticsTable,
+    FeatureTable,
+    RegionRequestItem,
+    RegionRequestTable,
+)
 from aws.osml.model_runner.inference import Detector, FeatureSelector
 from aws.osml.model_runner.inference.endpoint_factory import FeatureDetectorFactory
 from aws.osml.photogrammetry import ElevationModel, SensorModel
 
+from .buffered_tile_factory import BufferedGDALTileFactory, plan_tile_windows
 from .exceptions import ProcessTilesException, SetupTileWorkersException
+from .feature_collector import FeatureCollector
+from .nodata_tile_filter import NoDataTileFilter
+from .processing_resolution import scale_dimensions
+from .raw_tile_factory import RawTileFactory
+from .region_mask_mosaic import RegionMaskMosaic
+from .tile_read_planner import plan_tile_reads
 from .tile_worker import TileWorker
-from .tiling_strategy import TilingStrategy
+from .tiling_strategy import TilingStrategy, region_polygon
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +57,8 @@ def setup_tile_workers(
     region_request: RegionRequest,
     sensor_model: Optional[SensorModel] = None,
     elevation_model: Optional[ElevationModel] = None,
+    mask_mosaic: Optional[RegionMaskMosaic] = None,
+    feature_collector: Optional[FeatureCollector] = None,
 ) -> Tuple[Queue, List[TileWorker]]:
     """
     Sets up a pool of tile-workers to process image tiles from a region request
@@ -49,6 +66,9 @@ def setup_tile_workers(
     :param region_request: RegionRequest = the region request to update.
     :param sensor_model: Optional[SensorModel] = the sensor model for this raster dataset
     :param elevation_model: Optional[ElevationModel] = an elevation model used to fix the elevation of the image coordinate
+    :param mask_mosaic: Optional[RegionMaskMosaic] = the mosaic the workers add segmentation masks of the region to
+    :param feature_collector: Optional[FeatureCollector] = collects the features in memory instead of the feature
+                              table, the tile states of the region are then not written to the region request table
 
     :return: Tuple[Queue, List[TileWorker] = a list of tile workers and the queue that manages them
     """
@@ -62,15 +82,27 @@ def setup_tile_workers(
         tile_workers = []
 
         for _ in range(int(ServiceConfig.workers)):
-            # Set up our feature table to work with the region quest
-            feature_table = FeatureTable(
-                ServiceConfig.feature_table,
-                region_request.tile_size,
-                region_request.tile_overlap,
-            )
-
-            # Set up our feature table to work with the region quest
-            region_request_table = RegionRequestTable(ServiceConfig.region_request_table)
+            feature_table: Union[FeatureTable, FeatureCollector]
+            region_request_table: Optional[RegionRequestTable]
+            if feature_collector is not None:
+                # The region is processed in memory so the features and tile states stay on this host
+                feature_table = feature_collector
+                region_request_table = None
+            else:
+                # Set up our feature table to work with the region quest
+                feature_table = FeatureTable(
+                    ServiceConfig.feature_table,
+                    region_request.tile_size,
+                    region_request.tile_overlap,
+                )
+
+                # Set up our feature table to work with the region quest
+                region_request_table = RegionRequestTable(ServiceConfig.region_request_table)
+
+            # Share the observed inference latencies with the schedulers if statistics are enabled
+            endpoint_statistics_table = None
+            if ServiceConfig.endpoint_statistics_table:
+                endpoint_statistics_table = EndpointStatisticsTable(ServiceConfig.endpoint_statistics_table)
 
             feature_detector = _get_feature_detector(region_request, model_invocation_credentials)
 
@@ -78,7 +110,15 @@ def setup_tile_workers(
             if sensor_model is not None:
                 geolocator = Geolocator(ImagedFeaturePropertyAccessor(), sensor_model, elevation_model=elevation_model)
 
-            worker = TileWorker(tile_queue, feature_detector, geolocator, feature_table, region_request_table)
+            worker = TileWorker(
+                tile_queue,
+                feature_detector,
+                geolocator,
+                feature_table,
+                region_request_table,
+                endpoint_statistics_table=endpoint_statistics_table,
+                mask_mosaic=mask_mosaic,
+            )
             worker.start()
             tile_workers.append(worker)
 
@@ -114,6 +154,12 @@ def process_tiles(
     tile_workers: List[TileWorker],
     raster_dataset: gdal.Dataset,
     sensor_model: Optional[SensorModel] = None,
+    tile_buffer_bytes: int = 0,
+    read_ahead_tiles: int = 0,
+    nodata_threshold: Optional[float] = None,
+    processing_area: Optional[BaseGeometry] = None,
+    processing_scale: int = 1,
+    reprocess_succeeded_tiles: bool = False,
 ) -> Tuple[int, int]:
     """
     Loads a GDAL dataset into memory and processes it with a pool of tile workers.
@@ -124,6 +170,20 @@ def process_tiles(
     :param tile_workers: List[TileWorker] = the list of tile workers
     :param raster_dataset: gdal.Dataset = the raster dataset containing the region
     :param sensor_model: Optional[SensorModel] = the sensor model for this raster dataset
+    :param tile_buffer_bytes: int = memory ceiling for decoding the region once and cutting tiles from memory,
+                              0 reads every tile from the source image
+    :param read_ahead_tiles: int = number of upcoming tiles GDAL is advised to fetch together when tiles are read
+                             from the source image, 0 disables read-ahead
+    :param nodata_threshold: Optional[float] = tiles with at least this fraction of nodata pixels are skipped and
+                             recorded in the skipped tiles of the region request item, None disables skipping
+    :param processing_area: Optional[BaseGeometry] = the ROI in (x, y) image coordinates, tiles outside it are not
+                            created and detections outside it are dropped
+    :param processing_scale: int = decimation factor the tiles are read at, each tile covers tile_size pixels of
+                             the image at the reduced resolution and detections are mapped back to full image
+                             coordinates
+    :param reprocess_succeeded_tiles: bool = process the tiles that succeeded in an earlier attempt of the region
+                                      again, the segmentation mask of a region is only complete when every tile is
+                                      blended into it
 
     :return: Tuple[int, int, List[ImageRegion]] = number of tiles processed, number of tiles with an error
     """
@@ -142,9 +202,17 @@ def process_tiles(
     # Explicitly cast tile_overlap to Tuple[int, int]
     tile_overlap: Tuple[int, int] = (region_request_item.tile_overlap[0], region_request_item.tile_overlap[1])
 
-    tile_array = tiling_strategy.compute_tiles(region_bounds, tile_size, tile_overlap)
+    # Tiles are laid out in full image pixels, a decimated tile covers processing_scale times as many of them
+    if processing_scale > 1:
+        tile_size = scale_dimensions(tile_size, processing_scale)
+        tile_overlap = scale_dimensions(tile_overlap, processing_scale)
 
-    if region_request_item.succeeded_tiles is not None:
+    if processing_area is not None:
+        tile_array = tiling_strategy.compute_tiles(region_bounds, tile_size, tile_overlap, processing_area=processing_area)
+    else:
+        tile_array = tiling_strategy.compute_tiles(region_bounds, tile_size, tile_overlap)
+
+    if region_request_item.succeeded_tiles is not None and not reprocess_succeeded_tiles:
         # Filter ImageRegions based on matching in succeeded_tiles
         filtered_regions = [
             region
@@ -157,6 +225,7 @@ def process_tiles(
         tile_array = filtered_regions
 
     total_tile_count = len(tile_array)
+    skipped_tiles: List[ImageRegion] = []
     try:
         # This will update the GDAL configuration options to use the security credentials for
         # this request. Any GDAL managed AWS calls (i.e. incrementally fetching pixels from a
@@ -170,46 +239,106 @@ def process_tiles(
             # Use the request and metadata from the raster dataset to create a set of keyword
             # arguments for the gdal.Translate() function. This will configure that function to
             # create image tiles using the format, compression, etc. needed by the CV container.
-            gdal_tile_factory = GDALTileFactory(
-                raster_dataset=raster_dataset,
-                tile_format=region_request_item.tile_format,
-                tile_compression=region_request_item.tile_compression,
-                sensor_model=sensor_model,
-            )
+            # Decode the region, or strips of it, once and cut the overlapping tiles from memory. Decimated
+            # tiles are always read from the source image so GDAL can serve them from its overviews.
+            use_tile_buffer = tile_buffer_bytes > 0 and processing_scale == 1
+            if region_request_item.tile_format == ImageFormats.RAW:
+                # Raw tiles are the decoded pixels so there is no encoder to configure
+                gdal_tile_factory = RawTileFactory(raster_dataset, tile_compression=region_request_item.tile_compression)
+            elif use_tile_buffer:
+                gdal_tile_factory = BufferedGDALTileFactory(
+                    raster_dataset=raster_dataset,
+                    tile_format=region_request_item.tile_format,
+                    tile_compression=region_request_item.tile_compression,
+                    sensor_model=sensor_model,
+                )
+            else:
+                gdal_tile_factory = GDALTileFactory(
+                    raster_dataset=raster_dataset,
+                    tile_format=region_request_item.tile_format,
+                    tile_compression=region_request_item.tile_compression,
+                    sensor_model=sensor_model,
+                )
+            if use_tile_buffer:
+                tile_windows = plan_tile_windows(
+                    tile_array, BufferedGDALTileFactory.bytes_per_pixel(raster_dataset), tile_buffer_bytes
+                )
+            else:
+                tile_windows = [(None, tile_array)]
+
+            nodata_filter = None
+            if nodata_threshold is not None:
+                nodata_filter = NoDataTileFilter(raster_dataset, nodata_threshold)
+                if not nodata_filter.enabled:
+                    nodata_filter = None
 
             # Calculate a set of ML engine sized regions that we need to process for this image
             # and set up a temporary directory to store the temporary files. The entire directory
             # will be deleted at the end of this image's processing
             with tempfile.TemporaryDirectory() as tmp:
-                # Ignoring mypy error - if region_bounds was None the call to validate the
-                # image region request at the start of this function would have failed
-                for tile_bounds in tile_array:
-                    # Create a temp file name for the encoded region
-                    region_image_filename = (
-                        f"{token_hex(16)}-region-{tile_bounds[0][0]}-{tile_bounds[0][1]}-"
-                        f"{tile_bounds[1][0]}-{tile_bounds[1][1]}.{region_request_item.tile_format}"
-                    )
-
-                    # Set a path for the tmp image
-                    tmp_image_path = Path(tmp, region_image_filename)
-
-                    # Generate an encoded tile of the requested image region
-                    absolute_tile_path = _create_tile(gdal_tile_factory, tile_bounds, tmp_image_path)
-                    if not absolute_tile_path:
-                        continue
-
-                    # Put the image info on the tile worker queue allowing each tile to be
-                    # processed in parallel.
-                    image_info = {
-                        "image_path": tmp_image_path,
-                        "region": tile_bounds,
-                        "image_id": region_request_item.image_id,
-                        "job_id": region_request_item.job_id,
-                        "region_id": region_request_item.region_id,
-                    }
-
-                    # Place the image info onto our processing queue
-                    tile_queue.put(image_info)
+                for tile_window, window_tiles in tile_windows:
+                    if tile_window is not None and gdal_tile_factory.load_window(tile_window):
+                        read_ahead = None
+                    else:
+                        # Tiles are read from the source image so walk its internal blocks in storage order
+                        # and let GDAL fetch the blocks for upcoming tiles together
+                        window_tiles, read_ahead = plan_tile_reads(raster_dataset, window_tiles, read_ahead_tiles)
+
+                    # Ignoring mypy error - if region_bounds was None the call to validate the
+                    # image region request at the start of this function would have failed
+                    for tile_index, tile_bounds in enumerate(window_tiles):
+                        if read_ahead is not None:
+                            read_ahead.before_read(tile_index)
+
+                        # Tiles of nodata fill (e.g. collars, masked areas) are not encoded or sent to the model
+                        if nodata_filter is not None and nodata_filter.is_empty(tile_bounds):
+                            skipped_tiles.append(tile_bounds)
+                            continue
+
+                        # Create a temp file name for the encoded region
+                        region_image_filename = (
+                            f"{token_hex(16)}-region-{tile_bounds[0][0]}-{tile_bounds[0][1]}-"
+                            f"{tile_bounds[1][0]}-{tile_bounds[1][1]}.{region_request_item.tile_format}"
+                        )
+
+                        # Set a path for the tmp image
+                        tmp_image_path = Path(tmp, region_image_filename)
+
+                        # Generate an encoded tile of the requested image region
+                        output_size = None
+                        if processing_scale > 1:
+                            output_size = (
+                                -(-tile_bounds[1][0] // processing_scale),
+                                -(-tile_bounds[1][1] // processing_scale),
+                            )
+                        absolute_tile_path = _create_tile(
+                            gdal_tile_factory, tile_bounds, tmp_image_path, output_size=output_size
+                        )
+                        if not absolute_tile_path:
+                            continue
+
+                        # Put the image info on the tile worker queue allowing each tile to be
+                        # processed in parallel.
+                        image_info = {
+                            "image_path": tmp_image_path,
+                            "region": tile_bounds,
+                            "image_id": region_request_item.image_id,
+                            "job_id": region_request_item.job_id,
+                            "region_id": region_request_item.region_id,
+                        }
+
+                        if processing_scale > 1:
+                            image_info["processing_scale"] = processing_scale
+
+                        # Tiles crossing the ROI boundary carry it so detections outside the ROI are dropped
+                        if processing_area is not None and not processing_area.contains(region_polygon(tile_bounds)):
+                            image_info["processing_area"] = processing_area
+
+                        # Place the image info onto our processing queue
+                        tile_queue.put(image_info)
+
+                    if tile_window is not None:
+                        gdal_tile_factory.release_window()
 
                 # Put enough empty messages on the queue to shut down the workers
                 for i in range(len(tile_workers)):
@@ -227,18 +356,29 @@ def process_tiles(
         logger.debug(
             (
                 f"Model Runner Stats Processed {total_tile_count} image tiles for "
-                f"region {region_request_item.region_bounds}. {tile_error_count} tiles failed to process."
+                f"region {region_request_item.region_bounds}. {tile_error_count} tiles failed to process "
+                f"and {len(skipped_tiles)} nodata tiles were skipped."
             )
         )
     except Exception as err:
         logger.exception(f"File processing tiles: {err}")
         raise ProcessTilesException("Failed to process tiles!") from err
 
+    # Record the skipped tiles as their own state so retries and status reporting can account for them
+    region_request_item.skipped_tiles = [[list(tile[0]), list(tile[1])] for tile in skipped_tiles]
+    region_request_item.skipped_tile_count = len(skipped_tiles)
+
     return total_tile_count, tile_error_count
 
 
 @metric_scope
-def _create_tile(gdal_tile_factory, tile_bounds, tmp_image_path, metrics: MetricsLogger = None) -> Optional[str]:
+def _create_tile(
+    gdal_tile_factory,
+    tile_bounds,
+    tmp_image_path,
+    metrics: MetricsLogger = None,
+    output_size: Optional[Tuple[int, int]] = None,
+) -> Optional[str]:
     """
     Create an encoded tile of the requested image region.
 
@@ -246,6 +386,7 @@ def _create_tile(gdal_tile_factory, tile_bounds, tmp_image_path, metrics: Metric
     :param tile_bounds: the requested tile boundary
     :param tmp_image_path: the output location of the tile
     :param metrics: the current metrics scope
+    :param output_size: an optional (width, height) to decimate the tile to, None keeps full resolution
     :return: the resulting tile path or None if the tile could not be created
     """
     if isinstance(metrics, MetricsLogger):
@@ -268,9 +409,11 @@ def _create_tile(gdal_tile_factory, tile_bounds, tmp_image_path, metrics: Metric
         if isinstance(metrics, MetricsLogger):
             metrics.put_metric(MetricLabels.INVOCATIONS, 1, str(Unit.COUNT.value))
 
-        encoded_tile_data = gdal_tile_factory.create_encoded_tile(
-            [tile_bounds[0][1], tile_bounds[0][0], tile_bounds[1][0], tile_bounds[1][1]]
-        )
+        src_window = [tile_bounds[0][1], tile_bounds[0][0], tile_bounds[1][0], tile_bounds[1][1]]
+        if output_size is not None:
+            encoded_tile_data = gdal_tile_factory.create_encoded_tile(src_window, output_size)
+        else:
+            encoded_tile_data = gdal_tile_factory.create_encoded_tile(src_window)
 
         if encoded_tile_data is None:
             logger.error(
@@ -314,13 +457,13 @@ def sizeof_fmt(num: float, suffix: str = "B") -> str:
 
 def select_features(
     feature_distillation_option: str,
-    features: List[Feature],
+    features: Union[List[Feature], FeatureBatch],
     processing_bounds: ImageRegion,
     region_size: str,
     tile_size: str,
     tile_overlap: str,
     tiling_strategy: TilingStrategy,
-) -> List[Feature]:
+) -> Union[List[Feature], FeatureBatch]:
     """
     Selects the desired features using the options in the ImageRequestItem (NMS, SOFT_NMS, etc.).
     This code applies a feature selector only to the features that came from regions of the image
@@ -338,13 +481,14 @@ def select_features(
 
     :param region_size:
     :param feature_distillation_option: str = the options used in selecting features (e.g., NMS/SOFT_NMS, thresholds)
-    :param features: List[Feature] = the list of geojson features to process
+    :param features: Union[List[Feature], FeatureBatch] = the geojson features or the feature batch to process
     :param processing_bounds: the requested area of the image
     :param region_size: str = region size to use for feature dedup
     :param tile_size: str = size of the tiles used during processing
     :param tile_overlap: str = overlap between tiles during processing
     :param tiling_strategy: the tiling strategy to use for feature dedup
-    :return: List[Feature] = the list of geojson features after processing
+    :return: Union[List[Feature], FeatureBatch] = the features after processing, of the same type as the input. The
+             features of a list are returned themselves; those without image bounds are dropped.
     """
     feature_distillation_option_dict = json.loads(feature_distillation_option)
     feature_distillation_option = FeatureDistillationDeserializer().deserialize(feature_distillation_option_dict)
@@ -353,8 +497,13 @@ def select_features(
     region_size = ast.literal_eval(region_size)
     tile_size = ast.literal_eval(tile_size)
     overlap = ast.literal_eval(tile_overlap)
+    # Extract the bounds, scores and classes of all the features in one pass. The overlap groups are then slices of
+    # the batch instead of lists the feature selector has to walk feature by feature.
+    feature_batch = features if isinstance(features, FeatureBatch) else FeatureBatch.from_features(features)
     deduped_features = tiling_strategy.cleanup_duplicate_features(
-        processing_bounds, region_size, tile_size, overlap, features, feature_selector
+        processing_bounds, region_size, tile_size, overlap, feature_batch, feature_selector
     )
 
-    return deduped_features
+    if isinstance(features, FeatureBatch):
+        return deduped_features
+    return [features[i] for i in deduped_features.source_indices.tolist()]
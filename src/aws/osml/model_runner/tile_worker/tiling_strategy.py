@@ -1,11 +1,15 @@
-#  Copyright 2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2024-2026 Amazon.com, Inc. or its affiliates.
 
 from abc import ABC, abstractmethod
-from typing import List
+from itertools import chain
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
+import shapely
 from geojson import Feature
+from shapely.geometry.base import BaseGeometry
 
-from ..common import ImageDimensions, ImageRegion
+from ..common import FeatureBatch, ImageDimensions, ImageRegion
 from ..inference import FeatureSelector
 
 
@@ -22,6 +26,7 @@ class TilingStrategy(ABC):
         region_size: ImageDimensions,
         tile_size: ImageDimensions,
         overlap: ImageDimensions,
+        processing_area: Optional[BaseGeometry] = None,
     ) -> List[ImageRegion]:
         """
         Identify the regions that should be created from this image.
@@ -30,18 +35,28 @@ class TilingStrategy(ABC):
         :param region_size: the size of the regions in pixels (w, h)
         :param tile_size: the size of the tiles in pixels (w, y)
         :param overlap: the amount of overlap (w, h)
+        :param processing_area: optional area of interest in (x, y) image coordinates, regions that do not
+                                intersect it are not created
 
         :return: a collection of region boundaries
         """
 
     @abstractmethod
-    def compute_tiles(self, region: ImageRegion, tile_size: ImageDimensions, overlap: ImageDimensions) -> List[ImageRegion]:
+    def compute_tiles(
+        self,
+        region: ImageRegion,
+        tile_size: ImageDimensions,
+        overlap: ImageDimensions,
+        processing_area: Optional[BaseGeometry] = None,
+    ) -> List[ImageRegion]:
         """
         Identify the tiles that should be created from this region.
 
         :param region: the bounds of the region in pixels ((r, c), (w, h))
         :param tile_size: the size of the tiles in pixels (w, h)
         :param overlap: the amount of overlap (w, h)
+        :param processing_area: optional area of interest in (x, y) image coordinates, tiles that do not
+                                intersect it are not created
 
         :return: a collection of tile boundaries
         """
@@ -53,9 +68,9 @@ class TilingStrategy(ABC):
         region_size: ImageDimensions,
         tile_size: ImageDimensions,
         overlap: ImageDimensions,
-        features: List[Feature],
+        features: Union[List[Feature], FeatureBatch],
         feature_selector: FeatureSelector,
-    ) -> List[Feature]:
+    ) -> Union[List[Feature], FeatureBatch]:
         """
         This method handles cleaning up duplicates caused by tiling by applying the feature selector to any features
         that come from overlap regions.
@@ -64,10 +79,10 @@ class TilingStrategy(ABC):
         :param region_size: the size of the regions in pixels (w, h)
         :param tile_size: the size of the tiles in pixels (w, y)
         :param overlap: the amount of overlap (w, h)
-        :param features: the collection of features to deduplicate
+        :param features: the collection of features to deduplicate, a list of features or a feature batch
         :param feature_selector: the algorithm that will be used to resolve duplicates
 
-        :return: the collection of features with duplicates removed
+        :return: the collection of features with duplicates removed, of the same type as the input
         """
 
 
@@ -114,6 +129,107 @@ def generate_crops(
     return crops
 
 
+def region_polygon(region: ImageRegion) -> BaseGeometry:
+    """
+    Create a polygon in (x, y) image coordinates covering a region.
+
+    :param region: a tuple for the bounding box of the region ((ul_r, ul_c), (width, height))
+
+    :return: the polygon for the region
+    """
+    return shapely.box(region[0][1], region[0][0], region[0][1] + region[1][0], region[0][0] + region[1][1])
+
+
+def filter_regions_by_area(regions: List[ImageRegion], processing_area: Optional[BaseGeometry]) -> List[ImageRegion]:
+    """
+    Remove the regions (or tiles) that do not intersect an area of interest. Regions that only touch the area
+    along an edge are removed since they contain none of its pixels.
+
+    :param regions: the regions as ((ul_r, ul_c), (width, height))
+    :param processing_area: the area of interest in (x, y) image coordinates, None keeps every region
+
+    :return: the regions that overlap the area
+    """
+    if processing_area is None:
+        return regions
+    shapely.prepare(processing_area)
+    kept_regions = []
+    for region in regions:
+        polygon = region_polygon(region)
+        if processing_area.intersects(polygon) and not processing_area.touches(polygon):
+            kept_regions.append(region)
+    return kept_regions
+
+
+def identify_batch_overlaps(
+    feature_batch: FeatureBatch, shape: Tuple[int, int], overlap: Tuple[int, int], origin: Tuple[int, int] = (0, 0)
+) -> np.ndarray:
+    """
+    Generate the min and max indexes of adjacent tiles or regions for every feature of a batch at once. This is the
+    columnar equivalent of the _identify_overlap methods of the tiling strategies.
+
+    :param feature_batch: the features to locate
+    :param shape: the width, height of the area in pixels
+    :param overlap: the x, y overlap between areas in pixels
+    :param origin: the x, y coordinate of the area in relation to the full image
+
+    :return: a (N, 4) array of minx, maxx, miny, maxy indexes that identifies any overlap
+    """
+    # If an offset origin was supplied adjust the bbox so the key is relative to the origin.
+    bboxes = feature_batch.image_bboxes - np.array([origin[0], origin[1], origin[0], origin[1]], dtype=np.float64)
+    stride = np.array([shape[0] - overlap[0], shape[1] - overlap[1]], dtype=np.int64)
+
+    max_indexes = np.trunc(bboxes[:, 2:] / stride).astype(np.int64)
+    min_indexes = np.trunc(bboxes[:, :2] / stride).astype(np.int64)
+    min_offsets = np.mod(np.trunc(bboxes[:, :2]).astype(np.int64), stride)
+    min_indexes -= ((min_offsets < np.array(overlap)) & (min_indexes > 0)).astype(np.int64)
+
+    return np.stack([min_indexes[:, 0], max_indexes[:, 0], min_indexes[:, 1], max_indexes[:, 1]], axis=1)
+
+
+def group_feature_batch_by_overlap(
+    feature_batch: FeatureBatch, shape: Tuple[int, int], overlap: Tuple[int, int], origin: Tuple[int, int] = (0, 0)
+) -> Dict[Tuple[int, int, int, int], FeatureBatch]:
+    """
+    Group the features of a batch by the overlap region they fall in. Groups are ordered by the first feature in
+    them and keep the order of their features, like the grouping of feature lists.
+
+    :param feature_batch: the features to group
+    :param shape: the width, height of the area in pixels
+    :param overlap: the x, y overlap between areas in pixels
+    :param origin: the x, y coordinate of the area in relation to the full image
+
+    :return: a mapping of overlap id to a batch of the features that intersect that overlap region
+    """
+    if len(feature_batch) == 0:
+        return {}
+    overlap_keys = identify_batch_overlaps(feature_batch, shape, overlap, origin)
+    unique_keys, first_indexes, inverse = np.unique(overlap_keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    sorted_indexes = np.argsort(inverse, kind="stable")
+    group_indexes = np.split(sorted_indexes, np.cumsum(np.bincount(inverse, minlength=len(unique_keys)))[:-1])
+    return {
+        tuple(unique_keys[group].tolist()): feature_batch.select(group_indexes[group])
+        for group in np.argsort(first_indexes, kind="stable").tolist()
+    }
+
+
+def combine_feature_groups(
+    groups: Sequence[Union[List[Feature], FeatureBatch]], features: Union[List[Feature], FeatureBatch]
+) -> Union[List[Feature], FeatureBatch]:
+    """
+    Combine groups of features back into a single collection of the same type as the collection they came from.
+
+    :param groups: the groups of features
+    :param features: the collection the groups were taken from
+
+    :return: a list of features or a feature batch
+    """
+    if isinstance(features, FeatureBatch):
+        return FeatureBatch.concatenate(groups) if groups else features.select([])
+    return list(chain.from_iterable(groups))
+
+
 def ceildiv(a: int, b: int) -> int:
     """
     Integer ceiling division
@@ -1,15 +1,15 @@
-#  Copyright 2023-2025 Amazon.com, Inc. or its affiliates.
+#  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import shapely.geometry.base
 
-from aws.osml.gdal import GDALConfigEnv, load_gdal_dataset
+from aws.osml.gdal import GDALConfigEnv, get_image_extension, load_gdal_dataset
 from aws.osml.model_runner.api import get_image_path
-from aws.osml.model_runner.common import ImageDimensions, ImageRegion, get_credentials_for_assumed_role
+from aws.osml.model_runner.common import ImageDimensions, ImageRegion, RegionPlan, get_credentials_for_assumed_role
 from aws.osml.model_runner.exceptions import LoadImageException
-from aws.osml.model_runner.inference import calculate_processing_bounds
+from aws.osml.model_runner.inference import calculate_processing_area, calculate_processing_bounds
 
 from .region_calculator import RegionCalculator
 from .tiling_strategy import TilingStrategy
@@ -27,6 +27,7 @@ class ToolkitRegionCalculator(RegionCalculator):
     - Loads sensor models when available
     - Calculates processing bounds with ROI
     - Uses TilingStrategy to compute regions
+    - Counts the tiles in each region and records the image metadata as a RegionPlan
     """
 
     def __init__(self, tiling_strategy: TilingStrategy, region_size: ImageDimensions):
@@ -65,14 +66,46 @@ class ToolkitRegionCalculator(RegionCalculator):
         :return: List of regions (each region is a tuple of ((row, col), (width, height)))
         :raises LoadImageException: If image cannot be read or processed
         """
-        try:
-            # Load image and calculate processing bounds
-            processing_bounds = self._load_image_and_calculate_bounds(image_url, roi, image_read_role)
+        return self.calculate_region_plan(image_url, tile_size, tile_overlap, roi, image_read_role).regions
 
-            # Compute regions using the tiling strategy
-            regions = self._compute_regions(processing_bounds, tile_size, tile_overlap)
+    def calculate_region_plan(
+        self,
+        image_url: str,
+        tile_size: ImageDimensions,
+        tile_overlap: ImageDimensions,
+        roi: Optional[shapely.geometry.base.BaseGeometry] = None,
+        image_read_role: Optional[str] = None,
+    ) -> RegionPlan:
+        """
+        Calculate the regions for an image along with the tile count of each region and the image metadata
+        read from the header.
 
-            return regions
+        :param image_url: URL or path to the image
+        :param tile_size: Size of tiles in pixels
+        :param tile_overlap: Overlap between tiles in pixels
+        :param roi: Optional region of interest to restrict processing
+        :param image_read_role: Optional IAM role ARN for accessing the image
+        :return: The region plan
+        :raises LoadImageException: If image cannot be read or processed
+        """
+        try:
+            # Load image and calculate processing bounds
+            processing_bounds, processing_area, image_plan = self._load_image_and_calculate_bounds(
+                image_url, roi, image_read_role
+            )
+
+            # Compute regions using the tiling strategy, regions and tiles outside a polygon ROI are not created
+            regions = self._compute_regions(processing_bounds, tile_size, tile_overlap, processing_area=processing_area)
+
+            image_plan.regions = regions
+            image_plan.tile_counts = [
+                len(self.tiling_strategy.compute_tiles(region, tile_size, tile_overlap, processing_area=processing_area))
+                for region in regions
+            ]
+            image_plan.region_size = self.region_size
+            image_plan.tile_size = tile_size
+            image_plan.tile_overlap = tile_overlap
+            return image_plan
 
         except Exception as err:
             logger.error(f"Failed to calculate regions for image {image_url}: {err}")
@@ -83,7 +116,7 @@ class ToolkitRegionCalculator(RegionCalculator):
         image_url: str,
         roi: Optional[shapely.geometry.base.BaseGeometry],
         image_read_role: Optional[str],
-    ) -> ImageRegion:
+    ) -> Tuple[ImageRegion, Optional[shapely.geometry.base.BaseGeometry], RegionPlan]:
         """
         Load image and calculate processing bounds.
 
@@ -99,7 +132,8 @@ class ToolkitRegionCalculator(RegionCalculator):
         :param image_url: URL or path to the image
         :param roi: Optional region of interest to restrict processing
         :param image_read_role: Optional IAM role ARN for accessing the image
-        :return: Processing bounds as ImageRegion ((row, col), (width, height))
+        :return: Processing bounds as ImageRegion ((row, col), (width, height)), the ROI in (x, y) image
+                 coordinates (None without an ROI) and a RegionPlan holding the bounds and the image metadata
         :raises LoadImageException: If image cannot be loaded or bounds cannot be calculated
         """
         # If this request contains an execution role retrieve credentials that will be used to access data
@@ -125,13 +159,41 @@ class ToolkitRegionCalculator(RegionCalculator):
             if not processing_bounds:
                 logger.warning(f"Requested ROI does not intersect image {image_url}. Nothing to do")
                 raise LoadImageException("Failed to create processing bounds for image!")
+            processing_area = calculate_processing_area(raster_dataset, roi, sensor_model)
 
-            # Return only the processing bounds; dataset and sensor_model will be garbage collected
+            # Return only the processing bounds and metadata; dataset and sensor_model will be garbage collected
             # when this method exits, freeing GDAL resources
-            return processing_bounds
+            driver = raster_dataset.GetDriver()
+            image_plan = RegionPlan(
+                processing_bounds=processing_bounds,
+                image_width=int(raster_dataset.RasterXSize),
+                image_height=int(raster_dataset.RasterYSize),
+                image_format=str(driver.ShortName).upper() if driver else None,
+                image_extension=self._get_image_extension(image_path),
+            )
+            return processing_bounds, processing_area, image_plan
+
+    @staticmethod
+    def _get_image_extension(image_path: str) -> Optional[str]:
+        """
+        Look up the extension of an image. The extension is only recorded in the plan so failures are not fatal;
+        the image handler looks it up again when it is missing.
+
+        :param image_path: The GDAL path of the image
+        :return: The image extension or None if it could not be determined
+        """
+        try:
+            return get_image_extension(image_path)
+        except Exception as err:
+            logger.debug(f"Unable to determine the extension of image {image_path}: {err}")
+            return None
 
     def _compute_regions(
-        self, processing_bounds: ImageRegion, tile_size: ImageDimensions, tile_overlap: ImageDimensions
+        self,
+        processing_bounds: ImageRegion,
+        tile_size: ImageDimensions,
+        tile_overlap: ImageDimensions,
+        processing_area: Optional[shapely.geometry.base.BaseGeometry] = None,
     ) -> List[ImageRegion]:
         """
         Use TilingStrategy to compute the regions.
@@ -139,7 +201,9 @@ class ToolkitRegionCalculator(RegionCalculator):
         :param processing_bounds: The bounds of the area to process
         :param tile_size: Size of tiles in pixels
         :param tile_overlap: Overlap between tiles in pixels
+        :param processing_area: Optional ROI in (x, y) image coordinates, regions outside it are not created
         :return: List of regions
         """
-        regions = self.tiling_strategy.compute_regions(processing_bounds, self.region_size, tile_size, tile_overlap)
-        return regions
+        return self.tiling_strategy.compute_regions(
+            processing_bounds, self.region_size, tile_size, tile_overlap, processing_area=processing_area
+        )
@@ -1,13 +1,20 @@
-#  Copyright 2024 Amazon.com, Inc. or its affiliates.
+#  Copyright 2024-2026 Amazon.com, Inc. or its affiliates.
 
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from geojson import Feature
+from shapely.geometry.base import BaseGeometry
 
-from ..common import ImageDimensions, ImageRegion, get_feature_image_bounds
+from ..common import FeatureBatch, ImageDimensions, ImageRegion, get_feature_image_bounds
 from ..inference import FeatureSelector
-from .tiling_strategy import TilingStrategy, generate_crops
+from .tiling_strategy import (
+    TilingStrategy,
+    combine_feature_groups,
+    filter_regions_by_area,
+    generate_crops,
+    group_feature_batch_by_overlap,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,7 @@ class VariableTileTilingStrategy(TilingStrategy):
         region_size: ImageDimensions,
         tile_size: ImageDimensions,
         overlap: ImageDimensions,
+        processing_area: Optional[BaseGeometry] = None,
     ) -> List[ImageRegion]:
         """
         Identify the regions that should be created from this image.
@@ -27,22 +35,34 @@ class VariableTileTilingStrategy(TilingStrategy):
         :param region_size: the size of the regions in pixels (w, h)
         :param tile_size: the size of the tiles in pixels (w, y)
         :param overlap: the amount of overlap (w, h)
+        :param processing_area: optional area of interest in (x, y) image coordinates, regions that do not
+                                intersect it are not created
 
         :return: a collection of region boundaries
         """
-        return generate_crops(processing_bounds, region_size, overlap, only_full_tiles=False)
+        regions = generate_crops(processing_bounds, region_size, overlap, only_full_tiles=False)
+        return filter_regions_by_area(regions, processing_area)
 
-    def compute_tiles(self, region: ImageRegion, tile_size: ImageDimensions, overlap: ImageDimensions) -> List[ImageRegion]:
+    def compute_tiles(
+        self,
+        region: ImageRegion,
+        tile_size: ImageDimensions,
+        overlap: ImageDimensions,
+        processing_area: Optional[BaseGeometry] = None,
+    ) -> List[ImageRegion]:
         """
         Identify the tiles that should be created from this region.
 
         :param region: the bounds of the region in pixels ((r, c), (w, h))
         :param tile_size: the size of the tiles in pixels (w, h)
         :param overlap: the amount of overlap (w, h)
+        :param processing_area: optional area of interest in (x, y) image coordinates, tiles that do not
+                                intersect it are not created
 
         :return: a collection of tile boundaries
         """
-        return generate_crops(region, tile_size, overlap, only_full_tiles=False)
+        tiles = generate_crops(region, tile_size, overlap, only_full_tiles=False)
+        return filter_regions_by_area(tiles, processing_area)
 
     def cleanup_duplicate_features(
         self,
@@ -50,9 +70,9 @@ class VariableTileTilingStrategy(TilingStrategy):
         region_size: ImageDimensions,
         tile_size: ImageDimensions,
         overlap: ImageDimensions,
-        features: List[Feature],
+        features: Union[List[Feature], FeatureBatch],
         feature_selector: FeatureSelector,
-    ) -> List[Feature]:
+    ) -> Union[List[Feature], FeatureBatch]:
         """
         This method handles cleaning up duplicates caused by tiling by applying the feature selector to any features
         that come from overlap regions.
@@ -61,15 +81,15 @@ class VariableTileTilingStrategy(TilingStrategy):
         :param region_size: the size of the regions in pixels (w, h)
         :param tile_size: the size of the tiles in pixels (w, y)
         :param overlap: the amount of overlap (w, h)
-        :param features: the collection of features to deduplicate
+        :param features: the collection of features to deduplicate, a list of features or a feature batch
         :param feature_selector: the algorithm that will be used to resolve duplicates
 
-        :return: the collection of features with duplicates removed
+        :return: the collection of features with duplicates removed, of the same type as the input
         """
         logger.debug("FeatureSelection: Starting overlap-aware deduplication of features.")
 
         total_skipped = 0
-        deduped_features = []
+        deduped_groups = []
         features_grouped_by_region = self._group_features_by_overlap(features, region_size, overlap)
         for region_key, region_features in features_grouped_by_region.items():
             region_stride = (region_size[0] - overlap[0], region_size[1] - overlap[1])
@@ -77,7 +97,7 @@ class VariableTileTilingStrategy(TilingStrategy):
 
             if region_key[0] != region_key[1] or region_key[2] != region_key[3]:
                 # The Group contains contributions from multiple regions, run selection on the entire group
-                deduped_features.extend(feature_selector.select_features(region_features))
+                deduped_groups.append(feature_selector.select_features(region_features))
             else:
                 # Not an overlap between regions group these features using tile size to identify overlaps
                 features_grouped_by_tile = self._group_features_by_overlap(
@@ -87,18 +107,18 @@ class VariableTileTilingStrategy(TilingStrategy):
                 for tile_key, tile_features in features_grouped_by_tile.items():
                     if tile_key[0] != tile_key[1] or tile_key[2] != tile_key[3]:
                         # Group contains contributions from multiple tiles, run selection
-                        deduped_features.extend(feature_selector.select_features(tile_features))
+                        deduped_groups.append(feature_selector.select_features(tile_features))
                     else:
                         # No overlap between tiles, features can be added directly to the result
                         total_skipped += len(tile_features)
-                        deduped_features.extend(tile_features)
+                        deduped_groups.append(tile_features)
 
         logger.debug(
             f"FeatureSelection: Skipped processing of {total_skipped} of {len(features)} features. "
             "They were not inside an overlap region."
         )
 
-        return deduped_features
+        return combine_feature_groups(deduped_groups, features)
 
     @staticmethod
     def _identify_overlap(
@@ -140,18 +160,23 @@ class VariableTileTilingStrategy(TilingStrategy):
 
     @staticmethod
     def _group_features_by_overlap(
-        features: List[Feature], shape: Tuple[int, int], overlap: Tuple[int, int], origin: Tuple[int, int] = (0, 0)
-    ) -> Dict[Tuple[int, int, int, int], List[Feature]]:
+        features: Union[List[Feature], FeatureBatch],
+        shape: Tuple[int, int],
+        overlap: Tuple[int, int],
+        origin: Tuple[int, int] = (0, 0),
+    ) -> Dict[Tuple[int, int, int, int], Union[List[Feature], FeatureBatch]]:
         """
         Group all the feature items by tile id
 
-        :param features: List[FeatureItem] = the list of feature items
+        :param features: List[FeatureItem] = the list of feature items, or a feature batch that is grouped into batches
         :param shape: the width, height of the area in pixels
         :param overlap: the x, y overlap between areas in pixels
         :param origin: the x, y coordinate of the area in relation to the full image
 
         :return: a mapping of overlap id to a list of features that intersect that overlap region
         """
+        if isinstance(features, FeatureBatch):
+            return group_feature_batch_by_overlap(features, shape, overlap, origin)
         grouped_features: Dict[Tuple[int, int, int, int], List[Feature]] = {}
         for feature in features:
             overlap_key = VariableTileTilingStrategy._identify_overlap(feature, shape, overlap, origin)
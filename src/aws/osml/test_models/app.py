@@ -7,11 +7,12 @@ from flask import Response, request
 
 from aws.osml.test_models import build_flask_app, build_logger, setup_server
 from aws.osml.test_models.centerpoint import app as centerpoint_app
+from aws.osml.test_models.echo import app as echo_app
 from aws.osml.test_models.failure import app as failure_app
 from aws.osml.test_models.flood import app as flood_app
 from aws.osml.test_models.server_utils import parse_custom_attributes
 
-SUPPORTED_MODELS = ("centerpoint", "flood", "failure")
+SUPPORTED_MODELS = ("centerpoint", "flood", "failure", "echo")
 MODEL_SELECTION_ENV = "DEFAULT_MODEL_SELECTION"
 CUSTOM_ATTR_KEY = "model_selection"
 
@@ -25,6 +26,7 @@ MODEL_HANDLERS: Dict[str, Callable[[bytes], Response]] = {
     "centerpoint": centerpoint_app.predict_from_bytes,
     "flood": flood_app.predict_from_bytes,
     "failure": failure_app.predict_from_bytes,
+    "echo": echo_app.predict_from_bytes,
 }
 
 
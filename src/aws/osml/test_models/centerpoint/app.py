@@ -13,6 +13,7 @@ from aws.osml.test_models.server_utils import (
     build_flask_app,
     build_logger,
     detect_to_feature,
+    read_raw_tile_header,
     setup_server,
     simulate_model_latency,
 )
@@ -117,6 +118,15 @@ def predict_from_bytes(payload: bytes) -> Response:
     # Simulate model latency if custom attributes are provided
     simulate_model_latency()
 
+    # Raw array tiles describe their size in the header so they do not need to be decoded
+    try:
+        raw_tile_header = read_raw_tile_header(payload)
+    except ValueError:
+        return Response(response="Unable to parse image from request!", status=400)
+    if raw_tile_header is not None:
+        _, height, width = raw_tile_header["shape"]
+        return Response(response=json.dumps(gen_center_detect(width, height, BBOX_PERCENTAGE)), status=200)
+
     temp_ds_name = "/vsimem/" + token_hex(16)
     gdal_dataset = None
     try:
@@ -0,0 +1 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
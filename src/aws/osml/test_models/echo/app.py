@@ -0,0 +1,110 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import json
+import os
+from functools import lru_cache
+
+from flask import Response, request
+
+from aws.osml.test_models.server_utils import (
+    build_flask_app,
+    build_logger,
+    detect_to_feature,
+    parse_custom_attributes,
+    setup_server,
+    simulate_model_latency,
+)
+
+# Create logger instance
+logger = build_logger()
+
+# Create our default flask app
+app = build_flask_app(logger)
+
+# Optional ENV configurations
+ECHO_FEATURE_COUNT = int(os.environ.get("ECHO_FEATURE_COUNT", 10))
+# Detections are placed on a grid inside this many pixels of the tile origin so they fit in any tile
+ECHO_EXTENT = int(os.environ.get("ECHO_EXTENT", 256))
+# Size of the detections in pixels
+ECHO_OBJECT_SIZE = 8
+
+
+@lru_cache(maxsize=32)
+def build_echo_response(feature_count: int) -> bytes:
+    """
+    Create the GeoJSON response with a number of detections. The response is built once for each feature count and
+    returned for every request, so serving a request does no work beyond copying the payload to the socket.
+
+    :param feature_count: The number of detections in the response.
+    :return: The encoded GeoJSON FeatureCollection
+    """
+    columns = max(1, ECHO_EXTENT // ECHO_OBJECT_SIZE)
+    features = []
+    for index in range(feature_count):
+        x = (index % columns) * ECHO_OBJECT_SIZE
+        y = (index // columns % columns) * ECHO_OBJECT_SIZE
+        features.append(
+            detect_to_feature([x, y, x + ECHO_OBJECT_SIZE, y + ECHO_OBJECT_SIZE], detection_score=1.0, model_name="echo")
+        )
+    return json.dumps({"type": "FeatureCollection", "features": features}).encode("utf-8")
+
+
+def resolve_feature_count(default_count: int) -> int:
+    """
+    Resolve per-request feature count from CustomAttributes if provided.
+
+    :param default_count: Default feature count from environment
+    :return: Feature count to use for this request
+    """
+    attributes = parse_custom_attributes()
+    if "echo_feature_count" not in attributes:
+        return default_count
+
+    try:
+        return max(0, int(attributes["echo_feature_count"]))
+    except (ValueError, TypeError):
+        return default_count
+
+
+@app.route("/ping", methods=["GET"])
+def healthcheck() -> Response:
+    """
+    This is a health check that will always pass since this is a stub model.
+
+    :return: Response: Status code (200) indicates all is well
+    """
+    app.logger.debug("Responding to health check")
+    return Response(response="\n", status=200)
+
+
+def predict_from_bytes(payload: bytes) -> Response:
+    """
+    Invoke the echo model using a provided payload. The payload is not decoded, the model waits for the simulated
+    latency and returns a prebuilt response with the requested number of detections. It is a stand-in for load
+    tests where the cost of the model server should not limit the throughput of ModelRunner.
+
+    :return: Response: Contains the GeoJSON results
+    """
+    app.logger.debug("Invoking echo model endpoint")
+
+    # Simulate model latency if custom attributes or the environment provide one
+    simulate_model_latency()
+
+    return Response(response=build_echo_response(resolve_feature_count(ECHO_FEATURE_COUNT)), status=200)
+
+
+@app.route("/invocations", methods=["POST"])
+def predict() -> Response:
+    """
+    This is the model invocation endpoint for the model container's REST
+    API. This is a stub implementation that returns the same detections for
+    every request without reading the image.
+
+    :return: Response: Contains the GeoJSON results
+    """
+    return predict_from_bytes(request.get_data())
+
+
+# pragma: no cover
+if __name__ == "__main__":
+    setup_server(app)
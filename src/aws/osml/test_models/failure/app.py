@@ -12,6 +12,7 @@ from osgeo import gdal
 from aws.osml.test_models.server_utils import (
     build_flask_app,
     build_logger,
+    decode_raw_tile,
     detect_to_feature,
     setup_server,
 )
@@ -130,15 +131,18 @@ def predict_from_bytes(payload: bytes) -> Response:
     gdal_dataset = None
 
     try:
-        # Load image from request
-        gdal.FileFromMemBuffer(temp_ds_name, payload)
-        gdal_dataset = gdal.Open(temp_ds_name)
-
-        if gdal_dataset is None:
-            raise RuntimeError("Failed to open image")
-
-        # Read image as array
-        image_array = gdal_dataset.ReadAsArray()
+        # Raw array tiles are already the pixels, encoded images are read with GDAL
+        image_array = decode_raw_tile(payload)
+        if image_array is None:
+            # Load image from request
+            gdal.FileFromMemBuffer(temp_ds_name, payload)
+            gdal_dataset = gdal.Open(temp_ds_name)
+
+            if gdal_dataset is None:
+                raise RuntimeError("Failed to open image")
+
+            # Read image as array
+            image_array = gdal_dataset.ReadAsArray()
 
         # Get dominant color
         dominant_color = get_dominant_color(image_array)
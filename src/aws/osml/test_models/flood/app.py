@@ -4,18 +4,24 @@ import json
 import math
 import os
 import random
+from functools import lru_cache
 from random import randrange
 from secrets import token_hex
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 
+import numpy as np
 from flask import Response, request
 from osgeo import gdal
 
 from aws.osml.test_models.server_utils import (
+    SEGMENTATION_MASK_MEDIA_TYPE,
+    accepts_segmentation_mask,
     build_flask_app,
     build_logger,
     detect_to_feature,
+    encode_segmentation_mask,
     parse_custom_attributes,
+    read_raw_tile_header,
     setup_server,
     simulate_model_latency,
 )
@@ -33,6 +39,9 @@ app = build_flask_app(logger)
 BBOX_PERCENTAGE = float(os.environ.get("BBOX_PERCENTAGE", 0.1))
 FLOOD_VOLUME = int(os.environ.get("FLOOD_VOLUME", 100))
 ENABLE_SEGMENTATION = os.environ.get("ENABLE_SEGMENTATION", "False").lower() == "true"
+# Number of responses generated ahead of time for each tile size and volume. When set, each request returns one of
+# these templates instead of generating its detections, so the model is not the bottleneck of load tests.
+FLOOD_TEMPLATE_COUNT = int(os.environ.get("FLOOD_TEMPLATE_COUNT", 0))
 
 
 def gen_flood_detects(height: int, width: int, bbox_percentage: float, volume: int) -> Dict[str, Union[str, list]]:
@@ -79,6 +88,70 @@ def gen_flood_detects(height: int, width: int, bbox_percentage: float, volume: i
     return geojson_feature_collection_dict
 
 
+def gen_flood_mask(height: int, width: int, bbox_percentage: float, volume: int) -> np.ndarray:
+    """
+    Generate a segmentation mask of random rectangular objects within the input image. Each object is filled with
+    a random confidence, the highest confidence is kept where objects overlap.
+
+    :param height: Height of the image tile.
+    :param width: Width of the image tile.
+    :param bbox_percentage: The size of the objects to produce.
+    :param volume: The number of objects to produce.
+    :return: The (height, width) 8-bit confidence mask
+    """
+    mask = np.zeros((height, width), dtype=np.uint8)
+    object_width, object_height = math.ceil(width * bbox_percentage), math.ceil(height * bbox_percentage)
+    for _ in range(volume):
+        gen_x = randrange(object_width, max(object_width + 1, width - object_width))
+        gen_y = randrange(object_height, max(object_height + 1, height - object_height))
+        window = mask[gen_y - object_height : gen_y + object_height, gen_x - object_width : gen_x + object_width]
+        np.maximum(window, random.randint(1, 255), out=window)
+    return mask
+
+
+@lru_cache(maxsize=64)
+def get_flood_templates(height: int, width: int, volume: int, segmentation_mask: bool) -> Tuple[bytes, ...]:
+    """
+    Generate the encoded responses returned for tiles of a size when templates are enabled.
+
+    :param height: Height of the image tile.
+    :param width: Width of the image tile.
+    :param volume: The number of objects in each response.
+    :param segmentation_mask: Whether the responses are segmentation masks instead of GeoJSON.
+    :return: FLOOD_TEMPLATE_COUNT encoded responses
+    """
+    if segmentation_mask:
+        return tuple(
+            encode_segmentation_mask(gen_flood_mask(height, width, BBOX_PERCENTAGE, volume))
+            for _ in range(FLOOD_TEMPLATE_COUNT)
+        )
+    return tuple(
+        json.dumps(gen_flood_detects(height, width, BBOX_PERCENTAGE, volume)).encode("utf-8")
+        for _ in range(FLOOD_TEMPLATE_COUNT)
+    )
+
+
+def flood_response(height: int, width: int) -> Response:
+    """
+    Create the response for a tile, a segmentation mask if the request Accepts one and GeoJSON features otherwise.
+
+    :param height: Height of the image tile.
+    :param width: Width of the image tile.
+    :return: Response: Contains the mask or the GeoJSON results
+    """
+    flood_volume = resolve_flood_volume(FLOOD_VOLUME)
+    segmentation_mask = accepts_segmentation_mask()
+    mimetype = SEGMENTATION_MASK_MEDIA_TYPE if segmentation_mask else None
+    if FLOOD_TEMPLATE_COUNT > 0:
+        templates = get_flood_templates(height, width, flood_volume, segmentation_mask)
+        return Response(response=random.choice(templates), status=200, mimetype=mimetype)
+    if segmentation_mask:
+        mask = gen_flood_mask(height, width, BBOX_PERCENTAGE, flood_volume)
+        return Response(response=encode_segmentation_mask(mask), status=200, mimetype=mimetype)
+    geojson_detects = gen_flood_detects(height, width, BBOX_PERCENTAGE, flood_volume)
+    return Response(response=json.dumps(geojson_detects), status=200)
+
+
 @app.route("/ping", methods=["GET"])
 def healthcheck() -> Response:
     """
@@ -118,6 +191,15 @@ def predict_from_bytes(payload: bytes) -> Response:
     # Simulate model latency if custom attributes are provided
     simulate_model_latency()
 
+    # Raw array tiles describe their size in the header so they do not need to be decoded
+    try:
+        raw_tile_header = read_raw_tile_header(payload)
+    except ValueError:
+        return Response(response="Unable to parse image from request!", status=400)
+    if raw_tile_header is not None:
+        _, height, width = raw_tile_header["shape"]
+        return flood_response(height, width)
+
     temp_ds_name = "/vsimem/" + token_hex(16)
     gdal_dataset = None
     try:
@@ -130,17 +212,8 @@ def predict_from_bytes(payload: bytes) -> Response:
         except RuntimeError:
             return Response(response="Unable to parse image from request!", status=400)
 
-        # generate random flood detections
-        flood_volume = resolve_flood_volume(FLOOD_VOLUME)
-        geojson_detects = gen_flood_detects(
-            gdal_dataset.RasterXSize,
-            gdal_dataset.RasterYSize,
-            BBOX_PERCENTAGE,
-            flood_volume,
-        )
-
-        # send back the detections
-        return Response(response=json.dumps(geojson_detects), status=200)
+        # generate random flood detections and send them back
+        return flood_response(gdal_dataset.RasterYSize, gdal_dataset.RasterXSize)
 
     except Exception as err:
         app.logger.warning("Image could not be processed by the test model server.", exc_info=True)
@@ -1,20 +1,41 @@
 #  Copyright 2023-2026 Amazon.com, Inc. or its affiliates.
 
+import json
 import logging
+import math
+import multiprocessing
 import os
 import random
+import socket
+import struct
 import sys
 import time
 from secrets import token_hex
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import json_logging
+import numpy as np
 from flask import Flask, request
 from osgeo import gdal
 
 # Enable exceptions for GDAL
 gdal.UseExceptions()
 
+# Raw array tiles sent by the model runner when the RAW tile format is requested: the magic bytes, a little-endian
+# uint32 header length, a JSON header describing the (bands, height, width) array and then the pixels.
+RAW_TILE_MAGIC = b"OSMLRAW1"
+
+# Media type of the segmentation masks a model returns when a request Accepts them. Masks are encoded like raw
+# tiles with one 8-bit confidence band for each class.
+SEGMENTATION_MASK_MEDIA_TYPE = "application/vnd.osml.mask"
+
+# Distributions the simulated model latency can be drawn from
+LATENCY_DISTRIBUTIONS = ("normal", "lognormal", "exponential", "constant")
+
+# CustomAttributes that set the simulated model latency of a request. The environment variables with the same names
+# in upper case set the latency of requests without any of them.
+LATENCY_ATTRIBUTES = ("mock_latency_mean", "mock_latency_std", "mock_latency_distribution")
+
 
 def build_logger(level: int = logging.INFO) -> logging.Logger:
     """
@@ -40,6 +61,80 @@ def build_logger(level: int = logging.INFO) -> logging.Logger:
     return logger
 
 
+def get_server_options() -> Dict[str, int]:
+    """
+    Read the options of the Waitress server from the environment. Load tests can raise the number of threads that
+    handle requests, and the connections and pending connections the server accepts, so the test model keeps up
+    with the requests ModelRunner sends. The defaults are the Waitress defaults.
+
+    :return: The threads, connection_limit and backlog options of the server
+    """
+    return {
+        "threads": int(os.getenv("SERVER_THREADS", 4)),
+        "connection_limit": int(os.getenv("SERVER_CONNECTION_LIMIT", 100)),
+        "backlog": int(os.getenv("SERVER_BACKLOG", 1024)),
+    }
+
+
+def get_server_processes() -> int:
+    """
+    Read the number of server processes from the SERVER_PROCESSES environment variable. A value of "auto" starts
+    a process for each CPU.
+
+    :return: The number of server processes
+    """
+    processes = os.getenv("SERVER_PROCESSES", "1").strip().lower()
+    if processes == "auto":
+        return os.cpu_count() or 1
+    return max(1, int(processes))
+
+
+def _serve_process(app: Flask, listen_socket: socket.socket, server_options: Dict[str, int]) -> None:
+    """
+    Serve the application on a listening socket shared with the other server processes.
+
+    :param app: The flask application to serve
+    :param listen_socket: The bound socket created by the parent process
+    :param server_options: The Waitress server options
+    :return: None
+    """
+    from waitress import serve
+
+    # Forked processes inherit the random state of the parent, reseed so they do not return the same detections
+    random.seed()
+    np.random.seed()
+    serve(app, sockets=[listen_socket], clear_untrusted_proxy_headers=True, **server_options)
+
+
+def serve_processes(app: Flask, port: int, processes: int, server_options: Dict[str, int]) -> None:
+    """
+    Serve the application from several processes that accept connections on the same socket. The models generate
+    their responses in Python, so a single process is limited by the GIL no matter how many threads it has.
+
+    :param app: The flask application to serve
+    :param port: The port to listen on
+    :param processes: The number of server processes
+    :param server_options: The Waitress server options of each process
+    :return: None
+    """
+    listen_socket = socket.create_server(("0.0.0.0", port), backlog=server_options["backlog"])
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_serve_process, args=(app, listen_socket, server_options), daemon=True)
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        listen_socket.close()
+
+
 def setup_server(app: Flask):
     """
     The assumption is that this script will be the ENTRYPOINT for the inference
@@ -48,20 +143,30 @@ def setup_server(app: Flask):
     only one model will be active at a time (i.e., this is not a Multi Model Server),
     so it can be selected by name using the "model" parameter.
 
+    The server runs in one process by default. Setting SERVER_PROCESSES starts that many processes, or one for each
+    CPU when it is "auto", to drive ModelRunner at production rates during load tests.
+
     :param app: The flask application to set up
     :return: None
     """
     port = int(os.getenv("SAGEMAKER_BIND_TO_PORT", 8080))
+    server_options = get_server_options()
+    processes = get_server_processes()
 
     # Log all arguments in a single log message
     app.logger.debug(f"Initializing OSML Model Flask server on port {port}!")
 
+    if processes > 1:
+        app.logger.debug(f"Starting {processes} server processes with {server_options}")
+        serve_processes(app, port, processes, server_options)
+        return
+
     # Start the simple web application server using Waitress.
     # Flask's app.run() is only intended to be used in development
     #  mode, so this provides a solution for hosting the application.
     from waitress import serve
 
-    serve(app, host="0.0.0.0", port=port, clear_untrusted_proxy_headers=True)
+    serve(app, host="0.0.0.0", port=port, clear_untrusted_proxy_headers=True, **server_options)
 
 
 def build_flask_app(logger: logging.Logger) -> Flask:
@@ -175,6 +280,33 @@ def parse_custom_attributes() -> Dict[str, str]:
     return parse_custom_attributes_header(custom_attributes)
 
 
+def sample_latency_ms(mean_ms: float, std_ms: float, distribution: str = "normal") -> float:
+    """
+    Draw a model latency from a distribution with the given mean and standard deviation.
+
+    * normal: a normal distribution clamped to zero
+    * lognormal: a log-normal distribution, the long tail of real model latencies
+    * exponential: an exponential distribution with the mean, the standard deviation is ignored
+    * constant: always the mean
+
+    :param mean_ms: The mean latency in milliseconds
+    :param std_ms: The standard deviation of the latency in milliseconds
+    :param distribution: The name of the distribution
+    :return: The latency in milliseconds, never negative
+    :raises ValueError: If the distribution is not supported
+    """
+    if distribution not in LATENCY_DISTRIBUTIONS:
+        raise ValueError(f"Unsupported latency distribution: {distribution}")
+    if distribution == "constant" or mean_ms <= 0:
+        return max(0.0, mean_ms)
+    if distribution == "exponential":
+        return random.expovariate(1.0 / mean_ms)
+    if distribution == "lognormal":
+        sigma_squared = math.log(1.0 + (std_ms / mean_ms) ** 2)
+        return random.lognormvariate(math.log(mean_ms) - sigma_squared / 2.0, math.sqrt(sigma_squared))
+    return max(0, random.gauss(mean_ms, std_ms))
+
+
 def simulate_model_latency() -> None:
     """
     Simulate model inference latency by sleeping for a random duration based on
@@ -183,36 +315,44 @@ def simulate_model_latency() -> None:
     This function checks for 'mock_latency_mean' and 'mock_latency_std' parameters
     in the CustomAttributes header. If found, it sleeps for a random number of
     milliseconds drawn from a normal distribution with the specified mean and
-    standard deviation.
+    standard deviation. The 'mock_latency_distribution' parameter selects another
+    distribution, see sample_latency_ms.
 
     If only mock_latency_mean is provided, mock_latency_std defaults to 10% of the mean.
-    If neither parameter is present, no sleep occurs.
+    If no mean is present, no sleep occurs. The MOCK_LATENCY_MEAN, MOCK_LATENCY_STD
+    and MOCK_LATENCY_DISTRIBUTION environment variables set the latency of requests without
+    any of these parameters. A request that sets any of them does not use the environment
+    variables at all, so its latency is never a mix of the two.
 
     :return: None
     """
     # Get parsed custom attributes
     attributes = parse_custom_attributes()
+    if any(name in attributes for name in LATENCY_ATTRIBUTES):
+        settings = attributes
+    else:
+        settings = {name: os.environ[name.upper()] for name in LATENCY_ATTRIBUTES if name.upper() in os.environ}
 
     # Check for mock_latency_mean
-    if "mock_latency_mean" not in attributes:
+    mean = settings.get("mock_latency_mean")
+    if mean is None:
         return
 
     try:
         # Parse the mean latency
-        mean_ms = float(attributes["mock_latency_mean"])
+        mean_ms = float(mean)
 
         # Parse or calculate the standard deviation
-        if "mock_latency_std" in attributes:
-            std_ms = float(attributes["mock_latency_std"])
+        std = settings.get("mock_latency_std")
+        if std is not None:
+            std_ms = float(std)
         else:
             # Default to 10% of mean if std is not provided
             std_ms = mean_ms * 0.1
 
-        # Generate a random latency using normal distribution
-        latency_ms = random.gauss(mean_ms, std_ms)
-
-        # Ensure latency is non-negative
-        latency_ms = max(0, latency_ms)
+        # Generate a random latency from the requested distribution, it is never negative
+        distribution = settings.get("mock_latency_distribution", "normal")
+        latency_ms = sample_latency_ms(mean_ms, std_ms, distribution.strip().lower())
 
         # Convert to seconds and sleep
         time.sleep(latency_ms / 1000.0)
@@ -220,3 +360,82 @@ def simulate_model_latency() -> None:
     except (ValueError, TypeError):
         # If conversion to float fails, just return without sleeping
         return
+
+
+def read_raw_tile_header(payload: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Read the header of a raw array tile.
+
+    :param payload: The request payload
+    :return: The header with the shape, dtype and compression of the pixels, or None if the payload is an
+             encoded image instead of a raw tile
+    :raises ValueError: If the payload starts like a raw tile but the header cannot be read
+    """
+    if not payload.startswith(RAW_TILE_MAGIC):
+        return None
+    prefix_length = len(RAW_TILE_MAGIC) + 4
+    try:
+        (header_length,) = struct.unpack("<I", payload[len(RAW_TILE_MAGIC) : prefix_length])
+        header = json.loads(payload[prefix_length : prefix_length + header_length].decode("utf-8"))
+        header["offset"] = prefix_length + header_length
+        return header
+    except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as err:
+        raise ValueError(f"Invalid raw tile header: {err}") from err
+
+
+def decode_raw_tile(payload: bytes) -> Optional[np.ndarray]:
+    """
+    Decode a raw array tile into a (bands, height, width) array, the same layout GDAL's ReadAsArray returns.
+
+    :param payload: The request payload
+    :return: The pixels of the tile, or None if the payload is an encoded image instead of a raw tile
+    :raises ValueError: If the payload starts like a raw tile but cannot be decoded
+    """
+    header = read_raw_tile_header(payload)
+    if header is None:
+        return None
+    pixels = memoryview(payload)[header["offset"] :]
+    compression = header.get("compression", "NONE")
+    if compression == "LZ4":
+        import lz4.frame
+
+        pixels = lz4.frame.decompress(pixels)
+    elif compression == "ZSTD":
+        import zstandard
+
+        pixels = zstandard.ZstdDecompressor().decompress(pixels)
+    elif compression != "NONE":
+        raise ValueError(f"Unsupported raw tile compression: {compression}")
+    return np.frombuffer(pixels, dtype=np.dtype(header["dtype"])).reshape(header["shape"])
+
+
+def accepts_segmentation_mask() -> bool:
+    """
+    Check whether the request Accepts a segmentation mask response instead of GeoJSON features.
+
+    :return: True if the segmentation mask media type is in the Accept header of the request
+    """
+    accept = request.headers.get("Accept", "")
+    return any(value.split(";")[0].strip().lower() == SEGMENTATION_MASK_MEDIA_TYPE for value in accept.split(","))
+
+
+def encode_segmentation_mask(mask: np.ndarray) -> bytes:
+    """
+    Encode an 8-bit segmentation mask with the raw tile layout.
+
+    :param mask: The (height, width) or (bands, height, width) mask
+    :return: The encoded mask
+    """
+    mask = np.ascontiguousarray(mask, dtype=np.uint8)
+    if mask.ndim == 2:
+        mask = mask[np.newaxis]
+    header = json.dumps(
+        {
+            "shape": list(mask.shape),
+            "dtype": mask.dtype.str,
+            "interleave": "BSQ",
+            "bands": list(range(1, mask.shape[0] + 1)),
+            "compression": "NONE",
+        }
+    ).encode("utf-8")
+    return RAW_TILE_MAGIC + struct.pack("<I", len(header)) + header + mask.tobytes()
@@ -252,6 +252,26 @@ def test_image_request_invalid_sink():
     assert not request.is_valid()
 
 
+def test_image_request_invalid_sink_format():
+    """
+    Test ImageRequest creation with an invalid output format.
+    """
+    request = ImageRequest.from_external_message(
+        {
+            "jobName": "test-job-name",
+            "jobId": "test-job-id",
+            "imageUrls": ["test-image-url"],
+            "outputs": [{"type": "S3", "bucket": "test-bucket", "prefix": "images/outputs", "format": "SHP"}],
+            "imageProcessor": {"name": "test-model", "type": "SM_ENDPOINT"},
+            "imageProcessorTileSize": 1024,
+            "imageProcessorTileOverlap": 50,
+        }
+    )
+
+    # Should fail with an unsupported output format provided
+    assert not request.is_valid()
+
+
 def test_image_request_invalid_roles(image_request):
     """
     Test invalid role formats are rejected.
@@ -401,6 +421,55 @@ def test_parse_roi():
     assert ImageRequest._parse_roi(None) is None
 
 
+def test_parse_priority_and_deadline():
+    """
+    Test parsing the scheduling priority and deadline.
+    """
+    assert ImageRequest._parse_priority(None) == 0
+    assert ImageRequest._parse_priority("5") == 5
+    assert ImageRequest._parse_priority("urgent") == 0
+    assert ImageRequest._parse_deadline(None) is None
+    assert ImageRequest._parse_deadline(1700000000) == 1700000000
+    assert ImageRequest._parse_deadline("1700000000") == 1700000000
+    assert ImageRequest._parse_deadline("2023-11-14T22:13:20Z") == 1700000000
+    assert ImageRequest._parse_deadline("2023-11-14T22:13:20") == 1700000000
+    assert ImageRequest._parse_deadline("tomorrow") is None
+
+
+def test_invalid_priority_and_deadline(image_request):
+    """
+    Test ImageRequest with a negative priority or deadline.
+    """
+    image_request.priority = -1
+    assert not image_request.is_valid()
+    image_request.priority = 1
+    image_request.deadline = -1
+    assert not image_request.is_valid()
+
+
+def test_parse_processing_resolution():
+    """
+    Test parsing the overview level and target GSD of the request.
+    """
+    assert ImageRequest._parse_overview_level(None) is None
+    assert ImageRequest._parse_overview_level("2") == 2
+    assert ImageRequest._parse_overview_level("coarse") is None
+    assert ImageRequest._parse_target_gsd(None) is None
+    assert ImageRequest._parse_target_gsd("1.5") == 1.5
+    assert ImageRequest._parse_target_gsd("fine") is None
+
+
+def test_invalid_processing_resolution(image_request):
+    """
+    Test ImageRequest with a negative overview level or target GSD.
+    """
+    image_request.overview_level = -1
+    assert not image_request.is_valid()
+    image_request.overview_level = None
+    image_request.target_gsd = 0.0
+    assert not image_request.is_valid()
+
+
 def test_parse_tile_format_and_compression_defaults():
     """
     Test parsing tile format and compression defaults.
@@ -472,6 +541,8 @@ def test_get_shared_values(image_request):
     Test shared values include key fields.
     """
     image_request.model_endpoint_parameters = {"CustomAttributes": "x=y"}
+    image_request.roi = ImageRequest._parse_roi("POLYGON ((0 0, 1 0, 1 1, 0 0))")
     shared = image_request.get_shared_values()
     assert shared["image_id"] == "test-image-id"
     assert shared["model_endpoint_parameters"] == {"CustomAttributes": "x=y"}
+    assert shared["roi_wkt"] == "POLYGON ((0 0, 1 0, 1 1, 0 0))"
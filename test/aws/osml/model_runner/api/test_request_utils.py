@@ -130,6 +130,20 @@ def test_shared_properties_invalid_tile_compression_returns_false(sample_request
     assert not result
 
 
+def test_raw_tile_format_compressions(sample_request_data):
+    """Test that LZ4 and ZSTD compression are only accepted for raw tiles and raw tiles reject GDAL codecs"""
+    from aws.osml.model_runner.api.request_utils import shared_properties_are_valid
+
+    sample_request_data.tile_compression = "ZSTD"
+    assert not shared_properties_are_valid(sample_request_data)
+
+    sample_request_data.tile_format = "RAW"
+    assert shared_properties_are_valid(sample_request_data)
+
+    sample_request_data.tile_compression = "J2K"
+    assert not shared_properties_are_valid(sample_request_data)
+
+
 def test_get_image_path_non_s3_returns_unchanged():
     """Test get_image_path returns local/network path unchanged (no vsis3 prefix)"""
     from aws.osml.model_runner.api.request_utils import get_image_path
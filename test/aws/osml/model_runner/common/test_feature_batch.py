@@ -0,0 +1,118 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import geojson
+import numpy as np
+import pytest
+
+from aws.osml.model_runner.common import FeatureBatch
+
+
+@pytest.fixture
+def features():
+    return [
+        geojson.Feature(
+            id="polygon",
+            geometry=geojson.Point((1.0, 2.0)),
+            properties={
+                "imageGeometry": {"type": "Polygon", "coordinates": [[[10, 20], [30, 20], [30, 25], [10, 25], [10, 20]]]},
+                "imageBBox": [0, 0, 1, 1],
+                "featureClasses": [{"iri": "car", "score": 0.4}, {"iri": "truck", "score": 0.7}],
+                "image_id": "image-1",
+            },
+        ),
+        geojson.Feature(
+            id="bbox",
+            geometry=geojson.Point((3.0, 4.0)),
+            properties={"imageBBox": [5, 6, 7, 8], "featureClasses": [{"iri": "car", "score": 0.9}]},
+        ),
+        geojson.Feature(id="deprecated", geometry=None, properties={"bounds_imcoords": [1, 2, 3, 4]}),
+    ]
+
+
+def test_from_features(features):
+    """
+    Test that the bounds, top class and score of each feature are extracted into columns.
+    """
+    batch = FeatureBatch.from_features(features)
+
+    assert len(batch) == 3
+    np.testing.assert_array_equal(batch.image_bboxes, [[10, 20, 30, 25], [5, 6, 7, 8], [1, 2, 3, 4]])
+    np.testing.assert_array_equal(batch.scores, [0.7, 0.9, -1.0])
+    assert [batch.class_names[class_id] for class_id in batch.class_ids] == ["truck", "car", ""]
+    assert batch.ids == ["polygon", "bbox", "deprecated"]
+    assert batch.properties[1] is features[1]["properties"]
+
+
+def test_from_features_drops_features_without_image_bounds(features):
+    """
+    Test that features without finite image bounds are dropped instead of reaching the selection algorithms with
+    NaN bounds.
+    """
+    invalid_features = [
+        geojson.Feature(id="no-geometry", geometry=geojson.Point((0.0, 0.0)), properties={"featureClasses": []}),
+        geojson.Feature(id="nan-bbox", geometry=None, properties={"imageBBox": [float("nan"), 0, 1, 1]}),
+        geojson.Feature(id="short-bbox", geometry=None, properties={"imageBBox": [0, 1]}),
+    ]
+
+    batch = FeatureBatch.from_features(invalid_features[:2] + features + invalid_features[2:])
+
+    assert len(batch) == 3
+    assert batch.ids == ["polygon", "bbox", "deprecated"]
+    np.testing.assert_array_equal(batch.source_indices, [2, 3, 4])
+    assert np.isfinite(batch.image_bboxes).all()
+    assert batch.scores.shape == batch.class_ids.shape == (3,)
+    assert len(FeatureBatch.from_features(invalid_features)) == 0
+
+
+def test_select_and_concatenate(features):
+    """
+    Test that selected batches can be combined and the class ids are remapped to the combined class names.
+    """
+    batch = FeatureBatch.from_features(features)
+    other = FeatureBatch.from_features(
+        [geojson.Feature(properties={"imageBBox": [0, 0, 2, 2], "featureClasses": [{"iri": "boat", "score": 0.5}]})]
+    )
+
+    combined = FeatureBatch.concatenate([batch.select([1, 0]), batch.select(np.array([False, False, True])), other])
+
+    assert combined.ids == ["bbox", "polygon", "deprecated", None]
+    assert [combined.class_names[class_id] for class_id in combined.class_ids] == ["car", "truck", "", "boat"]
+    np.testing.assert_array_equal(combined.scores, [0.9, 0.7, -1.0, 0.5])
+    np.testing.assert_array_equal(
+        FeatureBatch.concatenate([batch.select([2]), batch.select([1, 0])]).source_indices, [2, 1, 0]
+    )
+    assert FeatureBatch.concatenate([batch, FeatureBatch.empty()]).source_indices is None
+    assert len(FeatureBatch.concatenate([])) == 0
+    assert len(batch.select([])) == 0
+
+
+def test_update_scores(features):
+    """
+    Test that new scores replace the score of the top class and keep the previous one as the raw score.
+    """
+    batch = FeatureBatch.from_features(features[:2])
+
+    batch.update_scores(np.array([0.5, 0.8]))
+
+    assert batch.properties[0]["featureClasses"] == [
+        {"iri": "car", "score": 0.4},
+        {"iri": "truck", "score": 0.5, "rawScore": 0.7},
+    ]
+    assert batch.properties[1]["featureClasses"] == [{"iri": "car", "score": 0.8, "rawScore": 0.9}]
+
+
+def test_to_features(features):
+    """
+    Test that the batch is converted back to features with the shared properties added and excluded ones removed.
+    """
+    batch = FeatureBatch.from_features(features)
+    batch.shared_properties["custom"] = "value"
+    batch.excluded_properties.add("image_id")
+
+    converted = batch.to_features()
+
+    assert [feature["id"] for feature in converted] == ["polygon", "bbox", "deprecated"]
+    assert converted[0]["geometry"] == geojson.Point((1.0, 2.0))
+    assert converted[2]["geometry"] is None
+    assert converted[0]["properties"]["custom"] == "value"
+    assert "image_id" not in converted[0]["properties"]
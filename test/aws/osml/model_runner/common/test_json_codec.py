@@ -0,0 +1,127 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import json
+from json import JSONDecodeError
+
+import geojson
+import numpy as np
+import pytest
+import shapely
+
+from aws.osml.model_runner.common import JSONCodecType, get_json_codec
+from aws.osml.model_runner.common.json_codec import StdlibJSONCodec, to_geojson
+
+FEATURE_COLLECTION = geojson.FeatureCollection(
+    [
+        geojson.Feature(
+            id="feature-1",
+            geometry=geojson.Polygon([[(10.5, 20.25), (11.0, 20.25), (11.0, 21.0), (10.5, 20.25)]]),
+            properties={
+                "imageBBox": [429, 553, 440, 561],
+                "featureClasses": [{"iri": "véhicule", "score": 0.875}],
+                "source": {"type": "model", "name": "test"},
+            },
+        )
+    ]
+)
+
+
+@pytest.mark.parametrize("codec_type", [JSONCodecType.ORJSON, JSONCodecType.STDLIB])
+def test_round_trip_geojson(codec_type):
+    """
+    Test that every codec decodes GeoJSON into the same geojson objects as geojson.loads.
+    """
+    codec = get_json_codec(codec_type)
+
+    decoded = codec.loads_geojson(codec.dumpb(FEATURE_COLLECTION))
+
+    assert decoded == geojson.loads(geojson.dumps(FEATURE_COLLECTION))
+    assert isinstance(decoded, geojson.FeatureCollection)
+    assert isinstance(decoded.features[0], geojson.Feature)
+    assert isinstance(decoded.features[0].geometry, geojson.Polygon)
+    # Objects whose type is not a GeoJSON type are left as dictionaries
+    assert type(decoded.features[0].properties["source"]) is dict
+
+
+def test_stdlib_codec_matches_geojson_dumps():
+    """
+    Test that the standard library codec produces exactly the output of geojson.dumps.
+    """
+    codec = get_json_codec(JSONCodecType.STDLIB)
+
+    assert isinstance(codec, StdlibJSONCodec)
+    assert codec.dumps(FEATURE_COLLECTION) == geojson.dumps(FEATURE_COLLECTION)
+    assert codec.dumpb(FEATURE_COLLECTION) == geojson.dumps(FEATURE_COLLECTION).encode("utf-8")
+
+
+def test_fast_codec_encodes_geometries_and_arrays():
+    """
+    Test that objects the fast libraries do not serialize natively are converted.
+    """
+    codec = get_json_codec(JSONCodecType.ORJSON)
+
+    decoded = codec.loads(codec.dumps({"geometry": shapely.Point(1, 2), "bbox": np.array([1.5, 2.5])}))
+
+    assert decoded == {"geometry": {"type": "Point", "coordinates": [1.0, 2.0]}, "bbox": [1.5, 2.5]}
+
+
+@pytest.mark.parametrize("codec_type", [JSONCodecType.ORJSON, JSONCodecType.STDLIB])
+def test_invalid_json(codec_type):
+    """
+    Test that every codec raises a JSONDecodeError for invalid documents.
+    """
+    with pytest.raises(JSONDecodeError):
+        get_json_codec(codec_type).loads_geojson(b"Not a json string")
+
+
+def test_get_json_codec_fallback(mocker):
+    """
+    Test that unknown codecs fall back to AUTO and that libraries that are not installed fall back to the standard
+    library.
+    """
+    mocker.patch("aws.osml.model_runner.common.json_codec._codecs", {})
+    mocker.patch("aws.osml.model_runner.common.json_codec._create_codec", return_value=None)
+
+    assert get_json_codec("not-a-codec").codec_type == JSONCodecType.STDLIB
+    assert get_json_codec("orjson").codec_type == JSONCodecType.STDLIB
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"type": "Feature", "geometry": null, "properties": null}',
+        '{"type": "Feature", "id": null, "geometry": {}, "properties": {"type": "Point", "coordinates": [1.1234567, 2]}}',
+        '{"type": "Feature", "bbox": [1, 2, 3, 4], "geometry": {"type": "Point", "coordinates": [1, 2]}, "properties": {}}',
+        '{"type": "FeatureCollection", "features": [{"a": 1}, {"type": "Feature", "geometry": null, "properties": {}}]}',
+        '[{"type": "Polygon", "coordinates": [[[0, 0], [1, 0.00000001], [0, 0]]]}, {"type": "Foo"}, 3]',
+        '{"type": "GeometryCollection", "geometries": [{"type": "Point", "coordinates": [1, 2]}]}',
+        '{"type": "LineString", "coordinates": [[true, 2], [3, 4]]}',
+    ],
+)
+def test_to_geojson_matches_geojson_loads(document):
+    """
+    Test that converting decoded JSON gives the same objects, in the same key order, as geojson.loads.
+    """
+    expected = geojson.loads(document)
+    decoded = to_geojson(json.loads(document))
+
+    assert decoded == expected
+    assert type(decoded) is type(expected)
+    assert geojson.dumps(decoded) == geojson.dumps(expected)
+
+
+def test_new_geojson_instance_matches_constructor():
+    """
+    Test that a feature created from its items is the same as one created by the geojson constructor.
+    """
+    from aws.osml.model_runner.common import new_geojson_instance
+
+    geometry = geojson.Point((1.0, 2.0))
+    expected = geojson.Feature(id="feature-1", geometry=geometry, properties={"score": 0.5})
+    created = new_geojson_instance(
+        geojson.Feature, {"type": "Feature", "id": "feature-1", "geometry": geometry, "properties": {"score": 0.5}}
+    )
+
+    assert created == expected
+    assert type(created) is geojson.Feature
+    assert geojson.dumps(created) == geojson.dumps(expected)
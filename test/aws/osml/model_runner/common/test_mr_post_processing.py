@@ -48,6 +48,38 @@ def test_feature_distillation_deserializer_soft_nms():
     assert isinstance(new_feature_selection_option.algorithm_type, FeatureDistillationAlgorithmType)
 
 
+def test_feature_distillation_deserializer_point_nms():
+    from aws.osml.model_runner.common import (
+        FeatureDistillationAlgorithmType,
+        FeatureDistillationDeserializer,
+        FeatureDistillationPointNMS,
+        mr_post_processing_options_factory,
+    )
+
+    feature_selection_option = FeatureDistillationPointNMS(radius=2.5)
+
+    feature_selection_options_json = dumps(asdict(feature_selection_option, dict_factory=mr_post_processing_options_factory))
+    expected_json = '{"algorithm_type": "POINT_NMS", "iou_threshold": 0.75, "radius": 2.5}'
+    assert feature_selection_options_json == expected_json
+
+    deserializer = FeatureDistillationDeserializer()
+    new_feature_selection_option = deserializer.deserialize(loads(feature_selection_options_json))
+
+    assert isinstance(new_feature_selection_option, FeatureDistillationPointNMS)
+    assert isinstance(new_feature_selection_option.algorithm_type, FeatureDistillationAlgorithmType)
+    assert new_feature_selection_option.radius == 2.5
+
+
+@pytest.mark.parametrize("radius", [0, -1.5, float("nan"), float("inf"), "5"])
+def test_feature_distillation_deserializer_point_nms_invalid_radius(radius):
+    from aws.osml.model_runner.common import FeatureDistillationDeserializer, FeatureDistillationPointNMS
+
+    with pytest.raises(ValueError):
+        FeatureDistillationDeserializer().deserialize({"algorithm_type": "POINT_NMS", "radius": radius})
+    with pytest.raises(ValueError):
+        FeatureDistillationPointNMS(radius=radius)
+
+
 def test_feature_distillation_deserializer_missing_algorithm_type():
     from aws.osml.model_runner.common import FeatureDistillationDeserializer
 
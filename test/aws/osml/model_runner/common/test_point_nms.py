@@ -0,0 +1,51 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import numpy as np
+import pytest
+
+from aws.osml.model_runner.common import point_nms
+
+
+def test_point_nms_keeps_highest_score_within_radius():
+    """
+    Test that points of the same label within the radius are reduced to the highest scoring point while points of
+    other labels and points further away are kept.
+    """
+    points = np.array([[10.0, 10.0], [12.0, 10.0], [10.0, 10.0], [30.0, 30.0], [10.0, 13.1]])
+    scores = np.array([0.5, 0.9, 0.8, 0.3, 0.7])
+    labels = np.array([0, 0, 1, 0, 0])
+
+    keep = point_nms(points, scores, labels, radius=3.0)
+
+    np.testing.assert_array_equal(keep, [1, 2, 4, 3])
+
+
+def test_point_nms_matches_brute_force():
+    """
+    Test that the hash grid gives the same result as comparing every pair of points.
+    """
+    rng = np.random.default_rng(0)
+    points = rng.uniform(0, 200, size=(2000, 2))
+    scores = rng.random(2000)
+    labels = rng.integers(0, 3, size=2000)
+    radius = 4.0
+
+    expected = []
+    suppressed = np.zeros(len(points), dtype=bool)
+    for i in np.argsort(-scores, kind="mergesort"):
+        if suppressed[i]:
+            continue
+        expected.append(i)
+        distances = np.hypot(*(points - points[i]).T)
+        suppressed |= (distances <= radius) & (labels == labels[i])
+
+    np.testing.assert_array_equal(point_nms(points, scores, labels, radius), expected)
+
+
+def test_point_nms_empty_and_invalid_radius():
+    """
+    Test that no points are kept from an empty set and that the radius must be positive.
+    """
+    assert len(point_nms(np.zeros((0, 2)), np.zeros(0), np.zeros(0), 1.0)) == 0
+    with pytest.raises(ValueError):
+        point_nms(np.zeros((1, 2)), np.ones(1), np.zeros(1), 0.0)
@@ -0,0 +1,45 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from aws.osml.model_runner.common import RegionPlan
+
+
+def test_region_plan_normalizes_lists():
+    """
+    Test that a region plan read back from DynamoDB as nested lists is normalized to tuples.
+    """
+    region_plan = RegionPlan(
+        processing_bounds=[[0, 0], [2048, 1024]],
+        regions=[[[0, 0], [1024, 1024]], [[0, 974], [1074, 1024]]],
+        tile_counts=[1, 2],
+        region_size=[1024, 1024],
+        tile_size=[512, 512],
+        tile_overlap=[50, 50],
+    )
+
+    assert region_plan.processing_bounds == ((0, 0), (2048, 1024))
+    assert region_plan.regions == [((0, 0), (1024, 1024)), ((0, 974), (1074, 1024))]
+    assert region_plan.region_size == (1024, 1024)
+    assert region_plan.region_count == 2
+    assert region_plan.tile_count == 3
+
+
+def test_region_plan_matches():
+    """
+    Test that a region plan only matches the tiling parameters it was computed with.
+    """
+    region_plan = RegionPlan(
+        processing_bounds=((0, 0), (1024, 1024)),
+        regions=[((0, 0), (1024, 1024))],
+        tile_counts=[4],
+        region_size=(10240, 10240),
+        tile_size=(512, 512),
+        tile_overlap=(0, 0),
+    )
+
+    assert region_plan.matches((10240, 10240), (512, 512), (0, 0))
+    assert region_plan.matches([10240, 10240], [512, 512], [0, 0])
+    assert not region_plan.matches((10240, 10240), (1024, 1024), (0, 0))
+    assert not region_plan.matches((10240, 10240), (512, 512), (50, 50))
+
+    region_plan.tile_counts = []
+    assert not region_plan.matches((10240, 10240), (512, 512), (0, 0))
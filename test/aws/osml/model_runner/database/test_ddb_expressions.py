@@ -0,0 +1,98 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from decimal import Decimal
+
+import pytest
+from botocore.exceptions import ClientError
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("num_attempts = :one", True),
+        ("num_attempts <> :one", False),
+        ("num_attempts < :two AND #s = :status", True),
+        ("num_attempts > :two OR begins_with(#s, :prefix)", True),
+        ("NOT (num_attempts = :one)", False),
+        ("num_attempts BETWEEN :one AND :two", True),
+        ("#s IN (:prefix, :status)", True),
+        ("attribute_exists(job_id) AND attribute_not_exists(missing)", True),
+        ("contains(regions_complete, :region)", True),
+        ("size(regions_complete) = :one", True),
+        ("missing = :one", False),
+        ("missing <> :one", True),
+    ],
+)
+def test_evaluate_condition(expression, expected):
+    from aws.osml.model_runner.database.ddb_expressions import evaluate_condition
+
+    item = {"job_id": "job-1", "num_attempts": Decimal(1), "status": "IN_PROGRESS", "regions_complete": ["region-1"]}
+    values = {":one": 1, ":two": 2, ":status": "IN_PROGRESS", ":prefix": "IN_", ":region": "region-1"}
+
+    assert evaluate_condition(expression, item, {"#s": "status"}, values) is expected
+
+
+def test_apply_update_set_and_remove():
+    from aws.osml.model_runner.database.ddb_expressions import apply_update
+
+    item = {"job_id": "job-1", "num_attempts": Decimal(1), "old": "value"}
+    updated = apply_update(
+        "SET num_attempts = num_attempts + :one, regions_complete = list_append(if_not_exists(regions_complete, :empty), "
+        ":regions), #t = :time REMOVE old",
+        item,
+        {"#t": "last_updated_time"},
+        {":one": 1, ":empty": [], ":regions": ["region-1"], ":time": 1000},
+    )
+
+    assert item["num_attempts"] == Decimal(1)
+    assert updated == {
+        "job_id": "job-1",
+        "num_attempts": Decimal(2),
+        "regions_complete": ["region-1"],
+        "last_updated_time": Decimal(1000),
+    }
+
+
+def test_apply_update_add_and_delete():
+    from aws.osml.model_runner.database.ddb_expressions import apply_update
+
+    item = {"count": Decimal(1), "tiles": {"a", "b"}}
+    updated = apply_update(
+        "ADD #c :two, new_count :one DELETE tiles :remove", item, {"#c": "count"}, {":one": 1, ":two": 2, ":remove": {"a"}}
+    )
+
+    assert updated == {"count": Decimal(3), "new_count": Decimal(1), "tiles": {"b"}}
+
+
+def test_apply_update_uses_original_item_for_operands():
+    from aws.osml.model_runner.database.ddb_expressions import apply_update
+
+    item = {"a": Decimal(1), "b": Decimal(2)}
+    updated = apply_update("SET a = b, b = a", item, {}, {})
+
+    assert updated == {"a": Decimal(2), "b": Decimal(1)}
+
+
+@pytest.mark.parametrize(
+    "expression, values",
+    [
+        ("SET a = :missing", {}),
+        ("SET a = a +", {}),
+        ("SET a = b + :one", {":one": 1}),
+        ("UPSERT a = :one", {":one": 1}),
+    ],
+)
+def test_invalid_update_raises_validation_exception(expression, values):
+    from aws.osml.model_runner.database.ddb_expressions import apply_update
+
+    with pytest.raises(ClientError) as error:
+        apply_update(expression, {"a": Decimal(1)}, {}, values)
+
+    assert error.value.response["Error"]["Code"] == "ValidationException"
+
+
+def test_normalize_value():
+    from aws.osml.model_runner.database.ddb_expressions import normalize_value
+
+    assert normalize_value({"a": [1, 2.5], "b": "c", "d": True}) == {"a": [Decimal(1), Decimal("2.5")], "b": "c", "d": True}
+    assert isinstance(normalize_value(1), Decimal)
@@ -0,0 +1,81 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import boto3
+import pytest
+from moto import mock_aws
+
+TEST_TABLE_NAME = "test-endpoint-statistics-table"
+TEST_ENDPOINT = "test-endpoint"
+
+
+@pytest.fixture
+def endpoint_statistics_table_setup():
+    """
+    Set up virtual DDB resources/tables for each test to use.
+    """
+    from aws.osml.model_runner.app_config import BotoConfig
+    from aws.osml.model_runner.database.endpoint_statistics_table import EndpointStatisticsTable
+
+    with mock_aws():
+        ddb = boto3.resource("dynamodb", config=BotoConfig.default)
+        table = ddb.create_table(
+            TableName=TEST_TABLE_NAME,
+            KeySchema=[
+                {"AttributeName": "endpoint_key", "KeyType": "HASH"},
+                {"AttributeName": "bucket_start", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "endpoint_key", "AttributeType": "S"},
+                {"AttributeName": "bucket_start", "AttributeType": "N"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+        yield EndpointStatisticsTable(TEST_TABLE_NAME)
+
+        table.delete()
+
+
+def test_bucket_for_aligns_to_bucket_start(endpoint_statistics_table_setup):
+    """
+    Validate that timestamps are assigned to the bucket that contains them.
+    """
+    statistics_table = endpoint_statistics_table_setup
+    assert statistics_table.bucket_for(1_700_000_059.9) == 1_700_000_040
+    assert statistics_table.bucket_for(1_700_000_100) == 1_700_000_100
+
+
+def test_add_tile_statistics_accumulates(endpoint_statistics_table_setup):
+    """
+    Validate that statistics written by multiple workers for the same bucket are added together.
+    """
+    statistics_table = endpoint_statistics_table_setup
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, "variant-1", 1_700_000_040, 10, 1, 5000)
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, "variant-1", 1_700_000_040, 5, 0, 2500)
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, "variant-1", 1_700_000_100, 3, 2, 900)
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, "variant-2", 1_700_000_040, 7, 0, 700)
+
+    buckets = statistics_table.get_tile_statistics(TEST_ENDPOINT, "variant-1", since=0)
+
+    assert [bucket.bucket_start for bucket in buckets] == [1_700_000_040, 1_700_000_100]
+    assert buckets[0].tile_count == 15
+    assert buckets[0].failed_tile_count == 1
+    assert buckets[0].latency_sum_ms == 7500
+    assert buckets[0].expire_time is not None
+    assert buckets[1].tile_count == 3
+
+
+def test_get_tile_statistics_filters_by_time_and_variant(endpoint_statistics_table_setup):
+    """
+    Validate that only buckets of the requested variant starting at or after the requested time are returned.
+    """
+    statistics_table = endpoint_statistics_table_setup
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, None, 1_700_000_040, 1, 0, 100)
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, None, 1_700_000_100, 2, 0, 200)
+    statistics_table.add_tile_statistics(TEST_ENDPOINT, "variant-1", 1_700_000_100, 4, 0, 400)
+
+    buckets = statistics_table.get_tile_statistics(TEST_ENDPOINT, None, since=1_700_000_100)
+
+    assert len(buckets) == 1
+    assert buckets[0].endpoint_key == f"{TEST_ENDPOINT}#"
+    assert buckets[0].tile_count == 2
@@ -188,3 +188,19 @@ def test_generate_tile_key_bad_bbox(feature_table_setup):
     )
     with pytest.raises(ValueError):
         feature_table_setup.generate_tile_key(feature)
+
+
+def test_aggregate_feature_batch(feature_table_setup, feature_list):
+    """
+    Test that `aggregate_feature_batch` collects the features of an image request into a single batch.
+    """
+    from aws.osml.model_runner.common import FeatureBatch
+    from aws.osml.model_runner.database.image_request_table import ImageRequestItem
+
+    feature_table_setup.add_features(feature_list)
+
+    image_request_item = ImageRequestItem(image_id=TEST_IMAGE_ID)
+    feature_batch = feature_table_setup.aggregate_feature_batch(image_request_item)
+    assert isinstance(feature_batch, FeatureBatch)
+    assert sorted(feature_batch.ids) == sorted(feature["id"] for feature in feature_list)
+    assert feature_batch.image_bboxes.shape == (len(feature_list), 4)
@@ -97,6 +97,25 @@ def test_region_ended_success(image_request_table_setup):
     assert resulting_image_request_item.end_time is not None
 
 
+def test_end_image_request_with_item(image_request_table_setup, mocker):
+    """
+    Validate that an image request held in memory is ended without reading it from the table first.
+    """
+    image_request_table, image_request_item = image_request_table_setup
+    image_request_table.start_image_request(image_request_item)
+    image_request_item.region_count = 1
+    image_request_item.region_success = 1
+    get_ddb_item = mocker.spy(image_request_table, "get_ddb_item")
+
+    image_request_table.end_image_request(TEST_IMAGE_ID, image_request_item)
+
+    get_ddb_item.assert_not_called()
+    resulting_image_request_item = image_request_table.get_image_request(TEST_IMAGE_ID)
+    assert resulting_image_request_item.end_time is not None
+    assert resulting_image_request_item.region_success == 1
+    assert resulting_image_request_item.region_count == 1
+
+
 def test_start_image_failure(image_request_table_setup, mocker):
     """
     Validate that we throw the correct StartImageFailed exception.
@@ -0,0 +1,238 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import time
+from decimal import Decimal
+
+import pytest
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+
+@pytest.fixture
+def in_memory_persistence(mocker):
+    """Replace the in-memory tables of the process with empty ones and select the MEMORY backend."""
+    from aws.osml.model_runner.database import persistence_backend
+    from aws.osml.model_runner.database.persistence_backend import InMemoryPersistence
+
+    persistence = InMemoryPersistence()
+    mocker.patch.object(persistence_backend, "_in_memory_persistence", persistence)
+    mocker.patch("aws.osml.model_runner.app_config.ServiceConfig.persistence_backend", "MEMORY")
+    return persistence
+
+
+@pytest.fixture
+def jobs_table(in_memory_persistence):
+    return in_memory_persistence.create_table("jobs", ("endpoint_id", "job_id"))
+
+
+def test_put_and_get_item(jobs_table):
+    item = {"endpoint_id": "model", "job_id": "job-1", "num_attempts": 0, "details": {"tiles": [1, 2.5]}}
+    jobs_table.put_item(Item=item)
+    item["num_attempts"] = 5
+
+    stored = jobs_table.get_item(Key={"endpoint_id": "model", "job_id": "job-1"})["Item"]
+
+    assert stored["num_attempts"] == Decimal(0)
+    assert stored["details"] == {"tiles": [Decimal(1), Decimal("2.5")]}
+    assert jobs_table.get_item(Key={"endpoint_id": "model", "job_id": "job-2"}) == {}
+
+
+def test_get_item_without_key_raises_validation_exception(jobs_table):
+    with pytest.raises(ClientError) as error:
+        jobs_table.get_item(Key={"endpoint_id": "model"})
+
+    assert error.value.response["Error"]["Code"] == "ValidationException"
+
+
+def test_conditional_put_item(jobs_table):
+    item = {"endpoint_id": "model", "job_id": "job-1"}
+    jobs_table.put_item(Item=item, ConditionExpression="attribute_not_exists(job_id)")
+
+    with pytest.raises(ClientError) as error:
+        jobs_table.put_item(Item=item, ConditionExpression=Attr("job_id").not_exists())
+
+    assert error.value.response["Error"]["Code"] == "ConditionalCheckFailedException"
+
+
+def test_conditional_update_item(jobs_table):
+    key = {"endpoint_id": "model", "job_id": "job-1"}
+    jobs_table.put_item(Item={**key, "num_attempts": 0})
+    update = dict(
+        Key=key,
+        UpdateExpression="SET num_attempts = num_attempts + :inc",
+        ConditionExpression="num_attempts = :current_attempts",
+        ExpressionAttributeValues={":inc": 1, ":current_attempts": 0},
+        ReturnValues="ALL_NEW",
+    )
+
+    assert jobs_table.update_item(**update)["Attributes"]["num_attempts"] == Decimal(1)
+    with pytest.raises(ClientError) as error:
+        jobs_table.update_item(**update)
+
+    assert error.value.response["Error"]["Code"] == "ConditionalCheckFailedException"
+    assert jobs_table.get_item(Key=key)["Item"]["num_attempts"] == Decimal(1)
+
+
+def test_update_item_creates_missing_item(jobs_table):
+    key = {"endpoint_id": "model", "job_id": "job-1"}
+    jobs_table.update_item(
+        Key=key,
+        UpdateExpression="SET regions_complete = list_append(if_not_exists(regions_complete, :empty), :region)",
+        ExpressionAttributeValues={":empty": [], ":region": ["region-1"]},
+    )
+
+    assert jobs_table.get_item(Key=key)["Item"] == {**key, "regions_complete": ["region-1"]}
+
+
+def test_update_item_cannot_change_key(jobs_table):
+    key = {"endpoint_id": "model", "job_id": "job-1"}
+    with pytest.raises(ClientError) as error:
+        jobs_table.update_item(Key=key, UpdateExpression="SET job_id = :job", ExpressionAttributeValues={":job": "job-2"})
+
+    assert error.value.response["Error"]["Code"] == "ValidationException"
+    assert jobs_table.items == {}
+
+
+def test_conditional_delete_item(jobs_table):
+    key = {"endpoint_id": "model", "job_id": "job-1"}
+    jobs_table.put_item(Item={**key, "status": "IN_PROGRESS"})
+
+    with pytest.raises(ClientError):
+        jobs_table.delete_item(Key=key, ConditionExpression=Attr("status").eq("SUCCESS"))
+    response = jobs_table.delete_item(Key=key, ReturnValues="ALL_OLD")
+
+    assert response["Attributes"]["status"] == "IN_PROGRESS"
+    assert jobs_table.get_item(Key=key) == {}
+
+
+def test_query_and_scan(jobs_table):
+    for endpoint_id, job_id, status in [
+        ("model", "job-1", "SUCCESS"),
+        ("model", "job-2", "FAILED"),
+        ("other", "job-3", "SUCCESS"),
+    ]:
+        jobs_table.put_item(Item={"endpoint_id": endpoint_id, "job_id": job_id, "status": status})
+
+    query = jobs_table.query(
+        KeyConditionExpression=Key("endpoint_id").eq("model"), FilterExpression=Attr("status").eq("SUCCESS")
+    )
+    count = jobs_table.query(KeyConditionExpression=Key("endpoint_id").eq("model"), Select="COUNT")
+    scan = jobs_table.scan(
+        FilterExpression="#s = :status",
+        ExpressionAttributeNames={"#s": "status"},
+        ExpressionAttributeValues={":status": "SUCCESS"},
+    )
+
+    assert [item["job_id"] for item in query["Items"]] == ["job-1"]
+    assert count == {"Count": 2, "ScannedCount": 2}
+    assert sorted(item["job_id"] for item in scan["Items"]) == ["job-1", "job-3"]
+    assert "LastEvaluatedKey" not in scan
+
+
+def test_query_sorts_by_range_key(in_memory_persistence):
+    table = in_memory_persistence.create_table(
+        "sorted-jobs", ("endpoint_id", "job_id"), index_key_attributes={"by-update": ("endpoint_id", "last_updated")}
+    )
+    for job_id, last_updated in [("job-2", 20), ("job-3", 10), ("job-1", 30)]:
+        table.put_item(Item={"endpoint_id": "model", "job_id": job_id, "last_updated": last_updated})
+    table.put_item(Item={"endpoint_id": "model", "job_id": "job-4"})
+
+    ascending = table.query(KeyConditionExpression=Key("endpoint_id").eq("model"))
+    descending = table.query(KeyConditionExpression=Key("endpoint_id").eq("model"), ScanIndexForward=False)
+    by_update = table.query(
+        IndexName="by-update", KeyConditionExpression=Key("endpoint_id").eq("model") & Key("last_updated").gte(15)
+    )
+    with pytest.raises(ClientError) as error:
+        table.query(IndexName="missing", KeyConditionExpression=Key("endpoint_id").eq("model"))
+
+    assert [item["job_id"] for item in ascending["Items"]] == ["job-1", "job-2", "job-3", "job-4"]
+    assert [item["job_id"] for item in descending["Items"]] == ["job-4", "job-3", "job-2", "job-1"]
+    assert [item["job_id"] for item in by_update["Items"]] == ["job-2", "job-1"]
+    assert error.value.response["Error"]["Code"] == "ValidationException"
+
+
+def test_expired_items_are_removed(jobs_table):
+    jobs_table.put_item(Item={"endpoint_id": "model", "job_id": "job-1", "expire_time": int(time.time()) - 1})
+    jobs_table.put_item(Item={"endpoint_id": "model", "job_id": "job-2", "expire_time": int(time.time()) + 60})
+
+    assert jobs_table.get_item(Key={"endpoint_id": "model", "job_id": "job-1"}) == {}
+    assert [item["job_id"] for item in jobs_table.scan()["Items"]] == ["job-2"]
+
+
+def test_batch_write_item(in_memory_persistence, jobs_table):
+    jobs_table.put_item(Item={"endpoint_id": "model", "job_id": "job-0"})
+
+    response = in_memory_persistence.batch_write_item(
+        RequestItems={
+            "jobs": [
+                {"PutRequest": {"Item": {"endpoint_id": "model", "job_id": "job-1"}}},
+                {"DeleteRequest": {"Key": {"endpoint_id": "model", "job_id": "job-0"}}},
+            ]
+        }
+    )
+
+    assert response == {"UnprocessedItems": {}}
+    assert [item["job_id"] for item in jobs_table.scan()["Items"]] == ["job-1"]
+
+
+def test_tables_are_shared_by_name(in_memory_persistence, jobs_table):
+    assert in_memory_persistence.Table("jobs") is jobs_table
+    assert in_memory_persistence.create_table("jobs", ("job_id", "endpoint_id")) is jobs_table
+    with pytest.raises(ValueError):
+        in_memory_persistence.create_table("jobs", ("job_id",))
+    with pytest.raises(ClientError) as error:
+        in_memory_persistence.Table("missing")
+
+    assert error.value.response["Error"]["Code"] == "ResourceNotFoundException"
+
+
+def test_open_table(in_memory_persistence, mocker):
+    from aws.osml.model_runner.database.persistence_backend import open_table
+
+    backend, table = open_table("images", ("image_id",))
+    assert backend is in_memory_persistence
+    assert table is in_memory_persistence.Table("images")
+    with pytest.raises(ValueError):
+        open_table("regions", ())
+
+    mock_resource = mocker.patch("aws.osml.model_runner.database.persistence_backend.boto3.resource")
+    backend, table = open_table("images", ("image_id",), "DYNAMODB")
+    assert backend is mock_resource.return_value
+    mock_resource.return_value.Table.assert_called_once_with("images")
+
+    backend, _ = open_table("images", ("image_id",), "INVALID")
+    assert backend is mock_resource.return_value
+
+
+def test_requested_jobs_table_in_memory(in_memory_persistence):
+    from aws.osml.model_runner.api import ImageRequest
+    from aws.osml.model_runner.database.requested_jobs_table import RequestedJobsTable
+
+    image_request = ImageRequest.from_external_message(
+        {
+            "jobName": "test-job",
+            "jobId": "test-job-id",
+            "imageUrls": ["s3://test-bucket/test.nitf"],
+            "outputs": [{"type": "S3", "bucket": "test-bucket", "prefix": "results"}],
+            "imageProcessor": {"name": "test-model", "type": "SM_ENDPOINT"},
+            "imageProcessorTileSize": 2048,
+            "imageProcessorTileOverlap": 50,
+        }
+    )
+    table = RequestedJobsTable("test-requested-jobs")
+    other_worker_table = RequestedJobsTable("test-requested-jobs")
+    table.add_new_request(image_request, region_count=2)
+
+    record = table.get_outstanding_requests()[0]
+    assert other_worker_table.start_next_attempt(other_worker_table.get_outstanding_requests()[0])
+    assert not table.start_next_attempt(record)
+    assert table.complete_region(image_request, "region-1")
+    assert not table.complete_region(image_request, "region-1")
+
+    record = other_worker_table.get_outstanding_requests()[0]
+    assert record.num_attempts == 1
+    assert record.regions_complete == ["region-1"]
+
+    table.complete_request(image_request)
+    assert table.get_outstanding_requests() == []
+    assert in_memory_persistence.Table("test-requested-jobs").items == {}
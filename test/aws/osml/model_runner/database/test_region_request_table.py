@@ -192,6 +192,22 @@ def test_add_tile_failed(region_request_table_setup):
     assert len(failed_tile_item.failed_tiles) == 1
 
 
+def test_add_tile_skipped(region_request_table_setup):
+    """
+    Validate that tiles can be added as skipped to the region request item.
+    """
+    from aws.osml.model_runner.common import TileState
+
+    region_request_table, region_request_item = region_request_table_setup
+    region_request_table.start_region_request(region_request_item)
+    tile = ((0, 0), (256, 256))
+    region_request_table.add_tiles(TEST_IMAGE_ID, TEST_REGION_ID, [tile], TileState.SKIPPED)
+    skipped_tile_item = region_request_table.get_region_request(TEST_REGION_ID, TEST_IMAGE_ID)
+
+    assert skipped_tile_item.skipped_tiles == [[[0, 0], [256, 256]]]
+    assert skipped_tile_item.skipped_tile_count == 0
+
+
 def test_add_tile_invalid_format(region_request_table_setup):
     """
     Validate that adding a tile with an invalid format raises UpdateRegionException.
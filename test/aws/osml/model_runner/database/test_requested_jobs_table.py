@@ -1,5 +1,7 @@
 #  Copyright 2025-2026 Amazon.com, Inc. or its affiliates.
 
+import dataclasses
+
 import boto3
 import pytest
 from botocore.exceptions import ClientError
@@ -433,3 +435,107 @@ def test_get_outstanding_requests_pagination_with_many_pages(requested_jobs_tabl
     # Verify all unique job IDs are present
     job_ids = {r.job_id for r in outstanding}
     assert len(job_ids) == 35
+
+
+@pytest.fixture
+def indexed_requested_jobs_table_setup():
+    """Set up a table with the update time index used for incremental refreshes."""
+    table_name = "test-indexed-requested-jobs"
+
+    with mock_aws():
+        ddb = boto3.resource("dynamodb")
+        ddb.create_table(
+            TableName=table_name,
+            KeySchema=[{"AttributeName": "endpoint_id", "KeyType": "HASH"}, {"AttributeName": "job_id", "KeyType": "RANGE"}],
+            AttributeDefinitions=[
+                {"AttributeName": "endpoint_id", "AttributeType": "S"},
+                {"AttributeName": "job_id", "AttributeType": "S"},
+                {"AttributeName": "scheduler_partition", "AttributeType": "S"},
+                {"AttributeName": "last_updated", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": RequestedJobsTable.UPDATED_INDEX,
+                    "KeySchema": [
+                        {"AttributeName": "scheduler_partition", "KeyType": "HASH"},
+                        {"AttributeName": "last_updated", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+        yield RequestedJobsTable(table_name), RequestedJobsTable(table_name)
+
+
+def test_get_outstanding_requests_incremental_refresh(indexed_requested_jobs_table_setup, mocker):
+    """Test that changes made by another worker are picked up through the index without a table scan"""
+    table, other_worker_table = indexed_requested_jobs_table_setup
+    first_request = create_sample_image_request(job_name="test-job-1")
+    table.add_new_request(first_request)
+    assert len(table.get_outstanding_requests()) == 1
+
+    # Another worker buffers a new request and records progress on the first one
+    other_worker_table.add_new_request(create_sample_image_request(job_name="test-job-2"))
+    other_worker_table.complete_region(first_request, "region1")
+
+    scan_spy = mocker.spy(table.table, "scan")
+    outstanding = {record.job_id: record for record in table.get_outstanding_requests()}
+
+    scan_spy.assert_not_called()
+    assert set(outstanding.keys()) == {"test-job-1-id", "test-job-2-id"}
+    assert outstanding["test-job-1-id"].regions_complete == ["region1"]
+    assert outstanding["test-job-1-id"].record_version == 1
+
+
+def test_get_outstanding_requests_full_refresh_removes_deleted(indexed_requested_jobs_table_setup):
+    """Test that requests completed by another worker are dropped at the next full refresh"""
+    table, other_worker_table = indexed_requested_jobs_table_setup
+    image_request = create_sample_image_request()
+    table.add_new_request(image_request)
+    assert len(table.get_outstanding_requests()) == 1
+
+    other_worker_table.complete_request(image_request)
+    table.full_refresh_interval = 0
+
+    assert table.get_outstanding_requests() == []
+
+
+def test_cache_record_ignores_older_versions(requested_jobs_table_setup):
+    """Test that an older copy of a record never replaces a newer one in the local view"""
+    table, _, _ = requested_jobs_table_setup
+    record = table.add_new_request(create_sample_image_request())
+    newer_record = dataclasses.replace(record, num_attempts=1, record_version=2)
+
+    table._cache_record(newer_record)
+    table._cache_record(record)
+
+    assert table._cached_records[(record.endpoint_id, record.job_id)] is newer_record
+
+
+def test_start_next_attempt_on_deleted_request_evicts_record(indexed_requested_jobs_table_setup):
+    """Test that losing the race for a request that no longer exists removes it from the local view"""
+    table, other_worker_table = indexed_requested_jobs_table_setup
+    image_request = create_sample_image_request()
+    table.add_new_request(image_request)
+    records = table.get_outstanding_requests()
+
+    other_worker_table.complete_request(image_request)
+
+    assert not table.start_next_attempt(records[0])
+    assert table.get_outstanding_requests() == []
+
+
+def test_get_outstanding_requests_without_index_falls_back_to_scan(requested_jobs_table_setup, mocker):
+    """Test that tables without the update index are scanned on every call"""
+    table, _, _ = requested_jobs_table_setup
+    table.add_new_request(create_sample_image_request())
+
+    scan_spy = mocker.spy(table.table, "scan")
+    table.get_outstanding_requests()
+    table.get_outstanding_requests()
+    table.get_outstanding_requests()
+
+    assert scan_spy.call_count == 3
+    assert not table._index_available
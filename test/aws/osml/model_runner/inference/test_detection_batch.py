@@ -0,0 +1,258 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import numpy as np
+import pytest
+import shapely
+
+from aws.osml.model_runner.inference import DetectionBatch, decode_detection_batch, encode_detection_batch
+from aws.osml.model_runner.inference.detection_batch import is_detection_batch_media_type
+from aws.osml.model_runner.inference.exceptions import InvalidDetectionBatchException
+
+
+def _build_batch(with_polygons: bool = False) -> DetectionBatch:
+    vertices = None
+    vertex_offsets = None
+    if with_polygons:
+        vertices = np.array([[10, 20], [30, 20], [30, 40], [10, 20], [50, 50], [60, 50], [55, 60], [50, 50]], np.float32)
+        vertex_offsets = np.array([0, 4, 8], dtype=np.int32)
+    return DetectionBatch(
+        bboxes=np.array([[10, 20, 30, 40], [50, 50, 60, 60]], dtype=np.float32),
+        scores=np.array([0.5, 0.75], dtype=np.float32),
+        class_ids=np.array([1, 0], dtype=np.int32),
+        class_names=["car", "truck"],
+        vertices=vertices,
+        vertex_offsets=vertex_offsets,
+    )
+
+
+@pytest.mark.parametrize("with_polygons", [False, True])
+def test_encode_decode_detection_batch(with_polygons):
+    """
+    Test that an encoded detection batch decodes into the same columns.
+    """
+    batch = _build_batch(with_polygons)
+
+    decoded = decode_detection_batch(encode_detection_batch(batch))
+
+    assert len(decoded) == 2
+    assert decoded.class_names == ["car", "truck"]
+    np.testing.assert_array_equal(decoded.bboxes, batch.bboxes)
+    np.testing.assert_array_equal(decoded.scores, batch.scores)
+    np.testing.assert_array_equal(decoded.class_ids, batch.class_ids)
+    assert decoded.has_polygons == with_polygons
+    if with_polygons:
+        np.testing.assert_array_equal(decoded.vertices, batch.vertices)
+        np.testing.assert_array_equal(decoded.vertex_offsets, batch.vertex_offsets)
+
+
+def test_decode_invalid_detection_batch():
+    """
+    Test that payloads that are not complete detection batches are rejected.
+    """
+    payload = encode_detection_batch(_build_batch())
+
+    with pytest.raises(InvalidDetectionBatchException):
+        decode_detection_batch(b'{"type": "FeatureCollection"}')
+    with pytest.raises(InvalidDetectionBatchException):
+        decode_detection_batch(payload[:-4])
+
+
+def _payload(header, *arrays) -> bytes:
+    import json
+    import struct
+
+    from aws.osml.model_runner.inference.detection_batch import DETECTION_BATCH_MAGIC
+
+    header_bytes = header if isinstance(header, bytes) else json.dumps(header).encode("utf-8")
+    return b"".join(
+        [DETECTION_BATCH_MAGIC, struct.pack("<I", len(header_bytes)), header_bytes] + [a.tobytes() for a in arrays]
+    )
+
+
+def _columns(**shapes):
+    return [{"name": name, "dtype": dtype, "shape": shape} for name, (dtype, shape) in shapes.items()]
+
+
+BBOX = np.zeros((2, 4), dtype=np.float32)
+SCORE = np.zeros(2, dtype=np.float32)
+CLASS_ID = np.zeros(2, dtype=np.int32)
+VERTICES = np.zeros((6, 2), dtype=np.float32)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        _payload(b"{not json"),
+        _payload(b"\xff\xfe"),
+        _payload({"count": 2}),
+        _payload({"count": 2, "columns": [{"name": "bbox", "dtype": "not-a-dtype", "shape": [2, 4]}]}),
+        _payload(
+            {"count": 2, "columns": _columns(bbox=("<f4", [8]), score=("<f4", [2]), class_id=("<i4", [2]))},
+            BBOX,
+            SCORE,
+            CLASS_ID,
+        ),
+        _payload(
+            {
+                "count": 2,
+                "columns": _columns(
+                    bbox=("<f4", [2, 4]),
+                    score=("<f4", [2]),
+                    class_id=("<i4", [2]),
+                    vertices=("<f4", [6, 2]),
+                    vertex_offsets=("<i4", [2]),
+                ),
+            },
+            BBOX,
+            SCORE,
+            CLASS_ID,
+            VERTICES,
+            np.array([0, 6], dtype=np.int32),
+        ),
+        _payload(
+            {
+                "count": 2,
+                "columns": _columns(
+                    bbox=("<f4", [2, 4]),
+                    score=("<f4", [2]),
+                    class_id=("<i4", [2]),
+                    vertices=("<f4", [6, 2]),
+                    vertex_offsets=("<i4", [3]),
+                ),
+            },
+            BBOX,
+            SCORE,
+            CLASS_ID,
+            VERTICES,
+            np.array([0, 4, 9], dtype=np.int32),
+        ),
+        _payload(
+            {
+                "count": 2,
+                "columns": _columns(
+                    bbox=("<f4", [2, 4]),
+                    score=("<f4", [2]),
+                    class_id=("<i4", [2]),
+                    vertices=("<f4", [6, 2]),
+                    vertex_offsets=("<i4", [3]),
+                ),
+            },
+            BBOX,
+            SCORE,
+            CLASS_ID,
+            VERTICES,
+            np.array([0, 4, 3], dtype=np.int32),
+        ),
+        _payload(
+            {
+                "count": 2,
+                "columns": _columns(
+                    bbox=("<f4", [2, 4]),
+                    score=("<f4", [2]),
+                    class_id=("<i4", [2]),
+                    vertices=("<f4", [6, 2]),
+                    vertex_offsets=("<i4", [3]),
+                ),
+            },
+            BBOX,
+            SCORE,
+            CLASS_ID,
+            VERTICES,
+            np.array([0, 4, 6], dtype=np.int32),
+        ),
+        _payload(
+            {
+                "count": 2,
+                "columns": _columns(
+                    bbox=("<f4", [2, 4]),
+                    score=("<f4", [2]),
+                    class_id=("<i4", [2]),
+                    vertices=("<f4", [6, 2]),
+                    vertex_offsets=("<i4", [3]),
+                ),
+            },
+            BBOX,
+            SCORE,
+            CLASS_ID,
+            VERTICES,
+            np.array([0, 0, 6], dtype=np.int32),
+        ),
+    ],
+    ids=[
+        "malformed-json",
+        "invalid-utf8",
+        "missing-columns",
+        "invalid-dtype",
+        "bbox-shape",
+        "short-vertex-offsets",
+        "vertex-offsets-past-vertices",
+        "decreasing-vertex-offsets",
+        "degenerate-polygon",
+        "empty-polygon",
+    ],
+)
+def test_decode_corrupt_detection_batch(payload):
+    """
+    Test that corrupt headers and inconsistent columns are rejected with the detection batch exception.
+    """
+    with pytest.raises(InvalidDetectionBatchException):
+        decode_detection_batch(payload)
+
+
+def test_detection_batch_to_features_closes_rings():
+    """
+    Test that polygon rings are closed when the model does not repeat the first vertex.
+    """
+    batch = DetectionBatch(
+        bboxes=np.array([[10, 20, 30, 40]], dtype=np.float32),
+        scores=np.array([0.5], dtype=np.float32),
+        class_ids=np.array([0], dtype=np.int32),
+        class_names=["car"],
+        vertices=np.array([[10, 20], [30, 20], [30, 40]], dtype=np.float32),
+        vertex_offsets=np.array([0, 3], dtype=np.int32),
+    )
+
+    ring = batch.to_features()[0]["properties"]["imageGeometry"]["coordinates"][0]
+
+    assert ring == [[10, 20], [30, 20], [30, 40], [10, 20]]
+    assert _build_batch(True).to_features()[0]["properties"]["imageGeometry"]["coordinates"][0][-1] == [10, 20]
+
+
+def test_is_detection_batch_media_type():
+    """
+    Test that the media type of a response is matched ignoring case and parameters.
+    """
+    assert is_detection_batch_media_type("application/vnd.osml.detections")
+    assert is_detection_batch_media_type("Application/VND.osml.detections; version=1")
+    assert not is_detection_batch_media_type("application/json")
+    assert not is_detection_batch_media_type(None)
+
+
+def test_detection_batch_to_full_image_and_select():
+    """
+    Test that detections are moved to full image coordinates and that selecting detections keeps their polygons.
+    """
+    batch = _build_batch(with_polygons=True).to_full_image(ulx=100, uly=200, processing_scale=2)
+
+    np.testing.assert_array_equal(batch.bboxes[0], [120, 240, 160, 280])
+    np.testing.assert_array_equal(batch.vertices[4], [200, 300])
+
+    selected = batch.select(np.array([False, True]))
+    assert len(selected) == 1
+    np.testing.assert_array_equal(selected.vertex_offsets, [0, 4])
+    np.testing.assert_array_equal(selected.vertices[0], [200, 300])
+    assert shapely.get_type_id(selected.geometries()[0]) == shapely.GeometryType.POLYGON
+
+
+def test_detection_batch_to_features():
+    """
+    Test that features created from a batch carry the standard image properties.
+    """
+    features = _build_batch().to_features({"image_id": "test-image-id"})
+
+    assert len(features) == 2
+    assert features[0]["properties"]["imageBBox"] == [10, 20, 30, 40]
+    assert features[0]["properties"]["imageGeometry"]["coordinates"][0][2] == [30, 40]
+    assert features[0]["properties"]["featureClasses"] == [{"iri": "truck", "score": 0.5}]
+    assert features[1]["properties"]["featureClasses"] == [{"iri": "car", "score": 0.75}]
+    assert features[1]["properties"]["image_id"] == "test-image-id"
@@ -345,3 +345,105 @@ def test_feature_selection_soft_nms_single_feature():
     ]
     processed_features = feature_selector.select_features(test_feature)
     assert len(processed_features) == 1
+
+
+@pytest.mark.parametrize("algorithm", ["NMS", "SOFT_NMS"])
+def test_feature_selection_batch_matches_list(algorithm):
+    """
+    Test that selecting from a feature batch keeps the same features with the same scores as selecting from a list.
+    """
+    from aws.osml.model_runner.common import FeatureBatch, FeatureDistillationNMS, FeatureDistillationSoftNMS
+    from aws.osml.model_runner.inference import FeatureSelector
+
+    options = FeatureDistillationNMS() if algorithm == "NMS" else FeatureDistillationSoftNMS()
+    with open("./test/data/detections.geojson", "r") as geojson_file:
+        list_features = geojson.load(geojson_file)["features"]
+    with open("./test/data/detections.geojson", "r") as geojson_file:
+        batch_features = geojson.load(geojson_file)["features"]
+    # Add a lower scoring copy of every feature so there are duplicates to remove
+    for features in (list_features, batch_features):
+        for feature in list(features):
+            duplicate = geojson.loads(geojson.dumps(feature))
+            duplicate["properties"]["featureClasses"][0]["score"] *= 0.5
+            features.append(duplicate)
+
+    selected_list = FeatureSelector(options).select_features(list_features)
+    selected_batch = FeatureSelector(options).select_features(FeatureBatch.from_features(batch_features))
+
+    assert isinstance(selected_batch, FeatureBatch)
+    assert len(selected_batch) < len(batch_features)
+    assert geojson.dumps(selected_batch.to_features()) == geojson.dumps(selected_list)
+
+
+@pytest.mark.parametrize("algorithm", ["NMS", "SOFT_NMS"])
+def test_feature_selection_list_with_feature_without_bounds(algorithm):
+    """
+    Test that a feature without image bounds is dropped from a list and the features selected from the rest are the
+    features of the list they were given in.
+    """
+    from aws.osml.model_runner.common import FeatureDistillationNMS, FeatureDistillationSoftNMS
+    from aws.osml.model_runner.inference import FeatureSelector
+
+    def create_feature(feature_id, bbox, score):
+        properties = {"featureClasses": [{"iri": "ship", "score": score}]}
+        if bbox is not None:
+            properties["imageBBox"] = bbox
+        return Feature(id=feature_id, geometry=Point((0.0, 0.0)), properties=properties)
+
+    no_bounds = create_feature("no-bounds", None, 0.95)
+    first = create_feature("a", [0, 0, 10, 10], 0.9)
+    second = create_feature("b", [100, 100, 110, 110], 0.8)
+    options = FeatureDistillationNMS() if algorithm == "NMS" else FeatureDistillationSoftNMS()
+
+    selected = FeatureSelector(options).select_features([no_bounds, first, second])
+
+    assert len(selected) == 2
+    assert selected[0] is first
+    assert selected[1] is second
+    assert "rawScore" not in no_bounds["properties"]["featureClasses"][0]
+    if algorithm == "SOFT_NMS":
+        assert first["properties"]["featureClasses"][0]["rawScore"] == 0.9
+        assert second["properties"]["featureClasses"][0]["rawScore"] == 0.8
+
+
+def test_feature_selection_point_nms():
+    """
+    Test that Point NMS removes points of the same class within the radius of a higher scoring point and selects
+    features with an area using NMS.
+    """
+    from aws.osml.model_runner.common import FeatureBatch, FeatureDistillationPointNMS
+    from aws.osml.model_runner.inference import FeatureSelector
+
+    def point_feature(feature_id, x, y, iri, score):
+        return Feature(
+            id=feature_id,
+            geometry=Point((85.0, 32.9)),
+            properties={
+                "imageGeometry": {"type": "Point", "coordinates": [x, y]},
+                "featureClasses": [{"iri": iri, "score": score}],
+            },
+        )
+
+    def box_feature(feature_id, bbox, score):
+        return Feature(
+            id=feature_id,
+            geometry=Point((85.0, 32.9)),
+            properties={"imageBBox": bbox, "featureClasses": [{"iri": "car", "score": score}]},
+        )
+
+    features = [
+        point_feature("duplicate", 101.0, 100.0, "car", 0.6),
+        point_feature("kept", 100.0, 100.0, "car", 0.9),
+        point_feature("other-class", 100.0, 100.0, "boat", 0.7),
+        point_feature("far", 120.0, 100.0, "car", 0.5),
+        box_feature("box", [0, 0, 10, 10], 0.8),
+        box_feature("box-duplicate", [0, 0, 10, 10.5], 0.4),
+    ]
+    feature_selector = FeatureSelector(options=FeatureDistillationPointNMS(radius=2.0))
+
+    selected_batch = feature_selector.select_features(FeatureBatch.from_features(features))
+    selected_features = feature_selector.select_features(features)
+
+    assert [feature["id"] for feature in selected_features] == ["kept", "box", "other-class", "far"]
+    assert selected_batch.ids == ["kept", "box", "other-class", "far"]
+    assert selected_features[0]["properties"]["featureClasses"] == [{"iri": "car", "score": 0.9}]
@@ -189,6 +189,26 @@ def test_calculate_processing_bounds_no_roi():
     assert processing_bounds == ((0, 0), (101, 101))
 
 
+def test_calculate_processing_area_keeps_roi_shape():
+    """
+    Test that the processing area follows the ROI polygon rather than its bounding box.
+    """
+    from aws.osml.model_runner.inference.feature_utils import calculate_processing_area
+    from aws.osml.photogrammetry import ImageCoordinate
+
+    ds, sensor_model = get_dataset_and_camera()
+    assert calculate_processing_area(ds, None, sensor_model) is None
+
+    # A triangle covering the lower left half of the image
+    corners = [sensor_model.image_to_world(ImageCoordinate(corner)) for corner in ([0, 0], [0, 101], [101, 101])]
+    roi = shapely.geometry.Polygon([(degrees(corner.longitude), degrees(corner.latitude)) for corner in corners])
+
+    processing_area = calculate_processing_area(ds, roi, sensor_model)
+    assert processing_area.area == pytest.approx(101 * 101 / 2, rel=0.05)
+    assert processing_area.contains(shapely.geometry.Point(10, 90))
+    assert not processing_area.contains(shapely.geometry.Point(90, 10))
+
+
 def test_calculate_processing_bounds_full_image():
     """
     Test calculating processing bounds with an ROI covering the full image.
@@ -402,6 +422,37 @@ def test_add_properties_to_features():
     assert "geom_imcoords" not in updated_props
 
 
+def test_add_properties_to_feature_batch():
+    """
+    Test that a feature batch gets the same properties as a list of features once it is converted for the sinks.
+    """
+    from aws.osml.model_runner.common import FeatureBatch
+    from aws.osml.model_runner.inference.feature_utils import add_properties_to_features
+
+    def build_features():
+        return [
+            geojson.Feature(
+                geometry=geojson.Point((0, i)),
+                properties={
+                    "imageBBox": [i, i, i + 10, i + 10],
+                    "inferenceTime": "2024-01-02T03:04:05Z",
+                    "image_id": "image-1",
+                    "detection_score": 0.7,
+                },
+            )
+            for i in range(3)
+        ]
+
+    feature_properties = '[{"custom": "value"}, {"another": 123}]'
+    expected = add_properties_to_features("job-1", feature_properties, build_features())
+    batch = add_properties_to_features("job-1", feature_properties, FeatureBatch.from_features(build_features()))
+
+    assert isinstance(batch, FeatureBatch)
+    assert batch.shared_properties == {"custom": "value", "another": 123}
+    assert batch.properties[0]["inferenceMetadata"] is batch.properties[2]["inferenceMetadata"]
+    assert geojson.dumps(batch.to_features()) == geojson.dumps(expected)
+
+
 def test_add_properties_to_features_invalid_json():
     """
     Test invalid feature properties raise InvalidFeaturePropertiesException.
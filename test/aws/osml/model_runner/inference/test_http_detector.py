@@ -154,6 +154,81 @@ def test_find_features(mocker):
         assert len(feature_collection["features"]) == 1
 
 
+def test_find_features_detection_batch(mocker):
+    """
+    Test that responses with the detection batch media type are decoded into a DetectionBatch.
+    """
+    import numpy as np
+
+    from aws.osml.model_runner.inference import (
+        DETECTION_BATCH_MEDIA_TYPE,
+        DetectionBatch,
+        HTTPDetector,
+        encode_detection_batch,
+    )
+
+    batch = DetectionBatch(
+        bboxes=np.array([[429, 553, 440, 561]], dtype=np.float32),
+        scores=np.array([0.3], dtype=np.float32),
+        class_ids=np.array([0], dtype=np.int32),
+        class_names=["ground_motor_passenger_vehicle"],
+    )
+    mock_pool_manager = mocker.patch("aws.osml.model_runner.inference.http_detector.urllib3.PoolManager", autospec=True)
+    _set_mock_response(
+        mock_pool_manager,
+        HTTPResponse(
+            body=encode_detection_batch(batch),
+            headers={"Content-Type": DETECTION_BATCH_MEDIA_TYPE},
+            status=200,
+        ),
+    )
+    feature_detector = HTTPDetector(
+        endpoint="http://dummy/endpoint", endpoint_parameters={"Accept": DETECTION_BATCH_MEDIA_TYPE}
+    )
+
+    with _open_payload() as image_file:
+        detections = feature_detector.find_features(image_file)
+
+    _, kwargs = mock_pool_manager.return_value.request.call_args
+    assert kwargs["headers"]["Accept"] == DETECTION_BATCH_MEDIA_TYPE
+    assert isinstance(detections, DetectionBatch)
+    np.testing.assert_array_equal(detections.scores, batch.scores)
+
+
+def test_find_features_segmentation_mask(mocker):
+    """
+    Test that responses with the segmentation mask media type are decoded into a SegmentationMask.
+    """
+    import numpy as np
+
+    from aws.osml.model_runner.inference import (
+        SEGMENTATION_MASK_MEDIA_TYPE,
+        HTTPDetector,
+        SegmentationMask,
+        encode_segmentation_mask,
+    )
+
+    pixels = np.array([[0.0, 0.5], [1.0, 0.25]], dtype=np.float32)
+    mock_pool_manager = mocker.patch("aws.osml.model_runner.inference.http_detector.urllib3.PoolManager", autospec=True)
+    _set_mock_response(
+        mock_pool_manager,
+        HTTPResponse(
+            body=encode_segmentation_mask(pixels),
+            headers={"Content-Type": SEGMENTATION_MASK_MEDIA_TYPE},
+            status=200,
+        ),
+    )
+    feature_detector = HTTPDetector(
+        endpoint="http://dummy/endpoint", endpoint_parameters={"Accept": SEGMENTATION_MASK_MEDIA_TYPE}
+    )
+
+    with _open_payload() as image_file:
+        mask = feature_detector.find_features(image_file)
+
+    assert isinstance(mask, SegmentationMask)
+    np.testing.assert_array_equal(mask.pixels, [[[0, 128], [255, 64]]])
+
+
 def test_find_features_with_headers_and_metrics(mocker):
     """
     Test custom headers and metric logging in find_features.
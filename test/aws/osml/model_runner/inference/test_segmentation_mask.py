@@ -0,0 +1,70 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import zlib
+
+import numpy as np
+import pytest
+
+from aws.osml.model_runner.inference import SegmentationMask, decode_segmentation_mask, encode_segmentation_mask
+from aws.osml.model_runner.inference.exceptions import InvalidSegmentationMaskException
+from aws.osml.model_runner.inference.segmentation_mask import accepts_segmentation_masks, is_segmentation_mask_media_type
+
+
+@pytest.mark.parametrize("compression", ["NONE", "LZ4", "ZSTD"])
+def test_encode_decode_segmentation_mask(compression, mocker):
+    """
+    Test that masks survive encoding with each compression.
+    """
+    codec = mocker.Mock()
+    codec.compress.side_effect = lambda data: zlib.compress(bytes(data))
+    codec.decompress.side_effect = lambda data: zlib.decompress(bytes(data))
+    mocker.patch("aws.osml.model_runner.tile_worker.raw_tile_factory._get_codec", return_value=codec)
+    pixels = np.random.default_rng(0).integers(0, 256, size=(3, 16, 24), dtype=np.uint8)
+
+    mask = decode_segmentation_mask(encode_segmentation_mask(pixels, compression=compression))
+
+    assert mask.band_count == 3
+    np.testing.assert_array_equal(mask.pixels, pixels)
+
+
+def test_to_confidence():
+    """
+    Test that boolean, floating point and integer masks are converted to 8-bit confidences.
+    """
+    np.testing.assert_array_equal(SegmentationMask.to_confidence(np.array([[True, False]])), [[[255, 0]]])
+    np.testing.assert_array_equal(SegmentationMask.to_confidence(np.array([[-1.0, 0.5, 2.0]])), [[[0, 128, 255]]])
+    np.testing.assert_array_equal(SegmentationMask.to_confidence(np.array([[-5, 100, 300]])), [[[0, 100, 255]]])
+    with pytest.raises(InvalidSegmentationMaskException):
+        SegmentationMask.to_confidence(np.zeros(4))
+    with pytest.raises(InvalidSegmentationMaskException):
+        SegmentationMask.to_confidence(np.zeros((2, 2), dtype=np.complex64))
+
+
+def test_decode_invalid_segmentation_mask():
+    """
+    Test that payloads that are not segmentation masks are rejected.
+    """
+    payload = encode_segmentation_mask(np.zeros((4, 4), dtype=np.uint8))
+
+    with pytest.raises(InvalidSegmentationMaskException):
+        decode_segmentation_mask(b'{"type": "FeatureCollection"}')
+    with pytest.raises(InvalidSegmentationMaskException):
+        decode_segmentation_mask(payload[:-4])
+
+
+def test_is_segmentation_mask_media_type():
+    """
+    Test the media type check ignores case and parameters.
+    """
+    assert is_segmentation_mask_media_type("application/vnd.osml.mask")
+    assert is_segmentation_mask_media_type("Application/VND.osml.mask; version=1")
+    assert not is_segmentation_mask_media_type("application/vnd.osml.detections")
+    assert not is_segmentation_mask_media_type(None)
+
+
+def test_accepts_segmentation_masks():
+    assert accepts_segmentation_masks({"Accept": "application/vnd.osml.mask"})
+    assert accepts_segmentation_masks({"Accept": "application/json, application/vnd.osml.mask; q=0.9"})
+    assert not accepts_segmentation_masks({"Accept": "application/json"})
+    assert not accepts_segmentation_masks({"TargetVariant": "AllTraffic"})
+    assert not accepts_segmentation_masks(None)
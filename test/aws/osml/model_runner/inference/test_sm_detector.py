@@ -116,6 +116,70 @@ def test_find_features(mock_boto3_client, sm_runtime_stub):
         assert len(feature_collection["features"]) == 1
 
 
+def test_find_features_detection_batch(mock_boto3_client, sm_runtime_stub):
+    """
+    Test that responses with the detection batch media type are decoded into a DetectionBatch.
+    """
+    import numpy as np
+
+    from aws.osml.model_runner.inference import (
+        DETECTION_BATCH_MEDIA_TYPE,
+        DetectionBatch,
+        SMDetector,
+        encode_detection_batch,
+    )
+
+    batch = DetectionBatch(
+        bboxes=np.array([[429, 553, 440, 561]], dtype=np.float32),
+        scores=np.array([0.3], dtype=np.float32),
+        class_ids=np.array([0], dtype=np.int32),
+        class_names=["ground_motor_passenger_vehicle"],
+    )
+    sm_runtime_stub.add_response(
+        "invoke_endpoint",
+        expected_params={"EndpointName": "test-endpoint", "Body": ANY, "Accept": DETECTION_BATCH_MEDIA_TYPE},
+        service_response={"Body": io.BytesIO(encode_detection_batch(batch)), "ContentType": DETECTION_BATCH_MEDIA_TYPE},
+    )
+    sm_runtime_stub.activate()
+
+    sm_detector = SMDetector("test-endpoint", endpoint_parameters={"Accept": DETECTION_BATCH_MEDIA_TYPE})
+    detections = sm_detector.find_features(b"payload")
+
+    sm_runtime_stub.assert_no_pending_responses()
+    assert isinstance(detections, DetectionBatch)
+    np.testing.assert_array_equal(detections.bboxes, batch.bboxes)
+    assert detections.class_names == ["ground_motor_passenger_vehicle"]
+
+
+def test_find_features_segmentation_mask(mock_boto3_client, sm_runtime_stub):
+    """
+    Test that responses with the segmentation mask media type are decoded into a SegmentationMask.
+    """
+    import numpy as np
+
+    from aws.osml.model_runner.inference import (
+        SEGMENTATION_MASK_MEDIA_TYPE,
+        SegmentationMask,
+        SMDetector,
+        encode_segmentation_mask,
+    )
+
+    pixels = np.arange(2 * 4 * 4, dtype=np.uint8).reshape(2, 4, 4)
+    sm_runtime_stub.add_response(
+        "invoke_endpoint",
+        expected_params={"EndpointName": "test-endpoint", "Body": ANY, "Accept": SEGMENTATION_MASK_MEDIA_TYPE},
+        service_response={"Body": io.BytesIO(encode_segmentation_mask(pixels)), "ContentType": SEGMENTATION_MASK_MEDIA_TYPE},
+    )
+    sm_runtime_stub.activate()
+
+    sm_detector = SMDetector("test-endpoint", endpoint_parameters={"Accept": SEGMENTATION_MASK_MEDIA_TYPE})
+    mask = sm_detector.find_features(b"payload")
+
+    sm_runtime_stub.assert_no_pending_responses()
+    assert isinstance(mask, SegmentationMask)
+    np.testing.assert_array_equal(mask.pixels, pixels)
+
+
 def test_find_features_throw_json_exception(mock_boto3_client, sm_runtime_stub):
     """
     Test that find_features raises a JSONDecodeError when the SageMaker response
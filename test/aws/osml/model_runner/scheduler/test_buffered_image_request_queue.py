@@ -1,6 +1,7 @@
 #  Copyright 2025-2026 Amazon.com, Inc. or its affiliates.
 
 import json
+import threading
 import time
 from unittest.mock import MagicMock, Mock
 
@@ -10,6 +11,7 @@ from botocore.exceptions import ClientError
 from moto import mock_aws
 
 from aws.osml.model_runner.api import ImageRequest
+from aws.osml.model_runner.common import RegionPlan
 from aws.osml.model_runner.database.requested_jobs_table import RequestedJobsTable
 from aws.osml.model_runner.exceptions import LoadImageException
 from aws.osml.model_runner.scheduler import BufferedImageRequestQueue, EndpointVariantSelector
@@ -282,6 +284,44 @@ def test_fetch_new_requests_with_region_calculator(buffered_queue_setup, mocker)
     mock_region_calculator.calculate_regions.assert_called_once()
 
 
+def test_fetch_new_requests_persists_region_plan(buffered_queue_setup, mocker):
+    """Test _fetch_new_requests() stores the region plan with the buffered request"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_region_plan.return_value = RegionPlan(
+        processing_bounds=((0, 0), (20000, 10000)),
+        regions=[((0, 0), (10240, 10000)), ((0, 10190), (9810, 10000))],
+        tile_counts=[110, 100],
+        image_width=20000,
+        image_height=10000,
+        image_format="NITF",
+    )
+
+    queue_with_calculator = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+    )
+
+    message = create_sample_image_request_message_body()
+    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(message))
+
+    requests = queue_with_calculator.get_outstanding_requests()
+
+    assert len(requests) == 1
+    assert requests[0].region_count == 2
+    mock_region_calculator.calculate_regions.assert_not_called()
+
+    # The plan is read back from the table by any worker
+    stored_requests = RequestedJobsTable(table_name).get_outstanding_requests()
+    assert len(stored_requests) == 1
+    stored_plan = stored_requests[0].request_payload.region_plan
+    assert stored_plan == mock_region_calculator.calculate_region_plan.return_value
+    assert stored_plan.tile_count == 210
+
+
 def test_fetch_new_requests_moves_inaccessible_images_to_dlq(buffered_queue_setup, mocker):
     """Test _fetch_new_requests() moves inaccessible images to DLQ (fail-fast)"""
     queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
@@ -313,6 +353,208 @@ def test_fetch_new_requests_moves_inaccessible_images_to_dlq(buffered_queue_setu
     assert len(dlq_messages) == 1
 
 
+def test_fetch_new_requests_probes_headers_in_background(buffered_queue_setup, mocker):
+    """Test _fetch_new_requests() leaves messages in flight while their headers are probed concurrently"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    release_probes = threading.Event()
+
+    def slow_calculate_regions(**kwargs):
+        release_probes.wait(timeout=10)
+        return [((0, 0), (10240, 10240)), ((0, 10240), (10240, 10240))]
+
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_regions.side_effect = slow_calculate_regions
+    probing_queue = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+        probe_workers=2,
+    )
+
+    for i in range(3):
+        sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body(f"job-{i}")))
+
+    # The messages are received and probed without blocking the call
+    assert probing_queue.get_outstanding_requests() == []
+    assert len(probing_queue._pending_probes) == 3
+
+    release_probes.set()
+    for future in [probe.future for probe in probing_queue._pending_probes.values()]:
+        future.result(timeout=10)
+
+    requests = probing_queue.get_outstanding_requests()
+    assert sorted(request.job_id for request in requests) == ["job-0-id", "job-1-id", "job-2-id"]
+    assert all(request.region_count == 2 for request in requests)
+    assert probing_queue._pending_probes == {}
+    assert mock_region_calculator.calculate_regions.call_count == 3
+
+
+def test_fetch_new_requests_background_probe_failure_moves_to_dlq(buffered_queue_setup, mocker):
+    """Test an inaccessible image found by a background probe is moved to the DLQ"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_regions.side_effect = LoadImageException("Image not accessible")
+    probing_queue = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+        probe_workers=2,
+    )
+    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body()))
+
+    assert probing_queue.get_outstanding_requests() == []
+    for probe in list(probing_queue._pending_probes.values()):
+        probe.future.exception(timeout=10)
+
+    assert probing_queue.get_outstanding_requests() == []
+    assert probing_queue._pending_probes == {}
+    dlq_messages = sqs.receive_message(QueueUrl=dlq_url, MaxNumberOfMessages=10).get("Messages", [])
+    assert len(dlq_messages) == 1
+
+
+def test_fetch_new_requests_background_probe_timeout_buffers_without_region_count(buffered_queue_setup, mocker):
+    """Test a request whose header probe runs past its deadline is buffered without a region count"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    release_probe = threading.Event()
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_regions.side_effect = lambda **kwargs: release_probe.wait(timeout=10)
+    probing_queue = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+        probe_workers=1,
+        probe_timeout=30,
+    )
+    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body()))
+
+    assert probing_queue.get_outstanding_requests() == []
+    for probe in probing_queue._pending_probes.values():
+        probe.deadline = time.time() - 1
+
+    requests = probing_queue.get_outstanding_requests()
+    release_probe.set()
+
+    assert len(requests) == 1
+    assert requests[0].region_count is None
+    assert probing_queue._pending_probes == {}
+
+
+def test_fetch_new_requests_skips_probes_while_workers_are_held_by_timed_out_probes(buffered_queue_setup, mocker):
+    """Test requests are buffered without a region count while every probe worker runs an abandoned probe"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    release_probe = threading.Event()
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_regions.side_effect = lambda **kwargs: release_probe.wait(timeout=10)
+    probing_queue = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+        probe_workers=1,
+        probe_timeout=30,
+    )
+    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body("job-0")))
+    assert probing_queue.get_outstanding_requests() == []
+    probe = next(iter(probing_queue._pending_probes.values()))
+    while not probe.future.running():
+        time.sleep(0.01)
+    probe.deadline = time.time() - 1
+    assert len(probing_queue.get_outstanding_requests()) == 1
+    assert probing_queue._abandoned_probes == [probe.future]
+
+    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body("job-1")))
+    requests = probing_queue.get_outstanding_requests()
+
+    assert [request.region_count for request in requests if request.job_id == "job-1-id"] == [None]
+    assert probing_queue._pending_probes == {}
+    assert mock_region_calculator.calculate_regions.call_count == 1
+
+    release_probe.set()
+    probe.future.exception(timeout=10)
+    assert probing_queue._has_free_probe_worker()
+    assert probing_queue._abandoned_probes == []
+    probing_queue.close()
+
+
+def test_fetch_new_requests_refreshes_receipt_handle_of_redelivered_probe(buffered_queue_setup, mocker):
+    """Test a message received again while its header is probed is deleted with its latest receipt handle"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    release_probe = threading.Event()
+
+    def slow_calculate_regions(**kwargs):
+        release_probe.wait(timeout=10)
+        return [((0, 0), (10240, 10240))]
+
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_regions.side_effect = slow_calculate_regions
+    probing_queue = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+        probe_workers=1,
+    )
+    sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body()))
+    assert probing_queue.get_outstanding_requests() == []
+    probe = next(iter(probing_queue._pending_probes.values()))
+    first_receipt_handle = probe.message["ReceiptHandle"]
+
+    # The message becomes visible again before the probe finishes and is received a second time
+    sqs.change_message_visibility(QueueUrl=queue_url, ReceiptHandle=first_receipt_handle, VisibilityTimeout=0)
+    mock_delete = mocker.patch.object(
+        probing_queue.sqs_client, "delete_message", wraps=probing_queue.sqs_client.delete_message
+    )
+    assert probing_queue.get_outstanding_requests() == []
+    assert probe.message["ReceiptHandle"] != first_receipt_handle
+
+    release_probe.set()
+    probe.future.result(timeout=10)
+    requests = probing_queue.get_outstanding_requests()
+
+    assert [request.region_count for request in requests] == [1]
+    mock_delete.assert_called_once_with(QueueUrl=queue_url, ReceiptHandle=probe.message["ReceiptHandle"])
+    assert mock_region_calculator.calculate_regions.call_count == 1
+    probing_queue.close()
+
+
+def test_close_shuts_down_probe_executor(buffered_queue_setup, mocker):
+    """Test closing the queue cancels the queued probes and stops the probe executor"""
+    queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
+
+    release_probe = threading.Event()
+    mock_region_calculator = mocker.Mock(spec=RegionCalculator)
+    mock_region_calculator.calculate_regions.side_effect = lambda **kwargs: release_probe.wait(timeout=10)
+    probing_queue = BufferedImageRequestQueue(
+        image_queue_url=queue_url,
+        image_dlq_url=dlq_url,
+        requested_jobs_table=jobs_table,
+        region_calculator=mock_region_calculator,
+        probe_workers=1,
+    )
+    for i in range(2):
+        sqs.send_message(QueueUrl=queue_url, MessageBody=json.dumps(create_sample_image_request_message_body(f"job-{i}")))
+    assert probing_queue.get_outstanding_requests() == []
+    executor = probing_queue._probe_executor
+    futures = [probe.future for probe in probing_queue._pending_probes.values()]
+
+    probing_queue.close()
+    release_probe.set()
+
+    assert probing_queue._probe_executor is None
+    assert probing_queue._pending_probes == {}
+    assert sum(future.cancelled() for future in futures) == 1
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
 def test_fetch_new_requests_without_region_calculator(buffered_queue_setup):
     """Test _fetch_new_requests() without region_calculator stores region_count=None"""
     queue, sqs, dynamodb, queue_url, dlq_url, jobs_table, table_name = buffered_queue_setup
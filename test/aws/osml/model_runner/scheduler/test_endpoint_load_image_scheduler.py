@@ -9,10 +9,12 @@ import pytest
 from moto import mock_aws
 
 from aws.osml.model_runner.api import ImageRequest
+from aws.osml.model_runner.common import RegionPlan
 from aws.osml.model_runner.database import ImageRequestStatusRecord
 from aws.osml.model_runner.scheduler.endpoint_load_image_scheduler import (
     EndpointLoadImageScheduler,
     EndpointUtilizationSummary,
+    SchedulingPolicy,
 )
 
 
@@ -250,6 +252,81 @@ def test_endpoint_utilization_summary():
     assert summary.load_factor == 2
 
 
+def test_select_next_eligible_request_deadline_policy():
+    """Test the deadline policy starts the earliest deadline and shortens implied deadlines by priority"""
+    mock_queue = Mock()
+    mock_queue.retry_time = 600
+    scheduler = EndpointLoadImageScheduler(
+        image_request_queue=mock_queue, scheduling_policy="deadline", default_deadline_seconds=3600
+    )
+    assert scheduler.scheduling_policy == SchedulingPolicy.DEADLINE
+
+    now = int(time.time())
+    old_request = create_status_record("old", "endpoint1-model", request_time=now - 1800)
+    urgent_request = create_status_record("urgent", "endpoint2-model", request_time=now)
+    urgent_request.request_payload.deadline = now + 600
+    endpoint_loads = [
+        EndpointUtilizationSummary("endpoint1-model", instance_count=1, current_load=0, requests=[old_request]),
+        EndpointUtilizationSummary("endpoint2-model", instance_count=1, current_load=5, requests=[urgent_request]),
+    ]
+    assert scheduler._select_next_eligible_request(endpoint_loads).job_id == "urgent-id"
+
+    # Without a deadline the old request is due in 1800s, a priority 3 request is due in 3600 / 4 = 900s
+    urgent_request.request_payload.deadline = None
+    urgent_request.request_payload.priority = 3
+    assert scheduler._select_next_eligible_request(endpoint_loads).job_id == "urgent-id"
+    urgent_request.request_payload.priority = 0
+    assert scheduler._select_next_eligible_request(endpoint_loads).job_id == "old-id"
+
+
+def test_select_next_eligible_request_weighted_fair_policy():
+    """Test the weighted fair policy starts small images first and ages large ones into the schedule"""
+    mock_queue = Mock()
+    mock_queue.retry_time = 600
+    scheduler = EndpointLoadImageScheduler(
+        image_request_queue=mock_queue, scheduling_policy=SchedulingPolicy.WEIGHTED_FAIR, aging_seconds=60
+    )
+
+    now = int(time.time())
+    large_request = create_status_record("large", "endpoint1-model", request_time=now - 60, region_count=100)
+    small_request = create_status_record("small", "endpoint1-model", request_time=now, region_count=2)
+    endpoint_loads = [
+        EndpointUtilizationSummary(
+            "endpoint1-model", instance_count=2, current_load=4, requests=[large_request, small_request]
+        )
+    ]
+    assert scheduler._select_next_eligible_request(endpoint_loads).job_id == "small-id"
+
+    # After waiting long enough the large request is credited enough to be started
+    large_request.request_time = now - 60 * 60
+    assert scheduler._select_next_eligible_request(endpoint_loads).job_id == "large-id"
+
+    # Priority scales down the remaining regions of a request
+    large_request.request_time = now - 60
+    large_request.request_payload.priority = 99
+    assert scheduler._select_next_eligible_request(endpoint_loads).job_id == "large-id"
+
+
+def test_select_next_eligible_request_skips_running_requests_for_all_policies():
+    """Test requests that are running or waiting to be retried are never selected"""
+    mock_queue = Mock()
+    mock_queue.retry_time = 600
+    now = int(time.time())
+    running_request = create_status_record("running", "endpoint1-model", request_time=now - 100, last_attempt=now)
+    endpoint_loads = [
+        EndpointUtilizationSummary("endpoint1-model", instance_count=1, current_load=1, requests=[running_request])
+    ]
+    for policy in SchedulingPolicy:
+        scheduler = EndpointLoadImageScheduler(image_request_queue=mock_queue, scheduling_policy=policy)
+        assert scheduler._select_next_eligible_request(endpoint_loads) is None
+
+
+def test_invalid_scheduling_policy_defaults_to_load_balanced():
+    """Test an unknown scheduling policy falls back to load balancing"""
+    scheduler = EndpointLoadImageScheduler(image_request_queue=Mock(), scheduling_policy="SHORTEST_JOB")
+    assert scheduler.scheduling_policy == SchedulingPolicy.LOAD_BALANCED
+
+
 def test_estimate_image_load_with_region_count(scheduler_setup):
     """Test _estimate_image_load with region_count=10 and TILE_WORKERS=4 returns 40"""
     scheduler, mock_queue, sagemaker, endpoints = scheduler_setup
@@ -277,6 +354,22 @@ def test_estimate_image_load_without_region_count(scheduler_setup):
     assert estimated_load == 80
 
 
+def test_estimate_image_load_with_region_plan(scheduler_setup):
+    """Test _estimate_image_load caps each region at its tile count when a region plan is available"""
+    scheduler, mock_queue, sagemaker, endpoints = scheduler_setup
+    status_record = create_status_record("job1", "endpoint1-model", region_count=3)
+    status_record.request_payload.region_plan = RegionPlan(
+        processing_bounds=((0, 0), (12000, 2000)),
+        regions=[((0, 0), (10240, 2000)), ((0, 10190), (1810, 2000)), ((1950, 0), (10240, 50))],
+        tile_counts=[22, 2, 1],
+    )
+
+    estimated_load = scheduler._estimate_image_load(status_record)
+
+    # With default TILE_WORKERS_PER_INSTANCE=4 the regions contribute 4 + 2 + 1
+    assert estimated_load == 7
+
+
 def test_check_capacity_available_sufficient_capacity(scheduler_setup):
     """Test _check_capacity_available returns True when sufficient capacity is available"""
     scheduler, mock_queue, sagemaker, endpoints = scheduler_setup
@@ -469,6 +562,40 @@ def test_calculate_available_capacity_with_target_100_percent(scheduler_setup):
     assert current_utilization == 28
 
 
+def test_calculate_available_capacity_uses_throughput_adjusted_capacity(scheduler_setup):
+    """Test _calculate_available_capacity applies the throughput estimator to the static capacity"""
+    from aws.osml.model_runner.scheduler.endpoint_capacity_estimator import EndpointCapacityEstimator
+    from aws.osml.model_runner.scheduler.endpoint_throughput_estimator import EndpointThroughputEstimator
+
+    scheduler, mock_queue, sagemaker, endpoints = scheduler_setup
+
+    mock_capacity_estimator = Mock(spec=EndpointCapacityEstimator)
+    mock_capacity_estimator.estimate_capacity.return_value = 50
+    mock_throughput_estimator = Mock(spec=EndpointThroughputEstimator)
+    mock_throughput_estimator.adjust_capacity.return_value = 40
+
+    scheduler = EndpointLoadImageScheduler(
+        image_request_queue=mock_queue,
+        capacity_estimator=mock_capacity_estimator,
+        throttling_enabled=True,
+        capacity_target_percentage=0.5,
+        tile_workers_per_instance=4,
+        throughput_estimator=mock_throughput_estimator,
+    )
+
+    current_time = int(time.time())
+    request1 = create_status_record("job1", "endpoint1-model", region_count=2, last_attempt=current_time - 10)
+
+    available_capacity, max_capacity, current_utilization = scheduler._calculate_available_capacity(
+        "endpoint1-model", None, [request1]
+    )
+
+    mock_throughput_estimator.adjust_capacity.assert_called_once_with("endpoint1-model", None, 50)
+    assert max_capacity == 40
+    assert current_utilization == 8
+    assert available_capacity == 12
+
+
 def test_calculate_available_capacity_with_target_120_percent(scheduler_setup):
     """Test _calculate_available_capacity with max_capacity=200, target=1.2, current_load=100 returns 140"""
     from aws.osml.model_runner.scheduler.endpoint_capacity_estimator import EndpointCapacityEstimator
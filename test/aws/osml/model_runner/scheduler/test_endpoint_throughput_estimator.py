@@ -0,0 +1,102 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import time
+from typing import List, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from aws.osml.model_runner.database import EndpointStatisticsItem
+from aws.osml.model_runner.scheduler.endpoint_throughput_estimator import EndpointThroughputEstimator
+
+
+def create_statistics_table(buckets: List[Tuple[int, int, int]], bucket_seconds: int = 60) -> Mock:
+    """
+    Helper function to create a statistics table returning buckets given as (minutes ago, tile count, mean latency ms)
+    """
+    current_bucket = int(time.time()) - int(time.time()) % bucket_seconds
+    table = Mock()
+    table.bucket_seconds = bucket_seconds
+    table.bucket_for.side_effect = lambda timestamp: int(timestamp) - int(timestamp) % bucket_seconds
+    table.get_tile_statistics.return_value = [
+        EndpointStatisticsItem(
+            endpoint_key="endpoint#",
+            bucket_start=current_bucket - minutes_ago * bucket_seconds,
+            tile_count=tile_count,
+            failed_tile_count=0,
+            latency_sum_ms=tile_count * latency_ms,
+        )
+        for minutes_ago, tile_count, latency_ms in sorted(buckets, reverse=True)
+    ]
+    return table
+
+
+def test_adjust_capacity_without_enough_samples_uses_static_capacity():
+    estimator = EndpointThroughputEstimator(create_statistics_table([(1, 10, 1000)]), min_samples=50)
+    assert estimator.adjust_capacity("endpoint", None, 8) == 8
+
+
+def test_adjust_capacity_when_statistics_unavailable_uses_static_capacity():
+    table = create_statistics_table([])
+    table.get_tile_statistics.side_effect = Exception("table not found")
+    estimator = EndpointThroughputEstimator(table)
+
+    assert estimator.get_statistics("endpoint", None) is None
+    assert estimator.adjust_capacity("endpoint", None, 8) == 8
+
+
+def test_adjust_capacity_reduces_capacity_when_latency_degrades():
+    # Baseline of 1s per tile 30 minutes ago, 2s per tile over the recent window
+    table = create_statistics_table([(30, 60, 1000), (3, 40, 2000), (2, 40, 2000), (1, 40, 2000)])
+    estimator = EndpointThroughputEstimator(table)
+
+    assert estimator.adjust_capacity("endpoint", None, 20) == 10
+
+
+def test_adjust_capacity_is_bounded_by_min_capacity_fraction():
+    table = create_statistics_table([(30, 60, 100), (1, 100, 10000)])
+    estimator = EndpointThroughputEstimator(table, min_capacity_fraction=0.25)
+
+    assert estimator.adjust_capacity("endpoint", None, 20) == 5
+
+
+def test_adjust_capacity_raises_capacity_to_observed_concurrency_when_healthy():
+    # 300 tiles at 10s each over a 5 minute window is an average of 10 concurrent requests
+    table = create_statistics_table([(5, 60, 10000), (4, 60, 10000), (3, 60, 10000), (2, 60, 10000), (1, 60, 10000)])
+    estimator = EndpointThroughputEstimator(table, window_seconds=300)
+
+    statistics = estimator.get_statistics("endpoint", None)
+    assert statistics.tile_count == 300
+    assert statistics.mean_latency == pytest.approx(10.0)
+    assert statistics.tiles_per_second == pytest.approx(1.0)
+    assert statistics.observed_concurrency == pytest.approx(10.0)
+    assert estimator.adjust_capacity("endpoint", None, 4) == 10
+    assert estimator.adjust_capacity("endpoint", None, 16) == 16
+
+
+def test_current_bucket_is_ignored():
+    table = create_statistics_table([(0, 1000, 50000), (1, 60, 1000)])
+    estimator = EndpointThroughputEstimator(table, min_samples=10)
+
+    statistics = estimator.get_statistics("endpoint", None)
+    assert statistics.tile_count == 60
+    assert statistics.baseline_latency == pytest.approx(1.0)
+
+
+def test_statistics_are_cached():
+    table = create_statistics_table([(1, 60, 1000)])
+    estimator = EndpointThroughputEstimator(table, cache_ttl_seconds=30)
+
+    estimator.get_statistics("endpoint", "variant-1")
+    estimator.get_statistics("endpoint", "variant-1")
+    estimator.get_statistics("endpoint", "variant-2")
+
+    assert table.get_tile_statistics.call_count == 2
+
+
+def test_expected_tiles_per_second():
+    table = create_statistics_table([(1, 60, 500)])
+    estimator = EndpointThroughputEstimator(table, min_samples=50)
+
+    assert estimator.expected_tiles_per_second("endpoint", None, 4) == pytest.approx(8.0)
+    assert EndpointThroughputEstimator(create_statistics_table([])).expected_tiles_per_second("endpoint", None, 4) is None
@@ -101,6 +101,64 @@ def test_write_features_default_credentials_image_id_with_slash(sample_feature_l
     s3_client_stub.assert_no_pending_responses()
 
 
+@pytest.mark.parametrize("sink_format, extension", [("GEOPARQUET", ".parquet"), ("FLATGEOBUF", ".fgb")])
+def test_write_features_columnar_formats(mocker, sample_feature_list, sink_format, extension):
+    """
+    Write features to S3 using one of the columnar output formats.
+    Ensures the features are converted with GDAL and the object key uses the extension of the format.
+    """
+    from aws.osml.model_runner.api import SinkFormat
+    from aws.osml.model_runner.sink.s3_sink import S3Sink
+
+    mock_translate = mocker.patch("aws.osml.model_runner.sink.vector_file_writer.gdal.VectorTranslate")
+    s3_sink = S3Sink(TEST_RESULTS_BUCKET, TEST_PREFIX, output_format=SinkFormat(sink_format))
+    mock_upload_file = mocker.patch.object(s3_sink.s3_client, "upload_file")
+    mocker.patch.object(s3_sink, "validate_s3_bucket", return_value=True)
+
+    assert s3_sink.write(TEST_IMAGE_ID, sample_feature_list)
+
+    mock_translate.assert_called_once()
+    assert mock_translate.call_args.kwargs["format"] in ["Parquet", "FlatGeobuf"]
+    mock_upload_file.assert_called_once()
+    assert mock_upload_file.call_args.kwargs["Key"] == f"{TEST_PREFIX}/{TEST_IMAGE_ID}{extension}"
+
+
+def test_flatgeobuf_without_geometry_disables_spatial_index(mocker, tmp_path):
+    """
+    Write FlatGeobuf output for features that are missing geometries.
+    Ensures the packed R-tree is disabled since it cannot index null geometries.
+    """
+    from aws.osml.model_runner.api import SinkFormat
+    from aws.osml.model_runner.sink.vector_file_writer import write_features_to_file
+
+    mock_translate = mocker.patch("aws.osml.model_runner.sink.vector_file_writer.gdal.VectorTranslate")
+    features = [Feature(geometry=None, properties={"id": 1})]
+
+    write_features_to_file(features, str(tmp_path / "features.fgb"), SinkFormat.FLATGEOBUF)
+
+    assert mock_translate.call_args.kwargs["layerCreationOptions"] == ["SPATIAL_INDEX=NO"]
+
+
+def test_write_raster(tmp_path):
+    """
+    Write a raster to S3 under a prefix named after the image.
+    """
+    from aws.osml.model_runner.sink.s3_sink import S3Sink
+
+    raster_path = tmp_path / "mask.tif"
+    raster_path.write_bytes(b"II*\x00raster")
+    with mock_aws():
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket=TEST_RESULTS_BUCKET)
+
+        s3_sink = S3Sink(TEST_RESULTS_BUCKET, TEST_PREFIX)
+        assert s3_sink.write_raster("fake/image/123", "mask-0-0.tif", str(raster_path))
+
+        s3_object = s3_client.get_object(Bucket=TEST_RESULTS_BUCKET, Key=f"{TEST_PREFIX}/123/mask-0-0.tif")
+        assert s3_object["ContentType"] == "image/tiff"
+        assert s3_object["Body"].read() == b"II*\x00raster"
+
+
 def test_s3_bucket_404_failure(sample_feature_list):
     """
     Attempt to write to a non-existent S3 bucket (HTTP 404).
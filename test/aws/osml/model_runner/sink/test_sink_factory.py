@@ -56,6 +56,21 @@ def test_kinesis_sink(mocker, sample_feature_list, destinations):
     mock_write.assert_called_once()
 
 
+def test_sink_feature_batch(mocker, sample_feature_list, destinations):
+    """
+    Test that a feature batch is converted to GeoJSON features once and the features are given to every sink.
+    """
+    from aws.osml.model_runner.common import FeatureBatch
+
+    mock_s3_write = mocker.patch("aws.osml.model_runner.sink.s3_sink.S3Sink.write", return_value=True)
+    mock_kinesis_write = mocker.patch("aws.osml.model_runner.sink.kinesis_sink.KinesisSink.write", return_value=True)
+    result = SinkFactory.sink_features("test-job-id", destinations["mixed"], FeatureBatch.from_features(sample_feature_list))
+    assert result
+    written_features = mock_s3_write.call_args[0][1]
+    assert written_features is mock_kinesis_write.call_args[0][1]
+    assert written_features == sample_feature_list
+
+
 def test_mixed_sinks_success(mocker, sample_feature_list, destinations):
     """
     Test sink features with mixed S3 and Kinesis sinks.
@@ -95,6 +110,19 @@ def test_mixed_sinks_failure(mocker, sample_feature_list, destinations):
     mock_kinesis_write.assert_called_once()
 
 
+def test_sink_raster(mocker, destinations):
+    """
+    Test that rasters are written to the S3 sinks and the Kinesis sinks, which only store features, are skipped.
+    """
+    mock_write_raster = mocker.patch("aws.osml.model_runner.sink.s3_sink.S3Sink.write_raster", return_value=True)
+    result = SinkFactory.sink_raster("test-job-id", destinations["mixed"], "mask-0-0.tif", "/tmp/mask.tif")
+    assert result
+    mock_write_raster.assert_called_once_with("test-job-id", "mask-0-0.tif", "/tmp/mask.tif")
+    assert not SinkFactory.sink_raster("test-job-id", destinations["kinesis"], "mask-0-0.tif", "/tmp/mask.tif")
+    with pytest.raises(InvalidImageRequestException):
+        SinkFactory.sink_raster("test-job-id", "", "mask-0-0.tif", "/tmp/mask.tif")
+
+
 def test_invalid_sink_type():
     """
     Test outputs_to_sinks with an invalid sink type.
@@ -112,3 +140,29 @@ def test_no_outputs_defined(sample_feature_list):
     """
     with pytest.raises(InvalidImageRequestException):
         SinkFactory.sink_features("test-job-id", "", sample_feature_list)
+
+
+def test_s3_sink_output_format():
+    """
+    Test outputs_to_sinks passes the requested output format to the S3 sink.
+    Ensures the format defaults to GeoJSON when not specified.
+    """
+    from aws.osml.model_runner.api import SinkFormat
+
+    sinks = SinkFactory.outputs_to_sinks(
+        [
+            {"type": "S3", "bucket": "test-bucket", "prefix": "test-prefix"},
+            {"type": "S3", "bucket": "test-bucket", "prefix": "test-prefix", "format": "GEOPARQUET"},
+            {"type": "S3", "bucket": "test-bucket", "prefix": "test-prefix", "format": "FLATGEOBUF"},
+        ]
+    )
+    assert [sink.output_format for sink in sinks] == [SinkFormat.GEOJSON, SinkFormat.GEOPARQUET, SinkFormat.FLATGEOBUF]
+
+
+def test_invalid_s3_sink_output_format():
+    """
+    Test outputs_to_sinks with an unknown S3 output format.
+    Ensures that the method raises an InvalidImageRequestException for unknown formats.
+    """
+    with pytest.raises(InvalidImageRequestException):
+        SinkFactory.outputs_to_sinks([{"type": "S3", "bucket": "test-bucket", "prefix": "test-prefix", "format": "SHP"}])
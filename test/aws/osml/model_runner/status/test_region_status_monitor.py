@@ -93,3 +93,18 @@ def test_get_status_failed(region_status_monitor_setup):
     test_request_item.failed_tile_count = 10  # All tiles failed
     status = monitor.get_status(test_request_item)
     assert status == RequestStatus.FAILED
+
+
+def test_get_status_with_skipped_tiles(region_status_monitor_setup):
+    """Tests get_status ignores skipped nodata tiles when comparing failed and processed tiles."""
+    monitor, test_request_item, _ = region_status_monitor_setup
+    test_request_item.skipped_tile_count = 6
+    test_request_item.failed_tile_count = 4  # Every tile sent to the model failed
+    assert monitor.get_status(test_request_item) == RequestStatus.FAILED
+
+    test_request_item.failed_tile_count = 2
+    assert monitor.get_status(test_request_item) == RequestStatus.PARTIAL
+
+    test_request_item.skipped_tile_count = 10  # Every tile was nodata
+    test_request_item.failed_tile_count = 0
+    assert monitor.get_status(test_request_item) == RequestStatus.SUCCESS
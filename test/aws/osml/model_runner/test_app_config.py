@@ -122,6 +122,7 @@ class TestServiceConfigValidation:
             "DEFAULT_HTTP_ENDPOINT_CONCURRENCY",
             "TILE_WORKERS_PER_INSTANCE",
             "CAPACITY_TARGET_PERCENTAGE",
+            "SINGLE_NODE_ENABLED",
         ]
 
         env_copy = os.environ.copy()
@@ -138,4 +139,5 @@ class TestServiceConfigValidation:
             assert config.default_instance_concurrency == 2
             assert config.default_http_endpoint_concurrency == 10
             assert config.tile_workers_per_instance == 4
+            assert config.single_node_enabled is False
             assert config.capacity_target_percentage == 1.0
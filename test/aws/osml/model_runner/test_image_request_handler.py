@@ -12,7 +12,7 @@ from botocore.stub import Stubber
 
 from aws.osml.model_runner.api import ImageRequest, ModelInvokeMode
 from aws.osml.model_runner.app_config import ServiceConfig
-from aws.osml.model_runner.common import RequestStatus
+from aws.osml.model_runner.common import FeatureBatch, RegionPlan, RequestStatus
 from aws.osml.model_runner.database import ImageRequestItem, ImageRequestTable, RegionRequestTable
 from aws.osml.model_runner.exceptions import (
     AggregateFeaturesException,
@@ -241,7 +241,7 @@ def test_process_image_request_failure_before_item_created(handler_setup):
 
 @patch("aws.osml.model_runner.image_request_handler.SinkFactory.sink_features")
 @patch("aws.osml.model_runner.image_request_handler.ImageRequestHandler.deduplicate")
-@patch("aws.osml.model_runner.image_request_handler.FeatureTable.aggregate_features")
+@patch("aws.osml.model_runner.image_request_handler.FeatureTable.aggregate_feature_batch")
 def test_complete_image_request(mock_aggregate_features, mock_deduplicate, mock_sink_features, handler_setup):
     """
     Test successful completion of image request.
@@ -269,21 +269,24 @@ def test_complete_image_request(mock_aggregate_features, mock_deduplicate, mock_
             "geometry": {"type": "Point", "coordinates": [-77.0364761352539, 38.89761287129639]},
         }
     ]
-    mock_deduplicate.return_value = mock_features
-    mock_aggregate_features.return_value = mock_features
+    feature_batch = FeatureBatch.from_features(mock_features)
+    mock_deduplicate.return_value = feature_batch
+    mock_aggregate_features.return_value = feature_batch
     mock_sink_features.return_value = True
 
     # Call complete_image_request
     handler.complete_image_request(mock_region_request, "tif", mock_raster_dataset, mock_sensor_model)
 
-    # Ensure sink_features was called correctly
+    # Ensure sink_features was called correctly with the batch, the sinks convert it to GeoJSON
     mock_sink_features.assert_called_once()
+    assert mock_sink_features.call_args[0][2] is feature_batch
+    assert "inferenceMetadata" in feature_batch.properties[0]
 
     # Ensure failure handling methods were called
     mock_image_status_monitor.process_event.assert_called()
 
 
-@patch("aws.osml.model_runner.image_request_handler.FeatureTable.aggregate_features", side_effect=Exception("boom"))
+@patch("aws.osml.model_runner.image_request_handler.FeatureTable.aggregate_feature_batch", side_effect=Exception("boom"))
 def test_complete_image_request_raises(_mock_aggregate, handler_setup):
     """
     Test completion wraps aggregation errors.
@@ -359,6 +362,127 @@ def test_queue_region_request_does_not_complete_when_incomplete(handler_setup):
     handler.complete_image_request.assert_not_called()
 
 
+def test_process_image_request_single_node(handler_setup):
+    """
+    Test an image with a single region is processed in memory without writing the derived image data or queueing
+    its region.
+    """
+    handler = handler_setup["handler"]
+    mock_image_request_table = handler_setup["mock_image_request_table"]
+    mock_image_status_monitor = handler_setup["mock_image_status_monitor"]
+    mock_image_request = handler_setup["mock_image_request"]
+
+    handler.single_node_max_pixels = 0
+    region = ((0, 0), (256, 256))
+    handler.load_image_request = MagicMock(return_value=("tif", MagicMock(), MagicMock(), [region]))
+    handler.queue_region_request = MagicMock()
+    handler.process_image_in_memory = MagicMock()
+    handler.set_default_model_endpoint_variant = MagicMock(return_value=mock_image_request)
+    on_image_update = MagicMock()
+    handler.on_image_update.subscribe(on_image_update)
+
+    handler.process_image_request(mock_image_request)
+
+    mock_image_request_table.start_image_request.assert_called_once()
+    mock_image_request_table.update_image_request.assert_not_called()
+    handler.queue_region_request.assert_not_called()
+    handler.process_image_in_memory.assert_called_once()
+    assert handler.process_image_in_memory.call_args[0][0] == [region]
+    on_image_update.assert_called_once()
+    assert mock_image_status_monitor.process_event.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "single_node_max_pixels, regions, processing_scale, expected",
+    [
+        (None, [((0, 0), (256, 256))], 1, False),
+        (0, [((0, 0), (256, 256))], 1, True),
+        (0, [((0, 0), (256, 256)), ((256, 0), (256, 256))], 1, False),
+        (2 * 256 * 256, [((0, 0), (256, 256)), ((256, 0), (256, 256))], 1, True),
+        (256 * 256, [((0, 0), (256, 256)), ((256, 0), (256, 256))], 1, False),
+        (256 * 256, [((0, 0), (512, 512)), ((512, 0), (512, 512))], 2, False),
+        (2 * 256 * 256, [((0, 0), (512, 512)), ((512, 0), (512, 512))], 2, True),
+    ],
+)
+def test_is_single_node_image(handler_setup, single_node_max_pixels, regions, processing_scale, expected):
+    """
+    Test images are processed on a single node when they have one region or few enough pixels.
+    """
+    handler = handler_setup["handler"]
+    handler.single_node_max_pixels = single_node_max_pixels
+
+    assert handler.is_single_node_image(regions, processing_scale) is expected
+
+
+def test_process_image_in_memory(handler_setup):
+    """
+    Test every region is processed in memory and the collected features are deduplicated, sunk and the image request
+    is ended with the region counts of the item.
+    """
+    from aws.osml.model_runner.tile_worker import FeatureCollector
+
+    handler = handler_setup["handler"]
+    mock_image_request = handler_setup["mock_image_request"]
+    image_request_item = handler_setup["mock_image_request_item"]
+    image_request_item.region_success = 0
+    image_request_item.region_error = 0
+
+    def process_region_in_memory(
+        region_request, region_request_item, raster_dataset, sensor_model, feature_collector, image_request_item
+    ):
+        feature_collector.add_features(
+            [
+                {
+                    "type": "Feature",
+                    "properties": {"imageBBox": [0, 0, 10, 10]},
+                    "geometry": {"type": "Point", "coordinates": [0.0, 0.0]},
+                }
+            ]
+        )
+        assert region_request_item.region_id == region_request.region_id
+        if region_request.region_bounds[0] == (256, 0):
+            return RequestStatus.PARTIAL
+        return RequestStatus.SUCCESS
+
+    handler.region_request_handler.process_region_in_memory = MagicMock(side_effect=process_region_in_memory)
+    handler.finish_image_request = MagicMock()
+    raster_dataset = MagicMock()
+    raster_dataset.GetDriver.return_value.ShortName = "GTiff"
+    regions = [((0, 0), (256, 256)), ((256, 0), (256, 256))]
+
+    handler.process_image_in_memory(regions, mock_image_request, image_request_item, raster_dataset, None, "tif")
+
+    assert handler.region_request_handler.process_region_in_memory.call_count == 2
+    assert isinstance(handler.region_request_handler.process_region_in_memory.call_args[0][4], FeatureCollector)
+    assert handler.region_request_handler.process_region_in_memory.call_args[0][5] is image_request_item
+    assert image_request_item.region_success == 1
+    assert image_request_item.region_error == 1
+    handler_setup["mock_region_request_table"].start_region_request.assert_not_called()
+    handler_setup["mock_region_request_queue"].send_request.assert_not_called()
+    args, kwargs = handler.finish_image_request.call_args
+    assert args[0] is image_request_item
+    assert len(args[1]) == 2
+    assert args[2] == "GTIFF"
+    assert kwargs == {"in_memory": True}
+
+
+def test_process_image_in_memory_wraps_finish_errors(handler_setup):
+    """
+    Test errors completing an image processed in memory are raised as aggregation errors.
+    """
+    handler = handler_setup["handler"]
+    image_request_item = handler_setup["mock_image_request_item"]
+    image_request_item.region_success = 0
+    image_request_item.region_error = 0
+    handler.region_request_handler.process_region_in_memory = MagicMock(return_value=RequestStatus.SUCCESS)
+    handler.finish_image_request = MagicMock(side_effect=Exception("boom"))
+
+    with pytest.raises(AggregateFeaturesException):
+        handler.process_image_in_memory(
+            [((0, 0), (256, 256))], handler_setup["mock_image_request"], image_request_item, MagicMock(), None, "tif"
+        )
+
+
 @patch("aws.osml.model_runner.image_request_handler.calculate_processing_bounds")
 @patch("aws.osml.model_runner.image_request_handler.get_image_extension")
 @patch("aws.osml.model_runner.image_request_handler.load_gdal_dataset")
@@ -438,6 +562,39 @@ def test_load_image_request_with_overlap(
     )
 
 
+@patch("aws.osml.model_runner.image_request_handler.resolve_processing_scale", return_value=4)
+@patch("aws.osml.model_runner.image_request_handler.calculate_processing_bounds", return_value=((0, 0), (400, 400)))
+@patch("aws.osml.model_runner.image_request_handler.get_image_extension", return_value="tif")
+@patch("aws.osml.model_runner.image_request_handler.load_gdal_dataset", return_value=(MagicMock(), MagicMock()))
+@patch("aws.osml.model_runner.image_request_handler.get_image_path", return_value="/vsis3/bucket/key")
+@patch("aws.osml.model_runner.image_request_handler.GDALConfigEnv")
+def test_load_image_request_at_overview_level(
+    _mock_gdal_env, _mock_get_image_path, mock_load_gdal, _mock_get_extension, _mock_bounds, mock_scale, handler_setup
+):
+    """
+    Test load_image_request lays out regions and tiles at the requested overview level in full image pixels.
+    """
+    handler = handler_setup["handler"]
+    mock_tiling_strategy = handler_setup["mock_tiling_strategy"]
+    mock_image_request_item = handler_setup["mock_image_request_item"]
+
+    mock_tiling_strategy.compute_regions.return_value = ["region"]
+    mock_image_request_item.tile_size = "(32, 32)"
+    mock_image_request_item.tile_overlap = "(2, 2)"
+
+    handler.load_image_request(mock_image_request_item, None, overview_level=2)
+
+    raster_dataset, sensor_model = mock_load_gdal.return_value
+    mock_scale.assert_called_once_with(raster_dataset, sensor_model, 2, None)
+    assert mock_image_request_item.processing_scale == 4
+    mock_tiling_strategy.compute_regions.assert_called_once_with(
+        ((0, 0), (400, 400)),
+        (1024, 1024),
+        (128, 128),
+        (8, 8),
+    )
+
+
 @patch("aws.osml.model_runner.image_request_handler.calculate_processing_bounds", return_value=None)
 @patch("aws.osml.model_runner.image_request_handler.get_image_extension", return_value="tif")
 @patch("aws.osml.model_runner.image_request_handler.load_gdal_dataset", return_value=(MagicMock(), MagicMock()))
@@ -457,6 +614,86 @@ def test_load_image_request_missing_bounds_raises(
         handler.load_image_request(mock_image_request_item, None)
 
 
+@patch("aws.osml.model_runner.image_request_handler.calculate_processing_bounds")
+@patch("aws.osml.model_runner.image_request_handler.get_image_extension")
+@patch("aws.osml.model_runner.image_request_handler.load_gdal_dataset")
+@patch("aws.osml.model_runner.image_request_handler.get_image_path", return_value="/vsis3/bucket/key")
+@patch("aws.osml.model_runner.image_request_handler.GDALConfigEnv")
+def test_load_image_request_reuses_region_plan(
+    _mock_gdal_env, _mock_get_image_path, mock_load_gdal, mock_get_extension, mock_bounds, handler_setup
+):
+    """
+    Test load_image_request reuses a matching region plan instead of recalculating regions.
+    """
+    handler = handler_setup["handler"]
+    mock_tiling_strategy = handler_setup["mock_tiling_strategy"]
+    mock_image_request_item = handler_setup["mock_image_request_item"]
+
+    raster_dataset = MagicMock(RasterXSize=300, RasterYSize=200)
+    mock_load_gdal.return_value = (raster_dataset, MagicMock())
+    mock_image_request_item.tile_size = "(32, 32)"
+    mock_image_request_item.tile_overlap = "(1, 1)"
+    region_plan = RegionPlan(
+        processing_bounds=((0, 0), (300, 200)),
+        regions=[((0, 0), (256, 200)), ((0, 255), (45, 200))],
+        tile_counts=[63, 14],
+        region_size=(256, 256),
+        tile_size=(32, 32),
+        tile_overlap=(1, 1),
+        image_width=300,
+        image_height=200,
+        image_format="GTIFF",
+        image_extension="TIFF",
+    )
+
+    extension, ds, _, regions = handler.load_image_request(mock_image_request_item, None, region_plan)
+
+    assert extension == "TIFF"
+    assert ds is raster_dataset
+    assert regions == region_plan.regions
+    mock_bounds.assert_not_called()
+    mock_get_extension.assert_not_called()
+    mock_tiling_strategy.compute_regions.assert_not_called()
+
+
+@patch("aws.osml.model_runner.image_request_handler.calculate_processing_bounds", return_value=((0, 0), (300, 200)))
+@patch("aws.osml.model_runner.image_request_handler.get_image_extension", return_value="tif")
+@patch("aws.osml.model_runner.image_request_handler.load_gdal_dataset")
+@patch("aws.osml.model_runner.image_request_handler.get_image_path", return_value="/vsis3/bucket/key")
+@patch("aws.osml.model_runner.image_request_handler.GDALConfigEnv")
+def test_load_image_request_ignores_stale_region_plan(
+    _mock_gdal_env, _mock_get_image_path, mock_load_gdal, _mock_get_extension, mock_bounds, handler_setup
+):
+    """
+    Test load_image_request recalculates regions when the region plan used different tiling parameters.
+    """
+    handler = handler_setup["handler"]
+    mock_tiling_strategy = handler_setup["mock_tiling_strategy"]
+    mock_image_request_item = handler_setup["mock_image_request_item"]
+
+    mock_load_gdal.return_value = (MagicMock(RasterXSize=300, RasterYSize=200), MagicMock())
+    mock_tiling_strategy.compute_regions.return_value = ["region"]
+    mock_image_request_item.tile_size = "(64, 64)"
+    mock_image_request_item.tile_overlap = "(1, 1)"
+    region_plan = RegionPlan(
+        processing_bounds=((0, 0), (300, 200)),
+        regions=[((0, 0), (300, 200))],
+        tile_counts=[77],
+        region_size=(256, 256),
+        tile_size=(32, 32),
+        tile_overlap=(1, 1),
+        image_width=300,
+        image_height=200,
+    )
+
+    extension, _, _, regions = handler.load_image_request(mock_image_request_item, None, region_plan)
+
+    assert extension == "tif"
+    assert regions == ["region"]
+    mock_bounds.assert_called_once()
+    mock_tiling_strategy.compute_regions.assert_called_once()
+
+
 def test_validate_model_hosting_invalid(handler_setup):
     """
     Test invalid model hosting raises and reports status.
@@ -568,6 +805,25 @@ def test_end_image_request_metrics(handler_setup):
     mock_image_status_monitor.process_event.assert_called()
 
 
+def test_end_image_request_in_memory(handler_setup):
+    """
+    Test an image processed in memory is ended with the item the handler holds instead of the one in the table.
+    """
+    handler = handler_setup["handler"]
+    mock_image_request_table = handler_setup["mock_image_request_table"]
+    mock_image_status_monitor = handler_setup["mock_image_status_monitor"]
+    image_request_item = handler_setup["mock_image_request_item"]
+    mock_image_request_table.end_image_request.return_value = image_request_item
+    mock_image_status_monitor.get_status.return_value = RequestStatus.SUCCESS
+
+    ImageRequestHandler.end_image_request.__wrapped__(handler, image_request_item, "NITF", in_memory=True)
+
+    mock_image_request_table.end_image_request.assert_called_once_with(image_request_item.image_id, image_request_item)
+    mock_image_status_monitor.process_event.assert_called_once_with(
+        image_request_item, RequestStatus.SUCCESS, "Completed image processing"
+    )
+
+
 def test_end_image_request_without_metrics(handler_setup):
     """
     Test end_image_request works without metrics logger.
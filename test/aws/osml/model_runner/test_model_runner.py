@@ -71,6 +71,34 @@ def test_process_region_requests_success(mock_load_gdal, mock_finish_request, mo
     mock_finish_request.assert_called_once_with("receipt_handle")
 
 
+@patch("aws.osml.model_runner.model_runner.RegionRequestHandler.process_region_request")
+@patch("aws.osml.model_runner.model_runner.RequestQueue.finish_request")
+@patch("aws.osml.model_runner.model_runner.load_gdal_dataset")
+@patch("aws.osml.model_runner.model_runner.get_image_path", return_value="/vsis3/bucket/image.ntf")
+def test_process_region_requests_reuses_cached_dataset(
+    _mock_get_path, mock_load_gdal, _mock_finish_request, _mock_process_region, model_runner_setup
+):
+    """Test that regions of the same image processed on one host open the dataset once."""
+    runner = model_runner_setup
+
+    runner._get_or_create_region_request_item = MagicMock(return_value=MagicMock())
+    mock_load_gdal.return_value = (MagicMock(), MagicMock())
+    runner.image_request_table.is_image_request_complete = MagicMock(return_value=False)
+    region_attributes = {"image_url": "s3://bucket/image.ntf", "image_read_role": None}
+    runner.region_requests_iter = iter(
+        [
+            ("receipt_handle_1", dict(region_attributes, region_id="region_1")),
+            ("receipt_handle_2", dict(region_attributes, region_id="region_2")),
+        ]
+    )
+
+    runner._process_region_requests()
+    runner._process_region_requests()
+
+    mock_load_gdal.assert_called_once_with("/vsis3/bucket/image.ntf")
+    assert runner.dataset_cache.hits == 1
+
+
 def test_process_image_request_noimage(model_runner_setup):
     """Test path where the scheduler does not return an ImageRequest to process"""
     runner = model_runner_setup
@@ -189,6 +217,7 @@ def test_monitor_work_queues_handles_unexpected_exception_stops_running(mock_set
 
     # Arrange
     runner._process_region_requests = MagicMock(side_effect=ValueError("Unexpected error"))
+    runner.buffered_image_request_queue = MagicMock()
     runner.running = True
 
     # Act
@@ -197,6 +226,7 @@ def test_monitor_work_queues_handles_unexpected_exception_stops_running(mock_set
     # Assert
     assert runner.running is False
     runner._process_region_requests.assert_called_once()
+    runner.buffered_image_request_queue.close.assert_called_once()
 
 
 def test_process_region_requests_with_empty_attributes_returns_false(model_runner_setup):
@@ -359,3 +389,23 @@ def test_get_or_create_region_request_item_returns_existing_item(model_runner_se
     runner.region_request_table.get_region_request.assert_called_once_with("region_123", "img_456")
     # Verify start_region_request was NOT called since item already exists
     runner.region_request_table.start_region_request.assert_not_called()
+
+
+@patch("aws.osml.model_runner.model_runner.S3BlockCacheProxy")
+@patch("aws.osml.model_runner.model_runner.S3BlockCache")
+def test_start_s3_block_cache_routes_gdal_through_proxy(mock_block_cache, mock_proxy, model_runner_setup):
+    """Test that the S3 block cache proxy is started and configured only when a cache directory is set."""
+    runner = model_runner_setup
+
+    runner.config.s3_block_cache_dir = None
+    runner._start_s3_block_cache()
+    mock_proxy.assert_not_called()
+
+    runner.config.s3_block_cache_dir = "/tmp/s3-block-cache"
+    runner._start_s3_block_cache()
+    runner._start_s3_block_cache()
+
+    mock_block_cache.assert_called_once_with(
+        "/tmp/s3-block-cache", max_size_bytes=runner.config.s3_block_cache_size_mb * 1024 * 1024
+    )
+    mock_proxy.return_value.start.return_value.configure_gdal.assert_called_once()
@@ -303,3 +303,163 @@ def test_fail_region_request_exception_handling(region_request_handler_setup):
     # Act / Assert - should raise ProcessRegionException
     with pytest.raises(ProcessRegionException):
         handler.fail_region_request(mock_region_request_item)
+
+
+@patch("aws.osml.model_runner.region_request_handler.SinkFactory.sink_raster")
+def test_sink_region_mask(mock_sink_raster, region_request_handler_setup):
+    """
+    Test that the mask mosaic of a region is written as a COG and sunk to the outputs of the image request.
+    """
+    from aws.osml.model_runner.exceptions import ProcessRegionException
+
+    (handler, _, mock_image_request_table, _, _, _, mock_raster_dataset, _, mock_region_request, _, _, _) = (
+        region_request_handler_setup
+    )
+    mock_image_request_table.get_image_request.return_value = MagicMock(outputs="[]")
+    mock_mask_mosaic = Mock()
+    mock_sink_raster.return_value = True
+
+    handler.sink_region_mask(mock_region_request, mock_mask_mosaic, mock_raster_dataset)
+
+    file_path = mock_mask_mosaic.write_cog.call_args[0][0]
+    assert file_path.endswith("mask-0-0.tif")
+    mock_sink_raster.assert_called_once_with(mock_region_request.job_id, "[]", "mask-0-0.tif", file_path)
+
+    mock_sink_raster.return_value = False
+    with pytest.raises(ProcessRegionException):
+        handler.sink_region_mask(mock_region_request, mock_mask_mosaic, mock_raster_dataset)
+
+
+@patch("aws.osml.model_runner.region_request_handler.RegionMaskMosaic")
+@patch("aws.osml.model_runner.region_request_handler.setup_tile_workers")
+@patch("aws.osml.model_runner.region_request_handler.process_tiles")
+def test_process_region_tiles_retry_with_masks(
+    mock_process_tiles, mock_setup_workers, mock_mask_mosaic_class, region_request_handler_setup
+):
+    """
+    Test that a retried region requesting segmentation masks processes its succeeded tiles again, so the mask
+    written for the region replaces the earlier one with every tile blended in.
+    """
+    (handler, _, _, _, _, _, mock_raster_dataset, mock_sensor_model, mock_region_request, mock_region_request_item, *_) = (
+        region_request_handler_setup
+    )
+    mock_setup_workers.return_value = (Mock(), [Mock()])
+    mock_process_tiles.return_value = (4, 0)
+    mock_mask_mosaic = mock_mask_mosaic_class.return_value
+    mock_mask_mosaic.has_masks = True
+    handler.sink_region_mask = Mock()
+    mock_region_request_item.succeeded_tiles = [[[0, 0], [10, 10]]]
+    mock_region_request.model_endpoint_parameters = {"Accept": "application/vnd.osml.mask"}
+
+    handler.process_region_tiles(mock_region_request, mock_region_request_item, mock_raster_dataset, mock_sensor_model)
+
+    assert mock_process_tiles.call_args.kwargs["reprocess_succeeded_tiles"] is True
+    handler.sink_region_mask.assert_called_once_with(mock_region_request, mock_mask_mosaic, mock_raster_dataset)
+    mock_mask_mosaic.close.assert_called_once()
+
+    mock_region_request.model_endpoint_parameters = None
+    handler.process_region_tiles(mock_region_request, mock_region_request_item, mock_raster_dataset, mock_sensor_model)
+
+    assert mock_process_tiles.call_args.kwargs["reprocess_succeeded_tiles"] is False
+
+
+@patch("aws.osml.model_runner.region_request_handler.setup_tile_workers")
+@patch("aws.osml.model_runner.region_request_handler.process_tiles")
+def test_process_region_in_memory(mock_process_tiles, mock_setup_workers, region_request_handler_setup):
+    """
+    Test processing a region of an image processed on this host without updating the tables.
+    """
+    (
+        handler,
+        mock_region_request_table,
+        mock_image_request_table,
+        mock_region_status_monitor,
+        mock_tiling_strategy,
+        mock_config,
+        mock_raster_dataset,
+        mock_sensor_model,
+        mock_region_request,
+        mock_region_request_item,
+        mock_tile_queue,
+        mock_tile_workers,
+    ) = region_request_handler_setup
+
+    from aws.osml.model_runner.tile_worker import FeatureCollector
+
+    feature_collector = FeatureCollector()
+    image_request_item = ImageRequestItem(image_id="test-image-d", job_id="test-job")
+    on_region_complete = Mock()
+    handler.on_region_complete.subscribe(on_region_complete)
+    mock_setup_workers.return_value = (mock_tile_queue, mock_tile_workers)
+    mock_process_tiles.return_value = (10, 0)
+    mock_region_status_monitor.get_status.return_value = RequestStatus.SUCCESS
+
+    result = handler.process_region_in_memory(
+        region_request=mock_region_request,
+        region_request_item=mock_region_request_item,
+        raster_dataset=mock_raster_dataset,
+        sensor_model=mock_sensor_model,
+        feature_collector=feature_collector,
+        image_request_item=image_request_item,
+    )
+
+    assert result == RequestStatus.SUCCESS
+    assert mock_setup_workers.call_args.kwargs["feature_collector"] is feature_collector
+    assert mock_region_request_item.total_tiles == 10
+    assert mock_region_request_item.region_status == RequestStatus.SUCCESS
+    assert mock_region_request_item.end_time is not None
+    mock_region_status_monitor.process_event.assert_called_once_with(
+        mock_region_request_item, RequestStatus.SUCCESS, "Completed region processing"
+    )
+    on_region_complete.assert_called_once_with(image_request_item, mock_region_request_item, RequestStatus.SUCCESS)
+    mock_region_request_table.start_region_request.assert_not_called()
+    mock_region_request_table.update_region_request.assert_not_called()
+    mock_image_request_table.complete_region_request.assert_not_called()
+
+
+@patch("aws.osml.model_runner.region_request_handler.setup_tile_workers")
+@patch("aws.osml.model_runner.region_request_handler.process_tiles")
+def test_process_region_in_memory_exception(mock_process_tiles, mock_setup_workers, region_request_handler_setup):
+    """
+    Test that a region processed in memory is reported as failed when its tiles cannot be processed.
+    """
+    (
+        handler,
+        mock_region_request_table,
+        mock_image_request_table,
+        mock_region_status_monitor,
+        mock_tiling_strategy,
+        mock_config,
+        mock_raster_dataset,
+        mock_sensor_model,
+        mock_region_request,
+        mock_region_request_item,
+        mock_tile_queue,
+        mock_tile_workers,
+    ) = region_request_handler_setup
+
+    from aws.osml.model_runner.tile_worker import FeatureCollector
+
+    image_request_item = ImageRequestItem(image_id="test-image-d", job_id="test-job")
+    on_region_complete = Mock()
+    handler.on_region_complete.subscribe(on_region_complete)
+    mock_setup_workers.return_value = (mock_tile_queue, mock_tile_workers)
+    mock_process_tiles.side_effect = Exception("Tile processing failed")
+
+    result = handler.process_region_in_memory(
+        region_request=mock_region_request,
+        region_request_item=mock_region_request_item,
+        raster_dataset=mock_raster_dataset,
+        sensor_model=mock_sensor_model,
+        feature_collector=FeatureCollector(),
+        image_request_item=image_request_item,
+    )
+
+    assert result == RequestStatus.FAILED
+    assert mock_region_request_item.message == "Failed to process image region: Tile processing failed"
+    mock_region_status_monitor.process_event.assert_called_once_with(
+        mock_region_request_item, RequestStatus.FAILED, "Completed region processing"
+    )
+    on_region_complete.assert_called_once_with(image_request_item, mock_region_request_item, RequestStatus.FAILED)
+    mock_region_request_table.update_region_request.assert_not_called()
+    mock_image_request_table.complete_region_request.assert_not_called()
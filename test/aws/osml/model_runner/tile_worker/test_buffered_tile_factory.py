@@ -0,0 +1,123 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import pytest
+
+from aws.osml.image_processing.gdal_tile_factory import GDALTileFactory
+from aws.osml.model_runner.tile_worker import BufferedGDALTileFactory, plan_tile_windows
+
+
+def _tiles(rows, columns, size=100, step=90):
+    return [((row * step, column * step), (size, size)) for row in range(rows) for column in range(columns)]
+
+
+def test_plan_tile_windows_single_window():
+    """
+    Test that a region that fits under the memory ceiling is decoded in one window.
+    """
+    tiles = _tiles(3, 3)
+
+    plan = plan_tile_windows(tiles, bytes_per_pixel=1, max_window_bytes=280 * 280)
+
+    assert plan == [([0, 0, 280, 280], sorted(tiles))]
+
+
+def test_plan_tile_windows_splits_into_strips():
+    """
+    Test that a region larger than the memory ceiling is split into horizontal strips of whole tile rows.
+    """
+    tiles = _tiles(3, 3)
+
+    plan = plan_tile_windows(tiles, bytes_per_pixel=2, max_window_bytes=280 * 190 * 2)
+
+    assert [window for window, _ in plan] == [[0, 0, 280, 190], [0, 180, 280, 100]]
+    assert [len(window_tiles) for _, window_tiles in plan] == [6, 3]
+
+
+def test_plan_tile_windows_falls_back_for_oversized_rows():
+    """
+    Test that rows of tiles too large to decode at once are read from the source one tile at a time.
+    """
+    tiles = _tiles(2, 3)
+
+    plan = plan_tile_windows(tiles, bytes_per_pixel=4, max_window_bytes=100 * 100 * 4)
+
+    assert plan == [(None, tiles[:3]), (None, tiles[3:])]
+
+
+@pytest.fixture
+def buffered_factory(mocker):
+    def init(self, raster_dataset, **kwargs):
+        self.raster_dataset = raster_dataset
+        self.sensor_model = kwargs.get("sensor_model")
+        self.sar_updater = mocker.Mock()
+
+    mocker.patch.object(GDALTileFactory, "__init__", init)
+    reads = []
+    mocker.patch.object(
+        GDALTileFactory,
+        "create_encoded_tile",
+        lambda self, src_window, output_size=None: reads.append((self.raster_dataset, src_window)) or b"tile",
+    )
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.buffered_tile_factory.gdal")
+    source_dataset = mocker.Mock()
+    source_dataset.GetMetadataDomainList.return_value = ["", "TRE", "xml:DES"]
+    source_dataset.GetMetadata.side_effect = lambda domain: {"TRE": {"RSMIDA": "x"}, "xml:DES": ["<des/>"]}.get(domain)
+    return BufferedGDALTileFactory(source_dataset), source_dataset, mock_gdal, reads
+
+
+def test_create_encoded_tile_reads_from_window(buffered_factory):
+    """
+    Test that tiles inside a loaded window are cut from the decoded window and others from the source image.
+    """
+    factory, source_dataset, mock_gdal, reads = buffered_factory
+    window_dataset = mock_gdal.Translate.return_value
+
+    assert factory.load_window([100, 200, 300, 300])
+    mock_gdal.Translate.assert_called_once_with("", source_dataset, format="MEM", srcWin=[100, 200, 300, 300])
+    window_dataset.SetMetadata.assert_any_call({"RSMIDA": "x"}, "TRE")
+    window_dataset.SetMetadata.assert_any_call(["<des/>"], "xml:DES")
+
+    factory.create_encoded_tile([150, 250, 100, 100])
+    factory.create_encoded_tile([350, 250, 100, 100])
+    factory.release_window()
+    factory.create_encoded_tile([150, 250, 100, 100])
+
+    assert reads == [
+        (window_dataset, [50, 50, 100, 100]),
+        (source_dataset, [350, 250, 100, 100]),
+        (source_dataset, [150, 250, 100, 100]),
+    ]
+    assert factory.raster_dataset is source_dataset
+
+
+def test_tile_metadata_uses_full_image_coordinates(buffered_factory, mocker):
+    """
+    Test that IGEOLO and SAR chip metadata computed while reading from a window use full image coordinates.
+    """
+    factory, _, _, _ = buffered_factory
+    sar_updater = factory.sar_updater.updater
+    mocker.patch.object(GDALTileFactory, "_create_new_igeolo", lambda self, src_window: src_window)
+
+    def create_encoded_tile(self, src_window, output_size=None):
+        self.sar_updater.update_image_data_for_chip(src_window, output_size)
+        return self._create_new_igeolo(src_window)
+
+    mocker.patch.object(GDALTileFactory, "create_encoded_tile", create_encoded_tile)
+
+    factory.load_window([100, 200, 300, 300])
+
+    assert factory.create_encoded_tile([150, 250, 100, 100]) == [150, 250, 100, 100]
+    sar_updater.update_image_data_for_chip.assert_called_once_with([150, 250, 100, 100], None)
+
+
+def test_load_window_failure_reads_from_source(buffered_factory):
+    """
+    Test that tiles are read from the source image when the window cannot be decoded.
+    """
+    factory, source_dataset, mock_gdal, reads = buffered_factory
+    mock_gdal.Translate.side_effect = RuntimeError("Out of memory")
+
+    assert not factory.load_window([0, 0, 300, 300])
+    factory.create_encoded_tile([0, 0, 100, 100])
+
+    assert reads == [(source_dataset, [0, 0, 100, 100])]
@@ -0,0 +1,45 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from threading import Thread
+
+import geojson
+
+
+def create_feature(index: int) -> geojson.Feature:
+    return geojson.Feature(
+        id=f"feature-{index}",
+        geometry=geojson.Point((index, index)),
+        properties={
+            "imageBBox": [index, index, index + 10, index + 10],
+            "featureClasses": [{"iri": "vehicle", "score": 0.5}],
+        },
+    )
+
+
+def test_feature_collector_collects_features_from_workers():
+    from aws.osml.model_runner.tile_worker import FeatureCollector
+
+    feature_collector = FeatureCollector()
+    workers = [
+        Thread(target=feature_collector.add_features, args=([create_feature(worker * 10 + i) for i in range(10)],))
+        for worker in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    feature_batch = feature_collector.to_feature_batch()
+
+    assert len(feature_collector) == 40
+    assert len(feature_batch) == 40
+    assert sorted(feature["id"] for feature in feature_batch.to_features()) == sorted(f"feature-{i}" for i in range(40))
+
+
+def test_feature_collector_without_features():
+    from aws.osml.model_runner.tile_worker import FeatureCollector
+
+    feature_collector = FeatureCollector()
+
+    assert len(feature_collector) == 0
+    assert len(feature_collector.to_feature_batch()) == 0
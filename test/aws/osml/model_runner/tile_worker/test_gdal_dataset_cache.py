@@ -0,0 +1,117 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from aws.osml.model_runner.tile_worker import GDALDatasetCache
+
+
+def _mock_dataset(mocker, metadata=None):
+    dataset = mocker.MagicMock()
+    dataset.RasterCount = 1
+    dataset.GetMetadataDomainList.return_value = [""]
+    dataset.GetMetadata.return_value = metadata or {}
+    return dataset
+
+
+def test_get_reuses_loaded_dataset(mocker):
+    """
+    Test that a dataset is opened once and reused for later requests with the same credentials.
+    """
+    cache = GDALDatasetCache(max_entries=2)
+    dataset = _mock_dataset(mocker)
+    sensor_model = mocker.MagicMock()
+    loader = mocker.Mock(return_value=(dataset, sensor_model))
+
+    assert cache.get("s3://bucket/image.ntf", None, loader) == (dataset, sensor_model)
+    assert cache.get("s3://bucket/image.ntf", None, loader) == (dataset, sensor_model)
+
+    loader.assert_called_once()
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_get_keys_on_credentials(mocker):
+    """
+    Test that a dataset opened with one role is not reused for a request using a different role.
+    """
+    cache = GDALDatasetCache(max_entries=4)
+    loader = mocker.Mock(side_effect=lambda: (_mock_dataset(mocker), None))
+
+    first, _ = cache.get("s3://bucket/image.ntf", "arn:aws:iam::012345678910:role/RoleA", loader)
+    second, _ = cache.get("s3://bucket/image.ntf", "arn:aws:iam::012345678910:role/RoleB", loader)
+
+    assert first is not second
+    assert loader.call_count == 2
+    assert len(cache) == 2
+
+
+def test_get_evicts_least_recently_used(mocker):
+    """
+    Test that the least recently used dataset is evicted when the cache is full.
+    """
+    cache = GDALDatasetCache(max_entries=2)
+    loader = mocker.Mock(side_effect=lambda: (_mock_dataset(mocker), None))
+
+    cache.get("image-a", None, loader)
+    cache.get("image-b", None, loader)
+    cache.get("image-a", None, loader)
+    cache.get("image-c", None, loader)
+
+    assert loader.call_count == 3
+    cache.get("image-a", None, loader)
+    assert loader.call_count == 3
+    cache.get("image-b", None, loader)
+    assert loader.call_count == 4
+
+
+def test_get_respects_memory_limit(mocker):
+    """
+    Test that datasets are evicted to stay within the memory limit and oversized datasets are not cached.
+    """
+    small_size = GDALDatasetCache.estimate_size(_mock_dataset(mocker))
+    cache = GDALDatasetCache(max_entries=10, max_memory_bytes=2 * small_size + 1)
+    loader = mocker.Mock(side_effect=lambda: (_mock_dataset(mocker), None))
+
+    for image_url in ["image-a", "image-b", "image-c"]:
+        cache.get(image_url, None, loader)
+    assert len(cache) == 2
+    assert cache.memory_bytes <= cache.max_memory_bytes
+
+    large_dataset = _mock_dataset(mocker, {"NITF_RSMPCA": "x" * (3 * small_size)})
+    cache.get("image-large", None, mocker.Mock(return_value=(large_dataset, None)))
+    assert len(cache) == 2
+    assert GDALDatasetCache.cache_key("image-large") not in cache._entries
+
+
+def test_get_reloads_expired_dataset(mocker):
+    """
+    Test that a dataset is reopened once its time-to-live has passed.
+    """
+    mock_time = mocker.patch("aws.osml.model_runner.tile_worker.gdal_dataset_cache.time.time", return_value=1000.0)
+    cache = GDALDatasetCache(ttl_seconds=60)
+    loader = mocker.Mock(side_effect=lambda: (_mock_dataset(mocker), None))
+
+    cache.get("image-a", None, loader)
+    mock_time.return_value = 1059.0
+    cache.get("image-a", None, loader)
+    assert loader.call_count == 1
+
+    mock_time.return_value = 1061.0
+    cache.get("image-a", None, loader)
+    assert loader.call_count == 2
+
+
+def test_invalidate_and_disabled_cache(mocker):
+    """
+    Test that invalidated datasets are reopened and that a cache with no entries never holds datasets.
+    """
+    cache = GDALDatasetCache()
+    loader = mocker.Mock(side_effect=lambda: (_mock_dataset(mocker), None))
+    cache.get("image-a", None, loader)
+    cache.invalidate("image-a")
+    cache.get("image-a", None, loader)
+    assert loader.call_count == 2
+
+    disabled_cache = GDALDatasetCache(max_entries=0)
+    disabled_cache.get("image-a", None, loader)
+    disabled_cache.get("image-a", None, loader)
+    assert loader.call_count == 4
+    assert len(disabled_cache) == 0
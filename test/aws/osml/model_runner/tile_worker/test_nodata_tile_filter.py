@@ -0,0 +1,144 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from aws.osml.model_runner.tile_worker import NoDataTileFilter
+
+GMF_ALL_VALID = 0x01
+GMF_PER_DATASET = 0x02
+GMF_NODATA = 0x08
+
+
+@pytest.fixture(autouse=True)
+def mock_gdal(mocker):
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.nodata_tile_filter.gdal")
+    mock_gdal.GMF_ALL_VALID = GMF_ALL_VALID
+    mock_gdal.GMF_PER_DATASET = GMF_PER_DATASET
+    return mock_gdal
+
+
+def _read_mask(mask, *args, buf_xsize, buf_ysize, **kwargs):
+    """
+    Read a 2D mask covering the requested window into the buffer size with nearest neighbor sampling, the worst case
+    for sparse valid pixels.
+    """
+    rows = np.arange(buf_ysize) * mask.shape[0] // buf_ysize
+    columns = np.arange(buf_xsize) * mask.shape[1] // buf_xsize
+    return mask[rows[:, np.newaxis], columns].tobytes()
+
+
+def _dataset(mask_flags, masks):
+    """
+    Build a mock dataset whose bands report the given mask flags and return the given 2D masks, stretched over the
+    window read, when read.
+    """
+    bands = []
+    for flags, mask in zip(mask_flags, masks):
+        band = Mock()
+        band.GetMaskFlags.return_value = flags
+        band.GetMaskBand.return_value.ReadRaster.side_effect = lambda *args, mask=mask, **kwargs: _read_mask(
+            mask, *args, **kwargs
+        )
+        bands.append(band)
+    raster_dataset = Mock()
+    raster_dataset.RasterCount = len(bands)
+    raster_dataset.GetRasterBand.side_effect = lambda index: bands[index - 1]
+    return raster_dataset
+
+
+def test_filter_skips_tiles_above_threshold():
+    """
+    Test that tiles are skipped when their nodata fraction reaches the threshold.
+    """
+    mask = np.zeros((64, 64), dtype=np.uint8)
+    mask[:, :16] = 255
+    nodata_filter = NoDataTileFilter(_dataset([GMF_NODATA], [mask]), nodata_threshold=0.7)
+
+    assert nodata_filter.enabled
+    assert nodata_filter.nodata_fraction(((0, 0), (512, 512))) == pytest.approx(0.75)
+    assert nodata_filter.is_empty(((0, 0), (512, 512)))
+
+    nodata_filter.nodata_threshold = 1.0
+    assert not nodata_filter.is_empty(((0, 0), (512, 512)))
+
+
+def test_filter_reads_reduced_resolution_mask(mock_gdal):
+    """
+    Test that the mask is read at a reduced resolution covering the whole tile and that a tile is only skipped once
+    its full resolution mask confirms it.
+    """
+    raster_dataset = _dataset([GMF_NODATA], [np.zeros((64, 64), dtype=np.uint8)])
+    nodata_filter = NoDataTileFilter(raster_dataset, nodata_threshold=1.0)
+
+    assert nodata_filter.is_empty(((100, 200), (1024, 512)))
+    mask_band = raster_dataset.GetRasterBand(1).GetMaskBand()
+    (sample_args, sample_kwargs), (full_args, full_kwargs) = mask_band.ReadRaster.call_args_list
+    assert sample_args == full_args == (200, 100, 1024, 512)
+    assert (sample_kwargs["buf_xsize"], sample_kwargs["buf_ysize"]) == (64, 64)
+    assert sample_kwargs["resample_alg"] == mock_gdal.GRIORA_Average
+    assert (full_kwargs["buf_xsize"], full_kwargs["buf_ysize"]) == (1024, 512)
+
+
+def test_filter_keeps_tile_with_thin_valid_strip():
+    """
+    Test that a tile whose only valid pixels are a strip too thin to show up in the reduced resolution sample is
+    not skipped.
+    """
+    mask = np.zeros((1024, 1024), dtype=np.uint8)
+    mask[:, 500] = 255
+    nodata_filter = NoDataTileFilter(_dataset([GMF_NODATA], [mask]), nodata_threshold=1.0)
+
+    assert nodata_filter.nodata_fraction(((0, 0), (1024, 1024))) == 1.0
+    assert nodata_filter.nodata_fraction(((0, 0), (1024, 1024)), full_resolution=True) == pytest.approx(1 - 1 / 1024)
+    assert not nodata_filter.is_empty(((0, 0), (1024, 1024)))
+
+
+def test_filter_small_tile_not_read_twice():
+    """
+    Test that tiles no larger than the sample are not read again at full resolution.
+    """
+    raster_dataset = _dataset([GMF_NODATA], [np.zeros((32, 32), dtype=np.uint8)])
+    nodata_filter = NoDataTileFilter(raster_dataset, nodata_threshold=1.0)
+
+    assert nodata_filter.is_empty(((0, 0), (32, 32)))
+    assert raster_dataset.GetRasterBand(1).GetMaskBand().ReadRaster.call_count == 1
+
+
+def test_filter_pixel_valid_in_any_band():
+    """
+    Test that a pixel is only nodata when it is masked out in every band.
+    """
+    first = np.zeros((64, 64), dtype=np.uint8)
+    second = np.zeros((64, 64), dtype=np.uint8)
+    first[:32] = 255
+    second[32:] = 255
+    nodata_filter = NoDataTileFilter(_dataset([GMF_NODATA, GMF_NODATA], [first, second]), nodata_threshold=1.0)
+
+    assert nodata_filter.nodata_fraction(((0, 0), (64, 64))) == 0.0
+
+
+def test_filter_disabled_when_all_valid():
+    """
+    Test that datasets without a mask or nodata value are not checked.
+    """
+    raster_dataset = _dataset([GMF_ALL_VALID], [np.zeros((64, 64), dtype=np.uint8)])
+    nodata_filter = NoDataTileFilter(raster_dataset, nodata_threshold=1.0)
+
+    assert not nodata_filter.enabled
+    assert not nodata_filter.is_empty(((0, 0), (512, 512)))
+    raster_dataset.GetRasterBand(1).GetMaskBand().ReadRaster.assert_not_called()
+
+
+def test_filter_keeps_tile_when_mask_unreadable():
+    """
+    Test that tiles are processed when their mask cannot be read.
+    """
+    raster_dataset = _dataset([GMF_PER_DATASET], [np.zeros((64, 64), dtype=np.uint8)])
+    raster_dataset.GetRasterBand(1).GetMaskBand().ReadRaster.side_effect = RuntimeError("Read failed")
+    nodata_filter = NoDataTileFilter(raster_dataset, nodata_threshold=1.0)
+
+    assert nodata_filter.nodata_fraction(((0, 0), (512, 512))) is None
+    assert not nodata_filter.is_empty(((0, 0), (512, 512)))
@@ -0,0 +1,64 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import pytest
+
+from aws.osml.model_runner.tile_worker import estimate_gsd, resolve_processing_scale, scale_dimensions
+from aws.osml.photogrammetry import GeodeticWorldCoordinate
+
+# Radians of longitude/latitude per pixel giving a GSD of ~0.5m at the equator
+RADIANS_PER_PIXEL = 0.5 / 6378137.0
+
+
+@pytest.fixture
+def raster_dataset(mocker):
+    dataset = mocker.Mock(RasterXSize=10000, RasterYSize=8000)
+    band = dataset.GetRasterBand.return_value
+    band.GetOverviewCount.return_value = 2
+    band.GetOverview.side_effect = lambda index: mocker.Mock(XSize=[3334, 1112][index])
+    return dataset
+
+
+@pytest.fixture
+def sensor_model(mocker):
+    model = mocker.Mock()
+    model.image_to_world.side_effect = lambda image_coordinate: GeodeticWorldCoordinate(
+        [image_coordinate.x * RADIANS_PER_PIXEL, -image_coordinate.y * RADIANS_PER_PIXEL, 0.0]
+    )
+    return model
+
+
+def test_resolve_processing_scale_from_overview_level(raster_dataset):
+    """
+    Test that overview levels resolve to the decimation factor of the dataset's overviews, falling back to powers
+    of two for levels the dataset does not have.
+    """
+    assert resolve_processing_scale(raster_dataset, None, overview_level=0) == 1
+    assert resolve_processing_scale(raster_dataset, None, overview_level=1) == 3
+    assert resolve_processing_scale(raster_dataset, None, overview_level=2) == 9
+    assert resolve_processing_scale(raster_dataset, None, overview_level=3) == 8
+
+
+def test_resolve_processing_scale_from_target_gsd(raster_dataset, sensor_model):
+    """
+    Test that a target GSD resolves to the largest decimation factor that does not exceed it.
+    """
+    assert estimate_gsd(raster_dataset, sensor_model) == pytest.approx(0.5, rel=0.01)
+    assert resolve_processing_scale(raster_dataset, sensor_model, target_gsd=2.2) == 4
+    assert resolve_processing_scale(raster_dataset, sensor_model, target_gsd=0.3) == 1
+    assert resolve_processing_scale(raster_dataset, sensor_model, overview_level=1, target_gsd=2.2) == 3
+
+
+def test_resolve_processing_scale_without_sensor_model(raster_dataset):
+    """
+    Test that a target GSD is ignored for images that are not georeferenced.
+    """
+    assert estimate_gsd(raster_dataset, None) is None
+    assert resolve_processing_scale(raster_dataset, None, target_gsd=2.0) == 1
+    assert resolve_processing_scale(raster_dataset, None) == 1
+
+
+def test_scale_dimensions():
+    """
+    Test that dimensions at the processing resolution are converted to full image pixels.
+    """
+    assert scale_dimensions((512, 256), 4) == (2048, 1024)
@@ -0,0 +1,87 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import zlib
+
+import numpy as np
+import pytest
+
+from aws.osml.model_runner.tile_worker import RawTileFactory, decode_raw_tile
+from aws.osml.model_runner.tile_worker.raw_tile_factory import decode_raw_tile_header
+
+IMAGE = np.arange(2 * 60 * 80, dtype=np.uint16).reshape(2, 60, 80)
+
+
+@pytest.fixture
+def raster_dataset(mocker):
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.raw_tile_factory.gdal")
+    mock_gdal.GetDataTypeName.return_value = "UInt16"
+    dataset = mocker.Mock(RasterCount=2)
+
+    def read_as_array(x, y, width, height, buf_obj, buf_xsize, buf_ysize):
+        window = IMAGE[:, y : y + height, x : x + width]
+        step_y, step_x = height // buf_ysize, width // buf_xsize
+        np.copyto(buf_obj, window[:, ::step_y, ::step_x])
+        return buf_obj
+
+    dataset.ReadAsArray.side_effect = read_as_array
+    return dataset
+
+
+def test_create_encoded_tile(raster_dataset):
+    """
+    Test that a raw tile carries a header describing the pixels followed by the pixels of the tile.
+    """
+    tile = RawTileFactory(raster_dataset).create_encoded_tile([10, 20, 30, 15])
+
+    header, _ = decode_raw_tile_header(tile)
+    assert header == {"shape": [2, 15, 30], "dtype": "<u2", "interleave": "BSQ", "bands": [1, 2], "compression": "NONE"}
+    np.testing.assert_array_equal(decode_raw_tile(tile), IMAGE[:, 20:35, 10:40])
+
+
+def test_create_encoded_tile_decimated(raster_dataset):
+    """
+    Test that a raw tile can be read at a reduced resolution.
+    """
+    tile = RawTileFactory(raster_dataset).create_encoded_tile([0, 0, 40, 20], output_size=(20, 10))
+
+    np.testing.assert_array_equal(decode_raw_tile(tile), IMAGE[:, 0:20:2, 0:40:2])
+
+
+def test_create_encoded_tile_from_window(raster_dataset):
+    """
+    Test that tiles inside a loaded window are cut from memory and others are read from the source image.
+    """
+    factory = RawTileFactory(raster_dataset)
+
+    assert factory.load_window([0, 0, 80, 30])
+    inside = factory.create_encoded_tile([40, 10, 20, 20])
+    outside = factory.create_encoded_tile([40, 20, 20, 20])
+
+    assert raster_dataset.ReadAsArray.call_count == 2
+    np.testing.assert_array_equal(decode_raw_tile(inside), IMAGE[:, 10:30, 40:60])
+    np.testing.assert_array_equal(decode_raw_tile(outside), IMAGE[:, 20:40, 40:60])
+
+
+def test_create_encoded_tile_compressed(raster_dataset, mocker):
+    """
+    Test that the pixels of compressed raw tiles are passed through the codec.
+    """
+    codec = mocker.Mock()
+    codec.compress.side_effect = lambda data: zlib.compress(bytes(data))
+    codec.decompress.side_effect = lambda data: zlib.decompress(bytes(data))
+    mocker.patch("aws.osml.model_runner.tile_worker.raw_tile_factory._get_codec", return_value=codec)
+
+    tile = RawTileFactory(raster_dataset, tile_compression="ZSTD").create_encoded_tile([0, 0, 8, 8])
+
+    assert decode_raw_tile_header(tile)[0]["compression"] == "ZSTD"
+    np.testing.assert_array_equal(decode_raw_tile(tile), IMAGE[:, 0:8, 0:8])
+
+
+def test_unsupported_compression(raster_dataset):
+    """
+    Test that raw tiles reject compressions that are only available for GDAL formats.
+    """
+    with pytest.raises(ValueError):
+        RawTileFactory(raster_dataset, tile_compression="J2K")
+    with pytest.raises(ValueError):
+        decode_raw_tile(b"II*\x00 not a raw tile")
@@ -0,0 +1,153 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import numpy as np
+import pytest
+
+
+def _mask(value: int, size: int = 8, bands: int = 1):
+    from aws.osml.model_runner.inference import SegmentationMask
+
+    return SegmentationMask(pixels=np.full((bands, size, size), value, dtype=np.uint8))
+
+
+def test_add_mask_blends_overlapping_tiles():
+    """
+    Test that masks keep their value outside the overlap and are blended with weights that fall off towards the
+    edges of each tile inside it.
+    """
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+
+    mosaic = RegionMaskMosaic(((0, 0), (14, 8)), (2, 2))
+    assert not mosaic.has_masks and mosaic.confidence is None
+
+    mosaic.add_mask(_mask(200), ((0, 0), (8, 8)))
+    mosaic.add_mask(_mask(100), ((0, 6), (8, 8)))
+
+    assert mosaic.mask_count == 2
+    assert mosaic.confidence.shape == (1, 8, 14)
+    assert mosaic.confidence[0, 4, 2] == 200
+    assert mosaic.confidence[0, 4, 12] == 100
+    # Column 6 is on the edge of the second tile and column 7 on the edge of the first, with an overlap of 2 the
+    # weights ramp from 1/3 on the edge to 2/3 of the weight in the middle of a tile
+    assert mosaic.confidence[0, 4, 6] == pytest.approx((200 * 42 + 100 * 21) / 63, abs=1)
+    assert mosaic.confidence[0, 4, 7] == pytest.approx((200 * 21 + 100 * 42) / 63, abs=1)
+    assert mosaic.weights[4, 6] == mosaic.weights[4, 7] == 63
+
+
+def test_add_mask_clips_and_resamples_tiles():
+    """
+    Test that tiles extending past the region are clipped and masks smaller than the tile are resampled.
+    """
+    from aws.osml.model_runner.inference import SegmentationMask
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+
+    mosaic = RegionMaskMosaic(((100, 200), (12, 12)), (0, 0), processing_scale=2)
+    pixels = np.array([[[10, 20], [30, 40]]], dtype=np.uint8)
+
+    mosaic.add_mask(SegmentationMask(pixels=pixels), ((104, 204), (16, 16)))
+
+    assert mosaic.confidence.shape == (1, 6, 6)
+    assert mosaic.confidence[0, 2, 2] == 10
+    assert mosaic.confidence[0, 5, 5] == 10
+    assert mosaic.confidence[0, 0, 0] == 0
+    assert mosaic.weights[0, 0] == 0
+
+
+def test_add_mask_band_mismatch():
+    """
+    Test that masks with a different number of bands than the mosaic are rejected.
+    """
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+
+    mosaic = RegionMaskMosaic(((0, 0), (8, 8)), (0, 0))
+    mosaic.add_mask(_mask(1, bands=2), ((0, 0), (8, 8)))
+
+    with pytest.raises(ValueError):
+        mosaic.add_mask(_mask(1), ((0, 0), (8, 8)))
+
+
+def test_write_cog(mocker):
+    """
+    Test that the mosaic is written as a COG georeferenced to the region at the processing resolution.
+    """
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+    from aws.osml.model_runner.tile_worker.region_mask_mosaic import COG_CREATION_OPTIONS, STAGING_CREATION_OPTIONS
+
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.region_mask_mosaic.gdal")
+    mock_driver = mock_gdal.GetDriverByName.return_value
+    staging_dataset = mock_driver.Create.return_value
+    raster_dataset = mocker.Mock()
+    raster_dataset.GetGeoTransform.return_value = (10.0, 0.5, 0.0, 20.0, 0.0, -0.5)
+    raster_dataset.GetProjectionRef.return_value = "EPSG:4326"
+    mosaic = RegionMaskMosaic(((100, 200), (16, 16)), (0, 0), processing_scale=2)
+
+    with pytest.raises(ValueError):
+        mosaic.write_cog("/tmp/mask.tif", raster_dataset)
+
+    mosaic.add_mask(_mask(255), ((100, 200), (16, 16)))
+    mosaic.write_cog("/tmp/mask.tif", raster_dataset)
+
+    mock_driver.Create.assert_called_once_with(
+        "/tmp/mask.tif.staging.tif", 8, 8, 1, mock_gdal.GDT_Byte, options=STAGING_CREATION_OPTIONS
+    )
+    staging_dataset.SetGeoTransform.assert_called_once_with([110.0, 1.0, 0.0, -30.0, 0.0, -1.0])
+    staging_dataset.SetProjection.assert_called_once_with("EPSG:4326")
+    mock_gdal.GetDriverByName.assert_any_call("COG")
+    mock_driver.CreateCopy.assert_called_once_with("/tmp/mask.tif", staging_dataset, options=COG_CREATION_OPTIONS)
+    mock_driver.Delete.assert_called_once_with("/tmp/mask.tif.staging.tif")
+
+
+def test_write_cog_in_strips(mocker):
+    """
+    Test that the mosaic is written to the staging GeoTIFF a strip of rows at a time.
+    """
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+
+    mocker.patch("aws.osml.model_runner.tile_worker.region_mask_mosaic.WRITE_STRIP_ROWS", 3)
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.region_mask_mosaic.gdal")
+    mock_band = mock_gdal.GetDriverByName.return_value.Create.return_value.GetRasterBand.return_value
+    mosaic = RegionMaskMosaic(((0, 0), (8, 8)), (0, 0))
+    mosaic.add_mask(_mask(7), ((0, 0), (8, 8)))
+
+    mosaic.write_cog("/tmp/mask.tif")
+
+    assert [call.args[1:] for call in mock_band.WriteArray.call_args_list] == [(0, 0), (0, 3), (0, 6)]
+    assert [call.args[0].shape for call in mock_band.WriteArray.call_args_list] == [(3, 8), (3, 8), (2, 8)]
+    assert all((call.args[0] == 7).all() for call in mock_band.WriteArray.call_args_list)
+
+
+def test_close_releases_mosaic():
+    """
+    Test that closing the mosaic releases the file backing it.
+    """
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+
+    mosaic = RegionMaskMosaic(((0, 0), (8, 8)), (0, 0))
+    mosaic.add_mask(_mask(7), ((0, 0), (8, 8)))
+    assert isinstance(mosaic.confidence, np.memmap)
+
+    mosaic.close()
+
+    assert mosaic.confidence is None and mosaic.weights is None
+    mosaic.close()
+
+
+def test_write_cog_adjusts_rpcs(mocker):
+    """
+    Test that the RPCs of images without a geo transform are moved to the region and scaled.
+    """
+    from aws.osml.model_runner.tile_worker import RegionMaskMosaic
+
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.region_mask_mosaic.gdal")
+    staging_dataset = mock_gdal.GetDriverByName.return_value.Create.return_value
+    raster_dataset = mocker.Mock()
+    raster_dataset.GetGeoTransform.return_value = None
+    raster_dataset.GetMetadata.return_value = {"LINE_OFF": "500", "SAMP_OFF": "600", "LINE_SCALE": "40", "SAMP_SCALE": "60"}
+    mosaic = RegionMaskMosaic(((100, 200), (16, 16)), (0, 0), processing_scale=2)
+    mosaic.add_mask(_mask(255), ((100, 200), (16, 16)))
+
+    mosaic.write_cog("/tmp/mask.tif", raster_dataset)
+
+    staging_dataset.SetMetadata.assert_any_call(
+        {"LINE_OFF": "200.0", "SAMP_OFF": "200.0", "LINE_SCALE": "20.0", "SAMP_SCALE": "30.0"}, "RPC"
+    )
@@ -0,0 +1,230 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import os
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aws.osml.model_runner.tile_worker import S3BlockCache, S3BlockCacheProxy
+
+OBJECT_BYTES = bytes(range(256)) * 64
+AUTHORIZATION = "AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/20260101/us-west-2/s3/aws4_request, Signature=abc"
+FORGED_AUTHORIZATION = AUTHORIZATION.replace("Signature=abc", "Signature=forged")
+
+
+class _FakeS3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+    etag = '"v1"'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self.requests.append(("HEAD", self.path, self.headers.get("Range")))
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(OBJECT_BYTES)))
+        self.end_headers()
+
+    def do_GET(self):
+        byte_range = self.headers.get("Range")
+        self.requests.append(("GET", self.path, byte_range, self.headers.get("If-None-Match")))
+        # Like S3, the signature is checked before the condition
+        if "Signature=forged" in self.headers.get("Authorization", ""):
+            self.send_response(403)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        start, end = (int(value) for value in byte_range.replace("bytes=", "").split("-"))
+        body = OBJECT_BYTES[start : end + 1]
+        self.send_response(206)
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(OBJECT_BYTES)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def proxy_setup(tmp_path):
+    _FakeS3Handler.requests = []
+    _FakeS3Handler.etag = '"v1"'
+    upstream = ThreadingHTTPServer(("127.0.0.1", 0), _FakeS3Handler)
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    block_cache = S3BlockCache(str(tmp_path / "blocks"), max_size_bytes=1024 * 1024)
+    upstream_host = f"127.0.0.1:{upstream.server_address[1]}"
+    proxy = S3BlockCacheProxy(block_cache, etag_ttl_seconds=60, upstream_https=False, s3_endpoint=upstream_host).start()
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({"http": f"http://{proxy.address}"}))
+    yield proxy, opener, f"http://{upstream_host}/bucket/image.ntf"
+    proxy.stop()
+    upstream.shutdown()
+    upstream.server_close()
+
+
+def _read(opener, url, byte_range, authorization=AUTHORIZATION):
+    request = urllib.request.Request(url, headers={"Range": byte_range, "Authorization": authorization})
+    with opener.open(request) as response:
+        return response.status, response.headers.get("Content-Range"), response.read()
+
+
+def test_block_cache_put_get_and_evict(tmp_path):
+    """
+    Test that blocks round trip through the disk cache and that the least recently used blocks are evicted.
+    """
+    block_cache = S3BlockCache(str(tmp_path), max_size_bytes=3000)
+    keys = [S3BlockCache.block_key("host/key", '"v1"', f"bytes={i * 1000}-{i * 1000 + 999}", "AKID") for i in range(3)]
+
+    block_cache.put(keys[0], {"Content-Range": "bytes 0-999/3000"}, b"a" * 1000)
+    block_cache.put(keys[1], {"Content-Range": "bytes 1000-1999/3000"}, b"b" * 1000)
+    old_time = os.path.getmtime(block_cache._path(keys[1])) - 100
+    os.utime(block_cache._path(keys[1]), (old_time, old_time))
+
+    assert block_cache.get(keys[0]) == ({"Content-Range": "bytes 0-999/3000"}, b"a" * 1000)
+
+    block_cache.put(keys[2], {"Content-Range": "bytes 2000-2999/3000"}, b"c" * 1000)
+
+    assert block_cache.get(keys[1]) is None
+    assert block_cache.get(keys[0]) is not None
+    assert block_cache.get(keys[2]) is not None
+
+
+def test_block_cache_shared_between_instances(tmp_path):
+    """
+    Test that a block written by one process is visible to another using the same directory.
+    """
+    key = S3BlockCache.block_key("host/key", '"v1"', "bytes=0-9", "AKID")
+    S3BlockCache(str(tmp_path)).put(key, {}, b"0123456789")
+
+    assert S3BlockCache(str(tmp_path)).get(key) == ({}, b"0123456789")
+
+
+def test_block_cache_size_limit_shared_between_instances(tmp_path):
+    """
+    Test that the size limit holds for the whole directory when several processes write to it.
+    """
+    caches = [S3BlockCache(str(tmp_path), max_size_bytes=3000) for _ in range(2)]
+    for i in range(4):
+        key = S3BlockCache.block_key("host/key", '"v1"', f"bytes={i * 1000}-{i * 1000 + 999}", "AKID")
+        caches[i % 2].put(key, {}, b"a" * 996)
+
+    block_bytes = sum(block[2] for block in caches[0]._list_blocks())
+    assert block_bytes <= 3000
+    assert caches[1].size_bytes() == block_bytes
+
+
+def test_proxy_serves_repeated_ranges_from_cache(proxy_setup):
+    """
+    Test that a range read again through the proxy is served from the cache once S3 confirms the object is unchanged.
+    """
+    proxy, opener, url = proxy_setup
+
+    first = _read(opener, url, "bytes=0-1023")
+    second = _read(opener, url, "bytes=0-1023")
+
+    assert first == (206, f"bytes 0-1023/{len(OBJECT_BYTES)}", OBJECT_BYTES[:1024])
+    assert second == first
+    assert [(request[0], request[3]) for request in _FakeS3Handler.requests] == [("GET", None), ("GET", '"v1"')]
+    assert proxy.hits == 1
+
+
+def test_proxy_does_not_serve_cached_blocks_to_unauthorized_requests(proxy_setup):
+    """
+    Test that a request carrying a known access key id with an invalid signature is refused by S3 instead of being
+    answered from the cache.
+    """
+    proxy, opener, url = proxy_setup
+
+    _read(opener, url, "bytes=0-99")
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _read(opener, url, "bytes=0-99", FORGED_AUTHORIZATION)
+
+    assert error.value.code == 403
+    assert proxy.hits == 0
+
+
+def test_proxy_keys_on_credentials_and_etag(proxy_setup):
+    """
+    Test that blocks are not shared between access keys and are not reused after the object changes.
+    """
+    proxy, opener, url = proxy_setup
+
+    _read(opener, url, "bytes=0-99")
+    _read(opener, url, "bytes=0-99", AUTHORIZATION.replace("AKIDEXAMPLE", "AKIDOTHER"))
+    assert len(_FakeS3Handler.requests) == 2
+
+    # The conditional request reveals the object has changed so the new data is returned and cached
+    _FakeS3Handler.etag = '"v2"'
+    changed = _read(opener, url, "bytes=0-99")
+    cached = _read(opener, url, "bytes=0-99")
+
+    assert [(request[0], request[3]) for request in _FakeS3Handler.requests] == [
+        ("GET", None),
+        ("GET", None),
+        ("GET", '"v1"'),
+        ("GET", '"v2"'),
+    ]
+    assert changed == cached
+    assert proxy.hits == 1
+
+
+def test_proxy_refuses_non_s3_hosts(proxy_setup):
+    """
+    Test that the proxy does not forward requests for hosts that are not S3 endpoints.
+    """
+    proxy, opener, url = proxy_setup
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        _read(opener, "http://example.com/image.ntf", "bytes=0-99")
+
+    assert error.value.code == 403
+    assert _FakeS3Handler.requests == []
+
+
+@pytest.mark.parametrize(
+    "host, expected",
+    [
+        ("bucket.s3.us-west-2.amazonaws.com", True),
+        ("s3.amazonaws.com:443", True),
+        ("bucket.s3-fips.us-gov-west-1.amazonaws.com", True),
+        ("s3.dualstack.us-east-1.amazonaws.com", True),
+        ("bucket.s3.cn-north-1.amazonaws.com.cn", True),
+        ("bucket.minio.internal:9000", True),
+        ("sqs.us-west-2.amazonaws.com", False),
+        ("s3.amazonaws.com.example.com", False),
+        ("example.com", False),
+    ],
+)
+def test_proxy_is_s3_host(tmp_path, host, expected):
+    """
+    Test that S3 endpoints in every partition and the configured custom endpoint are accepted.
+    """
+    proxy = S3BlockCacheProxy(S3BlockCache(str(tmp_path)), s3_endpoint="minio.internal:9000")
+
+    assert proxy.is_s3_host(host) is expected
+
+
+def test_proxy_configure_gdal_scopes_options_to_vsis3(tmp_path, mocker):
+    """
+    Test that the proxy options apply to /vsis3/ paths only and that a plain HTTP endpoint stays plain HTTP.
+    """
+    mock_gdal = mocker.patch("aws.osml.model_runner.tile_worker.s3_block_cache.gdal")
+    mock_gdal.GetConfigOption.side_effect = lambda key, default=None: {"AWS_HTTPS": "NO"}.get(key, default)
+    proxy = S3BlockCacheProxy(S3BlockCache(str(tmp_path))).start()
+    try:
+        proxy.configure_gdal()
+    finally:
+        proxy.stop()
+
+    mock_gdal.SetConfigOption.assert_not_called()
+    mock_gdal.SetPathSpecificOption.assert_any_call("/vsis3/", "GDAL_HTTP_PROXY", mocker.ANY)
+    mock_gdal.SetPathSpecificOption.assert_any_call("/vsis3/", "AWS_HTTPS", "NO")
+    assert proxy.upstream_https is False
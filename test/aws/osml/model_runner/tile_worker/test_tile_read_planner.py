@@ -0,0 +1,84 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from unittest.mock import Mock
+
+from aws.osml.model_runner.tile_worker import TileReadAhead, order_tiles_by_block, plan_tile_reads
+
+
+def _tiles(rows, columns, size=100, step=100):
+    return [((row * step, column * step), (size, size)) for row in range(rows) for column in range(columns)]
+
+
+def test_order_tiles_by_block_follows_block_layout():
+    """
+    Test that tiles sharing a block are read together and blocks are visited in row-major storage order.
+    """
+    tiles = _tiles(2, 4)
+
+    ordered = order_tiles_by_block(list(reversed(tiles)), (256, 256))
+
+    assert [tile[0] for tile in ordered] == [
+        (0, 0),
+        (0, 100),
+        (0, 200),
+        (100, 0),
+        (100, 100),
+        (100, 200),
+        (0, 300),
+        (100, 300),
+    ]
+
+
+def test_order_tiles_by_block_without_block_size():
+    """
+    Test that tiles keep row-major order when the block layout is unknown.
+    """
+    tiles = _tiles(2, 2)
+
+    assert order_tiles_by_block(list(reversed(tiles)), None) == tiles
+
+
+def test_read_ahead_advises_each_batch_once():
+    """
+    Test that GDAL is advised of the area covered by each batch of tiles when the first tile of the batch is read.
+    """
+    raster_dataset = Mock()
+    read_ahead = TileReadAhead(raster_dataset, _tiles(1, 5), batch_size=2)
+
+    for tile_index in range(5):
+        read_ahead.before_read(tile_index)
+
+    assert [call.args for call in raster_dataset.AdviseRead.call_args_list] == [
+        (0, 0, 200, 100),
+        (200, 0, 200, 100),
+        (400, 0, 100, 100),
+    ]
+
+
+def test_read_ahead_disabled_after_failure():
+    """
+    Test that a dataset which cannot take read hints is read without them.
+    """
+    raster_dataset = Mock()
+    raster_dataset.AdviseRead.side_effect = RuntimeError("Not supported")
+    read_ahead = TileReadAhead(raster_dataset, _tiles(1, 4), batch_size=2)
+
+    for tile_index in range(4):
+        read_ahead.before_read(tile_index)
+
+    assert raster_dataset.AdviseRead.call_count == 1
+
+
+def test_plan_tile_reads_handles_unknown_block_size():
+    """
+    Test that planning falls back to row-major order when the dataset does not report a block size.
+    """
+    raster_dataset = Mock()
+    raster_dataset.GetRasterBand.side_effect = RuntimeError("No bands")
+    tiles = _tiles(2, 2)
+
+    ordered, read_ahead = plan_tile_reads(raster_dataset, list(reversed(tiles)), 0)
+
+    assert ordered == tiles
+    read_ahead.before_read(0)
+    raster_dataset.AdviseRead.assert_not_called()
@@ -77,6 +77,30 @@ def test_process_tile_buffers_status_and_does_not_write_immediately(worker_setup
     assert len(worker._buffered_tile_updates) == 1
 
 
+def test_process_tile_records_inference_statistics_by_bucket():
+    feature_detector = Mock()
+    feature_detector.endpoint = "test-endpoint"
+    feature_detector.endpoint_parameters = {"TargetVariant": "variant-1"}
+    feature_detector.find_features.side_effect = [{"features": []}, Exception("model error"), {"features": []}]
+    statistics_table = Mock()
+    statistics_table.bucket_for.side_effect = [60, 60, 120]
+    worker = TileWorker(Queue(), feature_detector, None, Mock(), Mock(), endpoint_statistics_table=statistics_table)
+
+    with tempfile.NamedTemporaryFile() as temp_file:
+        image_info = {"image_path": temp_file.name, "image_id": "img-1", "region_id": "reg-1", "region": ((0, 0), (1, 1))}
+        for _ in range(3):
+            worker.process_tile(image_info)
+
+    # The first bucket is written as soon as the second one starts
+    statistics_table.add_tile_statistics.assert_called_once()
+    assert statistics_table.add_tile_statistics.call_args.args[:5] == ("test-endpoint", "variant-1", 60, 1, 1)
+
+    worker.flush_inference_statistics()
+    assert statistics_table.add_tile_statistics.call_args.args[:5] == ("test-endpoint", "variant-1", 120, 1, 0)
+    assert statistics_table.add_tile_statistics.call_args.args[5] >= 0
+    assert len(worker._buffered_statistics) == 0
+
+
 def test_run_handles_flush_failure_and_exits_cleanly(mocker):
     mock_set_context = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker.ThreadingLocalContextFilter.set_context")
     work_queue = Queue()
@@ -90,3 +114,31 @@ def test_run_handles_flush_failure_and_exits_cleanly(mocker):
 
     worker.flush_tile_updates.assert_called_once()
     mock_set_context.assert_called_once_with(None)
+
+
+def test_flush_inference_statistics_ignores_write_failures():
+    feature_detector = Mock()
+    feature_detector.endpoint = "test-endpoint"
+    feature_detector.endpoint_parameters = None
+    statistics_table = Mock()
+    statistics_table.bucket_for.return_value = 60
+    statistics_table.add_tile_statistics.side_effect = Exception("throttled")
+    worker = TileWorker(Queue(), feature_detector, None, Mock(), Mock(), endpoint_statistics_table=statistics_table)
+
+    worker.record_inference_statistics(0.5)
+    worker.flush_inference_statistics()
+
+    statistics_table.add_tile_statistics.assert_called_once_with("test-endpoint", None, 60, 1, 0, 500)
+    assert len(worker._buffered_statistics) == 0
+
+
+def test_flush_tile_updates_without_region_request_table():
+    worker = TileWorker(Queue(), Mock(), None, Mock(), None)
+    worker.buffer_tile_update(
+        {"image_id": "img-1", "region_id": "reg-1", "region": ((0, 0), (256, 256))},
+        TileState.SUCCEEDED,
+    )
+
+    worker.flush_tile_updates()
+
+    assert len(worker._buffered_tile_updates) == 0
@@ -199,3 +199,102 @@ def test_refine_features_with_valid_bbox_translates_coordinates(tile_worker_setu
     assert len(features) == 1
     # Verify feature was processed (image_id added)
     assert features[0]["properties"]["image_id"] == "img_123"
+
+
+def test_refine_features_drops_detections_outside_processing_area(tile_worker_setup):
+    """Test that detections outside the region of interest are not kept for tiles crossing the ROI boundary."""
+    import geojson
+    import shapely
+
+    tile_worker, _, _ = tile_worker_setup
+    inside = geojson.Feature(geometry=geojson.Point((0, 0)), properties={"imageBBox": [10, 10, 50, 50]})
+    outside = geojson.Feature(geometry=geojson.Point((0, 0)), properties={"imageBBox": [400, 400, 450, 450]})
+    image_info = {
+        "region": [[200, 100], [512, 512]],
+        "image_id": "img_123",
+        "image_path": "/tmp/tile.tif",
+        "processing_area": shapely.box(100, 200, 300, 400),
+    }
+
+    features = tile_worker._refine_features.__wrapped__(
+        tile_worker, {"features": [inside, outside]}, image_info, metrics=None
+    )
+
+    assert features == [inside]
+
+
+def test_refine_features_scales_decimated_detections(tile_worker_setup):
+    """Test that detections from tiles read at a reduced resolution are mapped back to full image coordinates."""
+    import geojson
+
+    tile_worker, _, _ = tile_worker_setup
+    feature = geojson.Feature(geometry=geojson.Point((0, 0)), properties={"imageBBox": [10, 20, 30, 40]})
+    image_info = {
+        "region": [[200, 100], [1024, 1024]],
+        "image_id": "img_123",
+        "image_path": "/tmp/tile.tif",
+        "processing_scale": 2,
+    }
+
+    features = tile_worker._refine_features.__wrapped__(tile_worker, {"features": [feature]}, image_info, metrics=None)
+
+    assert features[0]["properties"]["imageBBox"] == [120, 240, 160, 280]
+
+
+def test_refine_features_from_detection_batch(tile_worker_setup):
+    """Test that a columnar detection batch is refined into geolocated features inside the processing area."""
+    import numpy as np
+    import shapely
+
+    from aws.osml.model_runner.inference import DetectionBatch
+
+    tile_worker, _, _ = tile_worker_setup
+    batch = DetectionBatch(
+        bboxes=np.array([[10, 20, 30, 40], [500, 500, 520, 520]], dtype=np.float32),
+        scores=np.array([0.9, 0.8], dtype=np.float32),
+        class_ids=np.array([0, 0], dtype=np.int32),
+        class_names=["vehicle"],
+    )
+    image_info = {
+        "region": [[200, 100], [1024, 1024]],
+        "image_id": "img_123",
+        "image_path": "/tmp/tile.tif",
+        "processing_area": shapely.box(100, 200, 300, 400),
+    }
+
+    features = tile_worker._refine_features.__wrapped__(tile_worker, batch, image_info, metrics=None)
+
+    assert len(features) == 1
+    assert features[0]["properties"]["imageBBox"] == [110, 220, 130, 240]
+    assert features[0]["properties"]["featureClasses"][0]["iri"] == "vehicle"
+    assert features[0]["properties"]["image_id"] == "img_123"
+    tile_worker.geolocator.geolocate_features.assert_called_once_with(features)
+
+
+def test_process_tile_adds_segmentation_mask_to_mosaic(tile_worker_setup, mocker):
+    """Test that segmentation masks are added to the region mosaic instead of the feature table."""
+    import numpy as np
+
+    from aws.osml.model_runner.common import TileState
+    from aws.osml.model_runner.inference import SegmentationMask
+
+    tile_worker, feature_detector, region_request_table = tile_worker_setup
+    mask = SegmentationMask(pixels=np.full((1, 512, 512), 255, dtype=np.uint8))
+    feature_detector.find_features.return_value = mask
+    tile_worker.mask_mosaic = mocker.Mock()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_tile_path = Path(temp_dir) / "test_tile.tif"
+        test_tile_path.write_bytes(b"fake_image_data")
+        image_info = {
+            "image_path": str(test_tile_path),
+            "region": [[0, 0], [512, 512]],
+            "image_id": "img_123",
+            "region_id": "region_456",
+        }
+
+        tile_worker.process_tile.__wrapped__(tile_worker, image_info, metrics=None)
+
+    tile_worker.mask_mosaic.add_mask.assert_called_once_with(mask, [[0, 0], [512, 512]])
+    tile_worker.feature_table.add_features.assert_not_called()
+    assert list(tile_worker._buffered_tile_updates.keys())[0][2] == TileState.SUCCEEDED
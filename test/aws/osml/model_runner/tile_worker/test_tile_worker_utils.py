@@ -82,6 +82,48 @@ def test_setup_tile_workers(mocker):
         assert worker.start.call_count == 4
 
 
+def test_setup_tile_workers_with_feature_collector(mocker):
+    """
+    Test that tile workers of a region processed in memory add their features to the feature collector and do not
+    use the feature or region request tables.
+    """
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.tile_worker import FeatureCollector
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import setup_tile_workers
+
+    mock_service_config = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.ServiceConfig", autospec=True)
+    mock_tile_worker = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.TileWorker", autospec=True)
+    mock_feature_table = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.FeatureTable", autospec=True)
+    mock_region_request_table = mocker.patch(
+        "aws.osml.model_runner.tile_worker.tile_worker_utils.RegionRequestTable", autospec=True
+    )
+    mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.FeatureDetectorFactory")
+    mock_service_config.workers = 2
+    mock_service_config.endpoint_statistics_table = None
+    mock_region_request = RegionRequest(
+        {
+            "tile_size": (10, 10),
+            "tile_overlap": (1, 1),
+            "tile_format": "NITF",
+            "image_id": "1",
+            "image_url": "/mock/path",
+            "region_bounds": ((0, 0), (50, 50)),
+            "model_invoke_mode": "SM_ENDPOINT",
+            "image_extension": "fake",
+        }
+    )
+    feature_collector = FeatureCollector()
+
+    _, tile_worker_list = setup_tile_workers(mock_region_request, feature_collector=feature_collector)
+
+    assert len(tile_worker_list) == 2
+    mock_feature_table.assert_not_called()
+    mock_region_request_table.assert_not_called()
+    for call in mock_tile_worker.call_args_list:
+        assert call.args[3] is feature_collector
+        assert call.args[4] is None
+
+
 def test_setup_tile_workers_exception(mocker):
     """
     Test that an exception during tile worker setup raises a SetupTileWorkersException.
@@ -288,6 +330,63 @@ def test_process_tiles(mocker):
     assert work_queue.put.call_count == 27
 
 
+def test_process_tiles_with_tile_buffer(mocker):
+    """
+    Test that tiles are cut from decoded strips of the region when a tile buffer is configured.
+    """
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.database import RegionRequestItem
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_gdal_config_env = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALConfigEnv", autospec=True)
+    mock_gdal_tile_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory")
+    mock_buffered_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.BufferedGDALTileFactory")
+    mock_buffered_factory.bytes_per_pixel.return_value = 1
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__enter__ = mocker.Mock()
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__exit__ = mocker.Mock(return_value=False)
+    mock_create_tile.return_value = "/tmp/fake-tile.ntf"
+
+    region_request_item = RegionRequestItem.from_region_request(
+        RegionRequest(
+            {
+                "tile_size": (10, 10),
+                "tile_overlap": (0, 0),
+                "tile_format": "NITF",
+                "image_id": "1",
+                "image_url": "/mock/path",
+                "region_bounds": ((0, 0), (50, 50)),
+                "model_invoke_mode": "SM_ENDPOINT",
+                "image_extension": "fake",
+                "failed_tiles": [],
+            }
+        )
+    )
+    work_queue = mocker.Mock()
+
+    total_tile_count, _ = process_tiles(
+        tiling_strategy=VariableTileTilingStrategy(),
+        region_request_item=region_request_item,
+        tile_queue=work_queue,
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=mocker.Mock(),
+        sensor_model=mocker.Mock(),
+        tile_buffer_bytes=50 * 20,
+    )
+
+    assert total_tile_count == 25
+    mock_gdal_tile_factory.assert_not_called()
+    factory = mock_buffered_factory.return_value
+    assert [call.args[0] for call in factory.load_window.call_args_list] == [
+        [0, 0, 50, 20],
+        [0, 20, 50, 20],
+        [0, 40, 50, 10],
+    ]
+    assert factory.release_window.call_count == 3
+    assert mock_create_tile.call_count == 25
+
+
 def test_process_tiles_skips_succeeded_tiles_and_uses_role(mocker):
     """
     Test that succeeded tiles are filtered and image read credentials are used.
@@ -348,6 +447,48 @@ def test_process_tiles_skips_succeeded_tiles_and_uses_role(mocker):
     assert tile_queue.put.call_count == 3
 
 
+def test_process_tiles_reprocesses_succeeded_tiles(mocker):
+    """
+    Test that a retried region processes the tiles that already succeeded again when asked to, so its segmentation
+    mask covers every tile.
+    """
+    from types import SimpleNamespace
+
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory", autospec=True)
+    mock_create_tile.return_value = "/tmp/tile.ntf"
+
+    tiling_strategy = mocker.Mock()
+    tiling_strategy.compute_tiles.return_value = [((0, 0), (10, 10)), ((10, 0), (10, 10))]
+    region_request_item = SimpleNamespace(
+        region_bounds=((0, 0), (20, 10)),
+        tile_size=(10, 10),
+        tile_overlap=(0, 0),
+        succeeded_tiles=[[[0, 0], [10, 10]]],
+        image_read_role=None,
+        tile_format="NITF",
+        tile_compression="NONE",
+        image_id="image-1",
+        job_id="job-1",
+        region_id="region-1",
+    )
+
+    total_tile_count, tile_error_count = process_tiles(
+        tiling_strategy=tiling_strategy,
+        region_request_item=region_request_item,
+        tile_queue=mocker.Mock(),
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=mocker.Mock(),
+        reprocess_succeeded_tiles=True,
+    )
+
+    assert total_tile_count == 2
+    assert tile_error_count == 0
+    assert [call.args[1] for call in mock_create_tile.call_args_list] == [((0, 0), (10, 10)), ((10, 0), (10, 10))]
+
+
 def test_process_tiles_exception(mocker):
     """
     Test that process_tiles wraps exceptions in ProcessTilesException.
@@ -536,8 +677,12 @@ def test_create_tile_missing_file(mocker):
 
 def test_select_features(mocker):
     """
-    Test that select_features uses the deserializer and tiling strategy.
+    Test that select_features uses the deserializer and tiling strategy, and that a list of features is
+    deduplicated as a single feature batch.
     """
+    from geojson import Feature
+
+    from aws.osml.model_runner.common import FeatureBatch
     from aws.osml.model_runner.tile_worker.tile_worker_utils import select_features
 
     mock_feature_selector = mocker.patch(
@@ -551,9 +696,12 @@ def test_select_features(mocker):
     feature_selector = mocker.Mock()
     mock_feature_selector.return_value = feature_selector
     tiling_strategy = mocker.Mock()
-    tiling_strategy.cleanup_duplicate_features.return_value = ["feature"]
+    tiling_strategy.cleanup_duplicate_features.side_effect = lambda *args: args[4].select([1])
 
-    features = [mocker.Mock()]
+    # The feature without image bounds is not part of the batch the tiling strategy works on
+    features = [Feature(id="no-bounds", properties={})] + [
+        Feature(id=i, properties={"imageBBox": [i, i, i + 1, i + 1]}) for i in range(2)
+    ]
     processing_bounds = ((0, 0), (10, 10))
     result = select_features(
         feature_distillation_option='{"type": "nms"}',
@@ -570,7 +718,301 @@ def test_select_features(mocker):
         (10, 10),
         (5, 5),
         (1, 1),
-        features,
+        mocker.ANY,
         feature_selector,
     )
-    assert result == ["feature"]
+    feature_batch = tiling_strategy.cleanup_duplicate_features.call_args[0][4]
+    assert isinstance(feature_batch, FeatureBatch)
+    assert feature_batch.ids == [0, 1]
+    assert len(result) == 1
+    assert result[0] is features[2]
+
+    # A feature batch is passed through and returned as a batch
+    batch_result = select_features(
+        '{"type": "nms"}', feature_batch, processing_bounds, "(10, 10)", "(5, 5)", "(1, 1)", tiling_strategy
+    )
+    assert isinstance(batch_result, FeatureBatch)
+
+
+def test_process_tiles_reads_in_block_order_with_read_ahead(mocker):
+    """
+    Test that tiles read from the source image follow the dataset's block layout and that GDAL is advised of
+    upcoming tiles before they are read.
+    """
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.database import RegionRequestItem
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_gdal_config_env = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALConfigEnv", autospec=True)
+    mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory")
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__enter__ = mocker.Mock()
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__exit__ = mocker.Mock(return_value=False)
+    mock_create_tile.return_value = "/tmp/fake-tile.ntf"
+
+    region_request_item = RegionRequestItem.from_region_request(
+        RegionRequest(
+            {
+                "tile_size": (10, 10),
+                "tile_overlap": (0, 0),
+                "tile_format": "NITF",
+                "image_id": "1",
+                "image_url": "/mock/path",
+                "region_bounds": ((0, 0), (40, 20)),
+                "model_invoke_mode": "SM_ENDPOINT",
+                "image_extension": "fake",
+                "failed_tiles": [],
+            }
+        )
+    )
+    raster_dataset = mocker.Mock()
+    raster_dataset.GetRasterBand.return_value.GetBlockSize.return_value = [20, 20]
+
+    total_tile_count, _ = process_tiles(
+        tiling_strategy=VariableTileTilingStrategy(),
+        region_request_item=region_request_item,
+        tile_queue=mocker.Mock(),
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=raster_dataset,
+        sensor_model=mocker.Mock(),
+        read_ahead_tiles=4,
+    )
+
+    assert total_tile_count == 8
+    # Each 20x20 block is finished before moving on to the next block in the row
+    assert [call.args[1][0] for call in mock_create_tile.call_args_list] == [
+        (0, 0),
+        (0, 10),
+        (10, 0),
+        (10, 10),
+        (0, 20),
+        (0, 30),
+        (10, 20),
+        (10, 30),
+    ]
+    assert [call.args for call in raster_dataset.AdviseRead.call_args_list] == [(0, 0, 20, 20), (20, 0, 20, 20)]
+
+
+def test_process_tiles_skips_nodata_tiles(mocker):
+    """
+    Test that nodata tiles are not encoded or queued and are recorded as skipped on the region request item.
+    """
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.database import RegionRequestItem
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_gdal_config_env = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALConfigEnv", autospec=True)
+    mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory")
+    mock_nodata_filter = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.NoDataTileFilter")
+    mock_nodata_filter.return_value.enabled = True
+    mock_nodata_filter.return_value.is_empty.side_effect = lambda tile: tile[0][1] >= 20
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__enter__ = mocker.Mock()
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__exit__ = mocker.Mock(return_value=False)
+    mock_create_tile.return_value = "/tmp/fake-tile.ntf"
+
+    region_request_item = RegionRequestItem.from_region_request(
+        RegionRequest(
+            {
+                "tile_size": (10, 10),
+                "tile_overlap": (0, 0),
+                "tile_format": "NITF",
+                "image_id": "1",
+                "image_url": "/mock/path",
+                "region_bounds": ((0, 0), (40, 20)),
+                "model_invoke_mode": "SM_ENDPOINT",
+                "image_extension": "fake",
+                "failed_tiles": [],
+            }
+        )
+    )
+    work_queue = mocker.Mock()
+    raster_dataset = mocker.Mock()
+
+    total_tile_count, tile_error_count = process_tiles(
+        tiling_strategy=VariableTileTilingStrategy(),
+        region_request_item=region_request_item,
+        tile_queue=work_queue,
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=raster_dataset,
+        sensor_model=mocker.Mock(),
+        nodata_threshold=0.9,
+    )
+
+    mock_nodata_filter.assert_called_once_with(raster_dataset, 0.9)
+    assert (total_tile_count, tile_error_count) == (8, 0)
+    assert mock_create_tile.call_count == 4
+    # 4 tiles plus 1 worker shutdown sentinel
+    assert work_queue.put.call_count == 5
+    assert region_request_item.skipped_tile_count == 4
+    assert sorted(region_request_item.skipped_tiles) == [
+        [[0, 20], [10, 10]],
+        [[0, 30], [10, 10]],
+        [[10, 20], [10, 10]],
+        [[10, 30], [10, 10]],
+    ]
+
+
+def test_process_tiles_with_processing_area(mocker):
+    """
+    Test that tiles are computed within the ROI and that tiles crossing its boundary carry the ROI to the workers.
+    """
+    import shapely
+
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.database import RegionRequestItem
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_gdal_config_env = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALConfigEnv", autospec=True)
+    mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory")
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__enter__ = mocker.Mock()
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__exit__ = mocker.Mock(return_value=False)
+    mock_create_tile.return_value = "/tmp/fake-tile.ntf"
+
+    region_request_item = RegionRequestItem.from_region_request(
+        RegionRequest(
+            {
+                "tile_size": (10, 10),
+                "tile_overlap": (0, 0),
+                "tile_format": "NITF",
+                "image_id": "1",
+                "image_url": "/mock/path",
+                "region_bounds": ((0, 0), (40, 40)),
+                "model_invoke_mode": "SM_ENDPOINT",
+                "image_extension": "fake",
+                "failed_tiles": [],
+            }
+        )
+    )
+    work_queue = mocker.Mock()
+    processing_area = shapely.box(0, 0, 15, 40)
+
+    total_tile_count, _ = process_tiles(
+        tiling_strategy=VariableTileTilingStrategy(),
+        region_request_item=region_request_item,
+        tile_queue=work_queue,
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=mocker.Mock(),
+        sensor_model=mocker.Mock(),
+        processing_area=processing_area,
+    )
+
+    assert total_tile_count == 8
+    queued = [call.args[0] for call in work_queue.put.call_args_list if call.args[0] is not None]
+    # Tiles in the first column lie inside the ROI, tiles in the second column cross its boundary
+    assert all(("processing_area" in image_info) == (image_info["region"][0][1] == 10) for image_info in queued)
+
+
+def test_process_tiles_with_processing_scale(mocker):
+    """
+    Test that decimated tiles cover a scaled area of the region, are read from the source image at the model tile
+    size and tell the workers the scale used to read them.
+    """
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.database import RegionRequestItem
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_gdal_config_env = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALConfigEnv", autospec=True)
+    mock_gdal_tile_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory")
+    mock_buffered_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.BufferedGDALTileFactory")
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__enter__ = mocker.Mock()
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__exit__ = mocker.Mock(return_value=False)
+    mock_create_tile.return_value = "/tmp/fake-tile.ntf"
+
+    region_request_item = RegionRequestItem.from_region_request(
+        RegionRequest(
+            {
+                "tile_size": (10, 10),
+                "tile_overlap": (0, 0),
+                "tile_format": "NITF",
+                "image_id": "1",
+                "image_url": "/mock/path",
+                "region_bounds": ((0, 0), (50, 40)),
+                "model_invoke_mode": "SM_ENDPOINT",
+                "image_extension": "fake",
+                "failed_tiles": [],
+            }
+        )
+    )
+    work_queue = mocker.Mock()
+
+    total_tile_count, _ = process_tiles(
+        tiling_strategy=VariableTileTilingStrategy(),
+        region_request_item=region_request_item,
+        tile_queue=work_queue,
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=mocker.Mock(),
+        sensor_model=mocker.Mock(),
+        tile_buffer_bytes=50 * 40,
+        processing_scale=2,
+    )
+
+    assert total_tile_count == 6
+    mock_buffered_factory.assert_not_called()
+    mock_gdal_tile_factory.assert_called_once()
+    output_sizes = {call.args[1]: call.kwargs["output_size"] for call in mock_create_tile.call_args_list}
+    assert output_sizes[((0, 0), (20, 20))] == (10, 10)
+    assert output_sizes[((0, 40), (10, 20))] == (5, 10)
+    queued = [call.args[0] for call in work_queue.put.call_args_list if call.args[0] is not None]
+    assert all(image_info["processing_scale"] == 2 for image_info in queued)
+
+
+def test_process_tiles_with_raw_tile_format(mocker):
+    """
+    Test that raw tiles are created by the raw tile factory, cut from decoded windows when a tile buffer is set.
+    """
+    from aws.osml.model_runner.api import RegionRequest
+    from aws.osml.model_runner.database import RegionRequestItem
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+    from aws.osml.model_runner.tile_worker.tile_worker_utils import process_tiles
+
+    mock_gdal_config_env = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALConfigEnv", autospec=True)
+    mock_gdal_tile_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.GDALTileFactory")
+    mock_buffered_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.BufferedGDALTileFactory")
+    mock_buffered_factory.bytes_per_pixel.return_value = 1
+    mock_raw_factory = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils.RawTileFactory")
+    mock_create_tile = mocker.patch("aws.osml.model_runner.tile_worker.tile_worker_utils._create_tile", autospec=True)
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__enter__ = mocker.Mock()
+    mock_gdal_config_env.return_value.with_aws_credentials.return_value.__exit__ = mocker.Mock(return_value=False)
+    mock_create_tile.return_value = "/tmp/fake-tile.raw"
+
+    region_request_item = RegionRequestItem.from_region_request(
+        RegionRequest(
+            {
+                "tile_size": (10, 10),
+                "tile_overlap": (0, 0),
+                "tile_format": "RAW",
+                "tile_compression": "LZ4",
+                "image_id": "1",
+                "image_url": "/mock/path",
+                "region_bounds": ((0, 0), (20, 20)),
+                "model_invoke_mode": "SM_ENDPOINT",
+                "image_extension": "fake",
+                "failed_tiles": [],
+            }
+        )
+    )
+    raster_dataset = mocker.Mock()
+
+    total_tile_count, _ = process_tiles(
+        tiling_strategy=VariableTileTilingStrategy(),
+        region_request_item=region_request_item,
+        tile_queue=mocker.Mock(),
+        tile_workers=[mocker.Mock(failed_tile_count=0)],
+        raster_dataset=raster_dataset,
+        sensor_model=mocker.Mock(),
+        tile_buffer_bytes=20 * 20,
+    )
+
+    assert total_tile_count == 4
+    mock_raw_factory.assert_called_once_with(raster_dataset, tile_compression="LZ4")
+    mock_gdal_tile_factory.assert_not_called()
+    mock_buffered_factory.assert_not_called()
+    mock_raw_factory.return_value.load_window.assert_called_once_with([0, 0, 20, 20])
+    assert all(call.args[0] is mock_raw_factory.return_value for call in mock_create_tile.call_args_list)
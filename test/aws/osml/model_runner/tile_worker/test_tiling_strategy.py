@@ -1,8 +1,18 @@
 #  Copyright 2024-2026 Amazon.com, Inc. or its affiliates.
 
+import numpy as np
 import pytest
+import shapely
+from geojson import Feature
 
-from aws.osml.model_runner.tile_worker.tiling_strategy import generate_crops
+from aws.osml.model_runner.common import FeatureBatch
+from aws.osml.model_runner.tile_worker import VariableOverlapTilingStrategy
+from aws.osml.model_runner.tile_worker.tiling_strategy import (
+    filter_regions_by_area,
+    generate_crops,
+    group_feature_batch_by_overlap,
+    identify_batch_overlaps,
+)
 
 
 def test_chip_generator_partial_overlap():
@@ -77,3 +87,52 @@ def test_invalid_chip_generator():
         chip_list = []
         for chip in generate_crops(((5, 10), (1024, 1024)), (300, 300), (0, 301)):
             chip_list.append(chip)
+
+
+def test_filter_regions_by_area():
+    """
+    Test that only regions overlapping the area of interest are kept, regions that merely touch it are removed.
+    """
+    regions = generate_crops(((0, 0), (300, 300)), (100, 100), (0, 0))
+    # A diagonal corridor from the upper left to the lower right corner of the image
+    corridor = shapely.Polygon([(0, 0), (20, 0), (300, 280), (300, 300), (280, 300), (0, 20)])
+
+    kept = filter_regions_by_area(regions, corridor)
+
+    assert ((0, 0), (100, 100)) in kept
+    assert ((100, 100), (100, 100)) in kept
+    assert ((200, 200), (100, 100)) in kept
+    assert ((0, 200), (100, 100)) not in kept
+    assert ((200, 0), (100, 100)) not in kept
+    assert len(kept) < len(regions)
+    assert filter_regions_by_area(regions, shapely.box(300, 0, 400, 300)) == []
+    assert filter_regions_by_area(regions, None) == regions
+
+
+def test_identify_batch_overlaps():
+    """
+    Test that the overlap keys of a batch match the keys computed for each feature.
+    """
+    rng = np.random.default_rng(7)
+    corners = rng.uniform(0, 30000, size=(500, 2))
+    bboxes = np.hstack([corners, corners + rng.uniform(0, 60, size=(500, 2))])
+    features = [Feature(properties={"imageBBox": bbox}) for bbox in bboxes.tolist()]
+    batch = FeatureBatch.from_features(features)
+
+    for shape, overlap, origin in [((4096, 4096), (100, 100), (0, 0)), ((10000, 10000), (50, 80), (9950, 19900))]:
+        keys = identify_batch_overlaps(batch, shape, overlap, origin)
+        expected = [VariableOverlapTilingStrategy._identify_overlap(feature, shape, overlap, origin) for feature in features]
+        assert [tuple(key) for key in keys.tolist()] == expected
+
+
+def test_group_feature_batch_by_overlap():
+    """
+    Test that a batch is grouped in the order the groups first appear and keeps the order of the features.
+    """
+    bboxes = [[5000, 10, 5010, 20], [10, 10, 20, 20], [5020, 30, 5030, 40], [4000, 10, 4010, 20]]
+    batch = FeatureBatch.from_features([Feature(id=i, properties={"imageBBox": bbox}) for i, bbox in enumerate(bboxes)])
+
+    groups = group_feature_batch_by_overlap(batch, (4096, 4096), (100, 100))
+
+    assert list(groups.keys()) == [(1, 1, 0, 0), (0, 0, 0, 0), (0, 1, 0, 0)]
+    assert [groups[key].ids for key in groups] == [[0, 2], [1], [3]]
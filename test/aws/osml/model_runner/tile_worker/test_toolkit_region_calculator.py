@@ -62,6 +62,91 @@ def test_small_image_returns_one_region(toolkit_region_calculator_setup, mocker)
     mock_tiling_strategy.compute_regions.assert_called_once()
 
 
+def test_calculate_region_plan(toolkit_region_calculator_setup, mocker):
+    """
+    Test that the region plan records the regions, tile counts and image metadata.
+    """
+    calculator, mock_tiling_strategy = toolkit_region_calculator_setup
+
+    mock_dataset = mocker.MagicMock()
+    mock_dataset.RasterXSize = 20000
+    mock_dataset.RasterYSize = 10000
+    mock_dataset.GetDriver.return_value.ShortName = "GTiff"
+
+    mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.get_image_path", return_value="test/path/image.tif"
+    )
+    mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.load_gdal_dataset",
+        return_value=(mock_dataset, mocker.MagicMock()),
+    )
+    mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.calculate_processing_bounds",
+        return_value=((0, 0), (20000, 10000)),
+    )
+    mocker.patch("aws.osml.model_runner.tile_worker.toolkit_region_calculator.get_image_extension", return_value="TIFF")
+    mocker.patch("aws.osml.model_runner.tile_worker.toolkit_region_calculator.GDALConfigEnv")
+
+    mock_tiling_strategy.compute_regions.return_value = [((0, 0), (10240, 10000)), ((0, 10190), (9810, 10000))]
+    mock_tiling_strategy.compute_tiles.side_effect = [[mocker.MagicMock()] * 110, [mocker.MagicMock()] * 100]
+
+    region_plan = calculator.calculate_region_plan(
+        image_url="s3://bucket/image.tif", tile_size=(1024, 1024), tile_overlap=(50, 50)
+    )
+
+    assert region_plan.processing_bounds == ((0, 0), (20000, 10000))
+    assert region_plan.regions == [((0, 0), (10240, 10000)), ((0, 10190), (9810, 10000))]
+    assert region_plan.tile_counts == [110, 100]
+    assert mock_tiling_strategy.compute_regions.call_args.kwargs == {"processing_area": None}
+    assert mock_tiling_strategy.compute_tiles.call_args.kwargs == {"processing_area": None}
+    assert region_plan.matches((10240, 10240), (1024, 1024), (50, 50))
+    assert region_plan.image_width == 20000
+    assert region_plan.image_height == 10000
+    assert region_plan.image_format == "GTIFF"
+    assert region_plan.image_extension == "TIFF"
+
+
+def test_calculate_region_plan_prunes_with_roi_polygon(toolkit_region_calculator_setup, mocker):
+    """
+    Test that the image space ROI polygon is passed to the tiling strategy when computing regions and tiles.
+    """
+    calculator, mock_tiling_strategy = toolkit_region_calculator_setup
+    mock_dataset = mocker.MagicMock()
+    mock_dataset.RasterXSize = 20000
+    mock_dataset.RasterYSize = 10000
+    processing_area = shapely.geometry.Polygon([(0, 0), (2000, 0), (20000, 8000), (20000, 10000), (18000, 10000)])
+
+    mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.get_image_path", return_value="test/path/image.tif"
+    )
+    mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.load_gdal_dataset",
+        return_value=(mock_dataset, mocker.MagicMock()),
+    )
+    mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.calculate_processing_bounds",
+        return_value=((0, 0), (20000, 10000)),
+    )
+    mock_calc_area = mocker.patch(
+        "aws.osml.model_runner.tile_worker.toolkit_region_calculator.calculate_processing_area",
+        return_value=processing_area,
+    )
+    mocker.patch("aws.osml.model_runner.tile_worker.toolkit_region_calculator.get_image_extension", return_value="TIFF")
+    mocker.patch("aws.osml.model_runner.tile_worker.toolkit_region_calculator.GDALConfigEnv")
+    mock_tiling_strategy.compute_regions.return_value = [((0, 0), (10240, 10000))]
+    mock_tiling_strategy.compute_tiles.return_value = [mocker.MagicMock()] * 12
+    roi = shapely.geometry.box(0, 0, 1, 1)
+
+    region_plan = calculator.calculate_region_plan(
+        image_url="s3://bucket/image.tif", tile_size=(1024, 1024), tile_overlap=(50, 50), roi=roi
+    )
+
+    mock_calc_area.assert_called_once_with(mock_dataset, roi, mocker.ANY)
+    assert mock_tiling_strategy.compute_regions.call_args.kwargs == {"processing_area": processing_area}
+    assert mock_tiling_strategy.compute_tiles.call_args.kwargs == {"processing_area": processing_area}
+    assert region_plan.tile_counts == [12]
+
+
 def test_large_image_returns_multiple_regions(toolkit_region_calculator_setup, mocker):
     """
     Test that a large image (20480×20480) returns 4 regions.
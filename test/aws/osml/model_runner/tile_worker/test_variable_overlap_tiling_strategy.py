@@ -154,8 +154,10 @@ def test_deconflict_features(mocker):
     """
     Test that duplicate features are properly deconflicted based on specified rules.
     """
+    import numpy as np
     from geojson import Feature
 
+    from aws.osml.model_runner.common import FeatureBatch
     from aws.osml.model_runner.inference import FeatureSelector
     from aws.osml.model_runner.tile_worker import VariableOverlapTilingStrategy
 
@@ -206,3 +208,40 @@ def test_deconflict_features(mocker):
 
     # Verify that the feature selector was called for each overlapping group
     assert len(mock_feature_selector.method_calls) == 4
+
+    # A feature batch is deduplicated the same way and stays a batch
+    class DummyBatchSelector(FeatureSelector):
+        def select_features(self, features):
+            return features.select([0])
+
+    deduped_batch = tiling_strategy.cleanup_duplicate_features(
+        full_image_region,
+        nominal_region_size,
+        tile_size,
+        overlap,
+        FeatureBatch.from_features(features),
+        DummyBatchSelector(),
+    )
+    assert isinstance(deduped_batch, FeatureBatch)
+    assert deduped_batch.ids == [feature.get("id") for feature in deduped_features]
+    np.testing.assert_array_equal(
+        deduped_batch.image_bboxes, [feature["properties"]["imageBBox"] for feature in deduped_features]
+    )
+
+
+def test_compute_tiles_with_processing_area():
+    """
+    Test that tiles outside a polygon area of interest are never created.
+    """
+    import shapely
+
+    from aws.osml.model_runner.tile_worker import VariableOverlapTilingStrategy
+
+    tiling_strategy = VariableOverlapTilingStrategy()
+    region = ((0, 0), (2048, 2048))
+
+    all_tiles = tiling_strategy.compute_tiles(region, (1024, 1024), (0, 0))
+    tiles = tiling_strategy.compute_tiles(region, (1024, 1024), (0, 0), processing_area=shapely.box(0, 0, 500, 2048))
+
+    assert len(all_tiles) == 4
+    assert tiles == [((0, 0), (1024, 1024)), ((1024, 0), (1024, 1024))]
@@ -163,8 +163,10 @@ def test_deconflict_features(mocker):
     """
     Test that duplicate features are properly deconflicted based on specified rules.
     """
+    import numpy as np
     from geojson import Feature
 
+    from aws.osml.model_runner.common import FeatureBatch
     from aws.osml.model_runner.inference import FeatureSelector
     from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
 
@@ -210,3 +212,43 @@ def test_deconflict_features(mocker):
 
     # Verify that the feature selector was called for each overlapping group
     assert len(mock_feature_selector.method_calls) == 4
+
+    # A feature batch is deduplicated the same way and stays a batch
+    class DummyBatchSelector(FeatureSelector):
+        def select_features(self, features):
+            return features.select([0])
+
+    deduped_batch = tiling_strategy.cleanup_duplicate_features(
+        full_image_region,
+        nominal_region_size,
+        tile_size,
+        overlap,
+        FeatureBatch.from_features(features),
+        DummyBatchSelector(),
+    )
+    assert isinstance(deduped_batch, FeatureBatch)
+    assert deduped_batch.ids == [feature.get("id") for feature in deduped_features]
+    np.testing.assert_array_equal(
+        deduped_batch.image_bboxes, [feature["properties"]["imageBBox"] for feature in deduped_features]
+    )
+
+
+def test_compute_regions_and_tiles_with_processing_area():
+    """
+    Test that regions and tiles outside a polygon area of interest are never created.
+    """
+    import shapely
+
+    from aws.osml.model_runner.tile_worker import VariableTileTilingStrategy
+
+    tiling_strategy = VariableTileTilingStrategy()
+    # A narrow corridor along the top edge of the image
+    corridor = shapely.box(0, 0, 25000, 500)
+
+    regions = tiling_strategy.compute_regions(
+        ((0, 0), (25000, 12000)), (10000, 10000), (4096, 4096), (100, 100), processing_area=corridor
+    )
+    tiles = tiling_strategy.compute_tiles(regions[0], (4096, 4096), (100, 100), processing_area=corridor)
+
+    assert regions == [((0, 0), (10000, 10000)), ((0, 9900), (10000, 10000)), ((0, 19800), (5200, 10000))]
+    assert tiles == [((0, 0), (4096, 4096)), ((0, 3996), (4096, 4096)), ((0, 7992), (2008, 4096))]
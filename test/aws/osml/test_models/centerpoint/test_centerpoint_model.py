@@ -195,3 +195,23 @@ def test_predict_without_mock_latency(centerpoint_model_setup):
 
     actual_geojson_result = json.loads(response.data)
     compare_two_geojson_results(actual_geojson_result, expected_json_result)
+
+
+def test_predict_raw_tile(centerpoint_model_setup):
+    """
+    Test that the centerpoint model accepts raw array tiles and sizes its detection from the tile header.
+    """
+    import numpy as np
+
+    from aws.osml.model_runner.tile_worker import encode_raw_tile_header
+    from aws.osml.test_models.centerpoint.app import gen_center_bbox
+
+    client = centerpoint_model_setup
+    pixels = np.zeros((3, 200, 300), dtype=np.uint8)
+    payload = encode_raw_tile_header(pixels.shape, pixels.dtype, "NONE") + pixels.tobytes()
+
+    response = client.post("/invocations", data=payload)
+
+    assert response.status_code == 200
+    feature = json.loads(response.data)["features"][0]
+    assert feature["properties"]["imageBBox"] == gen_center_bbox(300, 200, 0.1)
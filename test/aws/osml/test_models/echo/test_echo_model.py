@@ -0,0 +1,59 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def echo_model_setup():
+    """
+    Set up the Flask application context and a test client for the echo model.
+    """
+    from aws.osml.test_models.echo.app import app
+
+    ctx = app.app_context()
+    ctx.push()
+    client = app.test_client()
+
+    yield client
+
+    ctx.pop()
+
+
+def test_ping(echo_model_setup):
+    """
+    Test the `/ping` endpoint to check if the application is running.
+    """
+    client = echo_model_setup
+    response = client.get("/ping")
+    assert response.status_code == 200
+
+
+def test_predict_echo_model(echo_model_setup):
+    """
+    Test that the echo model returns the default number of detections without reading the payload.
+    """
+    client = echo_model_setup
+    response = client.post("/invocations", data=b"not an image")
+
+    assert response.status_code == 200
+    feature_collection = json.loads(response.data)
+    assert feature_collection["type"] == "FeatureCollection"
+    assert len(feature_collection["features"]) == 10
+    for feature in feature_collection["features"]:
+        min_x, min_y, max_x, max_y = feature["properties"]["imageBBox"]
+        assert 0 <= min_x < max_x <= 256 and 0 <= min_y < max_y <= 256
+
+
+def test_predict_echo_model_feature_count(echo_model_setup):
+    """
+    Test that the response size is set with the echo_feature_count custom attribute and reused across requests.
+    """
+    client = echo_model_setup
+    headers = {"X-Amzn-SageMaker-Custom-Attributes": "echo_feature_count=1000"}
+    first_response = client.post("/invocations", data=b"", headers=headers)
+    second_response = client.post("/invocations", data=b"", headers=headers)
+
+    assert len(json.loads(first_response.data)["features"]) == 1000
+    assert first_response.data == second_response.data
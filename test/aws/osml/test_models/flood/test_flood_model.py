@@ -88,6 +88,45 @@ def test_predict_flood_model(flood_model_setup):
         assert 0 <= properties["featureClasses"][0]["score"] <= 1  # Random score between 0 and 1
 
 
+def test_predict_flood_model_segmentation_mask(flood_model_setup):
+    """
+    Test that the flood model returns a segmentation mask of the image when the request Accepts one.
+    """
+    from aws.osml.model_runner.inference import SEGMENTATION_MASK_MEDIA_TYPE, decode_segmentation_mask
+
+    client = flood_model_setup
+    with open("test/data/test-model.tif", "rb") as data_binary:
+        response = client.post("/invocations", data=data_binary, headers={"Accept": SEGMENTATION_MASK_MEDIA_TYPE})
+
+    assert response.status_code == 200
+    assert response.mimetype == SEGMENTATION_MASK_MEDIA_TYPE
+    mask = decode_segmentation_mask(response.data)
+    assert mask.band_count == 1
+    assert mask.pixels.max() > 0
+
+
+def test_predict_flood_model_templates(flood_model_setup, mocker):
+    """
+    Test that precomputed responses are returned when flood templates are enabled.
+    """
+    from aws.osml.test_models.flood import app as flood_app
+
+    mocker.patch.object(flood_app, "FLOOD_TEMPLATE_COUNT", 2)
+    flood_app.get_flood_templates.cache_clear()
+    client = flood_model_setup
+    responses = set()
+    for _ in range(10):
+        with open("test/data/test-model.tif", "rb") as data_binary:
+            response = client.post("/invocations", data=data_binary)
+        assert response.status_code == 200
+        assert len(json.loads(response.data)["features"]) == 10
+        responses.add(response.data)
+
+    # Every response is one of the 2 templates generated for the tile size
+    assert len(responses) <= 2
+    flood_app.get_flood_templates.cache_clear()
+
+
 def test_predict_bad_data_file(flood_model_setup):
     """
     Test the flood model's response to invalid data input.
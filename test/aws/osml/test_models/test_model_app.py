@@ -82,6 +82,18 @@ def test_flood_routing_with_volume(model_app_setup):
     assert len(actual_geojson_result["features"]) == 5
 
 
+def test_echo_routing_with_feature_count(model_app_setup):
+    """Test echo model routing with feature count parameter"""
+    app, client = model_app_setup
+    response = client.post(
+        "/invocations",
+        data=b"",
+        headers={"X-Amzn-SageMaker-Custom-Attributes": "model_selection=echo,echo_feature_count=3"},
+    )
+    assert response.status_code == 200
+    assert len(json.loads(response.data)["features"]) == 3
+
+
 def test_failure_routing(model_app_setup):
     """Test failure model routing"""
     app, client = model_app_setup
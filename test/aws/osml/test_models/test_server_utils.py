@@ -3,14 +3,22 @@
 import logging
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
 from flask import Flask
 
 from aws.osml.test_models.server_utils import (
     build_flask_app,
     build_logger,
+    decode_raw_tile,
     detect_to_feature,
+    encode_segmentation_mask,
+    get_server_processes,
     parse_custom_attributes,
     parse_custom_attributes_header,
+    read_raw_tile_header,
+    sample_latency_ms,
+    serve_processes,
     setup_server,
     simulate_model_latency,
 )
@@ -38,7 +46,55 @@ def test_setup_server(mock_serve):
     setup_server(app)
 
     app.logger.debug.assert_called_once_with("Initializing OSML Model Flask server on port 8080!")
-    mock_serve.assert_called_once_with(app, host="0.0.0.0", port=8080, clear_untrusted_proxy_headers=True)
+    mock_serve.assert_called_once_with(
+        app,
+        host="0.0.0.0",
+        port=8080,
+        clear_untrusted_proxy_headers=True,
+        threads=4,
+        connection_limit=100,
+        backlog=1024,
+    )
+
+
+@patch.dict("os.environ", {"SERVER_PROCESSES": "3", "SERVER_THREADS": "16"})
+@patch("aws.osml.test_models.server_utils.serve_processes")
+@patch("waitress.serve")
+def test_setup_server_multiple_processes(mock_serve, mock_serve_processes):
+    # Test that the server is started in several processes with the configured threads
+    app = Flask(__name__)
+
+    setup_server(app)
+
+    mock_serve.assert_not_called()
+    mock_serve_processes.assert_called_once_with(app, 8080, 3, {"threads": 16, "connection_limit": 100, "backlog": 1024})
+
+
+def test_get_server_processes():
+    with patch.dict("os.environ", {"SERVER_PROCESSES": "auto"}), patch("os.cpu_count", return_value=8):
+        assert get_server_processes() == 8
+    with patch.dict("os.environ", {"SERVER_PROCESSES": "0"}):
+        assert get_server_processes() == 1
+    with patch.dict("os.environ", {}, clear=True):
+        assert get_server_processes() == 1
+
+
+@patch("aws.osml.test_models.server_utils.socket.create_server")
+@patch("aws.osml.test_models.server_utils.multiprocessing.get_context")
+def test_serve_processes(mock_get_context, mock_create_server):
+    # Test that each process serves the application on the socket created by the parent
+    app = Flask(__name__)
+    server_options = {"threads": 4, "connection_limit": 100, "backlog": 2048}
+
+    serve_processes(app, 8080, 2, server_options)
+
+    mock_create_server.assert_called_once_with(("0.0.0.0", 8080), backlog=2048)
+    process = mock_get_context.return_value.Process
+    assert process.call_count == 2
+    assert process.call_args.kwargs["args"] == (app, mock_create_server.return_value, server_options)
+    assert process.return_value.start.call_count == 2
+    assert process.return_value.join.call_count == 2
+    mock_create_server.return_value.close.assert_called_once()
 
 
 def test_build_flask_app():
@@ -198,3 +254,91 @@ def test_simulate_model_latency_negative_random_value(mock_sleep, mock_gauss):
         simulate_model_latency()
         # Verify sleep was called with 0 (negative values should be clamped)
         mock_sleep.assert_called_once_with(0.0)
+
+
+@patch("time.sleep")
+def test_simulate_model_latency_from_environment(mock_sleep):
+    """Test that the environment sets the latency of requests without custom attributes"""
+    app = Flask(__name__)
+    with patch.dict(
+        "os.environ", {"MOCK_LATENCY_MEAN": "250", "MOCK_LATENCY_DISTRIBUTION": "constant"}
+    ), app.test_request_context():
+        simulate_model_latency()
+        mock_sleep.assert_called_once_with(0.25)
+
+
+@patch("aws.osml.test_models.server_utils.sample_latency_ms", return_value=100.0)
+@patch("time.sleep")
+def test_simulate_model_latency_request_ignores_environment(mock_sleep, mock_sample):
+    """Test that a request setting its own latency does not take the std or distribution from the environment"""
+    app = Flask(__name__)
+    with patch.dict(
+        "os.environ", {"MOCK_LATENCY_MEAN": "250", "MOCK_LATENCY_STD": "75", "MOCK_LATENCY_DISTRIBUTION": "exponential"}
+    ), app.test_request_context(headers={"X-Amzn-SageMaker-Custom-Attributes": "mock_latency_mean=500"}):
+        simulate_model_latency()
+        mock_sample.assert_called_once_with(500.0, 50.0, "normal")
+        mock_sleep.assert_called_once_with(0.1)
+
+
+def test_sample_latency_ms():
+    """Test that latencies are drawn from each distribution and are never negative"""
+    assert sample_latency_ms(100, 10, "constant") == 100
+    assert sample_latency_ms(-5, 10, "normal") == 0
+    samples = [sample_latency_ms(100, 50, "lognormal") for _ in range(2000)]
+    assert min(samples) > 0
+    assert 90 < sum(samples) / len(samples) < 110
+    assert min(sample_latency_ms(100, 0, "exponential") for _ in range(100)) >= 0
+    with pytest.raises(ValueError):
+        sample_latency_ms(100, 10, "bimodal")
+
+
+def test_decode_raw_tile():
+    """Test that raw array tiles are decoded into (bands, height, width) arrays and other payloads are ignored"""
+    from aws.osml.model_runner.tile_worker import encode_raw_tile_header
+
+    pixels = np.arange(2 * 3 * 4, dtype=np.uint16).reshape(2, 3, 4)
+    payload = encode_raw_tile_header(pixels.shape, pixels.dtype, "NONE") + pixels.tobytes()
+
+    assert read_raw_tile_header(payload)["shape"] == [2, 3, 4]
+    np.testing.assert_array_equal(decode_raw_tile(payload), pixels)
+    assert decode_raw_tile(b"II*\x00 an encoded image") is None
+    with pytest.raises(ValueError):
+        read_raw_tile_header(b"OSMLRAW1\x05\x00\x00\x00{bad")
+
+
+@pytest.mark.parametrize("compression", ["NONE", "LZ4", "ZSTD"])
+def test_raw_tile_format_matches_model_runner(compression):
+    """
+    Test that the test model servers read raw tiles created by the model runner exactly as the model runner's own
+    decoder does, so the two copies of the format cannot drift apart.
+    """
+    from aws.osml.model_runner.tile_worker import raw_tile_factory
+    from aws.osml.test_models import server_utils
+
+    if compression != "NONE":
+        pytest.importorskip({"LZ4": "lz4", "ZSTD": "zstandard"}[compression])
+    pixels = np.arange(3 * 5 * 7, dtype=np.int16).reshape(3, 5, 7) - 50
+    payload = raw_tile_factory.encode_raw_tile_header(pixels.shape, pixels.dtype, compression)
+    if compression == "NONE":
+        payload += pixels.tobytes()
+    else:
+        payload += raw_tile_factory._get_codec(compression).compress(pixels.tobytes())
+
+    header, offset = raw_tile_factory.decode_raw_tile_header(payload)
+    server_header = read_raw_tile_header(payload)
+
+    assert server_utils.RAW_TILE_MAGIC == raw_tile_factory.RAW_TILE_MAGIC
+    assert server_header.pop("offset") == offset
+    assert server_header == header
+    np.testing.assert_array_equal(decode_raw_tile(payload), raw_tile_factory.decode_raw_tile(payload))
+    np.testing.assert_array_equal(decode_raw_tile(payload), pixels)
+
+
+def test_encode_segmentation_mask():
+    from aws.osml.model_runner.inference import decode_segmentation_mask
+
+    mask = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    payload = encode_segmentation_mask(mask)
+
+    assert read_raw_tile_header(payload)["shape"] == [1, 3, 4]
+    np.testing.assert_array_equal(decode_segmentation_mask(payload).pixels[0], mask)
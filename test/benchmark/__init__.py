@@ -0,0 +1,4 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+# The benchmark modules are not imported here because the ModelRunner configuration is read from the environment at
+# import time and `python -m test.benchmark` needs to point it at the local stand-ins first.
@@ -0,0 +1,88 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Run the offline end-to-end throughput benchmark.
+
+Examples:
+  # Benchmark the sample configuration and write the results
+  python -m test.benchmark --config test/benchmark/sample-benchmark.json --output benchmark-results.json
+
+  # Compare a run with an earlier one, exiting with an error when a metric regressed by more than 10%
+  python -m test.benchmark --config test/benchmark/sample-benchmark.json --baseline benchmark-results.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from .local_benchmark import BenchmarkConfig, LocalBenchmark, compare_reports
+
+# Credentials for the local stand-ins, so nothing can reach a real AWS account
+for _name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SECURITY_TOKEN", "AWS_SESSION_TOKEN"):
+    os.environ[_name] = "testing"
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-west-2")
+
+
+def _summary_line(report: dict) -> str:
+    summary = report["summary"]
+    stages = ", ".join(
+        f"{stage} p90={latency['p90_ms']:.1f}ms" for stage, latency in report["stages"].items() if latency["p90_ms"]
+    )
+    return (
+        f"completed={summary['completed']}/{summary['jobs']} tiles={report['tiles']} "
+        f"elapsed={report['elapsed_seconds']:.1f}s tiles/sec={summary['tiles_per_second'] or 0:.1f} "
+        f"ddb_ops={report['dynamodb_operations']['Total']} peak_rss={summary['peak_rss_mb']:.0f}MiB\n  {stages}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ModelRunner end to end against local service stand-ins.")
+    parser.add_argument("--config", help="Path to a JSON benchmark configuration.")
+    parser.add_argument("--image-size", type=int, help="Width and height of the synthetic images.")
+    parser.add_argument("--image-format", help="Format of the synthetic images: GTiff, COG or NITF.")
+    parser.add_argument("--image-count", type=int, help="Number of image requests to submit.")
+    parser.add_argument("--output", help="Optional path to write the full JSON results to.")
+    parser.add_argument("--baseline", help="Optional path of earlier JSON results to compare the run with.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Fraction a metric may regress by.")
+    parser.add_argument("--verbose", action="store_true", help="Log the ModelRunner output.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    config_dict = {}
+    if args.config:
+        with open(args.config, "r") as config_file:
+            config_dict = json.load(config_file)
+    if args.image_size:
+        config_dict.update(image_width=args.image_size, image_height=args.image_size)
+    if args.image_format:
+        config_dict["image_format"] = args.image_format
+    if args.image_count:
+        config_dict["image_count"] = args.image_count
+    config = BenchmarkConfig.from_dict(config_dict)
+
+    # The ModelRunner configuration is read from the environment when the package is imported, so it must point at
+    # the local stand-ins before the benchmark imports it
+    os.environ.update(config.environment())
+
+    report = LocalBenchmark(config).run().to_dict()
+    print(_summary_line(report))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r") as baseline_file:
+            regressions = compare_reports(report, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,660 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import contextlib
+import dataclasses
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from unittest import mock
+
+import boto3
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Account the local stand-ins create their resources in
+ACCOUNT_ID = "123456789012"
+
+# Names of the resources ModelRunner is configured with, keyed by the environment variable that holds them
+TABLE_NAMES = {
+    "IMAGE_REQUEST_TABLE": "BENCHMARK-IMAGE-REQUEST-TABLE",
+    "OUTSTANDING_IMAGE_REQUEST_TABLE": "BENCHMARK-OUTSTANDING-IMAGE-REQUEST-TABLE",
+    "FEATURE_TABLE": "BENCHMARK-FEATURE-TABLE",
+    "REGION_REQUEST_TABLE": "BENCHMARK-REGION-REQUEST-TABLE",
+}
+QUEUE_NAMES = {
+    "IMAGE_QUEUE": "BENCHMARK-IMAGE-QUEUE",
+    "IMAGE_DLQ": "BENCHMARK-IMAGE-DLQ",
+    "REGION_QUEUE": "BENCHMARK-REGION-QUEUE",
+}
+TOPIC_NAMES = {
+    "IMAGE_STATUS_TOPIC": "BENCHMARK-IMAGE-STATUS-TOPIC",
+    "REGION_STATUS_TOPIC": "BENCHMARK-REGION-STATUS-TOPIC",
+}
+RESULTS_BUCKET = "benchmark-results"
+RESULTS_STREAM = "benchmark-results"
+
+# Key schemas of the tables, matching the tables deployed for ModelRunner
+TABLE_KEYS = {
+    "IMAGE_REQUEST_TABLE": [("image_id", "HASH")],
+    "OUTSTANDING_IMAGE_REQUEST_TABLE": [("endpoint_id", "HASH"), ("job_id", "RANGE")],
+    "FEATURE_TABLE": [("hash_key", "HASH"), ("range_key", "RANGE")],
+    "REGION_REQUEST_TABLE": [("region_id", "HASH"), ("image_id", "RANGE")],
+}
+
+# Stages timed during a run. Each stage wraps a method, or module function, of ModelRunner.
+STAGES = {
+    "image": ("aws.osml.model_runner.image_request_handler", "ImageRequestHandler", "process_image_request"),
+    "region": ("aws.osml.model_runner.region_request_handler", "RegionRequestHandler", "process_region_request"),
+    "tile_read": ("aws.osml.model_runner.tile_worker.tile_worker_utils", None, "_create_tile"),
+    "tile": ("aws.osml.model_runner.tile_worker.tile_worker", "TileWorker", "process_tile"),
+    "model_invocation": ("aws.osml.model_runner.inference.http_detector", "HTTPDetector", "find_features"),
+    "aggregation": ("aws.osml.model_runner.image_request_handler", "ImageRequestHandler", "complete_image_request"),
+    "deduplication": ("aws.osml.model_runner.image_request_handler", "ImageRequestHandler", "deduplicate"),
+    "sink": ("aws.osml.model_runner.image_request_handler", "ImageRequestHandler", "sink_features"),
+}
+
+# Statuses that end an image request
+TERMINAL_STATUSES = ("SUCCESS", "PARTIAL", "FAILED")
+
+# Percentiles reported for each stage
+PERCENTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+def queue_url(region: str, name: str) -> str:
+    return f"https://sqs.{region}.amazonaws.com/{ACCOUNT_ID}/{name}"
+
+
+def topic_arn(region: str, name: str) -> str:
+    return f"arn:aws:sns:{region}:{ACCOUNT_ID}:{name}"
+
+
+@dataclass
+class BenchmarkConfig:
+    """
+    Configuration of a benchmark run.
+
+    :param image_width: Width of the synthetic images in pixels.
+    :param image_height: Height of the synthetic images in pixels.
+    :param image_format: GDAL format of the synthetic images (GTiff, COG or NITF).
+    :param image_bands: Number of 8-bit bands in the synthetic images.
+    :param image_count: Number of image requests submitted.
+    :param tile_size: Size of the tiles sent to the model.
+    :param tile_overlap: Overlap between tiles.
+    :param tile_format: Format of the tiles sent to the model.
+    :param tile_compression: Compression of the tiles sent to the model.
+    :param model: Test model the local model server runs (echo, centerpoint or flood).
+    :param model_environment: Extra environment of the model server, e.g. MOCK_LATENCY_MEAN or ECHO_FEATURE_COUNT.
+    :param server_processes: Number of model server processes.
+    :param endpoint: URL of an already running model endpoint; the local model server is started when not set.
+    :param outputs: Sinks the features are written to, S3 and/or Kinesis.
+    :param workers: Number of tile workers, the WORKERS setting of ModelRunner.
+    :param region_size: Size of the regions images are divided into.
+    :param persistence_backend: Where ModelRunner keeps its tables, DYNAMODB (the local stand-in) or MEMORY.
+    :param timeout_seconds: Seconds after which a run is stopped even if requests are outstanding.
+    :param seed: Seed for the pixels of the synthetic images.
+    """
+
+    image_width: int = 10240
+    image_height: int = 10240
+    image_format: str = "GTiff"
+    image_bands: int = 3
+    image_count: int = 1
+    tile_size: int = 512
+    tile_overlap: int = 32
+    tile_format: str = "GTIFF"
+    tile_compression: str = "NONE"
+    model: str = "echo"
+    model_environment: Dict[str, str] = field(default_factory=dict)
+    server_processes: int = 1
+    endpoint: Optional[str] = None
+    outputs: List[str] = field(default_factory=lambda: ["S3", "Kinesis"])
+    workers: int = 4
+    region_size: Tuple[int, int] = (10240, 10240)
+    persistence_backend: str = "DYNAMODB"
+    timeout_seconds: float = 1800.0
+    seed: int = 0
+
+    @staticmethod
+    def from_dict(config: Dict[str, Any]) -> "BenchmarkConfig":
+        """
+        Build a benchmark configuration from a JSON compatible dictionary.
+
+        :param config: The configuration dictionary.
+        :return: The benchmark configuration.
+        """
+        config = dict(config)
+        if "region_size" in config:
+            config["region_size"] = tuple(config["region_size"])
+        return BenchmarkConfig(**config)
+
+    def environment(self) -> Dict[str, str]:
+        """
+        The environment ModelRunner must be imported with to use the local stand-ins and this configuration.
+
+        :return: The environment variables.
+        """
+        region = os.environ.get("AWS_DEFAULT_REGION", "us-west-2")
+        environment = {
+            "AWS_DEFAULT_REGION": region,
+            "WORKERS": str(self.workers),
+            "REGION_SIZE": str(tuple(self.region_size)),
+            "PERSISTENCE_BACKEND": self.persistence_backend,
+        }
+        environment.update(TABLE_NAMES)
+        environment.update({name: queue_url(region, value) for name, value in QUEUE_NAMES.items()})
+        environment.update({name: topic_arn(region, value) for name, value in TOPIC_NAMES.items()})
+        return environment
+
+
+class StageTimer:
+    """
+    Records the latency of each call to the instrumented stages. Tile workers run in threads so samples are added
+    under a lock.
+    """
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self._lock = Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.samples[stage].append(seconds)
+
+    def wrap(self, stage: str, function: Callable) -> Callable:
+        """
+        Wrap a function so the duration of every call is recorded for a stage, including calls that raise.
+
+        :param stage: The stage the function belongs to.
+        :param function: The function to time.
+        :return: The timed function.
+        """
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(stage, time.perf_counter() - start)
+
+        timed.__wrapped__ = function
+        return timed
+
+    @contextlib.contextmanager
+    def instrument(self, stages: Dict[str, Tuple[str, Optional[str], str]] = STAGES) -> Iterator["StageTimer"]:
+        """
+        Replace the functions of the stages with timed versions for the duration of the context.
+
+        :param stages: The stages as (module, class or None for module functions, attribute) by name.
+        :return: The timer.
+        """
+        import importlib
+
+        originals = []
+        try:
+            for stage, (module_name, class_name, attribute) in stages.items():
+                owner = importlib.import_module(module_name)
+                if class_name is not None:
+                    owner = getattr(owner, class_name)
+                original = owner.__dict__[attribute] if class_name is not None else getattr(owner, attribute)
+                originals.append((owner, attribute, original))
+                timed = self.wrap(stage, getattr(owner, attribute))
+                # Static methods are called on instances too so they must stay static
+                setattr(owner, attribute, staticmethod(timed) if isinstance(original, staticmethod) else timed)
+            yield self
+        finally:
+            for owner, attribute, original in reversed(originals):
+                setattr(owner, attribute, original)
+
+    def summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Summarize the latency of each stage in milliseconds.
+
+        :return: The call count, mean and percentiles of each stage.
+        """
+        summary = {}
+        with self._lock:
+            for stage, samples in self.samples.items():
+                latencies = sorted(sample * 1000.0 for sample in samples)
+                summary[stage] = {
+                    "count": len(latencies),
+                    "mean_ms": sum(latencies) / len(latencies) if latencies else None,
+                    **{f"{name}_ms": _percentile(latencies, fraction) for name, fraction in PERCENTILES.items()},
+                    "max_ms": latencies[-1] if latencies else None,
+                }
+        return summary
+
+
+class DynamoDBOperationCounter:
+    """
+    Counts the DynamoDB API calls made through a boto3 session, by operation. Clients copy the event handlers of
+    the session when they are created, so the counter must be registered before ModelRunner creates its tables.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = defaultdict(int)
+        self._lock = Lock()
+
+    def __call__(self, model=None, **kwargs) -> None:
+        with self._lock:
+            self.counts[model.name if model is not None else "Unknown"] += 1
+
+    def register(self, session: boto3.session.Session) -> None:
+        session.events.register("before-call.dynamodb", self)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+    def to_dict(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(sorted(self.counts.items()))
+        counts["Total"] = sum(counts.values())
+        return counts
+
+
+class JobTracker:
+    """
+    Tracks the status the image status monitor publishes for each job of a run.
+    """
+
+    def __init__(self) -> None:
+        self.statuses: Dict[str, str] = {}
+        self.finished_at: Dict[str, float] = {}
+        self._lock = Lock()
+
+    def record(self, job_id: Optional[str], status: Any) -> None:
+        status = str(getattr(status, "value", status))
+        with self._lock:
+            self.statuses[job_id] = status
+            if status in TERMINAL_STATUSES:
+                self.finished_at.setdefault(job_id, time.perf_counter())
+
+    def finished(self, job_ids: List[str]) -> bool:
+        with self._lock:
+            return all(job_id in self.finished_at for job_id in job_ids)
+
+    @contextlib.contextmanager
+    def instrument(self) -> Iterator["JobTracker"]:
+        """
+        Record the statuses published by the image status monitor for the duration of the context.
+
+        :return: The tracker.
+        """
+        from aws.osml.model_runner.status import ImageStatusMonitor
+
+        original = ImageStatusMonitor.__dict__["process_event"]
+
+        def process_event(monitor, image_request_item, status, message):
+            self.record(image_request_item.job_id, status)
+            return original(monitor, image_request_item, status, message)
+
+        ImageStatusMonitor.process_event = process_event
+        try:
+            yield self
+        finally:
+            ImageStatusMonitor.process_event = original
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Results of a benchmark run.
+
+    :param config: The configuration the run was made with.
+    :param elapsed_seconds: Seconds from submitting the first image request until the last one finished.
+    :param tiles: Number of tiles processed.
+    :param features: Number of features written to the outputs after deduplication.
+    :param jobs: Final status of each job.
+    :param stages: Latency summary of each stage in milliseconds.
+    :param dynamodb_operations: Number of DynamoDB calls made, by operation.
+    :param peak_rss_mb: Peak resident memory of the benchmark process in MiB.
+    :param environment: Description of the host the run was made on.
+    """
+
+    config: Dict[str, Any]
+    elapsed_seconds: float
+    tiles: int
+    features: int
+    jobs: Dict[str, str]
+    stages: Dict[str, Dict[str, Optional[float]]]
+    dynamodb_operations: Dict[str, int]
+    peak_rss_mb: float
+    environment: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def tiles_per_second(self) -> Optional[float]:
+        return self.tiles / self.elapsed_seconds if self.elapsed_seconds > 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to a JSON compatible dictionary including summary statistics.
+
+        :return: The report as a dictionary.
+        """
+        report = dataclasses.asdict(self)
+        report["summary"] = {
+            "tiles_per_second": self.tiles_per_second,
+            "completed": len([status for status in self.jobs.values() if status == "SUCCESS"]),
+            "jobs": len(self.jobs),
+            "dynamodb_operations_per_tile": (self.dynamodb_operations.get("Total", 0) / self.tiles if self.tiles else None),
+            "peak_rss_mb": self.peak_rss_mb,
+        }
+        return report
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+    """
+    Compare the summary of a run with a baseline run and describe the metrics that regressed by more than the
+    tolerance: lower tiles/sec, or higher stage p90 latency, DynamoDB operations per tile or peak RSS.
+
+    :param current: The report of the run as written by BenchmarkReport.to_dict.
+    :param baseline: The report of the baseline run.
+    :param tolerance: The fraction a metric may regress by before it is reported.
+    :return: A description of each regression, empty when there are none.
+    """
+    regressions = []
+
+    def check(name: str, value: Optional[float], previous: Optional[float], higher_is_better: bool) -> None:
+        if value is None or not previous:
+            return
+        change = (value - previous) / previous
+        if (-change if higher_is_better else change) > tolerance:
+            regressions.append(f"{name}: {previous:.4g} -> {value:.4g} ({change:+.1%})")
+
+    summary, baseline_summary = current["summary"], baseline["summary"]
+    check("tiles_per_second", summary["tiles_per_second"], baseline_summary["tiles_per_second"], True)
+    check(
+        "dynamodb_operations_per_tile",
+        summary["dynamodb_operations_per_tile"],
+        baseline_summary["dynamodb_operations_per_tile"],
+        False,
+    )
+    check("peak_rss_mb", summary["peak_rss_mb"], baseline_summary["peak_rss_mb"], False)
+    for stage, latency in current["stages"].items():
+        if stage in baseline["stages"]:
+            check(f"{stage}.p90_ms", latency["p90_ms"], baseline["stages"][stage]["p90_ms"], False)
+    return regressions
+
+
+def create_synthetic_image(path: str, config: BenchmarkConfig, seed: int) -> str:
+    """
+    Write an image filled with random pixels and georeferenced with a geo transform. The pixels are random so no
+    tile is skipped as nodata and every tile costs the model server the same.
+
+    :param path: The path of the image without its extension.
+    :param config: The benchmark configuration with the size, bands and format of the image.
+    :param seed: Seed for the pixels.
+    :return: The path of the image.
+    """
+    from osgeo import gdal, osr
+
+    extension = {"GTIFF": ".tif", "COG": ".tif", "NITF": ".ntf"}[config.image_format.upper()]
+    rng = np.random.default_rng(seed)
+    dataset = gdal.GetDriverByName("MEM").Create(
+        "", config.image_width, config.image_height, config.image_bands, gdal.GDT_Byte
+    )
+    # Roughly 0.5m pixels
+    dataset.SetGeoTransform([-43.68, 4.5e-6, 0.0, -22.94, 0.0, -4.5e-6])
+    spatial_reference = osr.SpatialReference()
+    spatial_reference.ImportFromEPSG(4326)
+    dataset.SetProjection(spatial_reference.ExportToWkt())
+    for band_index in range(config.image_bands):
+        band = dataset.GetRasterBand(band_index + 1)
+        # Write in strips to bound the memory used for large images
+        for row in range(0, config.image_height, 1024):
+            rows = min(1024, config.image_height - row)
+            band.WriteArray(rng.integers(0, 256, (rows, config.image_width), dtype=np.uint8), 0, row)
+
+    image_path = path + extension
+    driver_name = {"GTIFF": "GTiff", "COG": "COG", "NITF": "NITF"}[config.image_format.upper()]
+    options = ["TILED=YES", "BLOCKXSIZE=512", "BLOCKYSIZE=512"] if driver_name == "GTiff" else []
+    if driver_name == "NITF":
+        options = ["BLOCKXSIZE=512", "BLOCKYSIZE=512"]
+    gdal.GetDriverByName(driver_name).CreateCopy(image_path, dataset, options=options)
+    return image_path
+
+
+@contextlib.contextmanager
+def local_services(region: str) -> Iterator[None]:
+    """
+    Start in-process stand-ins for the AWS services ModelRunner uses and create its tables, queues, topics and
+    output stream and bucket. The status topics deliver to queues, as they do when deployed.
+
+    :param region: The region the resources are created in.
+    :return: None
+    """
+    from moto import mock_aws
+
+    with mock_aws():
+        ddb = boto3.resource("dynamodb", region_name=region)
+        for variable, name in TABLE_NAMES.items():
+            keys = TABLE_KEYS[variable]
+            ddb.create_table(
+                TableName=name,
+                KeySchema=[{"AttributeName": attribute, "KeyType": key_type} for attribute, key_type in keys],
+                AttributeDefinitions=[{"AttributeName": attribute, "AttributeType": "S"} for attribute, _ in keys],
+                BillingMode="PAY_PER_REQUEST",
+            )
+
+        sqs = boto3.client("sqs", region_name=region)
+        for name in QUEUE_NAMES.values():
+            sqs.create_queue(QueueName=name)
+
+        sns = boto3.client("sns", region_name=region)
+        for name in TOPIC_NAMES.values():
+            arn = sns.create_topic(Name=name)["TopicArn"]
+            status_queue_url = sqs.create_queue(QueueName=f"{name}-SUBSCRIPTION")["QueueUrl"]
+            status_queue_arn = sqs.get_queue_attributes(QueueUrl=status_queue_url, AttributeNames=["QueueArn"])
+            sns.subscribe(TopicArn=arn, Protocol="sqs", Endpoint=status_queue_arn["Attributes"]["QueueArn"])
+
+        boto3.client("s3", region_name=region).create_bucket(
+            Bucket=RESULTS_BUCKET, CreateBucketConfiguration={"LocationConstraint": region}
+        )
+        boto3.client("kinesis", region_name=region).create_stream(
+            StreamName=RESULTS_STREAM, StreamModeDetails={"StreamMode": "ON_DEMAND"}
+        )
+        yield
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def model_server(config: BenchmarkConfig, startup_timeout: float = 60.0) -> Iterator[str]:
+    """
+    Run the test model server in a separate process so its CPU use does not compete with the GIL of ModelRunner.
+    When the configuration names an endpoint it is used instead.
+
+    :param config: The benchmark configuration.
+    :param startup_timeout: Seconds to wait for the server to respond to a ping.
+    :return: The URL of the invocations endpoint.
+    """
+    if config.endpoint:
+        yield config.endpoint
+        return
+
+    port = _free_port()
+    environment = dict(os.environ)
+    environment.update(
+        {
+            "SAGEMAKER_BIND_TO_PORT": str(port),
+            "DEFAULT_MODEL_SELECTION": config.model,
+            "SERVER_PROCESSES": str(config.server_processes),
+        }
+    )
+    environment.update({name: str(value) for name, value in config.model_environment.items()})
+    process = subprocess.Popen(
+        [sys.executable, "-m", "aws.osml.test_models.app"],
+        env=environment,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/ping", timeout=1):
+                    break
+            except (urllib.error.URLError, ConnectionError):
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"The test model server did not start on port {port}")
+                time.sleep(0.2)
+        yield f"http://127.0.0.1:{port}/invocations"
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _peak_rss_mb() -> float:
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak_rss / (1024 * 1024) if platform.system() == "Darwin" else peak_rss / 1024
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+class LocalBenchmark:
+    """
+    Runs ModelRunner end to end on synthetic images without any AWS resources. The image requests are submitted to
+    the image queue and the ModelRunner work loop is driven until every request has finished, timing each stage and
+    counting the DynamoDB calls made.
+
+    :param config: The benchmark configuration. The environment of the process must have been set from
+                   BenchmarkConfig.environment before ModelRunner was imported.
+    """
+
+    def __init__(self, config: BenchmarkConfig) -> None:
+        self.config = config
+
+    def build_image_request(self, job_id: str, image_path: str, endpoint: str) -> Dict[str, Any]:
+        """
+        Create the image request message for a synthetic image.
+
+        :param job_id: The id of the job.
+        :param image_path: The path of the image.
+        :param endpoint: The URL of the model endpoint.
+        :return: The image request message.
+        """
+        outputs = []
+        if "S3" in self.config.outputs:
+            outputs.append({"type": "S3", "bucket": RESULTS_BUCKET, "prefix": job_id})
+        if "Kinesis" in self.config.outputs:
+            outputs.append({"type": "Kinesis", "stream": RESULTS_STREAM, "batchSize": 1000})
+        return {
+            "jobName": job_id,
+            "jobId": job_id,
+            "imageUrls": [image_path],
+            "outputs": outputs,
+            "imageProcessor": {"name": endpoint, "type": "HTTP_ENDPOINT"},
+            "imageProcessorTileSize": self.config.tile_size,
+            "imageProcessorTileOverlap": self.config.tile_overlap,
+            "imageProcessorTileFormat": self.config.tile_format,
+            "imageProcessorTileCompression": self.config.tile_compression,
+        }
+
+    def run(self) -> BenchmarkReport:
+        """
+        Run the benchmark.
+
+        :return: The report of the run.
+        """
+        region = os.environ["AWS_DEFAULT_REGION"]
+        dynamodb_counter = DynamoDBOperationCounter()
+        stage_timer = StageTimer()
+        job_tracker = JobTracker()
+
+        with contextlib.ExitStack() as stack:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="osml-benchmark-"))
+            stack.enter_context(local_services(region))
+            # The stand-ins reset the default session when they start, so the counter is registered afterwards
+            boto3.setup_default_session(region_name=region)
+            dynamodb_counter.register(boto3.DEFAULT_SESSION)
+            endpoint = stack.enter_context(model_server(self.config))
+            stack.enter_context(stage_timer.instrument())
+            stack.enter_context(job_tracker.instrument())
+
+            from aws.osml.model_runner.model_runner import ModelRunner
+            from aws.osml.model_runner.sink import SinkFactory
+
+            sink_features = SinkFactory.sink_features
+            features_written = []
+
+            def count_features(job_id, outputs, features):
+                features_written.append(len(features))
+                return sink_features(job_id, outputs, features)
+
+            stack.enter_context(mock.patch.object(SinkFactory, "sink_features", staticmethod(count_features)))
+
+            image_paths = [
+                create_synthetic_image(os.path.join(work_dir, f"image-{index}"), self.config, self.config.seed + index)
+                for index in range(self.config.image_count)
+            ]
+            model_runner = ModelRunner()
+            # Regions are queued by this process so there is no need to wait for messages
+            model_runner.region_request_queue.wait_seconds = 0
+            dynamodb_counter.reset()
+
+            sqs = boto3.client("sqs")
+            job_ids = []
+            start = time.perf_counter()
+            for image_path in image_paths:
+                job_id = str(uuid.uuid4())
+                job_ids.append(job_id)
+                sqs.send_message(
+                    QueueUrl=model_runner.config.image_queue,
+                    MessageBody=json.dumps(self.build_image_request(job_id, image_path, endpoint)),
+                )
+
+            deadline = start + self.config.timeout_seconds
+            while not job_tracker.finished(job_ids) and time.perf_counter() < deadline:
+                # The same order of work as ModelRunner.monitor_work_queues
+                if not model_runner._process_region_requests():
+                    model_runner._process_image_requests()
+            finished_at = max(job_tracker.finished_at.values(), default=time.perf_counter())
+            if not job_tracker.finished(job_ids):
+                logger.warning(f"Benchmark stopped after {self.config.timeout_seconds}s with requests outstanding")
+                finished_at = time.perf_counter()
+
+        return BenchmarkReport(
+            config=dataclasses.asdict(self.config),
+            elapsed_seconds=finished_at - start,
+            tiles=len(stage_timer.samples.get("tile", [])),
+            features=sum(features_written),
+            jobs={job_id: job_tracker.statuses.get(job_id, "TIMED_OUT") for job_id in job_ids},
+            stages=stage_timer.summary(),
+            dynamodb_operations=dynamodb_counter.to_dict(),
+            peak_rss_mb=_peak_rss_mb(),
+            environment={
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            },
+        )
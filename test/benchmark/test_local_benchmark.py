@@ -0,0 +1,172 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+from unittest.mock import Mock
+
+import pytest
+
+from .local_benchmark import (
+    BenchmarkConfig,
+    BenchmarkReport,
+    DynamoDBOperationCounter,
+    JobTracker,
+    StageTimer,
+    compare_reports,
+    queue_url,
+    topic_arn,
+)
+
+
+class TimedStages:
+    """Stand-in for the handlers whose methods the benchmark times"""
+
+    def process(self, value):
+        return value * 2
+
+    @staticmethod
+    def sink(value):
+        return value + 1
+
+    def fail(self):
+        raise ValueError("failed")
+
+
+def create_report(**kwargs) -> BenchmarkReport:
+    """Helper function to create a report of a run that processed 100 tiles in 10 seconds"""
+    defaults = dict(
+        config={},
+        elapsed_seconds=10.0,
+        tiles=100,
+        features=500,
+        jobs={"job-1": "SUCCESS", "job-2": "FAILED"},
+        stages={"tile": {"count": 100, "p90_ms": 50.0}},
+        dynamodb_operations={"UpdateItem": 150, "Total": 200},
+        peak_rss_mb=512.0,
+    )
+    defaults.update(kwargs)
+    return BenchmarkReport(**defaults)
+
+
+def test_benchmark_config_from_dict():
+    config = BenchmarkConfig.from_dict({"image_width": 2048, "image_format": "NITF", "region_size": [1024, 1024]})
+
+    assert config.image_width == 2048
+    assert config.image_height == 10240
+    assert config.image_format == "NITF"
+    assert config.region_size == (1024, 1024)
+    assert config.outputs == ["S3", "Kinesis"]
+
+
+def test_benchmark_config_environment(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    environment = BenchmarkConfig(workers=8, region_size=(2048, 2048)).environment()
+
+    assert environment["WORKERS"] == "8"
+    assert environment["REGION_SIZE"] == "(2048, 2048)"
+    assert environment["PERSISTENCE_BACKEND"] == "DYNAMODB"
+    assert environment["IMAGE_REQUEST_TABLE"] == "BENCHMARK-IMAGE-REQUEST-TABLE"
+    assert environment["IMAGE_QUEUE"] == queue_url("us-east-1", "BENCHMARK-IMAGE-QUEUE")
+    assert environment["IMAGE_QUEUE"] == "https://sqs.us-east-1.amazonaws.com/123456789012/BENCHMARK-IMAGE-QUEUE"
+    assert environment["IMAGE_STATUS_TOPIC"] == topic_arn("us-east-1", "BENCHMARK-IMAGE-STATUS-TOPIC")
+
+
+def test_stage_timer_instruments_and_restores_methods():
+    stages = {
+        "process": (__name__, "TimedStages", "process"),
+        "sink": (__name__, "TimedStages", "sink"),
+        "fail": (__name__, "TimedStages", "fail"),
+    }
+    original_sink = TimedStages.__dict__["sink"]
+    stage_timer = StageTimer()
+
+    with stage_timer.instrument(stages):
+        stages_instance = TimedStages()
+        assert stages_instance.process(2) == 4
+        assert stages_instance.process(3) == 6
+        # Static methods stay static whether they are called on the class or an instance
+        assert stages_instance.sink(1) == 2
+        assert TimedStages.sink(1) == 2
+        with pytest.raises(ValueError):
+            stages_instance.fail()
+
+    assert TimedStages.__dict__["sink"] is original_sink
+    assert TimedStages().process(2) == 4
+    summary = stage_timer.summary()
+    assert summary["process"]["count"] == 2
+    assert summary["sink"]["count"] == 2
+    assert summary["fail"]["count"] == 1
+
+
+def test_stage_timer_summary_percentiles():
+    stage_timer = StageTimer()
+    for milliseconds in range(1, 101):
+        stage_timer.record("tile", milliseconds / 1000.0)
+
+    summary = stage_timer.summary()["tile"]
+
+    assert summary["count"] == 100
+    assert summary["mean_ms"] == pytest.approx(50.5)
+    assert summary["p50_ms"] == pytest.approx(50.0)
+    assert summary["p90_ms"] == pytest.approx(90.0)
+    assert summary["p99_ms"] == pytest.approx(99.0)
+    assert summary["max_ms"] == pytest.approx(100.0)
+
+
+def test_dynamodb_operation_counter():
+    counter = DynamoDBOperationCounter()
+    session = Mock()
+    counter.register(session)
+    session.events.register.assert_called_once_with("before-call.dynamodb", counter)
+
+    for operation in ["GetItem", "UpdateItem", "UpdateItem"]:
+        operation_model = Mock()
+        operation_model.name = operation
+        counter(model=operation_model, params={})
+
+    assert counter.to_dict() == {"GetItem": 1, "UpdateItem": 2, "Total": 3}
+    counter.reset()
+    assert counter.to_dict() == {"Total": 0}
+
+
+def test_job_tracker():
+    job_tracker = JobTracker()
+    job_tracker.record("job-1", "IN_PROGRESS")
+    job_tracker.record("job-2", "SUCCESS")
+
+    assert not job_tracker.finished(["job-1", "job-2"])
+
+    job_tracker.record("job-1", Mock(value="PARTIAL"))
+
+    assert job_tracker.finished(["job-1", "job-2"])
+    assert job_tracker.statuses == {"job-1": "PARTIAL", "job-2": "SUCCESS"}
+
+
+def test_benchmark_report_to_dict():
+    report = create_report().to_dict()
+
+    assert report["tiles"] == 100
+    assert report["summary"]["tiles_per_second"] == pytest.approx(10.0)
+    assert report["summary"]["completed"] == 1
+    assert report["summary"]["jobs"] == 2
+    assert report["summary"]["dynamodb_operations_per_tile"] == pytest.approx(2.0)
+
+
+def test_compare_reports():
+    baseline = create_report().to_dict()
+
+    assert compare_reports(create_report(elapsed_seconds=10.5).to_dict(), baseline) == []
+
+    regressions = compare_reports(
+        create_report(
+            elapsed_seconds=20.0,
+            stages={"tile": {"count": 100, "p90_ms": 80.0}, "sink": {"count": 1, "p90_ms": 5.0}},
+            dynamodb_operations={"Total": 400},
+            peak_rss_mb=500.0,
+        ).to_dict(),
+        baseline,
+    )
+
+    assert [regression.split(":")[0] for regression in regressions] == [
+        "tiles_per_second",
+        "dynamodb_operations_per_tile",
+        "tile.p90_ms",
+    ]
@@ -0,0 +1,79 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Run the offline scheduler simulator.
+
+Examples:
+  # Run a single simulation and print a summary
+  python -m test.simulation --config test/simulation/sample-simulation.json --no-sweep
+
+  # Run every combination of the values listed under "sweep" and write the full results
+  python -m test.simulation --config test/simulation/sample-simulation.json --output simulation-results.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+# The ModelRunner configuration is read from the environment when the package is imported. None of these resources
+# are used by the simulator but they must be set.
+for _name, _value in {
+    "AWS_DEFAULT_REGION": "us-west-2",
+    "WORKERS": "4",
+    "IMAGE_REQUEST_TABLE": "SIMULATED-IMAGE-REQUEST-TABLE",
+    "OUTSTANDING_IMAGE_REQUEST_TABLE": "SIMULATED-OUTSTANDING-IMAGE-REQUEST-TABLE",
+    "FEATURE_TABLE": "SIMULATED-FEATURE-TABLE",
+    "REGION_REQUEST_TABLE": "SIMULATED-REGION-REQUEST-TABLE",
+    "IMAGE_QUEUE": "SIMULATED-IMAGE-QUEUE",
+    "IMAGE_DLQ": "SIMULATED-IMAGE-DLQ",
+    "REGION_QUEUE": "SIMULATED-REGION-QUEUE",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+from .scheduler_simulator import SchedulerSimulator, SimulationConfig, SimulationReport, run_sweep  # noqa: E402
+
+
+def _summary_line(report: SimulationReport) -> str:
+    summary = report.to_dict()["summary"]
+    parameters = ", ".join(f"{key}={value}" for key, value in report.parameters.items())
+    p90_duration = summary["p90_duration"]
+    return (
+        f"{parameters}: makespan={report.makespan:.1f}s "
+        f"completed={summary['completed']}/{summary['jobs']} failed={summary['failed']} "
+        f"p90_duration={'n/a' if p90_duration is None else f'{p90_duration:.1f}s'} "
+        f"throttles={report.throttles} cycles={report.scheduling_cycles}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulate the ModelRunner image scheduler against a synthetic workload.")
+    parser.add_argument("--config", required=True, help="Path to a JSON simulation configuration.")
+    parser.add_argument("--output", help="Optional path to write the full JSON results to.")
+    parser.add_argument("--no-sweep", action="store_true", help="Ignore the sweep section of the configuration.")
+    parser.add_argument("--verbose", action="store_true", help="Log the scheduler decisions.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+
+    with open(args.config, "r") as config_file:
+        config = json.load(config_file)
+    sweep = config.pop("sweep", None)
+
+    if sweep and not args.no_sweep:
+        reports = run_sweep(config, sweep)
+    else:
+        reports = [SchedulerSimulator(SimulationConfig.from_dict(config)).run()]
+
+    for report in reports:
+        print(_summary_line(report))
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump([report.to_dict() for report in reports], output_file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
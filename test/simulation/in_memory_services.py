@@ -0,0 +1,179 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import dataclasses
+import itertools
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import shapely.geometry.base
+
+from aws.osml.model_runner.api import ImageRequest
+from aws.osml.model_runner.common import ImageDimensions, ImageRegion
+from aws.osml.model_runner.database import ImageRequestStatusRecord, RequestedJobsTable
+from aws.osml.model_runner.exceptions import LoadImageException
+from aws.osml.model_runner.tile_worker import RegionCalculator, TilingStrategy
+
+from .simulation_clock import SimulationClock
+
+
+class InMemorySQSClient:
+    """
+    A minimal stand-in for the boto3 SQS client covering the calls made by the BufferedImageRequestQueue.
+
+    Received messages stay in flight until they are deleted; visibility timeouts are not modeled.
+    """
+
+    def __init__(self) -> None:
+        self.queues: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.in_flight: Dict[str, Dict[str, Any]] = {}
+        self._receipt_handles = itertools.count()
+
+    def send_message(self, QueueUrl: str, MessageBody: str, **kwargs) -> Dict[str, Any]:
+        message_id = str(next(self._receipt_handles))
+        self.queues.setdefault(QueueUrl, deque()).append({"MessageId": message_id, "Body": MessageBody})
+        return {"MessageId": message_id}
+
+    def receive_message(self, QueueUrl: str, MaxNumberOfMessages: int = 1, **kwargs) -> Dict[str, Any]:
+        queue = self.queues.setdefault(QueueUrl, deque())
+        messages = []
+        while queue and len(messages) < MaxNumberOfMessages:
+            message = dict(queue.popleft(), ReceiptHandle=str(next(self._receipt_handles)))
+            self.in_flight[message["ReceiptHandle"]] = message
+            messages.append(message)
+        return {"Messages": messages} if messages else {}
+
+    def delete_message(self, QueueUrl: str, ReceiptHandle: str, **kwargs) -> Dict[str, Any]:
+        self.in_flight.pop(ReceiptHandle, None)
+        return {}
+
+    def messages(self, queue_url: str) -> List[Dict[str, Any]]:
+        """
+        List the messages waiting on a queue without receiving them.
+
+        :param queue_url: The queue to inspect.
+        :return: The waiting messages.
+        """
+        return list(self.queues.get(queue_url, []))
+
+
+class SimulatedSageMakerClient:
+    """
+    A stand-in for the boto3 SageMaker client that describes single variant, instance backed endpoints.
+
+    :param endpoints: Mapping of endpoint name to (instance count, per instance concurrency).
+    """
+
+    VARIANT_NAME = "AllTraffic"
+
+    def __init__(self, endpoints: Dict[str, Tuple[int, int]]) -> None:
+        self.endpoints = endpoints
+
+    @staticmethod
+    def _endpoint_arn(endpoint_name: str) -> str:
+        return f"arn:aws:sagemaker:us-west-2:000000000000:endpoint/{endpoint_name}"
+
+    def describe_endpoint(self, EndpointName: str) -> Dict[str, Any]:
+        instance_count, _ = self.endpoints[EndpointName]
+        return {
+            "EndpointName": EndpointName,
+            "EndpointArn": self._endpoint_arn(EndpointName),
+            "ProductionVariants": [
+                {"VariantName": self.VARIANT_NAME, "CurrentInstanceCount": instance_count, "CurrentWeight": 1.0}
+            ],
+        }
+
+    def list_tags(self, ResourceArn: str) -> Dict[str, Any]:
+        endpoint_name = ResourceArn.split("/")[-1]
+        _, instance_concurrency = self.endpoints[endpoint_name]
+        return {"Tags": [{"Key": "osml:instance-concurrency", "Value": str(instance_concurrency)}]}
+
+
+class InMemoryRequestedJobsTable(RequestedJobsTable):
+    """
+    A RequestedJobsTable that keeps its records in a dictionary and timestamps them with the simulation clock.
+
+    Records are replaced rather than modified on every update so callers holding an older copy see the same
+    conditional update failures they would against DynamoDB.
+
+    :param clock: The simulation clock.
+    """
+
+    def __init__(self, clock: SimulationClock) -> None:
+        self.table_name = "in-memory"
+        self.clock = clock
+        self.records: Dict[Tuple[str, str], ImageRequestStatusRecord] = {}
+
+    def _now(self) -> int:
+        return int(self.clock.time())
+
+    def _update(self, key: Tuple[str, str], **changes) -> ImageRequestStatusRecord:
+        record = self.records[key]
+        updated = dataclasses.replace(record, last_updated=self._now(), record_version=record.record_version + 1, **changes)
+        self.records[key] = updated
+        return updated
+
+    def add_new_request(self, image_request: ImageRequest, region_count: Optional[int] = None) -> ImageRequestStatusRecord:
+        record = dataclasses.replace(
+            ImageRequestStatusRecord.new_from_request(image_request, region_count),
+            request_time=self._now(),
+            last_updated=self._now(),
+        )
+        self.records[(record.endpoint_id, record.job_id)] = record
+        return record
+
+    def update_request_details(self, image_request: ImageRequest, region_count: int) -> None:
+        key = (image_request.model_name, image_request.job_id)
+        if key in self.records:
+            self._update(key, region_count=region_count)
+
+    def get_outstanding_requests(self) -> List[ImageRequestStatusRecord]:
+        return list(self.records.values())
+
+    def start_next_attempt(self, request_status_record: ImageRequestStatusRecord) -> bool:
+        key = (request_status_record.endpoint_id, request_status_record.job_id)
+        current = self.records.get(key)
+        if current is None or current.num_attempts != request_status_record.num_attempts:
+            return False
+        self._update(key, last_attempt=self._now(), num_attempts=current.num_attempts + 1)
+        return True
+
+    def complete_request(self, image_request: ImageRequest) -> None:
+        self.records.pop((image_request.model_name, image_request.job_id), None)
+
+    def complete_region(self, image_request: ImageRequest, region_id: str) -> bool:
+        key = (image_request.model_name, image_request.job_id)
+        current = self.records.get(key)
+        if current is None or region_id in current.regions_complete:
+            return False
+        self._update(key, regions_complete=current.regions_complete + [region_id])
+        return True
+
+
+class SimulatedRegionCalculator(RegionCalculator):
+    """
+    A RegionCalculator that computes regions from known image dimensions instead of reading image headers.
+
+    :param tiling_strategy: Strategy used to divide the images into regions.
+    :param region_size: Size of the regions in pixels.
+    :param image_sizes: Mapping of image URL to image dimensions (width, height).
+    """
+
+    def __init__(
+        self, tiling_strategy: TilingStrategy, region_size: ImageDimensions, image_sizes: Dict[str, ImageDimensions]
+    ) -> None:
+        self.tiling_strategy = tiling_strategy
+        self.region_size = region_size
+        self.image_sizes = image_sizes
+
+    def calculate_regions(
+        self,
+        image_url: str,
+        tile_size: ImageDimensions,
+        tile_overlap: ImageDimensions,
+        roi: Optional[shapely.geometry.base.BaseGeometry] = None,
+        image_read_role: Optional[str] = None,
+    ) -> List[ImageRegion]:
+        if image_url not in self.image_sizes:
+            raise LoadImageException(f"Unknown simulated image: {image_url}")
+        processing_bounds = ((0, 0), self.image_sizes[image_url])
+        return self.tiling_strategy.compute_regions(processing_bounds, self.region_size, tile_size, tile_overlap)
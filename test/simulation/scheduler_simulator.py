@@ -0,0 +1,639 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+"""
+Discrete-event simulation of the ModelRunner image scheduler.
+
+The simulator drives the real BufferedImageRequestQueue, EndpointLoadImageScheduler and EndpointCapacityEstimator
+against in-memory stand-ins for SQS, the outstanding requests table and SageMaker. Endpoints are modeled as pools of
+concurrent inference slots with a configurable latency distribution and ModelRunner instances process regions with
+the configured number of tile workers, so the effect of scheduler settings on a workload can be measured offline.
+"""
+
+import dataclasses
+import itertools
+import json
+import math
+import random
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from aws.osml.model_runner.api import ImageRequest
+from aws.osml.model_runner.common import ImageDimensions
+from aws.osml.model_runner.scheduler import (
+    BufferedImageRequestQueue,
+    EndpointCapacityEstimator,
+    EndpointLoadImageScheduler,
+    buffered_image_request_queue,
+    endpoint_load_image_scheduler,
+)
+from aws.osml.model_runner.tile_worker import VariableOverlapTilingStrategy
+
+from .in_memory_services import (
+    InMemoryRequestedJobsTable,
+    InMemorySQSClient,
+    SimulatedRegionCalculator,
+    SimulatedSageMakerClient,
+)
+from .simulation_clock import SimulationClock
+
+IMAGE_QUEUE_URL = "simulated-image-queue"
+IMAGE_DLQ_URL = "simulated-image-dlq"
+
+
+@dataclass
+class SimulatedEndpointConfig:
+    """
+    Configuration of a simulated model endpoint.
+
+    :param name: Name of the endpoint. All endpoints are simulated as instance backed SageMaker endpoints.
+    :param instance_count: Number of instances backing the endpoint.
+    :param instance_concurrency: Concurrent requests each instance can serve (osml:instance-concurrency tag).
+    :param latency_mean: Mean tile inference latency in seconds.
+    :param latency_std: Standard deviation of the tile inference latency in seconds, latencies are lognormal.
+    """
+
+    name: str
+    instance_count: int = 1
+    instance_concurrency: int = 2
+    latency_mean: float = 1.0
+    latency_std: float = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self.instance_count * self.instance_concurrency
+
+
+@dataclass
+class SimulatedImageJob:
+    """
+    An image request submitted to the simulation.
+
+    :param job_id: Unique identifier of the job.
+    :param endpoint: Name of the endpoint the image is processed with.
+    :param arrival_time: Simulated seconds after the start of the run that the request is put on the image queue.
+    :param image_size: Dimensions of the image in pixels (width, height).
+    :param tile_size: Size of the tiles in pixels.
+    :param tile_overlap: Overlap between tiles in pixels.
+    :param priority: Scheduling priority of the request.
+    :param deadline_seconds: Optional deadline of the request in simulated seconds after its arrival.
+    """
+
+    job_id: str
+    endpoint: str
+    arrival_time: float = 0.0
+    image_size: ImageDimensions = (10240, 10240)
+    tile_size: int = 1024
+    tile_overlap: int = 50
+    priority: int = 0
+    deadline_seconds: Optional[float] = None
+
+
+@dataclass
+class SimulationConfig:
+    """
+    Configuration of a scheduler simulation run.
+
+    :param endpoints: The endpoints available to the workload.
+    :param jobs: The image requests to process.
+    :param model_runner_instances: Number of ModelRunner instances polling for work.
+    :param tile_workers_per_instance: Tile workers each instance uses to process a region.
+    :param capacity_target_percentage: Target endpoint utilization used by the scheduler.
+    :param throttling_enabled: Whether capacity based throttling is enabled.
+    :param scheduling_policy: Policy the scheduler uses to select the next image (LOAD_BALANCED, DEADLINE or
+                              WEIGHTED_FAIR).
+    :param default_deadline_seconds: Implied deadline of requests without one under the DEADLINE policy.
+    :param aging_seconds: Waiting time credited as one region per instance under the WEIGHTED_FAIR policy.
+    :param region_size: Size of the regions images are divided into (width, height).
+    :param max_jobs_lookahead: Maximum number of requests buffered by the scheduler.
+    :param retry_time: Seconds before an unfinished attempt is considered failed.
+    :param max_retry_attempts: Attempts made before a request is moved to the DLQ.
+    :param idle_poll_seconds: Delay before an idle instance polls for work again.
+    :param image_setup_seconds: Time spent opening an image and queuing its regions.
+    :param region_setup_seconds: Time spent preparing a region before its tiles are processed.
+    :param seed: Seed for the latency distributions.
+    :param max_simulated_seconds: Simulated time after which the run is stopped.
+    """
+
+    endpoints: List[SimulatedEndpointConfig]
+    jobs: List[SimulatedImageJob]
+    model_runner_instances: int = 1
+    tile_workers_per_instance: int = 4
+    capacity_target_percentage: float = 1.0
+    throttling_enabled: bool = True
+    scheduling_policy: str = "LOAD_BALANCED"
+    default_deadline_seconds: int = 3600
+    aging_seconds: int = 60
+    region_size: ImageDimensions = (10240, 10240)
+    max_jobs_lookahead: int = 50
+    retry_time: int = 600
+    max_retry_attempts: int = 1
+    idle_poll_seconds: float = 1.0
+    image_setup_seconds: float = 2.0
+    region_setup_seconds: float = 0.5
+    seed: int = 0
+    max_simulated_seconds: float = 7 * 24 * 3600
+
+    @staticmethod
+    def from_dict(config: Dict[str, Any]) -> "SimulationConfig":
+        """
+        Build a simulation configuration from a JSON compatible dictionary.
+
+        Jobs can be listed explicitly under "jobs" and/or generated from a "workload" section containing a job
+        "count", "mean_interarrival_seconds", a list of "endpoints" and a list of "image_sizes" to draw from.
+
+        :param config: The configuration dictionary.
+        :return: The simulation configuration.
+        """
+        config = dict(config)
+        endpoints = [SimulatedEndpointConfig(**endpoint) for endpoint in config.pop("endpoints")]
+        jobs = [
+            SimulatedImageJob(**dict(job, image_size=tuple(job.get("image_size", (10240, 10240)))))
+            for job in config.pop("jobs", [])
+        ]
+        workload = config.pop("workload", None)
+        if "region_size" in config:
+            config["region_size"] = tuple(config["region_size"])
+        simulation_config = SimulationConfig(endpoints=endpoints, jobs=jobs, **config)
+        if workload:
+            simulation_config.jobs.extend(generate_jobs(seed=simulation_config.seed, **workload))
+        return simulation_config
+
+
+def generate_jobs(
+    count: int,
+    endpoints: List[str],
+    image_sizes: List[ImageDimensions],
+    mean_interarrival_seconds: float = 0.0,
+    tile_size: int = 1024,
+    tile_overlap: int = 50,
+    seed: int = 0,
+) -> List[SimulatedImageJob]:
+    """
+    Generate a workload with Poisson arrivals and images drawn uniformly from the given endpoints and sizes.
+
+    :param count: Number of jobs to generate.
+    :param endpoints: Endpoints to choose from.
+    :param image_sizes: Image dimensions to choose from.
+    :param mean_interarrival_seconds: Mean time between arrivals, 0 submits every job at the start of the run.
+    :param tile_size: Size of the tiles in pixels.
+    :param tile_overlap: Overlap between tiles in pixels.
+    :param seed: Seed for the random choices.
+    :return: The generated jobs.
+    """
+    rng = random.Random(seed)
+    arrival_time = 0.0
+    jobs = []
+    for job_index in range(count):
+        if mean_interarrival_seconds > 0:
+            arrival_time += rng.expovariate(1.0 / mean_interarrival_seconds)
+        jobs.append(
+            SimulatedImageJob(
+                job_id=f"job-{job_index:05d}",
+                endpoint=rng.choice(endpoints),
+                arrival_time=arrival_time,
+                image_size=tuple(rng.choice(image_sizes)),
+                tile_size=tile_size,
+                tile_overlap=tile_overlap,
+            )
+        )
+    return jobs
+
+
+@dataclass
+class JobResult:
+    """
+    Outcome of a simulated image request. Times are simulated seconds from the start of the run.
+    """
+
+    job_id: str
+    endpoint: str
+    region_count: int
+    tile_count: int
+    arrival_time: float
+    start_time: Optional[float] = None
+    completion_time: Optional[float] = None
+    attempts: int = 0
+    status: str = "INCOMPLETE"
+
+    @property
+    def queue_wait(self) -> Optional[float]:
+        return None if self.start_time is None else self.start_time - self.arrival_time
+
+    @property
+    def duration(self) -> Optional[float]:
+        return None if self.completion_time is None else self.completion_time - self.arrival_time
+
+
+@dataclass
+class EndpointResult:
+    """
+    Load observed on a simulated endpoint.
+
+    :param name: Name of the endpoint.
+    :param capacity: Concurrent inference slots on the endpoint.
+    :param invocations: Number of tile inference requests served.
+    :param utilization: Fraction of the endpoint capacity in use over the makespan.
+    :param mean_invocation_wait: Mean time requests waited for a free slot in seconds.
+    :param max_waiting_invocations: Largest number of requests waiting for a slot at once.
+    :param throttles: Number of times the scheduler delayed an image for this endpoint.
+    """
+
+    name: str
+    capacity: int
+    invocations: int = 0
+    utilization: float = 0.0
+    mean_invocation_wait: float = 0.0
+    max_waiting_invocations: int = 0
+    throttles: int = 0
+
+
+@dataclass
+class SimulationReport:
+    """
+    Results of a simulation run.
+
+    :param makespan: Simulated seconds from the first arrival until the last job finished.
+    :param scheduling_cycles: Number of scheduling cycles that had outstanding requests.
+    :param throttles: Total number of scheduling decisions delayed by capacity throttling.
+    :param endpoints: Per endpoint results.
+    :param jobs: Per job results.
+    :param parameters: The tunable parameters the run was made with.
+    """
+
+    makespan: float
+    scheduling_cycles: int
+    throttles: int
+    endpoints: List[EndpointResult]
+    jobs: List[JobResult]
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def completed_jobs(self) -> List[JobResult]:
+        return [job for job in self.jobs if job.status == "SUCCESS"]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to a JSON compatible dictionary including summary statistics.
+
+        :return: The report as a dictionary.
+        """
+        queue_waits = sorted(job.queue_wait for job in self.jobs if job.queue_wait is not None)
+        durations = sorted(job.duration for job in self.completed_jobs)
+        report = dataclasses.asdict(self)
+        for job_dict, job in zip(report["jobs"], self.jobs):
+            job_dict["queue_wait"] = job.queue_wait
+            job_dict["duration"] = job.duration
+        report["summary"] = {
+            "jobs": len(self.jobs),
+            "completed": len(self.completed_jobs),
+            "failed": len([job for job in self.jobs if job.status == "FAILED"]),
+            "mean_queue_wait": sum(queue_waits) / len(queue_waits) if queue_waits else None,
+            "p90_queue_wait": _percentile(queue_waits, 0.9),
+            "mean_duration": sum(durations) / len(durations) if durations else None,
+            "p90_duration": _percentile(durations, 0.9),
+        }
+        return report
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+class _SimulationRecorder:
+    """
+    Collects the scheduler events that would otherwise be published as CloudWatch metrics.
+    """
+
+    def __init__(self) -> None:
+        self.scheduling_cycles = 0
+        self.throttles: Dict[str, int] = defaultdict(int)
+
+
+class _SimulatedBufferedImageRequestQueue(BufferedImageRequestQueue):
+    """
+    BufferedImageRequestQueue that drops its CloudWatch metrics.
+    """
+
+    def _do_emit_buffered_queue_metrics(self, num_buffered_requests: int, num_visible_requests: int, metrics=None) -> None:
+        pass
+
+    def _emit_image_access_error_metric(self, endpoint_name: str, metrics=None) -> None:
+        pass
+
+
+class _SimulatedEndpointLoadImageScheduler(EndpointLoadImageScheduler):
+    """
+    EndpointLoadImageScheduler that records its CloudWatch metrics in the simulation results.
+    """
+
+    def __init__(self, *args, recorder: _SimulationRecorder, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.recorder = recorder
+
+    def _emit_scheduling_metrics(self, duration_ms: float, metrics=None) -> None:
+        self.recorder.scheduling_cycles += 1
+
+    def _emit_utilization_metric(
+        self, endpoint_name: str, max_capacity: int, current_utilization: int, metrics=None
+    ) -> None:
+        pass
+
+    def _emit_throttle_metric(self, endpoint_name: str, metrics=None) -> None:
+        self.recorder.throttles[endpoint_name] += 1
+
+
+class _SimulatedEndpoint:
+    """
+    A model endpoint with a fixed number of concurrent inference slots. Requests beyond the capacity wait in
+    FIFO order for a free slot.
+    """
+
+    def __init__(self, config: SimulatedEndpointConfig, clock: SimulationClock, rng: random.Random) -> None:
+        self.config = config
+        self.clock = clock
+        self.rng = rng
+        self.active = 0
+        self.waiting: Deque[Tuple[float, Callable[[], None]]] = deque()
+        self.invocations = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.max_waiting = 0
+
+        # Lognormal parameters that reproduce the configured mean and standard deviation
+        mean = max(config.latency_mean, 1e-6)
+        self._sigma = math.sqrt(math.log(1.0 + (config.latency_std / mean) ** 2))
+        self._mu = math.log(mean) - self._sigma**2 / 2.0
+
+    def invoke(self, on_complete: Callable[[], None]) -> None:
+        if self.active < self.config.capacity:
+            self._start(self.clock.time(), on_complete)
+        else:
+            self.waiting.append((self.clock.time(), on_complete))
+            self.max_waiting = max(self.max_waiting, len(self.waiting))
+
+    def _start(self, requested_at: float, on_complete: Callable[[], None]) -> None:
+        self.active += 1
+        self.invocations += 1
+        self.wait_seconds += self.clock.time() - requested_at
+        latency = self.rng.lognormvariate(self._mu, self._sigma) if self._sigma > 0 else self.config.latency_mean
+        self.busy_seconds += latency
+        self.clock.schedule(latency, lambda: self._finish(on_complete))
+
+    def _finish(self, on_complete: Callable[[], None]) -> None:
+        self.active -= 1
+        if self.waiting:
+            self._start(*self.waiting.popleft())
+        on_complete()
+
+
+@dataclass
+class _SimulatedJob:
+    config: SimulatedImageJob
+    tile_counts: List[int]
+    result: JobResult
+    image_request: Optional[ImageRequest] = None
+    completed_regions: set = field(default_factory=set)
+
+
+class SchedulerSimulator:
+    """
+    Runs a workload through the real scheduler classes in simulated time.
+
+    :param config: The simulation configuration.
+    """
+
+    def __init__(self, config: SimulationConfig) -> None:
+        self.config = config
+        self.clock = SimulationClock()
+        self.rng = random.Random(config.seed)
+        self.recorder = _SimulationRecorder()
+
+        tiling_strategy = VariableOverlapTilingStrategy()
+        self.endpoints = {endpoint.name: _SimulatedEndpoint(endpoint, self.clock, self.rng) for endpoint in config.endpoints}
+        self.jobs: Dict[str, _SimulatedJob] = {}
+        image_sizes = {}
+        for job in config.jobs:
+            image_url = self._image_url(job)
+            image_sizes[image_url] = job.image_size
+            tile_size = (job.tile_size, job.tile_size)
+            overlap = (job.tile_overlap, job.tile_overlap)
+            regions = tiling_strategy.compute_regions(((0, 0), job.image_size), config.region_size, tile_size, overlap)
+            tile_counts = [len(tiling_strategy.compute_tiles(region, tile_size, overlap)) for region in regions]
+            self.jobs[job.job_id] = _SimulatedJob(
+                config=job,
+                tile_counts=tile_counts,
+                result=JobResult(
+                    job_id=job.job_id,
+                    endpoint=job.endpoint,
+                    region_count=len(regions),
+                    tile_count=sum(tile_counts),
+                    arrival_time=job.arrival_time,
+                ),
+            )
+
+        self.sqs_client = InMemorySQSClient()
+        self.requested_jobs_table = InMemoryRequestedJobsTable(self.clock)
+        sm_client = SimulatedSageMakerClient(
+            {endpoint.name: (endpoint.instance_count, endpoint.instance_concurrency) for endpoint in config.endpoints}
+        )
+
+        self.image_request_queue = _SimulatedBufferedImageRequestQueue(
+            IMAGE_QUEUE_URL,
+            IMAGE_DLQ_URL,
+            self.requested_jobs_table,
+            max_jobs_lookahead=config.max_jobs_lookahead,
+            retry_time=config.retry_time,
+            max_retry_attempts=config.max_retry_attempts,
+            region_calculator=SimulatedRegionCalculator(tiling_strategy, config.region_size, image_sizes),
+        )
+        self.image_request_queue.sqs_client = self.sqs_client
+
+        self.scheduler = _SimulatedEndpointLoadImageScheduler(
+            self.image_request_queue,
+            capacity_estimator=EndpointCapacityEstimator(sm_client=sm_client),
+            throttling_enabled=config.throttling_enabled,
+            capacity_target_percentage=config.capacity_target_percentage,
+            tile_workers_per_instance=config.tile_workers_per_instance,
+            scheduling_policy=config.scheduling_policy,
+            default_deadline_seconds=config.default_deadline_seconds,
+            aging_seconds=config.aging_seconds,
+            recorder=self.recorder,
+        )
+        self.scheduler.sm_client = sm_client
+
+        self.region_queue: Deque[Tuple[_SimulatedJob, int]] = deque()
+        self._unfinished_jobs = len(self.jobs)
+        self._dlq_messages_seen = 0
+
+    @staticmethod
+    def _image_url(job: SimulatedImageJob) -> str:
+        return f"s3://simulation/{job.job_id}.tif"
+
+    def run(self) -> SimulationReport:
+        """
+        Run the workload until every job has finished or the simulated time limit is reached.
+
+        :return: The results of the run.
+        """
+        for job in self.jobs.values():
+            self.clock.schedule(job.config.arrival_time, lambda job=job: self._submit(job))
+        for instance_id in range(self.config.model_runner_instances):
+            self.clock.schedule(0.0, lambda instance_id=instance_id: self._poll(instance_id))
+
+        with self.clock.installed([buffered_image_request_queue, endpoint_load_image_scheduler]):
+            while not self._all_jobs_finished() and self.clock.elapsed < self.config.max_simulated_seconds:
+                if not self.clock.run_next():
+                    break
+
+        return self._build_report()
+
+    def _submit(self, job: _SimulatedJob) -> None:
+        message = {
+            "jobName": job.config.job_id,
+            "jobId": job.config.job_id,
+            "imageUrls": [self._image_url(job.config)],
+            "outputs": [{"type": "S3", "bucket": "simulation", "prefix": "results"}],
+            "imageProcessor": {"name": job.config.endpoint, "type": "SM_ENDPOINT"},
+            "imageProcessorTileSize": job.config.tile_size,
+            "imageProcessorTileOverlap": job.config.tile_overlap,
+            "priority": job.config.priority,
+        }
+        if job.config.deadline_seconds is not None:
+            message["deadline"] = int(self.clock.time() + job.config.deadline_seconds)
+        self.sqs_client.send_message(QueueUrl=IMAGE_QUEUE_URL, MessageBody=json.dumps(message))
+
+    def _poll(self, instance_id: int) -> None:
+        """
+        One iteration of ModelRunner.monitor_work_queues: regions take priority over starting new images.
+        """
+        if self.region_queue:
+            job, region_index = self.region_queue.popleft()
+            self._process_region(instance_id, job, region_index)
+            return
+
+        image_request = self.scheduler.get_next_scheduled_request()
+        if image_request:
+            self._start_image(instance_id, image_request)
+        else:
+            self.clock.schedule(self.config.idle_poll_seconds, lambda: self._poll(instance_id))
+
+    def _start_image(self, instance_id: int, image_request: ImageRequest) -> None:
+        job = self.jobs[image_request.job_id]
+        job.image_request = image_request
+        job.result.attempts += 1
+        if job.result.start_time is None:
+            job.result.start_time = self.clock.elapsed
+
+        def queue_regions() -> None:
+            # The first region is processed by the instance that started the image, the rest are shared
+            for region_index in range(1, len(job.tile_counts)):
+                self.region_queue.append((job, region_index))
+            self._process_region(instance_id, job, 0)
+
+        self.clock.schedule(self.config.image_setup_seconds, queue_regions)
+
+    def _process_region(self, instance_id: int, job: _SimulatedJob, region_index: int) -> None:
+        endpoint = self.endpoints[job.config.endpoint]
+        remaining_tiles = itertools.count(job.tile_counts[region_index], -1)
+        state = {"outstanding": job.tile_counts[region_index]}
+
+        def next_tile() -> None:
+            if next(remaining_tiles) > 0:
+                endpoint.invoke(tile_complete)
+
+        def tile_complete() -> None:
+            state["outstanding"] -= 1
+            if state["outstanding"] == 0:
+                self._complete_region(instance_id, job, region_index)
+            else:
+                next_tile()
+
+        def start_workers() -> None:
+            if state["outstanding"] == 0:
+                self._complete_region(instance_id, job, region_index)
+                return
+            for _ in range(self.config.tile_workers_per_instance):
+                next_tile()
+
+        self.clock.schedule(self.config.region_setup_seconds, start_workers)
+
+    def _complete_region(self, instance_id: int, job: _SimulatedJob, region_index: int) -> None:
+        self.requested_jobs_table.complete_region(job.image_request, f"{job.config.job_id}-region-{region_index}")
+        job.completed_regions.add(region_index)
+        if len(job.completed_regions) == len(job.tile_counts):
+            self._finish_job(job, "SUCCESS")
+        self._poll(instance_id)
+
+    def _finish_job(self, job: _SimulatedJob, status: str) -> None:
+        if job.result.status == "INCOMPLETE":
+            job.result.status = status
+            job.result.completion_time = self.clock.elapsed
+            self._unfinished_jobs -= 1
+
+    def _all_jobs_finished(self) -> bool:
+        # Requests that ran out of attempts are moved to the DLQ by the buffered queue
+        dlq_messages = self.sqs_client.messages(IMAGE_DLQ_URL)
+        for message in dlq_messages[self._dlq_messages_seen :]:
+            try:
+                job = self.jobs.get(json.loads(message["Body"]).get("job_id"))
+            except ValueError:
+                continue
+            if job:
+                self._finish_job(job, "FAILED")
+        self._dlq_messages_seen = len(dlq_messages)
+        return self._unfinished_jobs == 0
+
+    def _build_report(self) -> SimulationReport:
+        results = [job.result for job in self.jobs.values()]
+        first_arrival = min((result.arrival_time for result in results), default=0.0)
+        last_completion = max((result.completion_time or self.clock.elapsed for result in results), default=0.0)
+        makespan = max(0.0, last_completion - first_arrival)
+
+        endpoint_results = []
+        for name, endpoint in self.endpoints.items():
+            capacity = endpoint.config.capacity
+            endpoint_results.append(
+                EndpointResult(
+                    name=name,
+                    capacity=capacity,
+                    invocations=endpoint.invocations,
+                    utilization=endpoint.busy_seconds / (capacity * makespan) if capacity and makespan else 0.0,
+                    mean_invocation_wait=endpoint.wait_seconds / endpoint.invocations if endpoint.invocations else 0.0,
+                    max_waiting_invocations=endpoint.max_waiting,
+                    throttles=self.recorder.throttles.get(name, 0),
+                )
+            )
+
+        return SimulationReport(
+            makespan=makespan,
+            scheduling_cycles=self.recorder.scheduling_cycles,
+            throttles=sum(self.recorder.throttles.values()),
+            endpoints=endpoint_results,
+            jobs=results,
+            parameters={
+                "model_runner_instances": self.config.model_runner_instances,
+                "tile_workers_per_instance": self.config.tile_workers_per_instance,
+                "capacity_target_percentage": self.config.capacity_target_percentage,
+                "throttling_enabled": self.config.throttling_enabled,
+                "region_size": list(self.config.region_size),
+            },
+        )
+
+
+def run_sweep(base_config: Dict[str, Any], sweep: Dict[str, List[Any]]) -> List[SimulationReport]:
+    """
+    Run the simulation once for every combination of the swept parameter values.
+
+    :param base_config: The simulation configuration dictionary shared by every run.
+    :param sweep: Mapping of configuration key to the values to try, e.g. {"tile_workers_per_instance": [2, 4, 8]}.
+    :return: One report per combination of parameter values.
+    """
+    reports = []
+    keys = list(sweep.keys())
+    for values in itertools.product(*(sweep[key] for key in keys)):
+        run_config = dict(base_config, **dict(zip(keys, values)))
+        reports.append(SchedulerSimulator(SimulationConfig.from_dict(run_config)).run())
+    return reports
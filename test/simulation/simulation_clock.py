@@ -0,0 +1,83 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import heapq
+import itertools
+from contextlib import ExitStack, contextmanager
+from types import ModuleType
+from typing import Callable, Iterator, List, Tuple
+from unittest import mock
+
+# Simulations start at a realistic epoch time because the scheduler treats a last_attempt of 0 as "never started"
+DEFAULT_START_TIME = 1_700_000_000.0
+
+
+class SimulationClock:
+    """
+    A virtual clock and event queue for discrete-event simulation.
+
+    The clock only advances when the next scheduled event is run so an arbitrarily long workload can be
+    simulated in a fraction of a second. It exposes a `time()` method so it can stand in for the `time`
+    module inside the scheduler classes being simulated.
+
+    :param start_time: The epoch time the simulation starts at.
+    """
+
+    def __init__(self, start_time: float = DEFAULT_START_TIME) -> None:
+        self.start_time = start_time
+        self.now = start_time
+        self._events: List[Tuple[float, int, Callable[[], None]]] = []
+        self._sequence = itertools.count()
+
+    def time(self) -> float:
+        """
+        Current simulated epoch time, mirrors `time.time()`.
+
+        :return: The current simulated time in seconds.
+        """
+        return self.now
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Number of simulated seconds since the start of the simulation.
+
+        :return: The elapsed simulated time in seconds.
+        """
+        return self.now - self.start_time
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> None:
+        """
+        Schedule a callback to run after a simulated delay. Events scheduled for the same time run in the
+        order they were scheduled.
+
+        :param delay: Number of simulated seconds from now to run the callback.
+        :param callback: The function to run.
+        """
+        heapq.heappush(self._events, (self.now + max(0.0, delay), next(self._sequence), callback))
+
+    def run_next(self) -> bool:
+        """
+        Advance the clock to the next event and run it.
+
+        :return: False if there were no events left to run.
+        """
+        if not self._events:
+            return False
+        event_time, _, callback = heapq.heappop(self._events)
+        self.now = event_time
+        callback()
+        return True
+
+    @contextmanager
+    def installed(self, modules: List[ModuleType]) -> Iterator["SimulationClock"]:
+        """
+        Replace the `time` module used by each of the given modules with this clock for the duration of the
+        context.
+
+        :param modules: The modules that should read the simulated time.
+        :return: This clock.
+        """
+        with ExitStack() as stack:
+            for module in modules:
+                stack.enter_context(mock.patch.object(module, "time", self))
+            yield self
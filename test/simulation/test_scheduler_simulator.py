@@ -0,0 +1,138 @@
+#  Copyright 2026 Amazon.com, Inc. or its affiliates.
+
+import pytest
+
+from .scheduler_simulator import (
+    SchedulerSimulator,
+    SimulatedEndpointConfig,
+    SimulatedImageJob,
+    SimulationConfig,
+    generate_jobs,
+    run_sweep,
+)
+from .simulation_clock import SimulationClock
+
+
+def create_config(**kwargs) -> SimulationConfig:
+    """Helper function to create a small two endpoint workload"""
+    defaults = dict(
+        endpoints=[
+            SimulatedEndpointConfig(name="fast-model", instance_count=1, instance_concurrency=4, latency_mean=0.2),
+            SimulatedEndpointConfig(name="slow-model", instance_count=1, instance_concurrency=2, latency_mean=1.0),
+        ],
+        jobs=generate_jobs(
+            count=6,
+            endpoints=["fast-model", "slow-model"],
+            image_sizes=[(2048, 2048), (12000, 4096)],
+            mean_interarrival_seconds=5.0,
+            seed=3,
+        ),
+        model_runner_instances=2,
+        tile_workers_per_instance=2,
+        region_size=(4096, 4096),
+    )
+    defaults.update(kwargs)
+    return SimulationConfig(**defaults)
+
+
+def test_simulation_clock_runs_events_in_order():
+    clock = SimulationClock(start_time=100.0)
+    events = []
+    clock.schedule(5.0, lambda: events.append(("late", clock.time())))
+    clock.schedule(1.0, lambda: events.append(("early", clock.time())))
+    clock.schedule(1.0, lambda: events.append(("early-second", clock.time())))
+
+    while clock.run_next():
+        pass
+
+    assert events == [("early", 101.0), ("early-second", 101.0), ("late", 105.0)]
+    assert clock.elapsed == 5.0
+
+
+def test_simulation_completes_all_jobs():
+    config = create_config()
+    report = SchedulerSimulator(config).run()
+
+    assert len(report.completed_jobs) == len(config.jobs)
+    assert report.makespan > 0
+    assert report.scheduling_cycles > 0
+    assert sum(endpoint.invocations for endpoint in report.endpoints) == sum(job.tile_count for job in report.jobs)
+    for job in report.jobs:
+        assert job.attempts == 1
+        assert job.queue_wait >= 0
+        assert job.duration >= job.queue_wait
+
+
+def test_simulation_throttles_when_endpoint_capacity_is_exhausted():
+    config = create_config(
+        endpoints=[SimulatedEndpointConfig(name="small-model", instance_count=1, instance_concurrency=1, latency_mean=2.0)],
+        jobs=[SimulatedImageJob(job_id=f"job-{i}", endpoint="small-model", image_size=(4096, 4096)) for i in range(3)],
+        tile_workers_per_instance=4,
+    )
+
+    throttled = SchedulerSimulator(config).run()
+    config.throttling_enabled = False
+    unthrottled = SchedulerSimulator(config).run()
+
+    assert len(throttled.completed_jobs) == 3
+    assert throttled.throttles > 0
+    assert throttled.endpoints[0].throttles == throttled.throttles
+    assert unthrottled.throttles == 0
+
+
+def test_simulation_is_deterministic_for_a_seed():
+    config = create_config(
+        endpoints=[SimulatedEndpointConfig(name="fast-model", instance_concurrency=2, latency_mean=0.5, latency_std=0.3)],
+        jobs=generate_jobs(count=4, endpoints=["fast-model"], image_sizes=[(8192, 8192)], seed=1),
+    )
+
+    first = SchedulerSimulator(config).run().to_dict()
+    second = SchedulerSimulator(config).run().to_dict()
+
+    assert first == second
+
+
+def test_simulation_fails_jobs_that_exceed_retry_time():
+    config = create_config(
+        endpoints=[SimulatedEndpointConfig(name="slow-model", instance_concurrency=1, latency_mean=100.0)],
+        jobs=[SimulatedImageJob(job_id="job-0", endpoint="slow-model", image_size=(4096, 4096))],
+        retry_time=10,
+        max_retry_attempts=0,
+        throttling_enabled=False,
+    )
+
+    report = SchedulerSimulator(config).run()
+
+    assert report.jobs[0].status == "FAILED"
+    assert report.to_dict()["summary"]["failed"] == 1
+
+
+def test_simulation_config_from_dict_generates_workload():
+    config = SimulationConfig.from_dict(
+        {
+            "endpoints": [{"name": "model", "instance_count": 2}],
+            "jobs": [{"job_id": "explicit", "endpoint": "model", "image_size": [1024, 1024]}],
+            "workload": {"count": 3, "endpoints": ["model"], "image_sizes": [[2048, 2048]]},
+            "region_size": [2048, 2048],
+            "seed": 5,
+        }
+    )
+
+    assert config.endpoints[0].capacity == 4
+    assert [job.job_id for job in config.jobs] == ["explicit", "job-00000", "job-00001", "job-00002"]
+    assert config.jobs[0].image_size == (1024, 1024)
+    assert config.region_size == (2048, 2048)
+
+
+@pytest.mark.parametrize("workers", [[1, 4], [2]])
+def test_run_sweep_returns_a_report_per_combination(workers):
+    base_config = {
+        "endpoints": [{"name": "model", "instance_concurrency": 2, "latency_mean": 0.5}],
+        "workload": {"count": 2, "endpoints": ["model"], "image_sizes": [[4096, 4096]]},
+    }
+
+    reports = run_sweep(base_config, {"tile_workers_per_instance": workers, "throttling_enabled": [True, False]})
+
+    assert len(reports) == len(workers) * 2
+    assert [report.parameters["tile_workers_per_instance"] for report in reports[::2]] == workers
+    assert all(len(report.completed_jobs) == 2 for report in reports)